@@ -0,0 +1,65 @@
+"""Benchmark the streaming ``--batch`` mode in lines/sec.
+
+Run from the repository root with ``python -m benchmarks.bench_batch``.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch
+
+
+def write_input(path: str, lines: int, seed: int = 42) -> None:
+    """
+    Write a synthetic batch input file.
+
+    Args:
+        path: Destination file path.
+        lines: Number of lines to generate.
+        seed: Random seed for reproducible content.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as handle:
+        for _ in range(lines):
+            operation = rng.choice("+-*/")
+            handle.write(
+                f"{operation} {rng.uniform(-1e6, 1e6):.6g} {rng.randint(0, 1000)}\n"
+            )
+
+
+def main() -> None:
+    """Report batch-mode throughput and peak traced memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        write_input(path, args.lines)
+
+        def run() -> None:
+            with open(path, encoding="utf-8") as source, open(
+                os.devnull, "w", encoding="utf-8"
+            ) as sink:
+                run_batch(source, sink)
+
+        elapsed = best_time(run, args.repeat)
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    rows: List[Tuple[object, ...]] = [
+        ("--batch", args.lines / elapsed, f"{peak / 1024:.0f} KiB")
+    ]
+    print_table(("mode", "lines/sec", "peak memory"), rows)
+
+
+if __name__ == "__main__":
+    main()
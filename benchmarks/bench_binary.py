@@ -0,0 +1,62 @@
+"""Benchmark the binary operand format against the text batch path.
+
+Run from the repository root with ``python -m benchmarks.bench_binary``.
+"""
+
+import argparse
+import os
+import tempfile
+from typing import List, Tuple
+
+from benchmarks.bench_batch import write_input
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch
+from src.calculator.binary import encode_text, run_binary
+from src.calculator.vectorized import load_numpy
+
+
+def main() -> None:
+    """Report records/sec for text batch mode and each binary backend."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "input.txt")
+        binary_path = os.path.join(directory, "input.bin")
+        write_input(text_path, args.lines)
+        with open(text_path, encoding="utf-8") as source, open(
+            binary_path, "wb"
+        ) as destination:
+            encode_text(source, destination)
+
+        def text() -> None:
+            with open(text_path, encoding="utf-8") as source, open(
+                os.devnull, "w", encoding="utf-8"
+            ) as sink:
+                run_batch(source, sink)
+
+        def binary(backend: str) -> None:
+            with open(os.devnull, "wb") as sink:
+                run_binary(binary_path, sink, backend=backend)
+
+        rows: List[Tuple[object, ...]] = []
+        baseline = best_time(text, args.repeat)
+        rows.append(("text --batch", args.lines / baseline, "1.0x"))
+        backends = ["python"] + (["numpy"] if load_numpy() is not None else [])
+        for backend in backends:
+            elapsed = best_time(lambda: binary(backend), args.repeat)
+            rows.append(
+                (
+                    f"binary {backend}",
+                    args.lines / elapsed,
+                    f"{baseline / elapsed:.1f}x",
+                )
+            )
+
+    print_table(("path", "records/sec", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
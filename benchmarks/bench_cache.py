@@ -0,0 +1,55 @@
+"""Benchmark CachedOperations against plain Operations on repeated triples.
+
+Run from the repository root with ``python -m benchmarks.bench_cache``.
+"""
+
+import argparse
+import random
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.cache import CachedOperations, ResultCache
+from src.calculator.exceptions import CalculatorError
+from src.calculator.operations import Operations
+
+
+def main() -> None:
+    """Report calls/sec with and without the result cache."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    parser.add_argument("--cache-size", type=int, default=4_096)
+    parser.add_argument("--zero-rate", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    triples = [
+        (
+            rng.choice("+-*/"),
+            float(rng.randint(1, 100)),
+            0.0 if rng.random() < args.zero_rate else float(rng.randint(1, 20)),
+        )
+        for _ in range(args.distinct)
+    ]
+    workload = [rng.choice(triples) for _ in range(args.calls)]
+
+    def run(operations: Operations) -> None:
+        calculate = operations.calculate
+        for operation, a, b in workload:
+            try:
+                calculate(operation, a, b)
+            except CalculatorError:
+                pass
+
+    cached = CachedOperations(ResultCache(args.cache_size))
+    rows: List[Tuple[object, ...]] = [
+        ("Operations", args.calls / best_time(lambda: run(Operations()), args.repeat)),
+        ("CachedOperations", args.calls / best_time(lambda: run(cached), args.repeat)),
+    ]
+    print_table(("implementation", "calls/sec"), rows)
+    print(cached.cache.format_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark Operations.calculate_many against the scalar calculate loop.
+
+Run from the repository root with ``python -m benchmarks.bench_calculate_many``.
+"""
+
+import argparse
+import random
+from array import array
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.exceptions import CalculatorError
+from src.calculator.operations import Operations
+from src.calculator.vectorized import load_numpy
+
+
+def main() -> None:
+    """Report rows/sec for the scalar loop and each batch backend."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    a = array("d", (rng.uniform(-1e6, 1e6) for _ in range(args.rows)))
+    # Roughly 1% of divisors are zero so the division path exercises its mask.
+    b = array(
+        "d",
+        (
+            0.0 if rng.random() < 0.01 else rng.uniform(-1e3, 1e3)
+            for _ in range(args.rows)
+        ),
+    )
+
+    rows: List[Tuple[object, ...]] = []
+    for operation in ("+", "*", "/"):
+
+        def scalar_loop() -> None:
+            calculate = Operations.calculate
+            for x, y in zip(a, b):
+                try:
+                    calculate(operation, x, y)
+                except CalculatorError:
+                    pass
+
+        elapsed = best_time(scalar_loop, args.repeat)
+        rows.append((operation, "calculate loop", args.rows / elapsed))
+
+        elapsed = best_time(
+            lambda: Operations.calculate_many(operation, a, b, backend="python"),
+            args.repeat,
+        )
+        rows.append((operation, "python", args.rows / elapsed))
+
+        np = load_numpy()
+        if np is not None:
+            xa, xb = np.frombuffer(a), np.frombuffer(b)
+            elapsed = best_time(
+                lambda: Operations.calculate_many(operation, xa, xb, backend="numpy"),
+                args.repeat,
+            )
+            rows.append((operation, "numpy", args.rows / elapsed))
+
+    print_table(("op", "backend", "rows/sec"), rows)
+
+
+if __name__ == "__main__":
+    main()
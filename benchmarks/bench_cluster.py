@@ -0,0 +1,90 @@
+"""Benchmark ``--batch --cluster`` scaling across 1/2/4/8 worker processes.
+
+Worker processes are started on localhost (``calculator worker --port 0``)
+and the same file is evaluated on the first N of them, against a serial
+``--batch`` run. Every chunk and its results cross a TCP connection.
+Speedups need as many free cores (locally, or on the worker hosts) as
+workers; without them a run only pays for the transfers.
+
+The coordinator only reads, sends and writes; its own CPU time per run
+bounds the throughput any number of workers can reach, reported as the
+"ceiling" column.
+
+Run from the repository root with ``python -m benchmarks.bench_cluster``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+from benchmarks.bench_batch import write_input
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch_path
+from src.calculator.cluster import Address, parse_address, run_cluster
+
+
+def start_workers(count: int) -> Tuple[List["subprocess.Popen[str]"], List[Address]]:
+    """Start worker processes on free ports; return them and their addresses."""
+    command = [sys.executable, "-m", "src.calculator.main", "worker", "--port", "0"]
+    processes = [
+        subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+        for _ in range(count)
+    ]
+    addresses = [
+        parse_address(process.stderr.readline().rsplit(" ", 1)[1])  # type: ignore
+        for process in processes
+    ]
+    return processes, addresses
+
+
+def main() -> None:
+    """Report lines/sec and speedup for each worker count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-bytes", type=int, default=4 * 1024 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"CPU count: {os.cpu_count()}")
+    rows: List[Tuple[object, ...]] = []
+    processes, addresses = start_workers(max(args.workers))
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            write_input(path, args.lines)
+
+            with open(os.devnull, "w", encoding="utf-8") as sink:
+                serial = best_time(lambda: run_batch_path(path, sink), args.repeat)
+                rows.append(("serial", args.lines / serial, "1.00x", "-"))
+                for workers in args.workers:
+
+                    def run() -> None:
+                        run_cluster(path, sink, addresses[:workers], args.chunk_bytes)
+
+                    elapsed = best_time(run, args.repeat)
+                    started = time.process_time()
+                    run()
+                    ceiling = args.lines / (time.process_time() - started)
+                    rows.append(
+                        (
+                            workers,
+                            args.lines / elapsed,
+                            f"{serial / elapsed:.2f}x",
+                            ceiling,
+                        )
+                    )
+    finally:
+        for process in processes:
+            process.kill()
+            process.wait()
+
+    print_table(("workers", "lines/sec", "speedup", "ceiling"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark ``calculator csv`` on a 1 GB CSV file.
+
+A CSV export of --megabytes is generated (id, item, price, qty and
+discount columns, with about one bad cell in 10,000), then
+``price * qty - discount`` is appended to every row three ways:
+
+- per row: each row is read, its cells validated and the formula computed
+  with Operations.calculate, one row at a time, as a REPL round trip
+  per row would;
+- run_csv with the pure-Python ``array('d')`` backend;
+- run_csv with NumPy, when it is installed.
+
+The per-row baseline is timed on the rows of the first
+--baseline-megabytes of the file.
+
+Run from the repository root with ``python -m benchmarks.bench_csv``.
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from itertools import islice
+from typing import IO, Callable, List, Tuple
+from unittest.mock import patch
+
+from benchmarks.common import print_table
+from src.calculator import vectorized
+from src.calculator.csvfile import run_csv
+from src.calculator.exceptions import CalculatorError
+from src.calculator.operations import Operations
+from src.calculator.validator import Validator
+
+EXPRESSION = "price * qty - discount"
+
+ITEMS = ("apple", "pear", "plum", "fig, dried", "kiwi")
+
+
+def write_csv(path: str, megabytes: int, seed: int = 42) -> int:
+    """Write a CSV file of about megabytes; return its number of data rows."""
+    rng = random.Random(seed)
+    limit = megabytes * 2**20
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(("id", "item", "price", "qty", "discount"))
+        while handle.tell() < limit:
+            block = [
+                (
+                    rows + i,
+                    rng.choice(ITEMS),
+                    f"{rng.uniform(0.1, 500.0):.2f}",
+                    rng.randint(0, 1000) if rng.random() > 1e-4 else "n/a",
+                    f"{rng.uniform(0.0, 10.0):.2f}",
+                )
+                for i in range(10_000)
+            ]
+            writer.writerows(block)
+            rows += len(block)
+    return rows
+
+
+def per_row(source: IO[str], output: IO[str], limit: int) -> None:
+    """Compute the formula one row at a time for the first limit rows."""
+    reader = csv.reader(source)
+    writer = csv.writer(output, lineterminator="\n")
+    header = next(reader)
+    writer.writerow(header + ["result"])
+    price, qty, discount = (header.index(name) for name in ("price", "qty", "discount"))
+    calculate = Operations.calculate
+    number = Validator.validate_number
+    for row in islice(reader, limit):
+        try:
+            product = calculate("*", number(row[price]), number(row[qty]))
+            row.append(repr(calculate("-", product, number(row[discount]))))
+        except CalculatorError:
+            row.append("")
+        writer.writerow(row)
+
+
+def timed(path: str, run: Callable[[IO[str], IO[str]], object]) -> float:
+    """Time run(source, output) over the file into the null device."""
+    with open(path, encoding="utf-8", newline="") as source, open(
+        os.devnull, "w", encoding="utf-8", newline=""
+    ) as output:
+        start = time.perf_counter()
+        run(source, output)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Report MiB/s and rows/s of each way of evaluating the file."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=1024)
+    parser.add_argument("--baseline-megabytes", type=int, default=64)
+    args = parser.parse_args()
+
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory, open(
+        os.devnull, "w", encoding="utf-8"
+    ) as errors:
+        path = os.path.join(directory, "input.csv")
+        count = write_csv(path, args.megabytes)
+        size = os.path.getsize(path) / 2**20
+        print(f"{size:,.0f} MiB, {count:,} rows")
+
+        sample = int(count * min(args.baseline_megabytes / size, 1.0))
+        elapsed = timed(path, lambda source, output: per_row(source, output, sample))
+        baseline = sample / elapsed
+        rows.append(("per row", f"{size * baseline / count:.1f}", baseline, "1.0x"))
+
+        def evaluate(source: IO[str], output: IO[str]) -> None:
+            run_csv(source, output, EXPRESSION, errors)
+
+        def row(name: str, elapsed: float) -> Tuple[object, ...]:
+            rate = count / elapsed
+            return (name, f"{size / elapsed:.1f}", rate, f"{rate / baseline:.1f}x")
+
+        with patch.object(vectorized, "load_numpy", return_value=None):
+            rows.append(row("run_csv (python)", timed(path, evaluate)))
+        if vectorized.load_numpy() is not None:
+            rows.append(row("run_csv (numpy)", timed(path, evaluate)))
+    print_table(("evaluation", "MiB/s", "rows/s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark per-invocation wall time of ``calculator eval``.
+
+Compares one-shot invocations that talk to the warm daemon with invocations
+that evaluate in-process (``--no-daemon``).
+
+Run from the repository root with ``python -m benchmarks.bench_daemon``.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+from benchmarks.common import print_table
+
+
+def time_invocation(command: List[str]) -> float:
+    """Run a command once and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """Report median and p90 wall time with and without the daemon."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    base = [sys.executable, "-m", "src.calculator.main", "eval"]
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "bench.sock")
+        daemon = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "src.calculator.main",
+                "daemon",
+                "--socket",
+                socket_path,
+            ]
+        )
+        try:
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+            # Alternate the two modes so caches warm up evenly for both.
+            with_daemon, in_process = [], []
+            for _ in range(args.runs):
+                with_daemon.append(
+                    time_invocation(base + ["+ 3 4", "--socket", socket_path])
+                )
+                in_process.append(time_invocation(base + ["+ 3 4", "--no-daemon"]))
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    rows: List[Tuple[object, ...]] = []
+    for name, timings in (("daemon", with_daemon), ("in-process", in_process)):
+        timings.sort()
+        rows.append(
+            (
+                name,
+                f"{statistics.median(timings):.1f}",
+                f"{timings[int(0.9 * (len(timings) - 1))]:.1f}",
+            )
+        )
+    print_table(("mode", "median ms", "p90 ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
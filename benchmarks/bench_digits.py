@@ -0,0 +1,109 @@
+"""Benchmark streaming a million digits of an exact quotient.
+
+Each row produces the first --digits digits after the point of a quotient
+and discards them as a stream consumer would:
+
+- long division: a generator computing one digit per divmod, the textbook
+  way to stream digits;
+- ExactQuotient.digits, yielding single digits from chunked divisions;
+- ExactQuotient.chunks, yielding strings of DEFAULT_DIGIT_CHUNK digits;
+- Decimal division at --digits of precision, for reference: it is not
+  lazy, and holds every digit in memory at once.
+
+The peak memory of each (measured with tracemalloc in an untimed run)
+shows the streaming ones stay bounded while Decimal grows with --digits.
+
+Run from the repository root with ``python -m benchmarks.bench_digits``.
+"""
+
+import argparse
+import tracemalloc
+from decimal import Decimal, localcontext
+from itertools import islice
+from typing import Callable, Iterator, List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.digits import ExactQuotient
+
+QUOTIENTS = [
+    ("1 / 7", 1, 7),
+    ("1 / 999983", 1, 999983),
+    ("22.5 / 0.0007", Decimal("22.5"), Decimal("0.0007")),
+    ("1 / (2**127 - 1)", 1, 2**127 - 1),
+]
+
+
+def long_division(numerator: int, denominator: int) -> Iterator[int]:
+    """Yield the digits after the point of a positive fraction, one per step."""
+    remainder = numerator % denominator
+    while remainder:
+        digit, remainder = divmod(remainder * 10, denominator)
+        yield digit
+
+
+def consume(iterator: Iterator[object], count: int) -> None:
+    """Read count items of an iterator, keeping none."""
+    for _ in islice(iterator, count):
+        pass
+
+
+def decimal_digits(quotient: ExactQuotient, count: int) -> str:
+    """Format the quotient to count digits after the point with Decimal."""
+    with localcontext() as context:
+        context.prec = count + len(quotient.integer_part)
+        value = Decimal(quotient.numerator) / Decimal(quotient.denominator)
+    return str(value)
+
+
+def peak_kib(func: Callable[[], object]) -> float:
+    """Run func and return the peak memory it allocated, in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Report digits/sec and peak memory of each way to stream the digits."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--digits", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    count = args.digits
+
+    rows: List[Tuple[object, ...]] = []
+    for label, dividend, divisor in QUOTIENTS:
+        quotient = ExactQuotient(dividend, divisor)
+        numerator, denominator = quotient.numerator, quotient.denominator
+        cases: List[Tuple[str, Callable[[], object]]] = [
+            (
+                "long division",
+                lambda: consume(long_division(numerator, denominator), count),
+            ),
+            ("ExactQuotient.digits", lambda: consume(quotient.digits(), count)),
+            (
+                "ExactQuotient.chunks",
+                lambda: consume(quotient.chunks(0, count), count),
+            ),
+            ("Decimal (not lazy)", lambda: decimal_digits(quotient, count)),
+        ]
+        baseline = 0.0
+        for name, func in cases:
+            elapsed = best_time(func, args.repeat)
+            baseline = baseline or elapsed
+            rows.append(
+                (
+                    label,
+                    name,
+                    count / elapsed,
+                    f"{baseline / elapsed:.1f}x",
+                    peak_kib(func),
+                )
+            )
+    print_table(("quotient", "method", "digits/sec", "speedup", "peak KiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
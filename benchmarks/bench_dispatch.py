@@ -0,0 +1,94 @@
+"""Benchmark Operations.calculate dispatch against the per-call dict it replaced.
+
+Operations.calculate used to build a symbol-to-method dict on every call.
+It now looks the symbol up in the registry's dispatch table, built once
+and only extended as plugins load. Each row times the same calculations
+through the old per-call dict, the current Operations.calculate, and a
+bare lookup in the table, and also a registered (non-built-in) operation.
+
+Run from the repository root with ``python -m benchmarks.bench_dispatch``.
+"""
+
+import argparse
+import random
+from typing import Callable, List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.operations import Operations
+from src.calculator.registry import REGISTRY
+
+Calculation = Tuple[str, float, float]
+Calculate = Callable[[str, float, float], float]
+
+
+def calculate_rebuilt(operation: str, a: float, b: float) -> float:
+    """Dispatch as Operations.calculate did before the registry."""
+    operations_map = {
+        "+": Operations.add,
+        "-": Operations.subtract,
+        "*": Operations.multiply,
+        "/": Operations.divide,
+    }
+
+    if operation not in operations_map:
+        raise ValueError(f"Unsupported operation: {operation}")
+
+    return operations_map[operation](a, b)
+
+
+def calculate_table(operation: str, a: float, b: float) -> float:
+    """Dispatch with one lookup in the registry's table."""
+    result: float = REGISTRY.table[operation](a, b)
+    return result
+
+
+def make_calculations(count: int, symbols: str, seed: int = 42) -> List[Calculation]:
+    """Build calculations spread over the given operation symbols."""
+    rng = random.Random(seed)
+    return [
+        (rng.choice(symbols), rng.uniform(-1e6, 1e6), rng.uniform(1.0, 1e3))
+        for _ in range(count)
+    ]
+
+
+def run(calculate: Calculate, calculations: List[Calculation]) -> None:
+    """Calculate every item."""
+    for operation, a, b in calculations:
+        calculate(operation, a, b)
+
+
+def main() -> None:
+    """Report calculations/sec of each dispatch and its ratio to the old one."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calculations", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if "max" not in REGISTRY.table:
+        REGISTRY.register("max", max)
+    builtins = make_calculations(args.calculations, "+-*/")
+    plugin = [("max", a, b) for _, a, b in builtins]
+
+    rows: List[Tuple[object, ...]] = []
+    baseline = best_time(lambda: run(calculate_rebuilt, builtins), args.repeat)
+    cases: List[Tuple[str, str, Calculate, List[Calculation]]] = [
+        ("per-call dict (old)", "+-*/", calculate_rebuilt, builtins),
+        ("Operations.calculate", "+-*/", Operations.calculate, builtins),
+        ("table lookup", "+-*/", calculate_table, builtins),
+        ("Operations.calculate", "max", Operations.calculate, plugin),
+    ]
+    for name, symbols, calculate, calculations in cases:
+        elapsed = best_time(lambda: run(calculate, calculations), args.repeat)
+        rows.append(
+            (
+                name,
+                symbols,
+                args.calculations / elapsed,
+                f"{baseline / elapsed:.2f}x",
+            )
+        )
+    print_table(("dispatch", "operations", "calcs/sec", "vs old"), rows)
+
+
+if __name__ == "__main__":
+    main()
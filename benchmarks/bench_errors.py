@@ -0,0 +1,89 @@
+"""Benchmark raising vs status-code evaluation at several error rates.
+
+Run from the repository root with ``python -m benchmarks.bench_errors``.
+"""
+
+import argparse
+import random
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import parse_line
+from src.calculator.evaluation import evaluate_lines
+from src.calculator.exceptions import CalculatorError
+from src.calculator.operations import Operations
+
+ERROR_LINES = ("/ 7 0", "+ 1 abc", "^ 2 3", "* 4")
+
+
+def make_lines(count: int, error_rate: float, seed: int = 42) -> List[str]:
+    """
+    Build batch lines with a given share of failing lines.
+
+    Args:
+        count: Number of lines.
+        error_rate: Fraction of lines that fail validation or divide by zero.
+        seed: Random seed for reproducible content.
+
+    Returns:
+        The lines.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if rng.random() < error_rate:
+            lines.append(rng.choice(ERROR_LINES))
+        else:
+            operation = rng.choice("+-*/")
+            lines.append(
+                f"{operation} {rng.uniform(-1e6, 1e6):.6g} {rng.randint(1, 1000)}"
+            )
+    return lines
+
+
+def raising(lines: List[str]) -> None:
+    """Evaluate through the raising API, keeping each error's message."""
+    calculate = Operations.calculate
+    for line in lines:
+        try:
+            calculate(*parse_line(line))
+        except CalculatorError as e:
+            str(e)
+
+
+def status_codes(lines: List[str]) -> None:
+    """Evaluate through the status-code API, formatting each message."""
+    for _ in evaluate_lines(lines).errors():
+        pass
+
+
+def main() -> None:
+    """Report lines/sec for both APIs at 0%, 10% and 50% error rates."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows: List[Tuple[object, ...]] = []
+    for error_rate in (0.0, 0.1, 0.5):
+        lines = make_lines(args.lines, error_rate)
+        raising_time = best_time(lambda: raising(lines), args.repeat)
+        status_time = best_time(lambda: status_codes(lines), args.repeat)
+        silent_time = best_time(lambda: evaluate_lines(lines), args.repeat)
+        rows.append(
+            (
+                f"{error_rate:.0%}",
+                args.lines / raising_time,
+                args.lines / status_time,
+                args.lines / silent_time,
+            )
+        )
+    print_table(
+        ("errors", "raising", "status + messages", "status only"),
+        rows,
+    )
+    print("(lines/sec)")
+
+
+if __name__ == "__main__":
+    main()
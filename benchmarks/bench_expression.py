@@ -0,0 +1,63 @@
+"""Benchmark cold (parse every time) and warm (cached) expression evaluation.
+
+Run from the repository root with ``python -m benchmarks.bench_expression``.
+"""
+
+import argparse
+import random
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.expression import ExpressionCache, compile_expression
+
+
+def make_expressions(count: int, seed: int = 42) -> List[str]:
+    """
+    Generate reproducible infix expressions with nesting and unary minus.
+
+    Args:
+        count: Number of distinct expressions.
+        seed: Random seed.
+
+    Returns:
+        The generated expressions.
+    """
+    rng = random.Random(seed)
+    expressions = []
+    for _ in range(count):
+        a, b, c, d = (rng.randint(1, 999) for _ in range(4))
+        expressions.append(f"(-{a} + {b}) * {c} / ({d} - {a}.5)")
+    return expressions
+
+
+def main() -> None:
+    """Report expressions/sec for cold and warm evaluation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--evaluations", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    distinct = make_expressions(args.distinct)
+    workload = [distinct[i % len(distinct)] for i in range(args.evaluations)]
+
+    def cold() -> None:
+        for text in workload:
+            compile_expression(text).evaluate()
+
+    cache = ExpressionCache(maxsize=args.distinct)
+
+    def warm() -> None:
+        for text in workload:
+            cache.evaluate(text)
+
+    rows: List[Tuple[object, ...]] = [
+        ("cold (parse each time)", args.evaluations / best_time(cold, args.repeat)),
+        ("warm (LRU cache)", args.evaluations / best_time(warm, args.repeat)),
+    ]
+    print_table(("mode", "evals/sec"), rows)
+    print(f"cache hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the REPL history at millions of calculations.
+
+Records calculations into a History with the default in-memory capacity,
+then reports the process's peak memory as the history grows, how fast it
+records, and the latency of recalling recent (in-memory) and old (spilled
+to disk) results. Unix only (uses the resource module). Run from the
+repository root with ``python -m benchmarks.bench_history``.
+"""
+
+import argparse
+import random
+import resource
+import time
+from typing import List, Tuple
+
+from benchmarks.common import print_table
+from src.calculator.defaults import DEFAULT_HISTORY_SIZE
+from src.calculator.history import History
+
+
+def recall_latency(history: History, numbers: List[int]) -> float:
+    """Return the mean seconds per History.result call over numbers."""
+    result = history.result
+    start = time.perf_counter()
+    for number in numbers:
+        result(number)
+    return (time.perf_counter() - start) / len(numbers)
+
+
+def main() -> None:
+    """Print memory and latency figures after recording --entries results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000_000)
+    parser.add_argument("--capacity", type=int, default=DEFAULT_HISTORY_SIZE)
+    parser.add_argument("--recalls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    history = History(args.capacity)
+    append = history.append
+    rows: List[Tuple[object, ...]] = []
+    checkpoint = 1
+    start = time.perf_counter()
+    for n in range(1, args.entries + 1):
+        append("*", float(n), 1.5, n * 1.5)
+        if n == checkpoint or n == args.entries:
+            # Peak resident memory; flat once the ring is full.
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rows.append((n, f"{peak / 1024:.1f}"))
+            checkpoint *= 10
+    elapsed = time.perf_counter() - start
+    print_table(("recorded", "peak RSS MiB"), rows)
+    print(f"recording: {args.entries / elapsed:,.0f} calculations/sec")
+    rng = random.Random(42)
+    size = len(history)
+    recent = [
+        rng.randint(max(size - args.capacity, 0) + 1, size) for _ in range(args.recalls)
+    ]
+    spilled = max(size - args.capacity, 0)
+    latency_rows: List[Tuple[object, ...]] = [
+        ("ans", f"{recall_latency(history, [size] * args.recalls) * 1e9:.0f}"),
+        ("$N in memory", f"{recall_latency(history, recent) * 1e9:.0f}"),
+    ]
+    if spilled:
+        old = [rng.randint(1, spilled) for _ in range(args.recalls)]
+        latency_rows.append(("$N on disk", f"{recall_latency(history, old) * 1e9:.0f}"))
+    print()
+    print_table(("recall", "ns/recall"), latency_rows)
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
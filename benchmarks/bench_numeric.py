@@ -0,0 +1,86 @@
+"""Benchmark the numeric backends on the same batch workloads.
+
+Run from the repository root with ``python -m benchmarks.bench_numeric``.
+"""
+
+import argparse
+import io
+import random
+from typing import List, Optional, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch
+from src.calculator.defaults import NUMERIC_BACKENDS
+from src.calculator.numeric import NumericOperations, make_backend
+from src.calculator.operations import Operations
+
+
+def make_text(lines: int, kind: str, seed: int = 42) -> str:
+    """
+    Build a batch input of one kind of operand.
+
+    Args:
+        lines: Number of lines.
+        kind: ``integers`` (up to 18 digits), ``decimals`` (two decimal
+            places) or ``big`` (60-digit integers).
+        seed: Random seed for reproducible content.
+
+    Returns:
+        The batch text.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(lines):
+        operation = rng.choice("+-*/")
+        if kind == "integers":
+            a, b = rng.randint(1, 10**18), rng.randint(1, 10**6)
+            rows.append(f"{operation} {a} {b}\n")
+        elif kind == "decimals":
+            a, b = rng.randint(1, 10**8), rng.randint(1, 10**4)
+            rows.append(f"{operation} {a / 100:.2f} {b / 100:.2f}\n")
+        else:
+            a, b = rng.randint(1, 10**60), rng.randint(1, 10**60)
+            rows.append(f"{operation} {a} {b}\n")
+    return "".join(rows)
+
+
+def run(text: str, operations: Optional[Operations]) -> None:
+    """Evaluate a batch text, discarding the output."""
+    run_batch(io.StringIO(text), io.StringIO(), operations)
+
+
+def main() -> None:
+    """Report lines/sec of each backend relative to the float fast path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    kinds = ("integers", "decimals", "big")
+    texts = {kind: make_text(args.lines, kind) for kind in kinds}
+    configurations: List[Tuple[str, Optional[Operations]]] = [
+        ("float fast path", None),
+        ("float raising path", Operations()),
+    ]
+    configurations += [
+        (name, NumericOperations(make_backend(name))) for name in NUMERIC_BACKENDS
+    ]
+
+    rows: List[Tuple[object, ...]] = []
+    for label, operations in configurations:
+        rows.append(
+            (
+                label,
+                *(
+                    args.lines
+                    / best_time(lambda: run(texts[kind], operations), args.repeat)
+                    for kind in kinds
+                ),
+            )
+        )
+    print_table(("backend", *kinds), rows)
+    print("(lines/sec; big = 60-digit integers)")
+
+
+if __name__ == "__main__":
+    main()
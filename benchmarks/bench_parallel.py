@@ -0,0 +1,46 @@
+"""Benchmark ``--batch --workers N`` scaling across 1/2/4/8 workers.
+
+Run from the repository root with ``python -m benchmarks.bench_parallel``.
+"""
+
+import argparse
+import os
+import tempfile
+from typing import List, Tuple
+
+from benchmarks.bench_batch import write_input
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch_path
+from src.calculator.parallel import run_parallel
+
+
+def main() -> None:
+    """Report lines/sec and speedup for each worker count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-bytes", type=int, default=4 * 1024 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"CPU count: {os.cpu_count()}")
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        write_input(path, args.lines)
+
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            serial = best_time(lambda: run_batch_path(path, sink), args.repeat)
+            rows.append(("serial", args.lines / serial, "1.00x"))
+            for workers in args.workers:
+                elapsed = best_time(
+                    lambda: run_parallel(path, sink, workers, args.chunk_bytes),
+                    args.repeat,
+                )
+                rows.append((workers, args.lines / elapsed, f"{serial / elapsed:.2f}x"))
+
+    print_table(("workers", "lines/sec", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the persistent result cache cold and warm on batch workloads.
+
+Each configuration evaluates the same batch text with the decimal backend:
+without a persistent cache, with an empty cache file (cold: every line is
+computed and written) and with the file a previous run filled (warm: every
+line is read back). The persistent cache only pays off when a calculation
+costs more than an indexed SQLite read, as high-precision division does.
+
+Run from the repository root with ``python -m benchmarks.bench_persistent_cache``.
+"""
+
+import argparse
+import io
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+from benchmarks.bench_numeric import make_text
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import run_batch
+from src.calculator.cache import CachedOperations
+from src.calculator.numeric import NumericOperations, make_backend
+from src.calculator.operations import Operations
+from src.calculator.persistent_cache import PersistentCache
+
+
+def run(text: str, operations: Operations, cache: Optional[PersistentCache]) -> None:
+    """Evaluate a batch text, discarding the output, then close the cache."""
+    run_batch(io.StringIO(text), io.StringIO(), operations)
+    if cache is not None:
+        cache.close()
+
+
+def main() -> None:
+    """Report lines/sec without, cold and warm for several precisions."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2_000)
+    parser.add_argument("--precisions", type=int, nargs="+", default=[28, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_text(args.lines, "big")
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for precision in args.precisions:
+            backend = make_backend("decimal", precision)
+            numeric = NumericOperations(backend)
+            path = os.path.join(directory, f"warm-{precision}.db")
+
+            def cold() -> None:
+                for name in os.listdir(directory):
+                    if name.startswith("cold"):
+                        os.remove(os.path.join(directory, name))
+                cache = PersistentCache(
+                    os.path.join(directory, "cold.db"), backend=backend
+                )
+                run(text, CachedOperations(cache, numeric), cache)
+
+            def warm() -> None:
+                cache = PersistentCache(path, backend=backend)
+                run(text, CachedOperations(cache, numeric), cache)
+
+            warm()
+            rows.append(
+                (
+                    precision,
+                    args.lines
+                    / best_time(lambda: run(text, numeric, None), args.repeat),
+                    args.lines / best_time(cold, args.repeat),
+                    args.lines / best_time(warm, args.repeat),
+                )
+            )
+    print_table(("precision", "uncached", "cold", "warm"), rows)
+    print("(lines/sec; 60-digit integer operands, decimal backend)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark the memory of 10M calculation results in each representation.
+
+Each representation is built from the same operand columns and measured
+with tracemalloc while it is the only thing alive: a list of tuples and a
+list of dicts of loose floats (the naive forms), a list of __slots__
+CalculationRecord objects, and one RecordBatch.
+
+tracemalloc keeps its own record of every traced block, several times the
+size of a float, so tracing the 40M+ blocks of the object forms at 10M
+records needs far more memory than they do. The object forms are traced
+on a --sample of records and their linear cost projected to --records;
+the RecordBatch is a handful of blocks and is traced at full size.
+
+Run from the repository root with ``python -m benchmarks.bench_records``.
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.common import print_table
+from src.calculator.registry import OPERATION_SYMBOLS
+from src.calculator.records import CalculationRecord, RecordBatch
+
+Columns = Tuple[bytearray, "array[float]", "array[float]", "array[float]"]
+
+
+def make_columns(count: int, seed: int = 42) -> Columns:
+    """Build opcode, operand and result columns of count calculations."""
+    rng = random.Random(seed)
+    batch = RecordBatch()
+    size = max(count // 4, 1)
+    for operation in OPERATION_SYMBOLS:
+        a = array("d", [rng.uniform(-1e6, 1e6) for _ in range(size)])
+        b = array("d", [rng.uniform(1.0, 1e3) for _ in range(size)])
+        batch.calculate(operation, a, b)
+    return batch.opcodes, batch.a, batch.b, batch.results
+
+
+def as_tuples(columns: Columns) -> List[Tuple[str, float, float, float]]:
+    """Build one tuple per calculation."""
+    opcodes, a, b, results = columns
+    symbols = OPERATION_SYMBOLS
+    return [(symbols[code], x, y, r) for code, x, y, r in zip(opcodes, a, b, results)]
+
+
+def as_dicts(columns: Columns) -> List[Dict[str, Any]]:
+    """Build one dict per calculation."""
+    opcodes, a, b, results = columns
+    symbols = OPERATION_SYMBOLS
+    return [
+        {"operation": symbols[code], "a": x, "b": y, "result": r}
+        for code, x, y, r in zip(opcodes, a, b, results)
+    ]
+
+
+def as_records(columns: Columns) -> List[CalculationRecord]:
+    """Build one CalculationRecord per calculation."""
+    opcodes, a, b, results = columns
+    symbols = OPERATION_SYMBOLS
+    return [
+        CalculationRecord(symbols[code], x, y, r)
+        for code, x, y, r in zip(opcodes, a, b, results)
+    ]
+
+
+def as_batch(columns: Columns) -> RecordBatch:
+    """Copy the columns into a RecordBatch."""
+    opcodes, a, b, results = columns
+    batch = RecordBatch()
+    batch.opcodes.extend(opcodes)
+    batch.a.extend(a)
+    batch.b.extend(b)
+    batch.results.extend(results)
+    return batch
+
+
+def measure(build: Callable[[Columns], Any], columns: Columns) -> Tuple[int, float]:
+    """Return the bytes a representation holds and the seconds to build it."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build(columns)
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size, elapsed
+
+
+def main() -> None:
+    """Report bytes per record and build time of each representation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000_000)
+    parser.add_argument("--sample", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    columns = make_columns(args.records)
+    count = len(columns[0])
+    sample = min(args.sample, count)
+    sampled: Columns = (
+        columns[0][:sample],
+        columns[1][:sample],
+        columns[2][:sample],
+        columns[3][:sample],
+    )
+    representations: List[Tuple[str, Callable[[Columns], Any]]] = [
+        ("list of tuples", as_tuples),
+        ("list of dicts", as_dicts),
+        ("list of CalculationRecord", as_records),
+        ("RecordBatch", as_batch),
+    ]
+    rows: List[Tuple[object, ...]] = []
+    for name, build in representations:
+        size, elapsed = measure(build, sampled)
+        per_record = size / sample
+        rows.append(
+            (
+                name,
+                f"{per_record:.1f}",
+                f"{per_record * count / 2**20:,.0f}",
+                f"{elapsed * count / sample:.1f}",
+            )
+        )
+    size, elapsed = measure(as_batch, columns)
+    rows.append(
+        (
+            "RecordBatch (full size)",
+            f"{size / count:.1f}",
+            f"{size / 2**20:,.0f}",
+            f"{elapsed:.1f}",
+        )
+    )
+    print_table(("representation", "bytes/record", "MiB", "build s"), rows)
+    print(
+        f"({count:,} records, object forms projected from {sample:,}; "
+        "build times include tracemalloc overhead)"
+    )
+
+
+if __name__ == "__main__":
+    main()
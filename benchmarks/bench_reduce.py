@@ -0,0 +1,94 @@
+"""Benchmark streaming reductions against repeated Operations.add.
+
+Reports the error of each way of summing ill-conditioned data relative to
+the correctly rounded math.fsum result, and the throughput of summing and
+scanning. Run from the repository root with
+``python -m benchmarks.bench_reduce``.
+"""
+
+import argparse
+import io
+import math
+import random
+from typing import Callable, List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.operations import Operations
+from src.calculator.reductions import NumberReader, reduce_values, scan_values
+
+
+def make_values(count: int, seed: int = 42) -> List[float]:
+    """
+    Build ill-conditioned values: wide magnitudes that mostly cancel.
+
+    Args:
+        count: Number of values.
+        seed: Random seed for reproducible content.
+
+    Returns:
+        The values.
+    """
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count // 2):
+        value = rng.uniform(-1, 1) * 10 ** rng.randint(-8, 16)
+        values += [value, -value * (1 + rng.uniform(-1e-9, 1e-9))]
+    rng.shuffle(values)
+    return values
+
+
+def naive_sum(values: List[float]) -> float:
+    """Sum with one Operations.add call per value, as the REPL would."""
+    add = Operations.add
+    total = 0.0
+    for value in values:
+        total = add(total, value)
+    return total
+
+
+def last_scan(values: List[float]) -> float:
+    """Return the final running sum of a scan."""
+    total = 0.0
+    for total in scan_values("sum", values):
+        pass
+    return total
+
+
+def main() -> None:
+    """Print the accuracy and throughput tables."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values = make_values(args.count)
+    text = "".join(f"{value!r}\n" for value in values)
+    exact = math.fsum(values)
+    methods: List[Tuple[str, Callable[[], float]]] = [
+        ("Operations.add loop", lambda: naive_sum(values)),
+        ("builtin sum", lambda: sum(values)),
+        ("reduce_values", lambda: reduce_values("sum", values)),
+        ("scan_values", lambda: last_scan(values)),
+        (
+            "reduce_values from text",
+            lambda: reduce_values("sum", NumberReader(io.StringIO(text))),
+        ),
+    ]
+
+    rows: List[Tuple[object, ...]] = []
+    for label, method in methods:
+        result = method()
+        error = abs(result - exact) / max(abs(exact), math.ulp(1.0))
+        rows.append(
+            (
+                label,
+                f"{error:.2e}",
+                len(values) / best_time(method, args.repeat),
+            )
+        )
+    print_table(("method", "relative error", "values/sec"), rows)
+    print(f"(reference math.fsum = {exact!r})")
+
+
+if __name__ == "__main__":
+    main()
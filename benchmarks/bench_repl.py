@@ -0,0 +1,97 @@
+"""Benchmark piped REPL sessions: prompted input() vs the streaming fast path.
+
+Run from the repository root with ``python -m benchmarks.bench_repl``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from benchmarks.bench_startup import ROOT
+from benchmarks.common import best_time, print_table
+from benchmarks.workloads import WORKLOADS, generate_answers
+from src.calculator.main import CalculatorCLI
+
+
+def write_session(path: str, calculations: int, workload: str) -> None:
+    """
+    Write a REPL session: the answers to every prompt, then ``quit``.
+
+    Args:
+        path: The output file path.
+        calculations: Number of calculations.
+        workload: One of WORKLOADS.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        for answer in generate_answers(calculations, workload):
+            handle.write(f"{answer}\n")
+        handle.write("quit\n")
+
+
+def prompted(path: str) -> None:
+    """Replay a session through input(), prompting and flushing per answer."""
+    original = sys.stdin
+    with open(path, encoding="utf-8") as source, open(os.devnull, "w") as output:
+        sys.stdin = source
+        try:
+            with redirect_stdout(output):
+                CalculatorCLI().run()
+        finally:
+            sys.stdin = original
+
+
+def streamed(path: str) -> None:
+    """Replay a session through CalculatorCLI.run_stream."""
+    with open(path, encoding="utf-8") as source, open(os.devnull, "w") as output:
+        CalculatorCLI().run_stream(source, output)
+
+
+def piped_process(path: str) -> None:
+    """Replay a session by piping it into ``python -m src.calculator.main``."""
+    with open(path, "rb") as source:
+        subprocess.run(
+            [sys.executable, "-m", "src.calculator.main"],
+            cwd=ROOT,
+            stdin=source,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+
+def main() -> None:
+    """Report calculations/sec for each way of replaying a piped session."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calculations", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for workload in WORKLOADS:
+            path = os.path.join(directory, f"{workload}.txt")
+            write_session(path, args.calculations, workload)
+            prompted_time = best_time(lambda: prompted(path), args.repeat)
+            streamed_time = best_time(lambda: streamed(path), args.repeat)
+            process_time = best_time(lambda: piped_process(path), args.repeat)
+            rows.append(
+                (
+                    workload,
+                    args.calculations / prompted_time,
+                    args.calculations / streamed_time,
+                    args.calculations / process_time,
+                    f"{prompted_time / streamed_time:.1f}x",
+                )
+            )
+    print_table(
+        ("workload", "prompted", "run_stream", "piped process", "speedup"),
+        rows,
+    )
+    print("(calculations/sec)")
+
+
+if __name__ == "__main__":
+    main()
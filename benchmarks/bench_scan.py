@@ -0,0 +1,76 @@
+"""Benchmark the bulk Validator.scan_lines scanner against per-token parsing.
+
+Run from the repository root with ``python -m benchmarks.bench_scan``.
+"""
+
+import argparse
+import random
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.batch import parse_line
+from src.calculator.exceptions import CalculatorError
+from src.calculator.validator import Validator
+
+INVALID_LINES = ("+ 1 abc", "^ 2 3", "* 4", "/ 1e 2", "- 5 6 7")
+
+
+def make_lines(count: int, invalid_rate: float, seed: int = 42) -> List[str]:
+    """
+    Build batch lines with a given share of invalid lines.
+
+    Args:
+        count: Number of lines.
+        invalid_rate: Fraction of lines that fail validation.
+        seed: Random seed for reproducible content.
+
+    Returns:
+        The lines, with trailing newlines.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if rng.random() < invalid_rate:
+            lines.append(rng.choice(INVALID_LINES) + "\n")
+        else:
+            operation = rng.choice("+-*/")
+            lines.append(
+                f"{operation} {rng.uniform(-1e6, 1e6):.6g} {rng.randint(0, 1000)}\n"
+            )
+    return lines
+
+
+def per_token(lines: List[str]) -> None:
+    """Validate lines through parse_line, formatting every error message."""
+    for line in lines:
+        try:
+            parse_line(line)
+        except CalculatorError as e:
+            str(e)
+
+
+def main() -> None:
+    """Report lines/sec for both paths at several invalid-line rates."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows: List[Tuple[object, ...]] = []
+    for invalid_rate in (0.0, 0.1, 0.5):
+        lines = make_lines(args.lines, invalid_rate)
+        token_time = best_time(lambda: per_token(lines), args.repeat)
+        scan_time = best_time(lambda: Validator.scan_lines(lines), args.repeat)
+        rows.append(
+            (
+                f"{invalid_rate:.0%}",
+                args.lines / token_time,
+                args.lines / scan_time,
+                f"{token_time / scan_time:.1f}x",
+            )
+        )
+    print_table(("invalid", "per-token lines/sec", "scan lines/sec", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Load-test ``calculator serve`` with many concurrent connections.
+
+Starts the server in a subprocess on a free localhost port, then opens
+``--connections`` clients that each send ``--requests`` request/response
+round trips, followed by one pipelined burst per connection. Reports p50/p99
+round-trip latency and requests/sec.
+
+Run from the repository root with ``python -m benchmarks.bench_server``.
+"""
+
+import argparse
+import asyncio
+import re
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from benchmarks.common import print_table
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def raise_file_limit() -> None:
+    """Raise the open-file soft limit so thousands of sockets fit."""
+    if resource is not None:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Return the value at the given fraction of a sorted list."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def round_trips(port: int, requests: int, latencies: List[float]) -> None:
+    """Send sequential requests on one connection, recording latencies."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for n in range(requests):
+        start = time.perf_counter()
+        writer.write(f"* {n} 1.5\n".encode())
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def pipelined(port: int, requests: int) -> None:
+    """Send all requests at once on one connection and read every response."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"".join(f"+ {n} 1\n".encode() for n in range(requests)))
+    for _ in range(requests):
+        await reader.readline()
+    writer.close()
+
+
+async def load(port: int, connections: int, requests: int) -> List[Tuple[object, ...]]:
+    """Run both load phases and build the report rows."""
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(round_trips(port, requests, latencies) for _ in range(connections))
+    )
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(pipelined(port, requests) for _ in range(connections)))
+    burst = time.perf_counter() - start
+
+    latencies.sort()
+    total = connections * requests
+    return [
+        (
+            "round trip",
+            total / sequential,
+            f"{percentile(latencies, 0.5) * 1e3:.2f}",
+            f"{percentile(latencies, 0.99) * 1e3:.2f}",
+        ),
+        ("pipelined", total / burst, "-", "-"),
+    ]
+
+
+def main() -> None:
+    """Start the server, run the load test and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=2_000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    raise_file_limit()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.calculator.main", "serve", "--port", "0"],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert server.stderr is not None
+        match = re.search(r":(\d+)$", server.stderr.readline().strip())
+        if match is None:
+            raise SystemExit("server failed to start")
+        rows = asyncio.run(load(int(match.group(1)), args.connections, args.requests))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{args.connections} connections x {args.requests} requests")
+    print_table(("mode", "requests/sec", "p50 ms", "p99 ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark calculator startup: import time and time to first prompt.
+
+Run from the repository root with ``python -m benchmarks.bench_startup``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.common import print_table
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = b"Enter operation"
+
+# Command-line modes timed end to end, from process start to exit.
+MODES: Tuple[Tuple[str, Sequence[str], bytes], ...] = (
+    ("--help", ("--help",), b""),
+    ("eval --no-daemon", ("eval", "--no-daemon", "+ 3 4"), b""),
+    ("--batch -", ("--batch", "-"), b"+ 3 4\n"),
+)
+
+
+def import_times(module: str = "src.calculator.main") -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter under ``-X importtime``.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        The cumulative import time in microseconds of every module the
+        import loaded, keyed by module name.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.decode().splitlines():
+        # Lines look like "import time:   self [us] | cumulative | name".
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def import_time_us(module: str = "src.calculator.main", repeat: int = 5) -> int:
+    """
+    Measure the cumulative import time of a module, best of several runs.
+
+    Args:
+        module: The module to import.
+        repeat: Number of fresh interpreters to measure.
+
+    Returns:
+        The fastest cumulative import time in microseconds.
+    """
+    return min(import_times(module)[module] for _ in range(repeat))
+
+
+def time_to_prompt(repeat: int = 5) -> float:
+    """
+    Measure the wall-clock time until the REPL prints its first prompt.
+
+    Needs a POSIX pseudo-terminal.
+
+    Args:
+        repeat: Number of processes to start.
+
+    Returns:
+        The fastest time in seconds, including interpreter startup.
+    """
+    import pty
+
+    timings = []
+    for _ in range(repeat):
+        # Piped input skips the prompts, so answer from a pseudo-terminal.
+        controller, terminal = pty.openpty()
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "src.calculator.main"],
+            cwd=ROOT,
+            stdin=terminal,
+            stdout=subprocess.PIPE,
+        )
+        os.close(terminal)
+        assert process.stdout is not None
+        seen = b""
+        try:
+            while PROMPT not in seen:
+                chunk = process.stdout.read1(4096)
+                if not chunk:
+                    raise RuntimeError("The REPL exited before printing a prompt.")
+                seen += chunk
+            timings.append(time.perf_counter() - start)
+            os.write(controller, b"quit\n")
+            process.communicate()
+        finally:
+            os.close(controller)
+    return min(timings)
+
+
+def time_command(args: Sequence[str], stdin: bytes = b"", repeat: int = 5) -> float:
+    """
+    Measure the wall-clock time of a complete interpreter invocation.
+
+    Args:
+        args: The interpreter arguments, such as ``-m src.calculator.main``.
+        stdin: Bytes fed to standard input.
+        repeat: Number of processes to run.
+
+    Returns:
+        The fastest time in seconds, including interpreter startup.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=ROOT,
+            input=stdin,
+            capture_output=True,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Report import time, the slowest imports and per-mode startup time."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    interpreter = time_command(("-c", "pass"), repeat=args.repeat)
+    print(f"import src.calculator.main: {import_time_us(repeat=args.repeat)} us")
+    print(f"bare interpreter startup: {interpreter * 1000:.1f} ms")
+    print()
+
+    slowest = sorted(import_times().items(), key=lambda item: item[1], reverse=True)
+    print_table(
+        ("module", "cumulative us"),
+        [(name, str(us)) for name, us in slowest[: args.top]],
+    )
+    print()
+
+    rows: List[Tuple[object, ...]] = [
+        ("REPL first prompt", f"{time_to_prompt(args.repeat) * 1000:.1f}")
+    ]
+    for name, mode_args, stdin in MODES:
+        elapsed = time_command(
+            ("-m", "src.calculator.main", *mode_args), stdin, args.repeat
+        )
+        rows.append((name, f"{elapsed * 1000:.1f}"))
+    print_table(("mode", "wall ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark one shared Engine across 1/2/4/8 threads.
+
+The same lines are split evenly between the threads, so perfect scaling
+keeps the elapsed time falling with the thread count. With the GIL only
+one thread runs Python at a time and throughput stays flat; free-threaded
+builds (Python 3.13+ ``python3.13t``) can scale up to the core count.
+
+Run from the repository root with ``python -m benchmarks.bench_threads``.
+"""
+
+import argparse
+import os
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from benchmarks.bench_numeric import make_text
+from benchmarks.common import best_time, print_table
+from src.calculator.engine import Engine
+from src.calculator.exceptions import CalculatorError
+from src.calculator.numeric import make_backend
+
+
+def run(engine: Engine, parts: List[List[str]]) -> None:
+    """Evaluate each part of the lines in its own thread."""
+
+    def work(lines: List[str]) -> None:
+        evaluate = engine.evaluate
+        for line in lines:
+            try:
+                evaluate(line)
+            except CalculatorError:
+                pass
+
+    threads = [threading.Thread(target=work, args=(part,)) for part in parts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main() -> None:
+    """Report lines/sec and speedup for each thread count and backend."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=400_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    build = "GIL" if is_gil_enabled() else "free-threaded"
+    print(f"Python {sys.version.split()[0]} ({build}), CPU count: {os.cpu_count()}")
+
+    lines = make_text(args.lines, "decimals").splitlines()
+    rows: List[Tuple[object, ...]] = []
+    for name in ("float", "decimal"):
+        engine = Engine(None if name == "float" else make_backend(name))
+        single: Optional[float] = None
+        for count in args.threads:
+            parts = [lines[i::count] for i in range(count)]
+            elapsed = best_time(lambda: run(engine, parts), args.repeat)
+            single = elapsed if single is None else single
+            rows.append((name, count, args.lines / elapsed, f"{single / elapsed:.2f}x"))
+    print_table(("backend", "threads", "lines/sec", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark incremental recomputation in a 100k-variable graph.
+
+Each graph holds the same number of variables, split into independent
+chains (``c1 = c0 * 1.0001 + 1``, ``c2 = c1 * 1.0001 + 1``, ...). Updating
+the head of one chain recomputes only that chain, so the update time
+should grow with the chain length, not with the size of the graph. Run
+from the repository root with ``python -m benchmarks.bench_variables``.
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.calculator.variables import VariableGraph
+
+
+def build_chains(cells: int, length: int) -> VariableGraph:
+    """
+    Build a graph of independent chains.
+
+    Args:
+        cells: Total number of variables.
+        length: Variables per chain, including its input.
+
+    Returns:
+        The graph; chain k's input is named ``k_0``.
+    """
+    graph = VariableGraph()
+    for chain in range(cells // length):
+        graph.set_value(f"k{chain}_0", 1.0)
+        for i in range(1, length):
+            graph.set_formula(f"k{chain}_{i}", f"k{chain}_{i - 1} * 1.0001 + 1")
+    return graph
+
+
+def main() -> None:
+    """Report the cost of one update for several affected-subgraph sizes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows: List[Tuple[object, ...]] = []
+    length = 10
+    while length <= args.cells:
+        start = time.perf_counter()
+        graph = build_chains(args.cells, length)
+        build = time.perf_counter() - start
+        values = iter(range(1, 10**9))
+        elapsed = best_time(
+            lambda: graph.set_value("k0_0", float(next(values))), args.repeat
+        )
+        rows.append(
+            (
+                len(graph),
+                length,
+                f"{build:.2f}",
+                f"{elapsed * 1e3:.3f}",
+                f"{elapsed / length * 1e6:.2f}",
+            )
+        )
+        length *= 10
+    print_table(("variables", "affected", "build s", "update ms", "us/affected"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Shared timing helpers for the calculator benchmarks."""
+
+import time
+from typing import Callable, List, Sequence, Tuple
+
+
+def best_time(func: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Time a callable several times and keep the fastest run.
+
+    Args:
+        func: The zero-argument callable to time.
+        repeat: Number of timed runs.
+
+    Returns:
+        The fastest wall-clock time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(headers: Sequence[str], rows: List[Tuple[object, ...]]) -> None:
+    """
+    Print benchmark rows as an aligned plain-text table.
+
+    Args:
+        headers: Column titles.
+        rows: One tuple of cell values per row.
+    """
+    cells = [list(map(str, headers))] + [
+        [f"{value:,.0f}" if isinstance(value, float) else str(value) for value in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,421 @@
+"""Benchmark suite with JSON results and a regression gate.
+
+Run from the repository root::
+
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 10
+
+``compare`` (or ``run --baseline FILE``) exits with status 1 when any
+benchmark's throughput dropped by more than the threshold percentage.
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import best_time, print_table
+from benchmarks.workloads import (
+    generate_answers,
+    generate_lines,
+    generate_numbers,
+    generate_triples,
+)
+from src.calculator.batch import run_batch
+from src.calculator.binary import encode_text, run_binary
+from src.calculator.cache import CachedOperations, ResultCache
+from src.calculator.evaluation import evaluate_lines
+from src.calculator.exceptions import CalculatorError
+from src.calculator.expression import compile_expression
+from src.calculator.main import CalculatorCLI
+from src.calculator.metrics import InstrumentedOperations
+from src.calculator.operations import Operations
+from src.calculator.reductions import NumberReader, reduce_values
+from src.calculator.validator import Validator
+
+FORMAT_VERSION = 1
+DEFAULT_SIZE = 50_000
+DEFAULT_THRESHOLD = 10.0
+
+# A case builds its input outside the timed region, given the workload, the
+# size and a scratch directory for files, and returns the timed callable
+# together with the number of operations one call performs.
+Case = Callable[[str, int, str], Tuple[Callable[[], None], int]]
+
+
+def _calculate(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time Operations.calculate over calculation triples."""
+    triples = generate_triples(size, workload)
+
+    def run() -> None:
+        calculate = Operations.calculate
+        for operation, a, b in triples:
+            try:
+                calculate(operation, a, b)
+            except CalculatorError:
+                pass
+
+    return run, size
+
+
+def _cached_calculate(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time CachedOperations.calculate over a repeating set of triples."""
+    distinct = generate_triples(max(size // 50, 1), workload)
+    triples = [distinct[i % len(distinct)] for i in range(size)]
+
+    def run() -> None:
+        calculate = CachedOperations(ResultCache(len(distinct))).calculate
+        for operation, a, b in triples:
+            try:
+                calculate(operation, a, b)
+            except CalculatorError:
+                pass
+
+    return run, size
+
+
+def _instrumented_calculate(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time InstrumentedOperations.calculate, the --metrics path."""
+    triples = generate_triples(size, workload)
+
+    def run() -> None:
+        calculate = InstrumentedOperations().calculate
+        for operation, a, b in triples:
+            try:
+                calculate(operation, a, b)
+            except CalculatorError:
+                pass
+
+    return run, size
+
+
+def _validate_number(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time Validator.validate_number over number strings."""
+    numbers = generate_numbers(size, workload)
+
+    def run() -> None:
+        validate = Validator.validate_number
+        for number in numbers:
+            try:
+                validate(number)
+            except CalculatorError:
+                pass
+
+    return run, size
+
+
+def _run_single_calculation(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time the REPL loop with scripted answers and discarded output."""
+    answers = generate_answers(size, workload)
+
+    def run() -> None:
+        remaining = iter(answers)
+        cli = CalculatorCLI()
+        original = builtins.input
+        builtins.input = lambda prompt="": next(remaining)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(size):
+                    cli.run_single_calculation()
+        finally:
+            builtins.input = original
+
+    return run, size
+
+
+def _run_stream(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time the streaming REPL over a piped session with discarded output."""
+    session = "".join(f"{answer}\n" for answer in generate_answers(size, workload))
+
+    def run() -> None:
+        CalculatorCLI().run_stream(io.StringIO(session), io.StringIO())
+
+    return run, size
+
+
+def _run_batch(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time streaming batch mode over an in-memory input."""
+    text = "".join(generate_lines(size, workload))
+
+    def run() -> None:
+        run_batch(io.StringIO(text), io.StringIO())
+
+    return run, size
+
+
+def _evaluate_lines(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time status-code evaluation, formatting every error message."""
+    lines = generate_lines(size, workload)
+
+    def run() -> None:
+        for _ in evaluate_lines(lines).errors():
+            pass
+
+    return run, size
+
+
+def _reduce_values(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time a compensated sum over a stream of number lines."""
+    text = "".join(f"{number}\n" for number in generate_numbers(size, workload))
+
+    def run() -> None:
+        reduce_values("sum", NumberReader(io.StringIO(text)))
+
+    return run, size
+
+
+def _compile_expression(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time uncached compilation of infix expressions."""
+    sources = [
+        f"({a:.6g} {operation} {b:.0f}) * 2 - {a:.3g}"
+        for operation, a, b in generate_triples(size, workload)
+    ]
+
+    def run() -> None:
+        for source in sources:
+            compile_expression(source)
+
+    return run, size
+
+
+def _run_binary(
+    workload: str, size: int, directory: str
+) -> Tuple[Callable[[], None], int]:
+    """Time the pure-Python binary record backend."""
+    path = os.path.join(directory, f"{workload}.bin")
+    with open(path, "wb") as destination:
+        encode_text(generate_lines(size, workload), destination)
+
+    def run() -> None:
+        run_binary(path, io.BytesIO(), backend="python")
+
+    return run, size
+
+
+# (benchmark name, case, workloads it runs under)
+CASES: List[Tuple[str, Case, Tuple[str, ...]]] = [
+    ("operations.calculate", _calculate, ("clean", "zero")),
+    ("cache.calculate", _cached_calculate, ("clean", "zero")),
+    ("metrics.calculate", _instrumented_calculate, ("clean", "zero")),
+    ("validator.validate_number", _validate_number, ("clean", "dirty")),
+    ("cli.run_single_calculation", _run_single_calculation, ("clean", "dirty", "zero")),
+    ("cli.run_stream", _run_stream, ("clean", "dirty", "zero")),
+    ("batch.run_batch", _run_batch, ("clean", "dirty", "zero")),
+    ("evaluation.evaluate_lines", _evaluate_lines, ("clean", "dirty", "zero")),
+    ("reductions.reduce_values", _reduce_values, ("clean",)),
+    ("expression.compile_expression", _compile_expression, ("clean",)),
+    ("binary.run_binary", _run_binary, ("clean", "zero")),
+]
+
+
+def benchmark_names() -> List[str]:
+    """
+    List the names of every benchmark in the suite.
+
+    Returns:
+        Names of the form ``subsystem.function[workload]``.
+    """
+    return [
+        f"{name}[{workload}]" for name, _, workloads in CASES for workload in workloads
+    ]
+
+
+def run_suite(
+    size: int = DEFAULT_SIZE,
+    repeat: int = 3,
+    pattern: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run the suite and build its JSON results document.
+
+    Args:
+        size: Operations per benchmark run.
+        repeat: Timed runs per benchmark; the fastest is kept.
+        pattern: Only run benchmarks whose name contains this substring.
+
+    Returns:
+        The results document.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, case, workloads in CASES:
+            for workload in workloads:
+                full_name = f"{name}[{workload}]"
+                if pattern and pattern not in full_name:
+                    continue
+                func, ops = case(workload, size, directory)
+                seconds = best_time(func, repeat)
+                results[full_name] = {
+                    "ops": ops,
+                    "seconds": seconds,
+                    "ops_per_sec": ops / seconds,
+                }
+
+    return {
+        "format": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": size,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Load a results document.
+
+    Args:
+        path: The JSON file path.
+
+    Returns:
+        The results document.
+
+    Raises:
+        ValueError: If the file is not a results document of this format.
+    """
+    with open(path, encoding="utf-8") as handle:
+        document: Dict[str, Any] = json.load(handle)
+    if document.get("format") != FORMAT_VERSION or "results" not in document:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} results file.")
+    return document
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[List[Tuple[object, ...]], List[str]]:
+    """
+    Compare two results documents.
+
+    Args:
+        baseline: The stored baseline document.
+        current: The document to check.
+        threshold: Largest allowed throughput drop, in percent.
+
+    Returns:
+        Table rows of (name, baseline ops/sec, current ops/sec, change,
+        verdict), and the names of the benchmarks that regressed.
+    """
+    rows: List[Tuple[object, ...]] = []
+    regressions = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+    for name in sorted(set(base_results) | set(current_results)):
+        if name not in current_results:
+            rows.append((name, base_results[name]["ops_per_sec"], "-", "-", "missing"))
+            continue
+        if name not in base_results:
+            rows.append((name, "-", current_results[name]["ops_per_sec"], "-", "new"))
+            continue
+        before = base_results[name]["ops_per_sec"]
+        after = current_results[name]["ops_per_sec"]
+        change = (after - before) / before * 100
+        verdict = "ok"
+        if change < -threshold:
+            verdict = "REGRESSION"
+            regressions.append(name)
+        rows.append((name, before, after, f"{change:+.1f}%", verdict))
+    return rows, regressions
+
+
+def _report(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Print a comparison and return the process exit status."""
+    rows, regressions = compare(baseline, current, threshold)
+    print_table(("benchmark", "baseline ops/sec", "ops/sec", "change", ""), rows)
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than {threshold:g}%.",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run or compare benchmark results.
+
+    Args:
+        argv: Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+        The process exit status: 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--output", "-o", help="write the JSON results to this file")
+    run.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--filter", help="only run benchmarks containing this text")
+    run.add_argument("--baseline", help="compare against this results file")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.add_argument("--list", action="store_true", help="list benchmark names")
+
+    check = commands.add_parser("compare", help="compare two results files")
+    check.add_argument("baseline")
+    check.add_argument("current")
+    check.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="largest allowed throughput drop in percent (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _report(
+            load_results(args.baseline), load_results(args.current), args.threshold
+        )
+
+    if args.list:
+        print("\n".join(benchmark_names()))
+        return 0
+    baseline = load_results(args.baseline) if args.baseline else None
+    document = run_suite(args.size, args.repeat, args.filter)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    if baseline is not None:
+        return _report(baseline, document, args.threshold)
+    print_table(
+        ("benchmark", "ops/sec"),
+        [(name, result["ops_per_sec"]) for name, result in document["results"].items()],
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
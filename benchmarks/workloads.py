@@ -0,0 +1,154 @@
+"""Reproducible synthetic workloads for the calculator benchmarks.
+
+Every generator is seeded, so the same arguments always produce the same
+data and results from different runs are comparable.
+"""
+
+import random
+from typing import List, Tuple
+
+# clean: every line is valid and no divisor is zero.
+# dirty: 30% of lines fail validation (bad numbers, operations, field counts).
+# zero: half of the lines divide by zero.
+WORKLOADS = ("clean", "dirty", "zero")
+
+DIRTY_RATE = 0.3
+ZERO_RATE = 0.5
+
+_DIRTY_LINES = ("+ 1 abc", "^ 2 3", "* 4", "/ 1e 2", "- 5 6 7", "add 1 2")
+_DIRTY_NUMBERS = ("abc", "1,000", "5..5", "", "--5", "$5")
+
+
+def _check(workload: str) -> None:
+    """Reject unknown workload names."""
+    if workload not in WORKLOADS:
+        raise ValueError(
+            f"Unknown workload: {workload}. Expected one of: {', '.join(WORKLOADS)}"
+        )
+
+
+def generate_triples(
+    count: int, workload: str = "clean", seed: int = 42
+) -> List[Tuple[str, float, float]]:
+    """
+    Generate (operation, first number, second number) calculations.
+
+    ``dirty`` has no invalid triples, so it produces the same data as
+    ``clean``.
+
+    Args:
+        count: Number of triples.
+        workload: One of WORKLOADS.
+        seed: Random seed.
+
+    Returns:
+        The triples.
+
+    Raises:
+        ValueError: If the workload is unknown.
+    """
+    _check(workload)
+    rng = random.Random(seed)
+    triples = []
+    for _ in range(count):
+        if workload == "zero" and rng.random() < ZERO_RATE:
+            triples.append(("/", rng.uniform(-1e6, 1e6), 0.0))
+        else:
+            triples.append(
+                (
+                    rng.choice("+-*/"),
+                    rng.uniform(-1e6, 1e6),
+                    float(rng.randint(1, 1000)),
+                )
+            )
+    return triples
+
+
+def generate_numbers(count: int, workload: str = "clean", seed: int = 42) -> List[str]:
+    """
+    Generate number strings as a user or input file would supply them.
+
+    Args:
+        count: Number of strings.
+        workload: One of WORKLOADS; ``dirty`` mixes in invalid strings.
+        seed: Random seed.
+
+    Returns:
+        The number strings.
+
+    Raises:
+        ValueError: If the workload is unknown.
+    """
+    _check(workload)
+    rng = random.Random(seed)
+    forms = ("{:.6g}", " {:.3f} ", "{:e}", "{:.0f}")
+    numbers = []
+    for _ in range(count):
+        if workload == "dirty" and rng.random() < DIRTY_RATE:
+            numbers.append(rng.choice(_DIRTY_NUMBERS))
+        elif workload == "zero" and rng.random() < ZERO_RATE:
+            numbers.append("0")
+        else:
+            numbers.append(rng.choice(forms).format(rng.uniform(-1e6, 1e6)))
+    return numbers
+
+
+def generate_lines(count: int, workload: str = "clean", seed: int = 42) -> List[str]:
+    """
+    Generate ``<operation> <number> <number>`` batch lines.
+
+    Args:
+        count: Number of lines.
+        workload: One of WORKLOADS.
+        seed: Random seed.
+
+    Returns:
+        The lines, each with a trailing newline.
+
+    Raises:
+        ValueError: If the workload is unknown.
+    """
+    _check(workload)
+    rng = random.Random(seed)
+    lines = []
+    for operation, a, b in generate_triples(count, "clean", seed):
+        if workload == "dirty" and rng.random() < DIRTY_RATE:
+            lines.append(rng.choice(_DIRTY_LINES) + "\n")
+        elif workload == "zero" and rng.random() < ZERO_RATE:
+            lines.append(f"/ {a:.6g} 0\n")
+        else:
+            lines.append(f"{operation} {a:.6g} {b:.0f}\n")
+    return lines
+
+
+def generate_answers(count: int, workload: str = "clean", seed: int = 42) -> List[str]:
+    """
+    Generate REPL answers for count calculations.
+
+    Each calculation takes an operation and two numbers. The ``dirty``
+    workload sometimes puts a rejected answer first, so the REPL has to
+    prompt again.
+
+    Args:
+        count: Number of calculations.
+        workload: One of WORKLOADS.
+        seed: Random seed.
+
+    Returns:
+        The answers in prompt order.
+
+    Raises:
+        ValueError: If the workload is unknown.
+    """
+    _check(workload)
+    rng = random.Random(seed)
+    answers = []
+    for operation, a, b in generate_triples(count, workload, seed):
+        if workload == "dirty" and rng.random() < DIRTY_RATE:
+            answers.append(rng.choice(("^", "add", "")))
+        answers.append(operation)
+        if workload == "dirty" and rng.random() < DIRTY_RATE:
+            answers.append(rng.choice(_DIRTY_NUMBERS))
+        answers.append(f"{a:.6g}")
+        answers.append(f"{b:.0f}")
+    return answers
@@ -0,0 +1,176 @@
+"""Non-interactive streaming batch mode for the calculator application."""
+
+import io
+import sys
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, Optional, Tuple
+
+from .evaluation import ZERO_POLICIES, evaluate_line_with_error, status_message
+from .exceptions import CalculatorError, DivisionByZeroError
+from .operations import Operations
+from .validator import Validator
+from .vectorized import zero_fill
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+
+
+def read_lines(stream: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Yield the non-blank lines of a stream with their 1-based line numbers.
+
+    Args:
+        stream: A text stream or any iterable of lines.
+
+    Yields:
+        Tuples of (line number, line text).
+    """
+    for line_number, line in enumerate(stream, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def parse_line(
+    line: str, backend: Optional["NumericBackend"] = None
+) -> Tuple[str, float, float]:
+    """
+    Parse and validate a batch line such as ``+ 3 4``.
+
+    Args:
+        line: The raw input line.
+        backend: The numeric backend to parse operands with, float if omitted.
+
+    Returns:
+        The validated (operation, first number, second number) triple.
+
+    Raises:
+        InvalidLineError: If the line does not have exactly three fields.
+        InvalidOperationError: If the operation is not supported.
+        InvalidNumberError: If an operand is not a valid number.
+    """
+    return Validator.validate_line(line, backend)
+
+
+def format_error(line_number: int, message: str) -> str:
+    """
+    Format the output line reported for a failed input line.
+
+    Args:
+        line_number: The 1-based input line number.
+        message: The error message.
+
+    Returns:
+        The output line, including its trailing newline.
+    """
+    return f"Error: line {line_number}: {message}\n"
+
+
+def evaluate_lines(
+    lines: Iterable[Tuple[int, str]],
+    operations: Optional[Operations] = None,
+    on_zero: str = "error",
+) -> Iterator[str]:
+    """
+    Evaluate numbered batch lines into output lines.
+
+    Without a custom operations implementation, lines are evaluated by the
+    non-raising evaluate_line, which never builds an exception. Otherwise
+    operands are parsed with the implementation's numeric backend.
+
+    Args:
+        lines: Tuples of (line number, line text), as from read_lines.
+        operations: The operations implementation to calculate with.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Yields:
+        One output line per input line: the result, or an error message
+        carrying the input line number.
+
+    Raises:
+        ValueError: If on_zero is not supported.
+    """
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+
+    if operations is None:
+        for line_number, line in lines:
+            status, value, error = evaluate_line_with_error(line, on_zero)
+            if status:
+                yield format_error(line_number, status_message(status, line, error))
+            else:
+                yield f"{value}\n"
+        return
+
+    calculate = operations.calculate
+    backend = operations.backend
+    for line_number, line in lines:
+        try:
+            operation, first_num, second_num = parse_line(line, backend)
+            yield f"{calculate(operation, first_num, second_num)}\n"
+        except DivisionByZeroError as e:
+            if on_zero == "error":
+                yield format_error(line_number, str(e))
+            else:
+                yield f"{zero_fill(first_num, second_num, on_zero)}\n"
+        except CalculatorError as e:
+            yield format_error(line_number, str(e))
+
+
+def run_batch(
+    source: IO[str],
+    output: IO[str],
+    operations: Optional[Operations] = None,
+    on_zero: str = "error",
+) -> None:
+    """
+    Stream every line of source through the calculator into output.
+
+    Lines are processed one at a time, so memory use does not depend on
+    the size of the input.
+
+    Args:
+        source: The input text stream.
+        output: The stream results are written to.
+        operations: The operations implementation to calculate with.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+    """
+    output.writelines(evaluate_lines(read_lines(source), operations, on_zero))
+    output.flush()
+
+
+def run_batch_path(
+    path: str,
+    output: Optional[IO[str]] = None,
+    operations: Optional[Operations] = None,
+    on_zero: str = "error",
+) -> None:
+    """
+    Run batch mode over a file path, or standard input for ``-``.
+
+    Bytes of the file or standard input that are not valid UTF-8 are
+    replaced with U+FFFD, as the --workers and --cluster paths decode them,
+    so the line reports an invalid number or operation instead of the run
+    failing.
+
+    Args:
+        path: The input file path, or ``-`` for standard input.
+        output: The output stream, standard output by default.
+        operations: The operations implementation to calculate with.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Raises:
+        OSError: If the input file cannot be opened.
+    """
+    output = output or sys.stdout
+    if path == "-":
+        if not isinstance(sys.stdin, io.TextIOWrapper):
+            run_batch(sys.stdin, output, operations, on_zero)
+            return
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+        try:
+            run_batch(source, output, operations, on_zero)
+        finally:
+            # Leave standard input's binary stream open for sys.stdin.
+            source.detach()
+        return
+    with open(path, encoding="utf-8", errors="replace") as source:
+        run_batch(source, output, operations, on_zero)
@@ -0,0 +1,252 @@
+"""Binary operand/result file format with memory-mapped, zero-copy reading.
+
+An operand file is a 16-byte header followed by fixed-width records::
+
+    header:  8 bytes  magic b"CALCREC1"
+             8 bytes  record count, unsigned little-endian
+    record:  1 byte   opcode (0 '+', 1 '-', 2 '*', 3 '/')
+             7 bytes  padding (zero)
+             8 bytes  first operand, float64 little-endian
+             8 bytes  second operand, float64 little-endian
+
+Records are 24 bytes so every operand is 8-byte aligned, which lets the
+whole record area be viewed as float64 values without copying. A result
+file is a plain sequence of float64 little-endian values, one per record;
+records that fail (division by zero, unknown opcode) store NaN, and an
+optional status file holds one status byte per record.
+"""
+
+import math
+import mmap
+import operator
+import struct
+import sys
+from array import array
+from typing import IO, Any, Iterable, List, Optional, Tuple
+
+from .batch import parse_line, read_lines
+from .exceptions import CalculatorError, InvalidBinaryFileError
+from .registry import OPERATION_SYMBOLS, builtin_opcode
+from .vectorized import KERNELS, load_numpy
+
+MAGIC = b"CALCREC1"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<B7xdd")
+HEADER_SIZE = HEADER.size
+RECORD_SIZE = RECORD.size
+
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_INVALID_OPCODE = 2
+
+# Records processed per block by the pure-Python backend.
+BLOCK_RECORDS = 65536
+
+
+def encode_text(source: Iterable[str], destination: IO[bytes]) -> List[Tuple[int, str]]:
+    """
+    Convert ``<operation> <number> <number>`` text lines to binary records.
+
+    Args:
+        source: The text lines.
+        destination: A seekable binary stream to write the file to.
+
+    Returns:
+        The (line number, message) of every line that failed validation,
+        or uses a plugin operation the format has no opcode for, and was
+        left out.
+    """
+    errors = []
+    count = 0
+    destination.write(HEADER.pack(MAGIC, 0))
+    for line_number, line in read_lines(source):
+        try:
+            operation, first_num, second_num = parse_line(line)
+            opcode = builtin_opcode(operation)
+        except (CalculatorError, ValueError) as e:
+            errors.append((line_number, str(e)))
+            continue
+        destination.write(RECORD.pack(opcode, first_num, second_num))
+        count += 1
+    destination.seek(0)
+    destination.write(HEADER.pack(MAGIC, count))
+    destination.seek(0, 2)
+    return errors
+
+
+def _map_records(path: str, handle: IO[bytes]) -> Tuple[mmap.mmap, int]:
+    """Memory-map an operand file and validate its header."""
+    try:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        raise InvalidBinaryFileError(path, "File is empty.")
+    if len(mapped) < HEADER_SIZE:
+        mapped.close()
+        raise InvalidBinaryFileError(path, "File is shorter than the header.")
+    magic, count = HEADER.unpack_from(mapped)
+    if magic != MAGIC:
+        mapped.close()
+        raise InvalidBinaryFileError(path, "Bad magic number.")
+    if len(mapped) != HEADER_SIZE + count * RECORD_SIZE:
+        mapped.close()
+        raise InvalidBinaryFileError(
+            path, f"Expected {count} records of {RECORD_SIZE} bytes."
+        )
+    return mapped, count
+
+
+def decode_to_text(path: str, output: IO[str]) -> int:
+    """
+    Convert a binary operand file back to text lines.
+
+    Args:
+        path: The operand file path.
+        output: The text stream to write lines to.
+
+    Returns:
+        The number of records written.
+
+    Raises:
+        InvalidBinaryFileError: If the file is malformed.
+    """
+    with open(path, "rb") as handle:
+        mapped, count = _map_records(path, handle)
+        with mapped:
+            for opcode, first_num, second_num in RECORD.iter_unpack(
+                memoryview(mapped)[HEADER_SIZE:]
+            ):
+                symbol = (
+                    OPERATION_SYMBOLS[opcode]
+                    if opcode < len(OPERATION_SYMBOLS)
+                    else f"#{opcode}"
+                )
+                output.write(f"{symbol} {first_num!r} {second_num!r}\n")
+    return count
+
+
+def _byteswapped(view: "memoryview[float]") -> "array[float]":
+    """Copy float64 values into an ``array('d')`` with their bytes reversed."""
+    values = array("d")
+    values.frombytes(view.tobytes())
+    values.byteswap()
+    return values
+
+
+def _run_python(
+    records: memoryview, count: int, results: IO[bytes], status: bytearray
+) -> None:
+    """Evaluate records block by block through zero-copy memoryviews."""
+    doubles = records.cast("d")
+    opcodes = records[::RECORD_SIZE]
+    first = doubles[1::3]
+    second = doubles[2::3]
+    nan = math.nan
+    functions = KERNELS
+    # The views read native doubles, but the file is little-endian: on a
+    # big-endian host each block is byte-swapped in, and its results out.
+    swap = sys.byteorder != "little"
+
+    for start in range(0, count, BLOCK_RECORDS):
+        stop = min(start + BLOCK_RECORDS, count)
+        xs: Iterable[float] = first[start:stop]
+        ys: Iterable[float] = second[start:stop]
+        if swap:
+            xs = _byteswapped(first[start:stop])
+            ys = _byteswapped(second[start:stop])
+        values = array("d")
+        append = values.append
+        for index, opcode, x, y in zip(range(start, stop), opcodes[start:stop], xs, ys):
+            try:
+                append(functions[opcode](x, y))
+            except ZeroDivisionError:
+                append(nan)
+                status[index] = STATUS_DIVISION_BY_ZERO
+            except IndexError:
+                append(nan)
+                status[index] = STATUS_INVALID_OPCODE
+        if swap:
+            values.byteswap()
+        values.tofile(results)
+
+
+def _run_numpy(
+    np: Any, mapped: mmap.mmap, count: int, results: IO[bytes], status: bytearray
+) -> None:
+    """Evaluate every record at once on a zero-copy NumPy view."""
+    dtype = np.dtype([("op", "u1"), ("pad", "V7"), ("a", "<f8"), ("b", "<f8")])
+    records = np.frombuffer(mapped, dtype=dtype, count=count, offset=HEADER_SIZE)
+    opcodes, first, second = records["op"], records["a"], records["b"]
+
+    values = np.full(count, np.nan)
+    codes = np.frombuffer(status, dtype=np.uint8)
+    codes[opcodes >= len(OPERATION_SYMBOLS)] = STATUS_INVALID_OPCODE
+    with np.errstate(invalid="ignore", over="ignore"):
+        for opcode, function in enumerate(KERNELS):
+            selected = opcodes == opcode
+            if function is operator.truediv:
+                zero = selected & (second == 0)
+                codes[zero] = STATUS_DIVISION_BY_ZERO
+                selected &= ~zero
+            values[selected] = function(first[selected], second[selected])
+    results.write(values.astype("<f8").tobytes())
+
+
+def run_binary(
+    path: str,
+    results: IO[bytes],
+    status: Optional[IO[bytes]] = None,
+    backend: str = "auto",
+) -> int:
+    """
+    Evaluate a binary operand file into a parallel float64 result file.
+
+    Args:
+        path: The operand file path.
+        results: Binary stream receiving one float64 per record.
+        status: Optional binary stream receiving one status byte per record.
+        backend: ``python``, ``numpy`` or ``auto`` (NumPy when installed).
+
+    Returns:
+        The number of records that failed.
+
+    Raises:
+        InvalidBinaryFileError: If the file is malformed.
+        ValueError: If the backend is not supported.
+    """
+    if backend not in ("auto", "python", "numpy"):
+        raise ValueError(f"Unsupported backend: {backend}")
+    np = load_numpy() if backend != "python" else None
+    if backend == "numpy" and np is None:
+        raise ValueError("The numpy backend requires NumPy to be installed.")
+
+    with open(path, "rb") as handle:
+        mapped, count = _map_records(path, handle)
+        with mapped:
+            codes = bytearray(count)
+            if np is not None:
+                _run_numpy(np, mapped, count, results, codes)
+            else:
+                with memoryview(mapped) as view:
+                    with view[HEADER_SIZE:] as records:
+                        _run_python(records, count, results, codes)
+    if status is not None:
+        status.write(codes)
+    return count - codes.count(STATUS_OK)
+
+
+def read_results(path: str) -> "array[float]":
+    """
+    Load a float64 result file.
+
+    Args:
+        path: The result file path.
+
+    Returns:
+        The results as an ``array('d')``.
+    """
+    values = array("d")
+    with open(path, "rb") as handle:
+        values.frombytes(handle.read())
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        values.byteswap()
+    return values
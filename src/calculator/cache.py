@@ -0,0 +1,235 @@
+"""Memoizing result cache in front of Operations.calculate."""
+
+import sys
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, Optional, Protocol, Tuple, Union
+
+from .exceptions import DivisionByZeroError
+from .operations import Operations
+
+COMMUTATIVE_OPERATIONS = frozenset({"+", "*"})
+
+# Approximate per-entry bookkeeping of an OrderedDict: the hash table slot
+# plus the linked-list node that tracks recency.
+_ENTRY_OVERHEAD = 104
+
+CacheKey = Tuple[str, type, Any, type, Any]
+CacheValue = Union[float, DivisionByZeroError]
+
+
+class ResultStore(Protocol):
+    """Where CachedOperations keeps outcomes: a ResultCache or PersistentCache."""
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        """Look up an outcome, None on a miss."""
+
+    def put(self, key: CacheKey, value: CacheValue) -> None:
+        """Store an outcome."""
+
+    def format_stats(self) -> str:
+        """Format the store's statistics for display."""
+
+
+class ResultCache:
+    """LRU cache of calculation outcomes bounded by entries and bytes."""
+
+    def __init__(self, maxsize: int = 4096, max_bytes: Optional[int] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached outcomes.
+            max_bytes: Optional bound on the estimated memory footprint.
+
+        Raises:
+            ValueError: If maxsize or max_bytes is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.memory_bytes = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[CacheValue, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached outcomes."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def make_key(operation: str, a: Any, b: Any) -> CacheKey:
+        """
+        Build the canonical key of a calculation.
+
+        Operands of commutative operations are ordered so that ``+ 3 4`` and
+        ``+ 4 3`` share an entry. Operand types are part of the key so that
+        ``3`` and ``3.0`` never share a result, and Decimal operands are
+        keyed by their text, since ``Decimal('6')`` and ``Decimal('6.0')``
+        are equal but give differently written results.
+
+        Args:
+            operation: The operation symbol.
+            a: First operand.
+            b: Second operand.
+
+        Returns:
+            The cache key.
+        """
+        if operation in COMMUTATIVE_OPERATIONS and b < a:
+            a, b = b, a
+        if a.__class__ is Decimal or b.__class__ is Decimal:
+            return (operation, type(a), str(a), type(b), str(b))
+        return (operation, type(a), a, type(b), b)
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        """
+        Look up an outcome and mark it as most recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached result or exception, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: CacheKey, value: CacheValue) -> None:
+        """
+        Store an outcome, evicting least recently used entries as needed.
+
+        Args:
+            key: The cache key.
+            value: The result, or a DivisionByZeroError like the one raised.
+        """
+        size = (
+            _ENTRY_OVERHEAD
+            + sys.getsizeof(key)
+            + sys.getsizeof(key[2])
+            + sys.getsizeof(key[4])
+            + sys.getsizeof(value)
+        )
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.memory_bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self.memory_bytes += size
+
+        while len(self._entries) > self.maxsize or (
+            self.max_bytes is not None
+            and self.memory_bytes > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.memory_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.memory_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Summarize cache effectiveness.
+
+        Returns:
+            Entries, hits, misses, hit rate, evictions and memory footprint.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "memory_bytes": self.memory_bytes,
+        }
+
+    def format_stats(self) -> str:
+        """
+        Format the cache statistics for display.
+
+        Returns:
+            A one-line human-readable summary.
+        """
+        return (
+            f"Cache: {len(self._entries)} entries, {self.hits} hits, "
+            f"{self.misses} misses, hit rate {self.hit_rate:.1%}, "
+            f"{self.evictions} evictions, {self.memory_bytes} bytes"
+        )
+
+
+class CachedOperations(Operations):
+    """Operations whose calculate results are memoized in a ResultStore."""
+
+    def __init__(
+        self, cache: Optional[ResultStore] = None, inner: Optional[Operations] = None
+    ) -> None:
+        """
+        Initialize the cached operations.
+
+        Args:
+            cache: The result store to use, a default ResultCache if omitted.
+            inner: The operations implementation computing cache misses,
+                such as a NumericOperations; plain Operations by default.
+        """
+        self.cache = cache if cache is not None else ResultCache()
+        self._calculate = Operations.calculate if inner is None else inner.calculate
+        self.backend = None if inner is None else inner.backend
+
+    def calculate(self, operation: str, a: float, b: float) -> float:  # type: ignore[override]
+        """
+        Perform the specified operation, reusing cached outcomes.
+
+        Division-by-zero outcomes are cached too, so a repeated bad input
+        skips the calculation. Only the error's type and message are
+        stored, in an exception that is never raised: each hit raises a
+        fresh one, so no traceback or frames are kept and no exception
+        object is shared between threads.
+        Calculations involving NaN or a zero (other than a zero divisor)
+        bypass the cache because equal keys could hide the sign of zero.
+
+        Args:
+            operation: The operation to perform (+, -, *, /).
+            a: First number.
+            b: Second number.
+
+        Returns:
+            The result of the calculation.
+
+        Raises:
+            DivisionByZeroError: If dividing by zero.
+            ValueError: If operation is not supported.
+        """
+        if a != a or b != b or not a or (not b and operation != "/"):
+            return self._calculate(operation, a, b)
+
+        cache = self.cache
+        key = ResultCache.make_key(operation, a, b)
+        value = cache.get(key)
+        if value is None:
+            try:
+                value = self._calculate(operation, a, b)
+            except DivisionByZeroError as e:
+                value = type(e)(e.message)
+            cache.put(key, value)
+
+        if isinstance(value, DivisionByZeroError):
+            raise type(value)(value.message)
+        return value
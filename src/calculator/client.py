@@ -0,0 +1,168 @@
+"""One-shot client for the resident calculator daemon (calculator eval).
+
+Kept free of asyncio and the server so a client invocation starts fast.
+"""
+
+import os
+import socket
+import stat
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Optional
+
+from .operations import Operations
+from .protocol import handle_request
+
+if TYPE_CHECKING:  # pragma: no cover
+    import subprocess
+
+SOCKET_ENV = "CALCULATOR_SOCKET"
+
+# How long a client waits for an auto-started daemon to accept connections.
+STARTUP_TIMEOUT = 2.0
+REQUEST_TIMEOUT = 5.0
+
+
+def default_socket_path() -> str:
+    """
+    Return the per-user daemon socket path.
+
+    Returns:
+        ``$CALCULATOR_SOCKET`` if set, otherwise ``calculator.sock`` in
+        ``$XDG_RUNTIME_DIR``, otherwise ``daemon.sock`` in a per-user
+        ``calculator-<uid>`` directory of the temporary directory, which
+        the daemon creates readable by the user only.
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return configured
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "calculator.sock")
+    user = getattr(os, "getuid", lambda: "user")()
+    return os.path.join(tempfile.gettempdir(), f"calculator-{user}", "daemon.sock")
+
+
+def check_socket_path(path: str) -> None:
+    """
+    Check that no other user controls the daemon socket path.
+
+    The socket's directory must belong to the user or to root, and be
+    sticky if others may write to it, so nobody else can swap the socket.
+    An existing socket must belong to the user, so the client never talks
+    to a server another user started there and the daemon never removes
+    their file. A missing directory or socket passes.
+
+    Args:
+        path: The Unix domain socket path.
+
+    Raises:
+        PermissionError: If the directory or the socket is another user's.
+    """
+    user = os.getuid()
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        info = os.stat(directory)
+    except FileNotFoundError:
+        return
+    shared = info.st_mode & 0o022 and not info.st_mode & stat.S_ISVTX
+    if info.st_uid not in (user, 0) or shared:
+        raise PermissionError(f"Unsafe daemon socket directory: {directory}")
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if info.st_uid != user:
+        raise PermissionError(f"Daemon socket belongs to another user: {path}")
+
+
+def request_daemon(line: str, path: str, timeout: float = REQUEST_TIMEOUT) -> str:
+    """
+    Send one request to the daemon and wait for its response line.
+
+    Args:
+        line: The request line, without a trailing newline.
+        path: The Unix domain socket path.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        The response line.
+
+    Raises:
+        OSError: If the daemon is unreachable or closes without answering.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(line.encode() + b"\n")
+        with sock.makefile("r", encoding="utf-8") as stream:
+            response = stream.readline()
+    if not response:
+        raise ConnectionError("The daemon closed the connection.")
+    return response
+
+
+def start_daemon(path: str) -> "subprocess.Popen[bytes]":
+    """
+    Launch a detached daemon process serving path.
+
+    Args:
+        path: The Unix domain socket path.
+
+    Returns:
+        The daemon process handle.
+    """
+    import subprocess
+
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.calculator.main", "daemon", "--socket", path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def evaluate(line: str, path: Optional[str] = None, use_daemon: bool = True) -> str:
+    """
+    Evaluate a request through the daemon, starting it when needed.
+
+    Falls back to in-process evaluation when Unix sockets are unavailable,
+    the socket path is not safe to use (see check_socket_path), or the
+    daemon cannot be reached. A daemon that exits while starting is not
+    waited for.
+
+    Args:
+        line: The request line, such as ``+ 3 4``.
+        path: The daemon socket path, default_socket_path() if omitted.
+        use_daemon: False to always evaluate in-process.
+
+    Returns:
+        The protocol response line (``OK <result>`` or ``ERR <message>``).
+    """
+    if use_daemon and hasattr(socket, "AF_UNIX"):
+        path = path or default_socket_path()
+        try:
+            check_socket_path(path)
+            return request_daemon(line, path)
+        except PermissionError:
+            return handle_request(line, Operations.calculate)
+        except OSError:
+            pass
+        try:
+            process = start_daemon(path)
+            deadline = time.monotonic() + STARTUP_TIMEOUT
+            while time.monotonic() < deadline:
+                # Checked first, so a daemon that exits because another
+                # one just took the socket still gets one more request.
+                exited = process.poll() is not None
+                try:
+                    return request_daemon(line, path)
+                except OSError:
+                    if exited:
+                        break
+                    time.sleep(0.01)
+        except OSError:
+            pass
+    return handle_request(line, Operations.calculate)
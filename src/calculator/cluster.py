@@ -0,0 +1,435 @@
+"""Batch evaluation distributed across worker processes over TCP.
+
+``calculator worker`` starts a worker; ``calculator --batch FILE --cluster
+HOST:PORT,...`` is the coordinator. The coordinator splits the file into
+line-aligned chunks (see parallel.split_ranges), sends them to the
+workers and writes the results in input order, exactly as a serial
+``--batch`` run would. Workers never open the file: every chunk travels
+with its request, so they may run on other hosts.
+
+Every message is a frame: a FRAME header (kind, division-by-zero policy,
+the chunk's first line number and the payload length) followed by the
+payload. A TASK payload is the chunk's raw lines. The worker evaluates
+them with batch.evaluate_lines and answers with a RESULT frame echoing
+the line number, whose payload is the chunk's output text with errors
+already numbered. Each connection has one chunk in flight.
+
+A worker whose connection fails, which sends a malformed frame, or which
+does not answer within the timeout is dropped, and its chunk is sent to
+another worker. The run fails with ClusterError if a chunk fails on
+``attempts`` workers or no worker is left.
+"""
+
+import asyncio
+import heapq
+import signal
+import struct
+import sys
+from typing import IO, Dict, List, Optional, Sequence, Tuple
+
+from .batch import evaluate_lines
+from .defaults import (
+    DEFAULT_CHUNK_ATTEMPTS,
+    DEFAULT_CHUNK_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_WORKER_PORT,
+    ZERO_POLICIES,
+)
+from .exceptions import ClusterError
+from .operations import Operations
+from .parallel import DEFAULT_CHUNK_BYTES, split_ranges
+from .server import CalculatorServer
+
+Address = Tuple[str, int]
+
+# Frame header: kind, division-by-zero policy (an index into
+# ZERO_POLICIES), first line number of the chunk, payload length.
+FRAME = struct.Struct("!BBQI")
+TASK = 1
+RESULT = 2
+
+# Longest accepted frame payload; longer frames close the connection.
+MAX_FRAME_BYTES = 1 << 30
+
+
+def parse_address(text: str) -> Address:
+    """
+    Parse a worker address such as ``10.0.0.2:7879`` or ``[::1]:7879``.
+
+    Args:
+        text: The address.
+
+    Returns:
+        The (host, port) pair.
+
+    Raises:
+        ValueError: If text is not HOST:PORT with a port from 1 to 65535.
+    """
+    host, _, port = text.strip().rpartition(":")
+    host = host.strip("[]")
+    if not host or not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid worker address: {text!r}. Expected HOST:PORT.")
+    return host, int(port)
+
+
+def count_lines(data: bytes) -> int:
+    """Count the lines of a chunk as ``bytes.splitlines`` splits them."""
+    breaks = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    return breaks + (data[-1:] not in (b"", b"\n", b"\r"))
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, int, int, bytes]:
+    """
+    Read one frame.
+
+    Args:
+        reader: The connection to read from.
+
+    Returns:
+        The kind, policy, line number and payload of the frame.
+
+    Raises:
+        asyncio.IncompleteReadError: If the connection closes first.
+        ValueError: If the payload is longer than MAX_FRAME_BYTES.
+    """
+    kind, policy, number, length = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame of {length} bytes is too long.")
+    return kind, policy, number, await reader.readexactly(length)
+
+
+def write_frame(
+    writer: asyncio.StreamWriter, kind: int, policy: int, number: int, payload: bytes
+) -> None:
+    """Queue one frame for writing."""
+    writer.writelines([FRAME.pack(kind, policy, number, len(payload)), payload])
+
+
+def evaluate_task(
+    payload: bytes, first_line: int, operations: Optional[Operations], on_zero: str
+) -> bytes:
+    """
+    Evaluate the lines of a TASK payload into the output text of a RESULT.
+
+    Args:
+        payload: The chunk's raw lines.
+        first_line: The line number of the chunk's first line.
+        operations: The operations implementation to calculate with.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Returns:
+        The chunk's output lines, UTF-8 encoded.
+    """
+    lines = enumerate(
+        (raw.decode("utf-8", "replace") for raw in payload.splitlines()), first_line
+    )
+    numbered = ((number, line) for number, line in lines if line.strip())
+    return "".join(evaluate_lines(numbered, operations, on_zero)).encode()
+
+
+class WorkerServer(CalculatorServer):
+    """Evaluates the batch chunks coordinators send, one at a time per connection."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_WORKER_PORT,
+        operations: Optional[Operations] = None,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            host: The interface to listen on.
+            port: The TCP port, or 0 to pick a free one.
+            operations: The operations implementation to calculate with;
+                without one, lines are evaluated by the non-raising path.
+            shutdown_timeout: Seconds to wait for connections to close on
+                shutdown.
+        """
+        super().__init__(host, port, operations, shutdown_timeout)
+        self.batch_operations = operations
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer TASK frames until the coordinator disconnects or misbehaves."""
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        try:
+            while True:
+                kind, policy, first_line, payload = await read_frame(reader)
+                if kind != TASK or policy >= len(ZERO_POLICIES):
+                    break
+                output = evaluate_task(
+                    payload, first_line, self.batch_operations, ZERO_POLICIES[policy]
+                )
+                write_frame(writer, RESULT, policy, first_line, output)
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError, EOFError, ValueError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+
+class _Job:
+    """The chunks of one coordinator run and how far each has got."""
+
+    def __init__(
+        self, path: str, ranges: List[Tuple[int, int]], workers: int, attempts: int
+    ) -> None:
+        self.handle = open(path, "rb")
+        self.ranges = ranges
+        self.workers = workers
+        self.attempts = attempts
+        # Chunks are read in order the first time, so the first line number
+        # of each is known by the time it is sent.
+        self.first_lines = [1]
+        self.failures: Dict[int, int] = {}
+        # Chunks to send again, a heap so the earliest (which the output
+        # is most likely waiting for) goes first.
+        self.retry: List[int] = []
+        self.results: Dict[int, str] = {}
+        self.written = 0
+        self.error: Optional[ClusterError] = None
+        # At most two chunks per worker are read but not yet written.
+        self.ahead = 2 * workers
+        self.changed = asyncio.Condition()
+
+    @property
+    def next_chunk(self) -> int:
+        """The index of the first chunk not read yet."""
+        return len(self.first_lines) - 1
+
+    def _ready(self) -> bool:
+        """Whether take has a chunk to return, or will never have one."""
+        if self.error is not None or self.retry:
+            return True
+        if self.written + len(self.results) == len(self.ranges):
+            return True
+        return self.next_chunk < min(len(self.ranges), self.written + self.ahead)
+
+    async def take(self) -> Optional[Tuple[int, int, bytes]]:
+        """Wait for a chunk to send; None once there is nothing left to do."""
+        async with self.changed:
+            await self.changed.wait_for(self._ready)
+            index: Optional[int] = None
+            if self.error is None:
+                if self.retry:
+                    index = heapq.heappop(self.retry)
+                elif self.next_chunk < len(self.ranges):
+                    index = self.next_chunk
+            if index is None:
+                return None
+            start, end = self.ranges[index]
+            self.handle.seek(start)
+            data = self.handle.read(end - start)
+            if index == self.next_chunk:
+                self.first_lines.append(self.first_lines[index] + count_lines(data))
+            return index, self.first_lines[index], data
+
+    async def finish(self, index: int, output: str) -> None:
+        """Store the output of a chunk."""
+        async with self.changed:
+            self.results[index] = output
+            self.changed.notify_all()
+
+    async def lose(self, address: Address, index: Optional[int], error: str) -> None:
+        """Drop a failed worker, sending the chunk it had to another one."""
+        async with self.changed:
+            self.workers -= 1
+            reason = f"worker {address[0]}:{address[1]}: {error}"
+            if index is not None:
+                self.failures[index] = self.failures.get(index, 0) + 1
+                if self.failures[index] >= self.attempts:
+                    self.error = ClusterError(
+                        f"Lines from {self.first_lines[index]} failed on "
+                        f"{self.attempts} workers; last {reason}"
+                    )
+                else:
+                    heapq.heappush(self.retry, index)
+            done = self.written + len(self.results) == len(self.ranges)
+            if not self.workers and not done and self.error is None:
+                self.error = ClusterError(f"No worker is left; last {reason}")
+            self.changed.notify_all()
+
+
+class Coordinator:
+    """Sends the chunks of batch files to workers and merges their results."""
+
+    def __init__(
+        self,
+        addresses: Sequence[Address],
+        on_zero: str = "error",
+        attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+        timeout: Optional[float] = DEFAULT_CHUNK_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the coordinator.
+
+        Args:
+            addresses: The (host, port) of each worker.
+            on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+            attempts: Workers a chunk is tried on before the run fails.
+            timeout: Seconds a worker may take to connect or to answer one
+                chunk, or None to wait indefinitely.
+
+        Raises:
+            ValueError: If there are no addresses, attempts or timeout is
+                not positive, or on_zero is not supported.
+        """
+        if not addresses:
+            raise ValueError("At least one worker address is required.")
+        if attempts <= 0:
+            raise ValueError("attempts must be a positive integer.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive.")
+        if on_zero not in ZERO_POLICIES:
+            raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+        self.addresses = list(addresses)
+        self.policy = ZERO_POLICIES.index(on_zero)
+        self.attempts = attempts
+        self.timeout = timeout
+
+    async def run(
+        self, path: str, output: IO[str], chunk_bytes: int = DEFAULT_CHUNK_BYTES
+    ) -> None:
+        """
+        Evaluate a batch file on the workers, writing results in input order.
+
+        Args:
+            path: The input file path.
+            output: The stream results are written to.
+            chunk_bytes: Target size of each chunk in bytes.
+
+        Raises:
+            ClusterError: If a chunk failed on ``attempts`` workers, or every
+                worker failed.
+            ValueError: If chunk_bytes is not positive.
+            OSError: If the file cannot be read.
+        """
+        ranges = split_ranges(path, chunk_bytes)
+        job = _Job(path, ranges, len(self.addresses), self.attempts)
+        drivers = [
+            asyncio.ensure_future(self._drive(job, address))
+            for address in self.addresses
+        ]
+        try:
+            while job.written < len(ranges):
+                async with job.changed:
+                    await job.changed.wait_for(
+                        lambda: job.error is not None or job.written in job.results
+                    )
+                    if job.error is not None:
+                        raise job.error
+                    text = job.results.pop(job.written)
+                    job.written += 1
+                    job.changed.notify_all()
+                output.write(text)
+        finally:
+            for driver in drivers:
+                driver.cancel()
+            await asyncio.gather(*drivers, return_exceptions=True)
+            job.handle.close()
+        output.flush()
+
+    async def _drive(self, job: _Job, address: Address) -> None:
+        """Send chunks to one worker until the job is done or the worker fails."""
+        connection: Optional[asyncio.StreamWriter] = None
+        index: Optional[int] = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(*address), self.timeout
+            )
+            connection = writer
+            while True:
+                index = None
+                chunk = await job.take()
+                if chunk is None:
+                    return
+                index, first_line, data = chunk
+                write_frame(writer, TASK, self.policy, first_line, data)
+                await writer.drain()
+                kind, _, number, payload = await asyncio.wait_for(
+                    read_frame(reader), self.timeout
+                )
+                if kind != RESULT or number != first_line:
+                    raise ValueError("Unexpected frame.")
+                await job.finish(index, payload.decode("utf-8"))
+        except asyncio.TimeoutError:
+            await job.lose(address, index, "Timed out.")
+        except (OSError, EOFError, ValueError) as e:
+            await job.lose(address, index, str(e) or type(e).__name__)
+        finally:
+            if connection is not None:
+                connection.close()
+
+
+def run_cluster(
+    path: str,
+    output: IO[str],
+    addresses: Sequence[Address],
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    on_zero: str = "error",
+    attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+    timeout: Optional[float] = DEFAULT_CHUNK_TIMEOUT,
+) -> None:
+    """
+    Evaluate a batch file on workers in a new event loop.
+
+    Args:
+        path: The input file path.
+        output: The stream results are written to.
+        addresses: The (host, port) of each worker.
+        chunk_bytes: Target size of each chunk in bytes.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+        attempts: Workers a chunk is tried on before the run fails.
+        timeout: Seconds a worker may take to connect or to answer one
+            chunk, or None to wait indefinitely.
+
+    Raises:
+        ClusterError: If a chunk failed on ``attempts`` workers, or every
+            worker failed.
+        ValueError: If an argument is not valid.
+        OSError: If the file cannot be read.
+    """
+    coordinator = Coordinator(addresses, on_zero, attempts, timeout)
+    asyncio.run(coordinator.run(path, output, chunk_bytes))
+
+
+async def serve_worker(
+    host: str, port: int, operations: Optional[Operations] = None
+) -> None:
+    """
+    Run a worker until SIGINT or SIGTERM.
+
+    Args:
+        host: The interface to listen on.
+        port: The TCP port, or 0 to pick a free one.
+        operations: The operations implementation to calculate with.
+    """
+    worker = WorkerServer(host, port, operations)
+    await worker.start()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, worker.request_shutdown)
+        except NotImplementedError:  # pragma: no cover - Windows event loops
+            pass
+    print(f"Worker listening on {host}:{worker.port}", file=sys.stderr, flush=True)
+    await worker.serve_until_shutdown()
+
+
+def run_worker(host: str, port: int, operations: Optional[Operations] = None) -> None:
+    """
+    Run a worker in a new event loop.
+
+    Args:
+        host: The interface to listen on.
+        port: The TCP port, or 0 to pick a free one.
+        operations: The operations implementation to calculate with.
+    """
+    asyncio.run(serve_worker(host, port, operations))
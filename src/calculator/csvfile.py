@@ -0,0 +1,297 @@
+"""Formula columns over CSV files.
+
+``calculator csv --expr "price * qty" in.csv out.csv`` appends the value of
+a formula to every row. The formula is compiled once. Rows are streamed
+with the csv module a block at a time: the columns the formula reads are
+parsed into ``array('d')`` buffers, and each of its operations is applied
+to the whole block with Operations.calculate_many. A row with a bad cell
+or a division by zero gets an empty result cell and an error message, and
+the run carries on.
+"""
+
+import csv
+import io
+import math
+import re
+from array import array
+from itertools import islice
+from operator import itemgetter
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .defaults import DEFAULT_CSV_BLOCK_ROWS, ZERO_POLICIES
+from .exceptions import DivisionByZeroError, InvalidColumnError, InvalidNumberError
+from .expression import NEGATE, Name, compile_expression
+from .operations import Operations
+
+_POSITIONAL_NAME = re.compile(r"col([1-9][0-9]*)")
+
+# Characters of the repr of a float, and line-ending characters.
+_FLOAT_CHARACTERS = frozenset("0123456789.+-eEinfa")
+_LINE_END = "\r\n"
+
+
+def resolve_column(name: str, header: Optional[Sequence[str]] = None) -> int:
+    """
+    Find the column a formula name reads.
+
+    A name matching a header title (ignoring surrounding whitespace) reads
+    that column; otherwise ``colN`` reads the Nth column, counting from 1.
+
+    Args:
+        name: The name used in the formula.
+        header: The header row, or None if the file has none.
+
+    Returns:
+        The 0-based column index.
+
+    Raises:
+        InvalidColumnError: If the name matches no column.
+    """
+    if header is not None:
+        titles = [title.strip() for title in header]
+        if name in titles:
+            return titles.index(name)
+    match = _POSITIONAL_NAME.fullmatch(name)
+    if match is None:
+        raise InvalidColumnError(name, "Use a header name or col1, col2, ...")
+    index = int(match.group(1)) - 1
+    if header is not None and index >= len(header):
+        raise InvalidColumnError(name, f"The header has {len(header)} columns.")
+    return index
+
+
+def _parse_column(
+    rows: Sequence[Sequence[str]], index: int, name: str, errors: Dict[int, str]
+) -> "array[float]":
+    """Parse one column of a block, recording the rows whose cell is bad."""
+    values = array("d")
+    while True:
+        try:
+            # array.extend keeps the items appended before an exception, so
+            # after a bad cell parsing resumes at the next row.
+            values.extend(
+                map(float, map(itemgetter(index), islice(rows, len(values), None)))
+            )
+            return values
+        except (ValueError, IndexError):
+            number = len(values)
+            row = rows[number]
+            if index < len(row):
+                message = InvalidNumberError(row[index].strip()).message
+            else:
+                reason = f"The row has {len(row)} columns."
+                message = InvalidColumnError(name, reason).message
+            errors.setdefault(number, message)
+            values.append(math.nan)
+
+
+def _zero_rows(mask: Any) -> List[int]:
+    """List the indexes set in a division-by-zero mask."""
+    if isinstance(mask, bytearray):
+        if 1 not in mask:
+            return []
+        return [index for index, hit in enumerate(mask) if hit]
+    rows: List[int] = mask.nonzero()[0].tolist()
+    return rows
+
+
+class ColumnFormula:
+    """An infix formula over the columns of CSV rows, compiled once."""
+
+    __slots__ = ("compiled", "columns")
+
+    def __init__(self, expression: str, header: Optional[Sequence[str]] = None) -> None:
+        """
+        Compile the formula and find the columns it reads.
+
+        Args:
+            expression: The formula, such as ``price * qty`` or ``col3 / col5``.
+            header: The header row, or None if the file has none.
+
+        Raises:
+            InvalidExpressionError: If the formula is not valid.
+            InvalidColumnError: If the formula reads a column that does not
+                exist.
+        """
+        self.compiled = compile_expression(expression, allow_names=True)
+        # The column index of each name the formula reads.
+        self.columns: Dict[str, int] = {
+            name: resolve_column(name, header) for name in self.compiled.names
+        }
+
+    def evaluate(
+        self, rows: Sequence[Sequence[str]], on_zero: str = "error"
+    ) -> Tuple[Any, Dict[int, str]]:
+        """
+        Evaluate the formula for every row of a block.
+
+        Cells are parsed as Validator.validate_number parses numbers. Rows
+        with a bad or missing cell, and with the ``error`` policy rows that
+        divide by zero, are reported as failed.
+
+        Args:
+            rows: The rows of the block.
+            on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+        Returns:
+            The value of each row (an ``array('d')`` or a NumPy array), and
+            the error message of each failed row by its index in the block.
+        """
+        size = len(rows)
+        errors: Dict[int, str] = {}
+        columns = {
+            name: _parse_column(rows, index, name, errors)
+            for name, index in self.columns.items()
+        }
+        policy = "nan" if on_zero == "error" else on_zero
+
+        stack: List[Any] = []
+        push, pop = stack.append, stack.pop
+        for instruction in self.compiled.code:
+            if instruction.__class__ is float:
+                push(instruction)
+            elif instruction.__class__ is Name:
+                push(columns[instruction])
+            elif instruction == NEGATE:
+                operand = pop()
+                if operand.__class__ is float:
+                    push(-operand)
+                else:
+                    push(Operations.calculate_many("*", operand, -1.0).values)
+            else:
+                right = pop()
+                left = pop()
+                if left.__class__ is float and right.__class__ is float:
+                    left = array("d", [left]) * size
+                result = Operations.calculate_many(
+                    instruction, left, right, on_zero=policy  # type: ignore[arg-type]
+                )
+                if on_zero == "error" and instruction == "/":
+                    for index in _zero_rows(result.zero_division):
+                        errors.setdefault(index, DivisionByZeroError().message)
+                push(result.values)
+
+        values = stack[0]
+        if values.__class__ is float:
+            values = array("d", [values]) * size
+        return values, errors
+
+
+def run_csv(
+    source: IO[str],
+    output: IO[str],
+    expression: str,
+    errors: IO[str],
+    on_zero: str = "error",
+    header: bool = True,
+    name: str = "result",
+    delimiter: str = ",",
+    block_rows: int = DEFAULT_CSV_BLOCK_ROWS,
+) -> int:
+    """
+    Copy CSV rows from source to output with a formula column appended.
+
+    Failed rows get an empty result cell and an ``Error: row N: ...`` line
+    in errors, where N is the row's number in the file, the header being
+    row 1. Blank rows are copied unchanged.
+
+    Args:
+        source: The CSV input, opened with ``newline=""``.
+        output: The CSV output, opened with ``newline=""``.
+        expression: The formula, such as ``price * qty`` or ``col3 / col5``.
+        errors: The stream failed rows are reported to.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+        header: Whether the first row is a header; name is appended to it.
+        name: The header title of the result column.
+        delimiter: The field delimiter.
+        block_rows: Rows evaluated at a time.
+
+    Returns:
+        The number of failed rows.
+
+    Raises:
+        InvalidExpressionError: If the formula is not valid.
+        InvalidColumnError: If the formula reads a column that does not exist.
+        ValueError: If on_zero or block_rows is not supported.
+    """
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+    if block_rows <= 0:
+        raise ValueError("block_rows must be a positive integer.")
+
+    lines: List[str] = []
+    reader = csv.reader(_recorded(source, lines), delimiter=delimiter)
+    # Copying lines as read is only safe when the delimiter cannot appear
+    # in a float's repr, which is then written unquoted.
+    copy_lines = delimiter not in _FLOAT_CHARACTERS
+    titles: Optional[List[str]] = None
+    row_number = 1
+    if header:
+        titles = next(reader, None)
+        if titles is None:
+            compile_expression(expression, allow_names=True)
+            return 0
+        row_number = 2
+    formula = ColumnFormula(expression, titles)
+    if titles is not None:
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=delimiter, lineterminator="").writerow([name])
+        _write_rows(output, lines, [titles], [buffer.getvalue()], delimiter, False)
+
+    failed = 0
+    while True:
+        rows = list(islice(reader, block_rows))
+        if not rows:
+            break
+        values, row_errors = formula.evaluate(rows, on_zero)
+        cells = list(map(repr, values.tolist()))
+        for index in sorted(row_errors):
+            if rows[index]:
+                cells[index] = ""
+                errors.write(f"Error: row {row_number + index}: {row_errors[index]}\n")
+                failed += 1
+        _write_rows(output, lines, rows, cells, delimiter, not copy_lines)
+        row_number += len(rows)
+    output.flush()
+    return failed
+
+
+def _recorded(source: Iterable[str], lines: List[str]) -> Iterator[str]:
+    """Yield the lines of source, appending each to lines as it is read."""
+    for line in source:
+        lines.append(line)
+        yield line
+
+
+def _write_rows(
+    output: IO[str],
+    lines: List[str],
+    rows: List[List[str]],
+    cells: List[str],
+    delimiter: str,
+    quote_cells: bool,
+) -> None:
+    """
+    Write rows with a cell appended to each, then forget their lines.
+
+    The csv reader consumes exactly the lines of the rows it returns, so
+    when there are as many lines as rows each row is one line. Those lines
+    are copied as read with the cell (already CSV text) appended, which is
+    much cheaper than formatting every field again. Rows with quoted line
+    breaks, and cells that may need quoting, go through csv.writer.
+    Blank rows are copied unchanged.
+    """
+    end = "\r\n" if lines[0].endswith("\r\n") else "\n"
+    if len(lines) == len(rows) and not quote_cells:
+        output.writelines(
+            [
+                f"{line.rstrip(_LINE_END)}{delimiter}{cell}{end}" if row else line
+                for line, row, cell in zip(lines, rows, cells)
+            ]
+        )
+    else:
+        for row, cell in zip(rows, cells):
+            if row:
+                row.append(cell)
+        csv.writer(output, delimiter=delimiter, lineterminator=end).writerows(rows)
+    lines.clear()
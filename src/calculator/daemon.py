@@ -0,0 +1,149 @@
+"""Warm resident daemon with a thin one-shot client (calculator eval).
+
+The client half lives in client.py, so ``calculator eval`` does not import
+asyncio.
+"""
+
+import asyncio
+import os
+import signal
+import time
+import socket
+from typing import Optional
+
+from .client import check_socket_path
+from .defaults import DEFAULT_IDLE_TIMEOUT
+from .operations import Operations
+from .server import MAX_LINE_BYTES, CalculatorServer
+
+
+class DaemonServer(CalculatorServer):
+    """Calculator server on a Unix domain socket that exits when idle."""
+
+    def __init__(
+        self,
+        path: str,
+        operations: Optional[Operations] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the daemon server.
+
+        Args:
+            path: The Unix domain socket path.
+            operations: The operations implementation to calculate with.
+            idle_timeout: Seconds without connections before the daemon exits.
+        """
+        super().__init__(operations=operations)
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.monotonic()
+
+    async def start(self) -> None:
+        """Bind the Unix socket, readable and writable by the owner only."""
+        self._shutdown = asyncio.Event()
+        # Set before binding, so the socket is never open to others.
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, self.path, limit=MAX_LINE_BYTES
+            )
+        finally:
+            os.umask(umask)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Record activity, then serve the connection."""
+        self.last_activity = time.monotonic()
+        await super()._handle_connection(reader, writer)
+        self.last_activity = time.monotonic()
+
+    async def watch_idle(self) -> None:
+        """Request shutdown once no connection was seen for idle_timeout."""
+        while True:
+            idle = time.monotonic() - self.last_activity
+            if idle >= self.idle_timeout and not self._handlers:
+                self.request_shutdown()
+                return
+            await asyncio.sleep(min(self.idle_timeout, 1.0))
+
+    async def close(self) -> None:
+        """Close the server and remove its socket file."""
+        await super().close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def is_daemon_running(path: str) -> bool:
+    """
+    Check whether a daemon is accepting connections on path.
+
+    Args:
+        path: The Unix domain socket path.
+
+    Returns:
+        True if a connection could be opened.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+async def serve_daemon(
+    path: str,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    operations: Optional[Operations] = None,
+) -> None:
+    """
+    Run the daemon until idle, SIGINT or SIGTERM.
+
+    Returns immediately if another daemon already owns the socket; a stale
+    socket file left by a crashed daemon is replaced. A missing socket
+    directory is created, readable by the user only.
+
+    Args:
+        path: The Unix domain socket path.
+        idle_timeout: Seconds without connections before exiting.
+        operations: The operations implementation to calculate with.
+
+    Raises:
+        PermissionError: If the socket path is not safe to use (see
+            check_socket_path).
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), 0o700, exist_ok=True)
+    check_socket_path(path)
+    if is_daemon_running(path):
+        return
+    if os.path.lexists(path):
+        os.unlink(path)
+
+    server = DaemonServer(path, operations, idle_timeout)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, server.request_shutdown)
+    watchdog = asyncio.ensure_future(server.watch_idle())
+    try:
+        await server.serve_until_shutdown()
+    finally:
+        watchdog.cancel()
+
+
+def run_daemon(
+    path: str,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    operations: Optional[Operations] = None,
+) -> None:
+    """
+    Run the daemon in a new event loop.
+
+    Args:
+        path: The Unix domain socket path.
+        idle_timeout: Seconds without connections before exiting.
+        operations: The operations implementation to calculate with.
+    """
+    asyncio.run(serve_daemon(path, idle_timeout, operations))
@@ -0,0 +1,48 @@
+"""Option defaults and choices shared by the CLI and the feature modules.
+
+This module imports nothing, so main.py can build its argument parser
+without loading the (sometimes heavy) modules that implement each mode.
+"""
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7878
+
+# Seconds without connections before the resident daemon exits.
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+# Seconds between --metrics-file dumps.
+DEFAULT_EXPORT_INTERVAL = 10.0
+
+# What a division by zero evaluates to: an error status, or a NaN or
+# IEEE 754 signed-infinity value with an OK status.
+ZERO_POLICIES = ("error", "nan", "inf")
+
+# Number types operands can be computed in (see numeric.py), and the
+# significant digits of the decimal backend.
+NUMERIC_BACKENDS = ("float", "int", "decimal", "fraction")
+DEFAULT_PRECISION = 28
+
+# Reductions of the reduce command (see reductions.py).
+REDUCTIONS = ("sum", "prod", "min", "max")
+
+# Calculations the REPL history keeps in memory before spilling to disk.
+DEFAULT_HISTORY_SIZE = 100_000
+
+# Results kept by the --persistent-cache SQLite file.
+DEFAULT_PERSISTENT_CACHE_SIZE = 1_000_000
+
+# Rows the csv command reads, evaluates and writes at a time.
+DEFAULT_CSV_BLOCK_ROWS = 1024
+
+# Digits the divide command prints after the point, the longest repeating
+# part --repeating looks for, and digits computed per big-integer division.
+DEFAULT_DIVIDE_DIGITS = 100
+DEFAULT_MAX_PERIOD = 10_000_000
+DEFAULT_DIGIT_CHUNK = 250
+
+# TCP port of ``calculator worker``; the workers a chunk of a --cluster
+# batch is tried on before the run fails, and seconds a worker may take to
+# connect or to answer one chunk before it is treated as dead.
+DEFAULT_WORKER_PORT = 7879
+DEFAULT_CHUNK_ATTEMPTS = 3
+DEFAULT_CHUNK_TIMEOUT = 300.0
@@ -0,0 +1,226 @@
+"""Exact decimal expansions of quotients, streamed lazily.
+
+Operations.divide returns a float, good to about 17 significant digits.
+ExactQuotient divides integers or decimals exactly and produces the digits
+after the decimal point as they are read, so ``calculator divide 1 7
+--digits 1000000`` streams a million digits without ever holding them.
+Only the long-division remainder is kept between digits; one big-integer
+divmod yields a whole chunk of DEFAULT_DIGIT_CHUNK digits at a time.
+
+Every quotient of two rationals terminates or repeats. Write the reduced
+denominator as ``2**a * 5**b * m`` with m coprime to 10: the first
+``max(a, b)`` digits after the point do not repeat, and the rest repeat
+with period the multiplicative order of 10 modulo m. ``cycle`` steps
+``10**k mod m`` until it returns to 1, which finds the period in constant
+memory instead of remembering every remainder seen.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import IO, Iterator, Optional, Tuple, Union
+
+from .defaults import DEFAULT_DIGIT_CHUNK
+from .exceptions import DivisionByZeroError, InvalidNumberError
+
+Exact = Union[int, Fraction, Decimal]
+
+# The most digits converted to text at once; Python 3.11+ refuses to
+# convert larger integers to str by default.
+MAX_DIGIT_CHUNK = 4300
+
+
+class ExactQuotient:
+    """The exact quotient of two rational numbers, as a decimal expansion."""
+
+    __slots__ = ("numerator", "denominator")
+
+    def __init__(self, dividend: Exact, divisor: Exact) -> None:
+        """
+        Divide exactly, keeping the quotient as a reduced fraction.
+
+        Args:
+            dividend: First number (dividend).
+            divisor: Second number (divisor).
+
+        Raises:
+            DivisionByZeroError: If divisor is zero.
+        """
+        if divisor == 0:
+            raise DivisionByZeroError()
+        quotient = Fraction(dividend) / Fraction(divisor)
+        self.numerator = quotient.numerator
+        self.denominator = quotient.denominator
+
+    @classmethod
+    def parse(cls, dividend: str, divisor: str) -> "ExactQuotient":
+        """
+        Divide two numbers written as text, such as ``22``, ``0.125`` or ``1/3``.
+
+        Args:
+            dividend: First number (dividend).
+            divisor: Second number (divisor).
+
+        Returns:
+            The quotient.
+
+        Raises:
+            InvalidNumberError: If an operand is not a finite rational number.
+            DivisionByZeroError: If divisor is zero.
+        """
+        operands = []
+        for text in (dividend, divisor):
+            try:
+                operands.append(Fraction(text))
+            except (ValueError, ZeroDivisionError):
+                raise InvalidNumberError(text) from None
+        return cls(*operands)
+
+    @property
+    def integer_part(self) -> str:
+        """The sign and digits before the decimal point, such as ``-0``."""
+        whole = abs(self.numerator) // self.denominator
+        scale = 10**MAX_DIGIT_CHUNK
+        blocks = []
+        while whole >= scale:
+            whole, block = divmod(whole, scale)
+            blocks.append(str(block).zfill(MAX_DIGIT_CHUNK))
+        blocks.append(str(whole))
+        text = "".join(reversed(blocks))
+        return f"-{text}" if self.numerator < 0 else text
+
+    def chunks(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        size: int = DEFAULT_DIGIT_CHUNK,
+    ) -> Iterator[str]:
+        """
+        Yield the digits after the decimal point, a string of digits at a time.
+
+        Any position can be started from without computing the digits
+        before it. The digits end early if the expansion terminates; a
+        repeating expansion with no stop never ends.
+
+        Args:
+            start: Index of the first digit, 0 being the first after the point.
+            stop: Index after the last digit, or None for no limit.
+            size: Digits per string; the last may be shorter.
+
+        Yields:
+            Strings of digits.
+
+        Raises:
+            ValueError: If size is not between 1 and MAX_DIGIT_CHUNK.
+        """
+        if not 0 < size <= MAX_DIGIT_CHUNK:
+            raise ValueError(f"size must be between 1 and {MAX_DIGIT_CHUNK}.")
+        denominator = self.denominator
+        remainder = abs(self.numerator) * pow(10, start, denominator) % denominator
+        scale = 10**size
+        position = start
+        while remainder and (stop is None or position < stop):
+            count = size if stop is None else min(size, stop - position)
+            block, remainder = divmod(
+                remainder * (scale if count == size else 10**count), denominator
+            )
+            text = str(block).zfill(count)
+            position += count
+            yield text if remainder else text.rstrip("0")
+
+    def digits(self, start: int = 0) -> Iterator[str]:
+        """
+        Yield the digits after the decimal point one at a time, lazily.
+
+        Args:
+            start: Index of the first digit, 0 being the first after the point.
+
+        Yields:
+            Single-character digit strings; endless if the expansion repeats.
+        """
+        for chunk in self.chunks(start):
+            yield from chunk
+
+    def cycle(self, limit: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Find where the digits after the decimal point start repeating.
+
+        Args:
+            limit: The longest period to look for, or None for no limit.
+
+        Returns:
+            The number of digits before the repeating part, and the length
+            of the repeating part (0 if the expansion terminates); None if
+            the period is longer than limit.
+        """
+        modulus = self.denominator
+        twos = fives = 0
+        while modulus % 2 == 0:
+            modulus //= 2
+            twos += 1
+        while modulus % 5 == 0:
+            modulus //= 5
+            fives += 1
+        start = max(twos, fives)
+        if modulus == 1:
+            return start, 0
+
+        power = 10 % modulus
+        period = 1
+        while power != 1:
+            if period == limit:
+                return None
+            power = power * 10 % modulus
+            period += 1
+        return start, period
+
+    def write(self, output: IO[str], count: int) -> int:
+        """
+        Write the quotient truncated to count digits after the point.
+
+        Digits are written a chunk at a time, so memory does not grow with
+        count. The decimal point is omitted if no digits follow it.
+
+        Args:
+            output: The stream to write to.
+            count: The most digits to write after the point.
+
+        Returns:
+            The number of digits written after the point.
+        """
+        output.write(self.integer_part)
+        written = 0
+        for chunk in self.chunks(0, count):
+            if not written:
+                output.write(".")
+            output.write(chunk)
+            written += len(chunk)
+        return written
+
+    def write_repeating(self, output: IO[str], limit: Optional[int] = None) -> bool:
+        """
+        Write the whole quotient with its repeating part in parentheses.
+
+        For example 1/6 is written ``0.1(6)``, 1/7 ``0.(142857)`` and
+        1/4 ``0.25``.
+
+        Args:
+            output: The stream to write to.
+            limit: The longest period to write, or None for no limit.
+
+        Returns:
+            True if written; False, writing nothing, if the period is
+            longer than limit.
+        """
+        cycle = self.cycle(limit)
+        if cycle is None:
+            return False
+        start, period = cycle
+        output.write(self.integer_part)
+        if start or period:
+            output.write(".")
+        output.writelines(self.chunks(0, start))
+        if period:
+            output.write("(")
+            output.writelines(self.chunks(start, start + period))
+            output.write(")")
+        return True
@@ -0,0 +1,154 @@
+"""Reentrant calculation engine for use from many threads at once.
+
+An Engine is the calculator without its REPL: it parses, validates and
+computes, and never reads input or prints. Everything it holds is fixed
+when it is created, so one instance can be shared by any number of
+threads without locks. The numeric backend is the one exception: a
+backend that records state as it computes (``thread_safe = False``, such
+as DecimalBackend) is copied once per thread that uses the engine, and
+the shared instance is only ever read.
+"""
+
+import copy
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .exceptions import DivisionByZeroError
+from .expression import compile_expression
+from .registry import OPERATION_SYMBOLS, REGISTRY
+from .validator import Validator
+from .vectorized import KERNELS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+
+Methods = Dict[str, Callable[[Any, Any], Any]]
+
+
+def _methods(backend: Optional["NumericBackend"]) -> Methods:
+    """Build the built-in operation table of a backend, float if None."""
+    if backend is None:
+        # The C kernels; Engine.calculate checks division by zero itself.
+        return dict(zip(OPERATION_SYMBOLS, KERNELS))
+    return backend.methods()
+
+
+class Engine:
+    """Thread-safe calculator: parse, validate and calculate without I/O.
+
+    Results and errors are those of Validator and Operations (or
+    NumericOperations with the same backend). The engine keeps no caches
+    or counters; wrap calls with a locked structure such as Metrics when
+    shared statistics are needed.
+    """
+
+    __slots__ = ("backend", "_methods", "_local")
+
+    def __init__(self, backend: Optional["NumericBackend"] = None) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            backend: The numeric backend to parse and compute with, plain
+                float if omitted.
+        """
+        self.backend = backend
+        self._methods = _methods(backend)
+        # Per-thread (backend, methods) copies for a backend that is not
+        # thread-safe; None when every thread may share self._methods.
+        self._local: Optional[threading.local] = (
+            None if backend is None or backend.thread_safe else threading.local()
+        )
+
+    def _state(self) -> Tuple[Optional["NumericBackend"], Methods]:
+        """Return the calling thread's backend and operation table."""
+        local = self._local
+        if local is None:
+            return self.backend, self._methods
+        try:
+            state: Tuple[Optional["NumericBackend"], Methods] = local.state
+        except AttributeError:
+            backend = copy.deepcopy(self.backend)
+            state = local.state = (backend, _methods(backend))
+        return state
+
+    def parse(self, text: str) -> Any:
+        """
+        Validate and convert an operand.
+
+        Args:
+            text: The operand text.
+
+        Returns:
+            The number, of the backend's number type.
+
+        Raises:
+            InvalidNumberError: If text is not a valid number.
+        """
+        return Validator.validate_number(text, self._state()[0])
+
+    def calculate(self, operation: str, a: Any, b: Any) -> Any:
+        """
+        Perform an operation on two numbers.
+
+        Args:
+            operation: The operation to perform (+, -, *, / or a plugin's,
+                which is passed the backend's numbers as they are).
+            a: First number, of the backend's number type.
+            b: Second number, of the backend's number type.
+
+        Returns:
+            The result.
+
+        Raises:
+            DivisionByZeroError: If dividing by zero.
+            OperationPluginError: If the operation's plugin cannot be loaded.
+            ValueError: If operation is not supported.
+        """
+        methods = self._methods if self._local is None else self._state()[1]
+        method = methods.get(operation)
+        if method is None:
+            method = REGISTRY.get(operation)
+            if method is None:
+                raise ValueError(f"Unsupported operation: {operation}")
+        if operation == "/" and b == 0:
+            raise DivisionByZeroError()
+        return method(a, b)
+
+    def evaluate(self, line: str) -> Any:
+        """
+        Validate and compute a line such as ``+ 3 4``.
+
+        Args:
+            line: The ``<operation> <number> <number>`` text.
+
+        Returns:
+            The result.
+
+        Raises:
+            InvalidLineError: If the line does not have exactly three fields.
+            InvalidOperationError: If the operation is not supported.
+            InvalidNumberError: If an operand is not a valid number.
+            DivisionByZeroError: If dividing by zero.
+        """
+        operation, a, b = Validator.validate_line(line, self._state()[0])
+        return self.calculate(operation, a, b)
+
+    def evaluate_expression(self, expression: str) -> float:
+        """
+        Evaluate an infix expression such as ``(1 + 2) * 3`` in float.
+
+        The expression is compiled on every call; share an ExpressionCache
+        only within one thread.
+
+        Args:
+            expression: The expression text.
+
+        Returns:
+            The value.
+
+        Raises:
+            InvalidExpressionError: If the expression is not valid.
+            DivisionByZeroError: If the expression divides by zero.
+        """
+        return compile_expression(expression).evaluate()
@@ -0,0 +1,224 @@
+"""Non-raising evaluation that reports failures as status codes.
+
+The raising API (Validator, Operations.calculate) builds and unwinds an
+exception for every bad line. Here each line yields a compact
+``(status, value)`` pair instead, and the error message for a failed line
+is only built when it is displayed, by status_message.
+"""
+
+import math
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .defaults import ZERO_POLICIES
+from .exceptions import (
+    DivisionByZeroError,
+    InvalidLineError,
+    InvalidNumberError,
+    InvalidOperationError,
+    OperationPluginCallError,
+    OperationPluginError,
+)
+from .registry import OPERATION_SYMBOLS, REGISTRY, plugin_target
+from .vectorized import KERNELS, zero_fill
+
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_INVALID_OPERATION = 2
+STATUS_INVALID_NUMBER = 3
+STATUS_INVALID_LINE = 4
+
+# The C kernels of the built-in operations, by symbol; plugins are looked
+# up in the registry.
+_KERNELS = dict(zip(OPERATION_SYMBOLS, KERNELS))
+_DIVIDE = _KERNELS["/"]
+
+
+def evaluate_line(line: str, on_zero: str = "error") -> Tuple[int, float]:
+    """
+    Validate and compute a line such as ``+ 3 4`` without raising.
+
+    Plugin operations are computed through the registry; one whose plugin
+    cannot be loaded, fails while computing, or returns a value that is
+    not a number reports STATUS_INVALID_OPERATION.
+
+    Args:
+        line: The raw input line.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Returns:
+        The (status, value) pair; the value is NaN unless the status is
+        STATUS_OK.
+    """
+    status, value, _ = evaluate_line_with_error(line, on_zero)
+    return status, value
+
+
+def evaluate_line_with_error(
+    line: str, on_zero: str = "error"
+) -> Tuple[int, float, Optional[OperationPluginError]]:
+    """
+    Evaluate a line like evaluate_line, also returning a plugin's error.
+
+    The plugin is called at most once: the error it failed with is kept
+    for status_message, which never runs it again.
+
+    Args:
+        line: The raw input line.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Returns:
+        The (status, value, error) triple; the error is the
+        OperationPluginError a plugin operation failed with, else None.
+    """
+    fields = line.split()
+    if len(fields) != 3:
+        return STATUS_INVALID_LINE, math.nan, None
+    operation = fields[0]
+    try:
+        a = float(fields[1])
+        b = float(fields[2])
+    except ValueError:
+        if operation not in REGISTRY:
+            return STATUS_INVALID_OPERATION, math.nan, None
+        return STATUS_INVALID_NUMBER, math.nan, None
+
+    kernel = _KERNELS.get(operation)
+    if kernel is not None:
+        if kernel is _DIVIDE and b == 0:
+            if on_zero == "error":
+                return STATUS_DIVISION_BY_ZERO, math.nan, None
+            return STATUS_OK, zero_fill(a, b, on_zero), None
+        return STATUS_OK, kernel(a, b), None
+
+    try:
+        function = REGISTRY.get(operation)
+    except OperationPluginError as e:
+        return STATUS_INVALID_OPERATION, math.nan, e
+    if function is None:
+        return STATUS_INVALID_OPERATION, math.nan, None
+    try:
+        return STATUS_OK, float(function(a, b)), None
+    except DivisionByZeroError:
+        if on_zero == "error":
+            return STATUS_DIVISION_BY_ZERO, math.nan, None
+        return STATUS_OK, zero_fill(a, b, on_zero), None
+    except OperationPluginError as e:
+        return STATUS_INVALID_OPERATION, math.nan, e
+    except (TypeError, ValueError, OverflowError) as e:
+        # The plugin returned something float() cannot convert.
+        error = OperationPluginCallError(
+            operation, plugin_target(function, operation), e
+        )
+        return STATUS_INVALID_OPERATION, math.nan, error
+
+
+def status_message(
+    status: int, line: str, error: Optional[OperationPluginError] = None
+) -> str:
+    """
+    Build the error message for a failed line.
+
+    The message is the one the raising API reports for the same line.
+
+    Args:
+        status: The status returned by evaluate_line.
+        line: The raw input line.
+        error: The plugin error returned by evaluate_line_with_error, if
+            any; its message is used as it is.
+
+    Returns:
+        The error message, or an empty string for STATUS_OK.
+    """
+    if status == STATUS_OK:
+        return ""
+    if error is not None:
+        return error.message
+    if status == STATUS_DIVISION_BY_ZERO:
+        return DivisionByZeroError().message
+    if status == STATUS_INVALID_LINE:
+        return InvalidLineError(line.strip()).message
+    fields = line.split()
+    if status == STATUS_INVALID_OPERATION:
+        try:
+            if REGISTRY.get(fields[0]) is None:
+                return InvalidOperationError(fields[0]).message
+        except OperationPluginError as e:
+            return e.message
+    for field in fields[1:]:
+        try:
+            float(field)
+        except ValueError:
+            return InvalidNumberError(field).message
+    raise ValueError(f"Line {line!r} does not fail with status {status}.")
+
+
+class EvaluationResult:
+    """Parallel values and statuses of the non-blank lines of a block."""
+
+    def __init__(self) -> None:
+        """Initialize an empty evaluation result."""
+        self.values: "array[float]" = array("d")
+        self.statuses = bytearray()
+        self.line_numbers: "array[int]" = array("L")
+        self._failed: List[Tuple[int, str, Optional[OperationPluginError]]] = []
+
+    def __len__(self) -> int:
+        """Return the number of evaluated lines."""
+        return len(self.statuses)
+
+    @property
+    def error_count(self) -> int:
+        """Number of lines that failed."""
+        return len(self._failed)
+
+    def errors(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over the failed lines, formatting their messages.
+
+        Yields:
+            Tuples of (line number, error message).
+        """
+        for index, line, error in self._failed:
+            yield self.line_numbers[index], status_message(
+                self.statuses[index], line, error
+            )
+
+
+def evaluate_lines(
+    lines: Iterable[str], on_zero: str = "error", first_line: int = 1
+) -> EvaluationResult:
+    """
+    Evaluate a block of lines into parallel value and status arrays.
+
+    Blank lines are skipped.
+
+    Args:
+        lines: The input lines.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+        first_line: The line number of the first line.
+
+    Returns:
+        The evaluation result.
+
+    Raises:
+        ValueError: If on_zero is not supported.
+    """
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+
+    result = EvaluationResult()
+    add_value = result.values.append
+    add_status = result.statuses.append
+    add_line = result.line_numbers.append
+    add_failed = result._failed.append
+    for line_number, line in enumerate(lines, first_line):
+        if not line or line.isspace():
+            continue
+        status, value, error = evaluate_line_with_error(line, on_zero)
+        if status:
+            add_failed((len(result.statuses), line, error))
+        add_value(value)
+        add_status(status)
+        add_line(line_number)
+    return result
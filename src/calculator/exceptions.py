@@ -1,18 +1,31 @@
-"""Custom exceptions for the calculator application."""
+"""Custom exceptions for the calculator application.
+
+Error messages are formatted when ``message`` or ``str()`` is first read,
+not when the exception is raised, so code that catches and discards
+errors in a loop never pays for formatting them.
+"""
+
+from typing import List
 
 
 class CalculatorError(Exception):
     """Base exception class for calculator errors."""
 
-    pass
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return str(self.args[0]) if self.args else ""
+
+    def __str__(self) -> str:
+        """Return the error message."""
+        return self.message
 
 
 class DivisionByZeroError(CalculatorError):
     """Raised when attempting to divide by zero."""
 
     def __init__(self, message: str = "Division by zero is not allowed.") -> None:
-        self.message = message
-        super().__init__(self.message)
+        super().__init__(message)
 
 
 class InvalidOperationError(CalculatorError):
@@ -20,10 +33,44 @@ class InvalidOperationError(CalculatorError):
 
     def __init__(self, operation: str) -> None:
         self.operation = operation
-        self.message = (
-            f"Invalid operation: '{operation}'. Supported operations: +, -, *, /"
+        super().__init__(operation)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        from .registry import REGISTRY
+
+        return (
+            f"Invalid operation: '{self.operation}'. "
+            f"Supported operations: {REGISTRY.describe()}"
+        )
+
+
+class OperationPluginError(CalculatorError):
+    """Raised when an operation plugin cannot be loaded."""
+
+    def __init__(self, operation: str, target: str, error: Exception) -> None:
+        self.operation = operation
+        self.target = target
+        self.error = error
+        super().__init__(operation, target, error)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return (
+            f"Cannot load operation '{self.operation}' from {self.target}: "
+            f"{self.error}"
         )
-        super().__init__(self.message)
+
+
+class OperationPluginCallError(OperationPluginError):
+    """Raised when an operation plugin fails while computing a result."""
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Operation '{self.operation}' from {self.target} failed: {self.error}"
 
 
 class InvalidNumberError(CalculatorError):
@@ -31,5 +78,122 @@ class InvalidNumberError(CalculatorError):
 
     def __init__(self, value: str) -> None:
         self.value = value
-        self.message = f"Invalid number: '{value}'. Please enter a valid number."
-        super().__init__(self.message)
+        super().__init__(value)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Invalid number: '{self.value}'. Please enter a valid number."
+
+
+class InvalidLineError(CalculatorError):
+    """Raised when a batch input line is not '<operation> <number> <number>'."""
+
+    def __init__(self, line: str) -> None:
+        self.line = line
+        super().__init__(line)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return (
+            f"Invalid line: '{self.line}'. "
+            "Expected: <operation> <first number> <second number>"
+        )
+
+
+class InvalidExpressionError(CalculatorError):
+    """Raised when an infix expression cannot be parsed."""
+
+    def __init__(self, expression: str, reason: str) -> None:
+        self.expression = expression
+        self.reason = reason
+        super().__init__(expression, reason)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Invalid expression: '{self.expression}'. {self.reason}"
+
+
+class InvalidColumnError(CalculatorError):
+    """Raised when a CSV formula reads a column that does not exist."""
+
+    def __init__(self, column: str, reason: str) -> None:
+        self.column = column
+        self.reason = reason
+        super().__init__(column, reason)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Invalid column: '{self.column}'. {self.reason}"
+
+
+class UndefinedVariableError(CalculatorError):
+    """Raised when a variable is read before it is defined."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__(name)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Undefined variable: '{self.name}'."
+
+
+class CircularReferenceError(CalculatorError):
+    """Raised when a formula would make a variable depend on itself."""
+
+    def __init__(self, cycle: List[str]) -> None:
+        self.cycle = cycle
+        super().__init__(cycle)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Circular reference: {' -> '.join(self.cycle)}."
+
+
+class HistoryError(CalculatorError):
+    """Raised when a calculation that is not in the history is recalled."""
+
+    def __init__(self, number: int, size: int) -> None:
+        self.number = number
+        self.size = size
+        super().__init__(number, size)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        if not self.size:
+            return "No results yet."
+        return f"No result ${self.number}. Results are numbered 1 to {self.size}."
+
+
+class InvalidBinaryFileError(CalculatorError):
+    """Raised when a binary operand file is malformed."""
+
+    def __init__(self, path: str, reason: str) -> None:
+        self.path = path
+        self.reason = reason
+        super().__init__(path, reason)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Invalid binary file: '{self.path}'. {self.reason}"
+
+
+class ClusterError(CalculatorError):
+    """Raised when a batch file cannot be evaluated on its workers."""
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(reason)
+
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return f"Distributed evaluation failed: {self.reason}"
@@ -0,0 +1,359 @@
+"""Infix expression engine with a compiled-expression cache."""
+
+import re
+from collections import OrderedDict
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
+
+from .exceptions import InvalidExpressionError, UndefinedVariableError
+from .registry import BUILTIN_OPERATIONS
+
+# Opcode of the unary minus instruction in compiled code.
+NEGATE = "neg"
+
+
+class Name(str):
+    """Instruction that loads the value of a variable by its name."""
+
+    __slots__ = ()
+
+
+Instruction = Union[float, str]
+
+_BINARY = BUILTIN_OPERATIONS
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<symbol>[-+*/()])"
+    r")"
+)
+
+_CONSTANTS = {"inf": float("inf"), "infinity": float("inf"), "nan": float("nan")}
+
+# Names that always denote constants, whatever the case, never variables.
+CONSTANT_NAMES = frozenset(_CONSTANTS)
+
+
+def tokenize(expression: str) -> List[Tuple[str, str, int]]:
+    """
+    Split an expression into tokens.
+
+    Args:
+        expression: The infix expression text.
+
+    Returns:
+        A list of (kind, text, position) tuples, where kind is ``number``,
+        ``name`` or ``symbol``.
+
+    Raises:
+        InvalidExpressionError: If the expression contains an unknown character.
+    """
+    tokens = []
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = _TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            offset = len(expression) - len(expression[position:].lstrip())
+            raise InvalidExpressionError(
+                expression,
+                f"Unexpected character '{expression[offset]}' at position {offset}.",
+            )
+        kind = str(match.lastgroup)
+        tokens.append((kind, match.group(kind), match.start(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser that emits postfix (RPN) instructions."""
+
+    def __init__(
+        self,
+        expression: str,
+        allow_names: bool = False,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.expression = expression
+        self.allow_names = allow_names
+        self.parse_number = parse
+        self.tokens = tokenize(expression)
+        self.index = 0
+        self.code: List[Instruction] = []
+
+    def error(self, reason: str) -> InvalidExpressionError:
+        """Build an error for the expression being parsed."""
+        return InvalidExpressionError(self.expression, reason)
+
+    def peek(self) -> Optional[str]:
+        """Return the text of the next token, or None at the end."""
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][1]
+        return None
+
+    def parse(self) -> Tuple[Instruction, ...]:
+        """Parse the whole expression into compiled code."""
+        if not self.tokens:
+            raise self.error("Expression is empty.")
+        self.parse_sum()
+        if self.index < len(self.tokens):
+            _, text, position = self.tokens[self.index]
+            raise self.error(f"Unexpected '{text}' at position {position}.")
+        return tuple(self.code)
+
+    def parse_sum(self) -> None:
+        """Parse ``term (('+' | '-') term)*``."""
+        self.parse_product()
+        while self.peek() in ("+", "-"):
+            operator = self.tokens[self.index][1]
+            self.index += 1
+            self.parse_product()
+            self.code.append(operator)
+
+    def parse_product(self) -> None:
+        """Parse ``unary (('*' | '/') unary)*``."""
+        self.parse_unary()
+        while self.peek() in ("*", "/"):
+            operator = self.tokens[self.index][1]
+            self.index += 1
+            self.parse_unary()
+            self.code.append(operator)
+
+    def parse_unary(self) -> None:
+        """Parse ``('-' | '+') unary | primary``."""
+        sign = self.peek()
+        if sign in ("+", "-"):
+            self.index += 1
+            self.parse_unary()
+            if sign == "-":
+                self.code.append(NEGATE)
+            return
+        self.parse_primary()
+
+    def number(self, text: str, position: int) -> float:
+        """Convert a number or constant token, with the backend's parse if any."""
+        if self.parse_number is None:
+            return float(text)
+        try:
+            value: float = self.parse_number(text)
+        except ValueError:
+            raise self.error(
+                f"Unsupported number '{text}' at position {position}."
+            ) from None
+        return value
+
+    def parse_primary(self) -> None:
+        """Parse a number, a constant, a name or a parenthesized expression."""
+        if self.index >= len(self.tokens):
+            raise self.error("Unexpected end of expression.")
+        kind, text, position = self.tokens[self.index]
+        self.index += 1
+
+        if kind == "number" or (kind == "name" and text.lower() in _CONSTANTS):
+            self.code.append(self.number(text, position))
+        elif kind == "name" and self.allow_names:
+            self.code.append(Name(text))
+        elif kind == "name":
+            raise self.error(f"Unknown name '{text}' at position {position}.")
+        elif text == "(":
+            self.parse_sum()
+            if self.peek() != ")":
+                raise self.error(f"Missing ')' for '(' at position {position}.")
+            self.index += 1
+        else:
+            raise self.error(f"Unexpected '{text}' at position {position}.")
+
+
+class CompiledExpression:
+    """An infix expression compiled to postfix instructions."""
+
+    __slots__ = ("source", "code", "names")
+
+    def __init__(self, source: str, code: Tuple[Instruction, ...]) -> None:
+        """
+        Initialize the compiled expression.
+
+        Args:
+            source: The original expression text.
+            code: Postfix instructions: number constants, Name loads,
+                binary operation symbols and the NEGATE opcode.
+        """
+        self.source = source
+        self.code = code
+        # The distinct variables the expression reads, in order of use.
+        self.names: Tuple[str, ...] = tuple(
+            dict.fromkeys(str(i) for i in code if i.__class__ is Name)
+        )
+
+    def __repr__(self) -> str:
+        """Return a debugging representation."""
+        return f"CompiledExpression({self.source!r})"
+
+    def evaluate(
+        self,
+        variables: Optional[Mapping[str, float]] = None,
+        calculate: Optional[Callable[[str, Any, Any], Any]] = None,
+        negate: Optional[Callable[[Any], Any]] = None,
+    ) -> float:
+        """
+        Evaluate the expression through the Operations functions.
+
+        Args:
+            variables: The values of the variables the expression reads.
+            calculate: Computes each binary operation instead, such as
+                NumericOperations.calculate for an expression compiled
+                with the same backend's parse.
+            negate: Computes unary minus instead, such as the same
+                backend's NumericBackend.negate.
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            DivisionByZeroError: If the expression divides by zero.
+            UndefinedVariableError: If a variable it reads has no value.
+        """
+        stack: List[Any] = []
+        push, pop = stack.append, stack.pop
+        for instruction in self.code:
+            kind = instruction.__class__
+            if kind is Name:
+                try:
+                    push(variables[instruction])  # type: ignore[index]
+                except (KeyError, TypeError):
+                    raise UndefinedVariableError(str(instruction)) from None
+            elif kind is not str:
+                push(instruction)
+            elif instruction == NEGATE:
+                push(-pop() if negate is None else negate(pop()))
+            elif calculate is None:
+                right = pop()
+                push(_BINARY[instruction](pop(), right))  # type: ignore[index]
+            else:
+                right = pop()
+                push(calculate(instruction, pop(), right))  # type: ignore[arg-type]
+        return stack[0]  # type: ignore[no-any-return]
+
+
+def compile_expression(
+    expression: str,
+    allow_names: bool = False,
+    parse: Optional[Callable[[str], Any]] = None,
+) -> CompiledExpression:
+    """
+    Parse an infix expression such as ``(3 + 4) * 2 / 7``.
+
+    Supports +, -, *, / with the usual precedence, parentheses, unary
+    minus and plus, and the constants ``inf`` and ``nan``.
+
+    Args:
+        expression: The infix expression text.
+        allow_names: Accept variable names, such as ``a * b``, whose values
+            are passed to CompiledExpression.evaluate.
+        parse: Converts numbers and constants to a numeric backend's type,
+            float() if omitted.
+
+    Returns:
+        The compiled expression.
+
+    Raises:
+        InvalidExpressionError: If the expression is not valid, or parse
+            rejects one of its numbers.
+    """
+    return CompiledExpression(
+        expression, _Parser(expression, allow_names, parse).parse()
+    )
+
+
+class ExpressionCache:
+    """Bounded LRU cache of compiled expressions keyed by their text."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of compiled expressions kept.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CompiledExpression]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached expressions."""
+        return len(self._entries)
+
+    def compile(self, expression: str) -> CompiledExpression:
+        """
+        Return the compiled form of an expression, parsing it on a miss.
+
+        Args:
+            expression: The infix expression text.
+
+        Returns:
+            The compiled expression.
+
+        Raises:
+            InvalidExpressionError: If the expression is not valid.
+        """
+        compiled = self._entries.get(expression)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(expression)
+            return compiled
+
+        self.misses += 1
+        compiled = compile_expression(expression)
+        self._entries[expression] = compiled
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def evaluate(self, expression: str) -> float:
+        """
+        Compile (or recall) and evaluate an expression.
+
+        Args:
+            expression: The infix expression text.
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            InvalidExpressionError: If the expression is not valid.
+            DivisionByZeroError: If the expression divides by zero.
+        """
+        return self.compile(expression).evaluate()
+
+    def clear(self) -> None:
+        """Remove every cached expression and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+default_cache = ExpressionCache()
+
+
+def evaluate(expression: str) -> float:
+    """
+    Evaluate an infix expression using the module-level cache.
+
+    Args:
+        expression: The infix expression text.
+
+    Returns:
+        The value of the expression.
+
+    Raises:
+        InvalidExpressionError: If the expression is not valid.
+        DivisionByZeroError: If the expression divides by zero.
+    """
+    return default_cache.evaluate(expression)
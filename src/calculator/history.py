@@ -0,0 +1,267 @@
+"""Bounded calculation history with constant-time recall.
+
+The most recent calculations are kept in a fixed-capacity ring buffer of
+typed columns. Older ones are spilled to an append-only log on disk, one
+text line per calculation, together with a fixed-width index holding the
+byte offset of every line. Calculation N is found either in its ring slot
+or with one index read and one log read, so recall takes constant time
+and memory stays bounded however long the session runs.
+"""
+
+from array import array
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .defaults import DEFAULT_HISTORY_SIZE
+from .exceptions import HistoryError
+
+# Spilled lines gathered before the log and the index are written.
+SPILL_BATCH = 1024
+
+# Width of one index entry: an unsigned 64-bit log offset.
+_OFFSET_SIZE = array("Q").itemsize
+
+
+class HistoryEntry(NamedTuple):
+    """One recorded calculation."""
+
+    operation: str
+    a: Any
+    b: Any
+    result: Any
+
+
+class History:
+    """Ring buffer of recent calculations that spills older ones to disk.
+
+    Calculations are numbered from 1. The newest ``capacity`` are held in
+    memory in columns: array('d') for float values, or lists when a numeric
+    backend gives other number types. Operation symbols, which plugins may
+    spell with several characters, are interned: the ring holds the index
+    of each symbol in a table of the distinct symbols seen. Each one
+    evicted is written to the log as ``<operation> <a> <b> <result>``, and
+    its offset to the index.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_HISTORY_SIZE,
+        path: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity: Calculations held in memory.
+            path: File the log is written to, with its index at
+                ``path + ".idx"``; both are overwritten. Temporary files
+                deleted on close are used if omitted.
+            parse: Converts logged values back to numbers, such as a
+                numeric backend's parse; float if omitted, in which case
+                values are stored in memory as doubles.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer.")
+        self.capacity = capacity
+        self.path = path
+        self.parse: Callable[[str], Any] = parse if parse is not None else float
+        self._symbols: List[str] = []
+        self._symbol_indexes: Dict[str, int] = {}
+        self._operations: "array[int]" = array("H", bytes(2 * capacity))
+        self._a = self._column()
+        self._b = self._column()
+        self._results = self._column()
+        self._size = 0
+        # Spilled calculations not yet written, and how many were written.
+        self._pending: List[bytes] = []
+        self._offsets: "array[int]" = array("Q")
+        self._written = 0
+        self._log_end = 0
+        self._log: Optional[IO[bytes]] = None
+        self._index: Optional[IO[bytes]] = None
+
+    def _column(self) -> MutableSequence[Any]:
+        """Create one column of the ring."""
+        if self.parse is float:
+            return array("d", bytes(8 * self.capacity))
+        return [None] * self.capacity
+
+    def __len__(self) -> int:
+        """Return the number of calculations recorded."""
+        return self._size
+
+    def append(self, operation: str, a: Any, b: Any, result: Any) -> int:
+        """
+        Record a calculation.
+
+        Args:
+            operation: The operation symbol.
+            a: First operand.
+            b: Second operand.
+            result: The result.
+
+        Returns:
+            The calculation's number.
+        """
+        slot = self._size % self.capacity
+        if self._size >= self.capacity:
+            self._spill(slot)
+        index = self._symbol_indexes.get(operation)
+        if index is None:
+            index = self._symbol_indexes[operation] = len(self._symbols)
+            self._symbols.append(operation)
+        self._operations[slot] = index
+        self._a[slot] = a
+        self._b[slot] = b
+        self._results[slot] = result
+        self._size += 1
+        return self._size
+
+    def result(self, number: int) -> Any:
+        """
+        Recall the result of a calculation.
+
+        Args:
+            number: The calculation's number, from 1.
+
+        Returns:
+            The result.
+
+        Raises:
+            HistoryError: If there is no such calculation.
+        """
+        size = self._size
+        if 0 < number <= size and number > size - self.capacity:
+            return self._results[(number - 1) % self.capacity]
+        return self.entry(number).result
+
+    def last(self) -> Any:
+        """
+        Recall the latest result.
+
+        Returns:
+            The result.
+
+        Raises:
+            HistoryError: If nothing is recorded yet.
+        """
+        return self.result(self._size)
+
+    def entry(self, number: int) -> HistoryEntry:
+        """
+        Recall a whole calculation.
+
+        Args:
+            number: The calculation's number, from 1.
+
+        Returns:
+            The calculation.
+
+        Raises:
+            HistoryError: If there is no such calculation.
+        """
+        if not 0 < number <= self._size:
+            raise HistoryError(number, self._size)
+        if number > self._size - self.capacity:
+            slot = (number - 1) % self.capacity
+            return HistoryEntry(
+                self._symbols[self._operations[slot]],
+                self._a[slot],
+                self._b[slot],
+                self._results[slot],
+            )
+        return self._read(number)
+
+    def tail(self, count: int) -> Iterator[HistoryEntry]:
+        """
+        Iterate over the latest calculations, oldest first.
+
+        Args:
+            count: Maximum number of calculations.
+
+        Yields:
+            The calculations.
+        """
+        for number in range(max(self._size - count, 0) + 1, self._size + 1):
+            yield self.entry(number)
+
+    def close(self) -> None:
+        """
+        Close the log and index.
+
+        With a path, the calculations still in memory are written first, so
+        the log holds the whole session. Temporary files are deleted.
+        """
+        if self.path is not None:
+            first = max(self._size - self.capacity, 0)
+            for position in range(first, self._size):
+                self._spill(position % self.capacity)
+        self._flush()
+        for stream in (self._log, self._index):
+            if stream is not None:
+                stream.close()
+        self._log = self._index = None
+
+    def _spill(self, slot: int) -> None:
+        """Queue the calculation in slot for the log."""
+        operation = self._symbols[self._operations[slot]]
+        line = (
+            f"{operation} {self._a[slot]} {self._b[slot]} {self._results[slot]}\n"
+        ).encode()
+        self._pending.append(line)
+        self._offsets.append(self._log_end)
+        self._log_end += len(line)
+        if len(self._pending) >= SPILL_BATCH:
+            self._flush()
+
+    def _files(self) -> Tuple[IO[bytes], IO[bytes]]:
+        """Return the log and index files, creating them on first use."""
+        if self._log is None or self._index is None:
+            if self.path is not None:
+                self._log = open(self.path, "w+b")
+                self._index = open(self.path + ".idx", "w+b")
+            else:
+                import tempfile
+
+                self._log = tempfile.TemporaryFile()
+                self._index = tempfile.TemporaryFile()
+        return self._log, self._index
+
+    def _flush(self) -> None:
+        """Append the queued lines to the log and their offsets to the index."""
+        if not self._pending:
+            return
+        log, index = self._files()
+        log.seek(0, 2)
+        log.write(b"".join(self._pending))
+        index.seek(0, 2)
+        index.write(self._offsets.tobytes())
+        self._written += len(self._pending)
+        self._pending.clear()
+        del self._offsets[:]
+
+    def _read(self, number: int) -> HistoryEntry:
+        """Read a spilled calculation from the log."""
+        if number > self._written:
+            self._flush()
+        log, index = self._files()
+        index.seek((number - 1) * _OFFSET_SIZE)
+        offset = array("Q", index.read(_OFFSET_SIZE))[0]
+        log.seek(offset)
+        operation, a, b, result = log.readline().decode().split()
+        parse = self.parse
+        return HistoryEntry(operation, parse(a), parse(b), parse(result))
@@ -1,49 +1,228 @@
-"""Main module for the Calculator CLI application."""
+"""Main module for the Calculator CLI application.
 
-from typing import Optional
+Only the REPL's dependencies are imported up front. Each other mode
+imports its implementation when it is selected, so short-lived
+invocations do not pay for asyncio, multiprocessing or mmap.
+"""
 
+import argparse
+import codecs
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import IO, TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+from .defaults import (
+    DEFAULT_DIVIDE_DIGITS,
+    DEFAULT_EXPORT_INTERVAL,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_HOST,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_PERIOD,
+    DEFAULT_PERSISTENT_CACHE_SIZE,
+    DEFAULT_PORT,
+    DEFAULT_PRECISION,
+    DEFAULT_WORKER_PORT,
+    NUMERIC_BACKENDS,
+    REDUCTIONS,
+    ZERO_POLICIES,
+)
 from .operations import Operations
+from .registry import REGISTRY
 from .validator import Validator
 from .exceptions import (
+    CalculatorError,
+    ClusterError,
     DivisionByZeroError,
+    HistoryError,
+    InvalidBinaryFileError,
+    InvalidColumnError,
+    InvalidExpressionError,
     InvalidOperationError,
     InvalidNumberError,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .history import History
+    from .metrics import Metrics
+    from .variables import VariableGraph
+
+# Most characters of piped input read per block by CalculatorCLI.run_stream;
+# the output produced by each block is written and flushed at once.
+STREAM_BLOCK_CHARS = 64 * 1024
+
+# Reads one answer, given the prompt for it; input() when interactive.
+Reader = Callable[[str], str]
+
+# Calculations listed by the REPL's history command.
+HISTORY_LINES = 10
+
 
 class CalculatorCLI:
     """Calculator command-line interface with REPL functionality."""
 
-    def __init__(self) -> None:
-        """Initialize the calculator CLI."""
-        self.operations = Operations()
+    def __init__(
+        self,
+        operations: Optional[Operations] = None,
+        metrics: Optional["Metrics"] = None,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        history_file: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the calculator CLI.
+
+        Args:
+            operations: The operations implementation, plain Operations
+                by default.
+            metrics: Metrics to record REPL calculations into. Defaults to
+                the metrics of an InstrumentedOperations; None disables them.
+            history_size: Calculations the history keeps in memory; older
+                ones are spilled to disk.
+            history_file: File the complete history is written to; a
+                temporary file holds the spilled calculations if omitted.
+        """
+        self.operations = operations if operations is not None else Operations()
+        if metrics is None:
+            metrics = getattr(self.operations, "metrics", None)
+        self.metrics = metrics
         self.validator = Validator()
+        # Created by the first assignment, such as "x = a * b".
+        self.variables: Optional["VariableGraph"] = None
+        # Created by the first calculation.
+        self.history: Optional["History"] = None
+        self.history_size = history_size
+        self.history_file = history_file
 
     def display_welcome(self) -> None:
         """Display welcome message and instructions."""
         print("Welcome to the Calculator CLI!")
-        print("Available operations: +, -, *, /")
+        print(f"Available operations: {REGISTRY.describe()}")
         print("Type 'quit' or 'exit' to exit.")
+        if self.metrics is not None:
+            print("Type 'stats' to show calculation metrics.")
         print()
 
+    def display_stats(self) -> None:
+        """Display the recorded calculation metrics."""
+        if self.metrics is None:
+            print("Metrics are disabled. Start the calculator with --metrics.")
+        else:
+            print(self.metrics.format_stats())
+
+    def assign_variable(self, statement: str) -> None:
+        """
+        Define or update a variable and display every value recomputed.
+
+        Args:
+            statement: The assignment, such as ``x = a * b``.
+        """
+        if self.variables is None:
+            from .variables import VariableGraph
+
+            self.variables = VariableGraph(self.operations.backend)
+        try:
+            updated = self.variables.assign(statement)
+        except CalculatorError as e:
+            print(f"Error: {e.message}")
+            return
+        for name in updated:
+            try:
+                print(f"{name} = {self.variables.get(name)}")
+            except CalculatorError as e:
+                print(f"{name} = Error: {e.message}")
+
+    def display_history(self) -> None:
+        """Display the latest calculations with their recall numbers."""
+        history = self.history
+        if history is None:
+            print("No calculations yet.")
+            return
+        first = max(len(history) - HISTORY_LINES, 0) + 1
+        for number, entry in enumerate(history.tail(HISTORY_LINES), first):
+            print(f"${number}: {entry.a} {entry.operation} {entry.b} = {entry.result}")
+
+    def record(self, operation: str, a: float, b: float, result: float) -> None:
+        """
+        Add a calculation to the history, creating it on first use.
+
+        Args:
+            operation: The operation performed.
+            a: First number.
+            b: Second number.
+            result: The result.
+        """
+        if self.history is None:
+            from .history import History
+
+            backend = self.operations.backend
+            self.history = History(
+                self.history_size,
+                self.history_file,
+                None if backend is None else backend.parse,
+            )
+        self.history.append(operation, a, b, result)
+
+    def recall(self, reference: str) -> float:
+        """
+        Recall a result from the history.
+
+        Args:
+            reference: ``ans`` for the latest result, or ``$N`` for the
+                result of calculation N.
+
+        Returns:
+            The result.
+
+        Raises:
+            InvalidNumberError: If reference is not ``ans`` or ``$N``.
+            HistoryError: If there is no such result.
+        """
+        if reference == "ans":
+            number = len(self.history) if self.history is not None else 0
+        elif reference[1:].isdigit():
+            number = int(reference[1:])
+        else:
+            raise InvalidNumberError(reference)
+        if self.history is None:
+            raise HistoryError(number, 0)
+        result: float = self.history.result(number)
+        return result
+
     def display_goodbye(self) -> None:
         """Display goodbye message."""
         print("Thank you for using Calculator CLI!")
 
-    def get_operation(self) -> Optional[str]:
+    def get_operation(self, read: Optional[Reader] = None) -> Optional[str]:
         """
         Get operation input from user.
 
+        Args:
+            read: Reads one answer given its prompt, input() by default.
+
         Returns:
             The validated operation string, or None if quit command.
         """
+        read = read or input
         while True:
             try:
-                operation_input = input("Enter operation (+, -, *, /): ")
+                operation_input = read(f"Enter operation ({REGISTRY.describe()}): ")
 
                 if self.validator.is_quit_command(operation_input):
                     return None
 
+                if self.validator.sanitize_input(operation_input) == "stats":
+                    self.display_stats()
+                    continue
+
+                if self.validator.sanitize_input(operation_input) == "history":
+                    self.display_history()
+                    continue
+
+                if "=" in operation_input:
+                    self.assign_variable(operation_input)
+                    continue
+
                 return self.validator.validate_operation(operation_input)
 
             except InvalidOperationError as e:
@@ -55,27 +234,40 @@ class CalculatorCLI:
                 print("\nExiting...")
                 return None
 
-    def get_number(self, prompt: str) -> Optional[float]:
+    def get_number(self, prompt: str, read: Optional[Reader] = None) -> Optional[float]:
         """
         Get number input from user.
 
         Args:
             prompt: The prompt to display to the user.
+            read: Reads one answer given its prompt, input() by default.
 
         Returns:
             The validated number, or None if quit command.
         """
+        read = read or input
         while True:
             try:
-                number_input = input(prompt)
+                number_input = read(prompt)
 
                 if self.validator.is_quit_command(number_input):
                     return None
 
-                return self.validator.validate_number(number_input)
+                name = number_input.strip()
+                if name.lower() == "ans" or name.startswith("$"):
+                    return self.recall(name.lower())
+                if self.variables is not None and name in self.variables:
+                    return self.variables.get(name)
+
+                return self.validator.validate_number(
+                    number_input, self.operations.backend
+                )
 
             except InvalidNumberError as e:
                 print(f"Error: {e.message}")
+            except CalculatorError as e:
+                # A variable whose formula failed, or a result not recorded.
+                print(f"Error: {e.message}")
             except KeyboardInterrupt:
                 print("\nExiting...")
                 return None
@@ -94,33 +286,46 @@ class CalculatorCLI:
             first_num: First number.
             second_num: Second number.
         """
+        metrics = self.metrics
+        start = time.perf_counter_ns() if metrics is not None else 0
+        error: Optional[Exception] = None
         try:
             result = self.operations.calculate(operation, first_num, second_num)
             print(f"Result: {result}")
+            self.record(operation, first_num, second_num, result)
         except DivisionByZeroError as e:
+            error = e
             print(f"Error: {e.message}")
         except Exception as e:
+            error = e
             print(f"Unexpected error: {e}")
+        if metrics is not None:
+            from .metrics import REPL_SCOPE
+
+            metrics.record(REPL_SCOPE, operation, time.perf_counter_ns() - start, error)
 
-    def run_single_calculation(self) -> bool:
+    def run_single_calculation(self, read: Optional[Reader] = None) -> bool:
         """
         Run a single calculation cycle.
 
+        Args:
+            read: Reads one answer given its prompt, input() by default.
+
         Returns:
             True to continue, False to exit.
         """
         # Get operation
-        operation = self.get_operation()
+        operation = self.get_operation(read)
         if operation is None:
             return False
 
         # Get first number
-        first_num = self.get_number("Enter first number: ")
+        first_num = self.get_number("Enter first number: ", read)
         if first_num is None:
             return False
 
         # Get second number
-        second_num = self.get_number("Enter second number: ")
+        second_num = self.get_number("Enter second number: ", read)
         if second_num is None:
             return False
 
@@ -130,24 +335,765 @@ class CalculatorCLI:
 
         return True
 
-    def run(self) -> None:
-        """Run the calculator REPL (Read-Eval-Print Loop)."""
+    def run(self, read: Optional[Reader] = None) -> None:
+        """
+        Run the calculator REPL (Read-Eval-Print Loop).
+
+        Args:
+            read: Reads one answer given its prompt, input() by default.
+        """
         self.display_welcome()
 
         try:
             while True:
-                if not self.run_single_calculation():
+                if not self.run_single_calculation(read):
                     break
         except KeyboardInterrupt:
             print("\nExiting...")
         finally:
             self.display_goodbye()
+            if self.history is not None:
+                self.history.close()
+
+    def run_stream(
+        self,
+        source: IO[str],
+        output: IO[str],
+        block_chars: int = STREAM_BLOCK_CHARS,
+    ) -> None:
+        """
+        Run the REPL over non-interactive streams, such as a piped session.
+
+        The answers are read from source in blocks of lines instead of one
+        input() call per prompt, and the output is buffered and written
+        once per block. Prompts are not shown; otherwise the output is
+        exactly what run() prints for the same answers.
+
+        Args:
+            source: The stream of answers, one per line.
+            output: The stream the REPL output is written to.
+            block_chars: Most characters read per block.
+        """
+        buffer = io.StringIO()
+        answers = _read_blocks(source, buffer, output, block_chars)
+
+        def read(prompt: str) -> str:
+            answer = next(answers, None)
+            if answer is None:
+                raise EOFError
+            return answer
+
+        try:
+            with redirect_stdout(buffer):
+                self.run(read)
+        finally:
+            output.write(buffer.getvalue())
+            output.flush()
+
+
+def _read_blocks(
+    source: IO[str], buffer: io.StringIO, output: IO[str], block_chars: int
+) -> Iterator[str]:
+    """
+    Yield the lines of source a block at a time.
+
+    Before each block is read, the output buffered so far is written and
+    flushed, so a consumer sees the results of one block before the next.
+
+    Args:
+        source: The input stream.
+        buffer: The buffer the REPL prints into.
+        output: The stream the buffer is drained into.
+        block_chars: Most characters read per block.
+
+    Yields:
+        The input lines.
+    """
+    blocks = _read_available(source, block_chars)
+    while True:
+        output.write(buffer.getvalue())
+        output.flush()
+        buffer.seek(0)
+        buffer.truncate()
+        lines = next(blocks, None)
+        if lines is None:
+            return
+        yield from lines
+
+
+def _read_available(source: IO[str], block_chars: int) -> Iterator[List[str]]:
+    """
+    Yield the complete lines of source as they become available.
+
+    A file or pipe is read with a single read1() per block, which returns
+    whatever is available instead of waiting for a full block, so a
+    coprocess that writes one line and waits for its answer is served at
+    once. Other text streams are read with readlines().
+
+    Args:
+        source: The input stream.
+        block_chars: Most characters read per block.
+
+    Yields:
+        Non-empty lists of lines; the last line may lack its newline.
+    """
+    if not isinstance(source, io.TextIOWrapper):
+        while True:
+            lines = source.readlines(block_chars)
+            if not lines:
+                return
+            yield lines
+
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(source.encoding)(source.errors or "strict"),
+        translate=True,
+    )
+    partial = ""
+    while True:
+        data = source.buffer.read1(block_chars)
+        *complete, partial = (partial + decoder.decode(data, not data)).split("\n")
+        lines = [line + "\n" for line in complete]
+        if not data:
+            if partial:
+                lines.append(partial)
+            if lines:
+                yield lines
+            return
+        if lines:
+            yield lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        The configured argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="calculator",
+        description="Command-line calculator with a REPL interface.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="evaluate '<operation> <number> <number>' lines from FILE "
+        "('-' for standard input) and print one result per line",
+    )
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=int,
+        default=1,
+        help="evaluate the --batch FILE across N worker processes",
+    )
+    parser.add_argument(
+        "--cluster",
+        metavar="HOST:PORT,...",
+        help="evaluate the --batch FILE on the 'calculator worker' processes "
+        "at these addresses",
+    )
+    parser.add_argument(
+        "--on-zero",
+        choices=ZERO_POLICIES,
+        default="error",
+        help="what a --batch division by zero yields: an error line (default), "
+        "nan, or a signed inf",
+    )
+    parser.add_argument(
+        "--numeric",
+        choices=NUMERIC_BACKENDS,
+        default="float",
+        help="number type of the REPL and --batch: float (default), exact int "
+        "with a float fallback, decimal, or fraction",
+    )
+    parser.add_argument(
+        "--precision",
+        metavar="DIGITS",
+        type=int,
+        help=f"significant digits of --numeric decimal (default: {DEFAULT_PRECISION})",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="ENTRIES",
+        type=int,
+        default=0,
+        help="memoize up to ENTRIES calculation results (0 disables the cache)",
+    )
+    parser.add_argument(
+        "--cache-bytes",
+        metavar="BYTES",
+        type=int,
+        help="also bound the result cache by its estimated memory footprint",
+    )
+    parser.add_argument(
+        "--persistent-cache",
+        metavar="FILE",
+        help="reuse calculation results across runs through the SQLite "
+        "database FILE, which several processes may share",
+    )
+    parser.add_argument(
+        "--persistent-cache-size",
+        metavar="ENTRIES",
+        type=int,
+        default=DEFAULT_PERSISTENT_CACHE_SIZE,
+        help="results kept in --persistent-cache FILE, least recently used "
+        "evicted first (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="record per-operation call counts, errors and latency "
+        "(type 'stats' in the REPL to show them)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="dump metrics to PATH in Prometheus text format (implies --metrics)",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        metavar="SECONDS",
+        type=float,
+        default=DEFAULT_EXPORT_INTERVAL,
+        help="seconds between --metrics-file dumps (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--history-size",
+        metavar="N",
+        type=int,
+        default=DEFAULT_HISTORY_SIZE,
+        help="calculations the REPL history keeps in memory before spilling "
+        "older ones to disk (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--history-file",
+        metavar="FILE",
+        help="write the complete REPL history to FILE (overwritten), with "
+        "its offset index in FILE.idx",
+    )
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    serve = commands.add_parser(
+        "serve", help="serve calculations over a line-based TCP protocol"
+    )
+    serve.add_argument("--host", default=DEFAULT_HOST, help="interface to bind")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+
+    worker = commands.add_parser(
+        "worker", help="evaluate chunks of --cluster batch files sent over TCP"
+    )
+    worker.add_argument("--host", default=DEFAULT_HOST, help="interface to bind")
+    worker.add_argument(
+        "--port", type=int, default=DEFAULT_WORKER_PORT, help="TCP port"
+    )
+
+    evaluate_command = commands.add_parser(
+        "eval", help="evaluate one calculation through the resident daemon"
+    )
+    evaluate_command.add_argument(
+        "request", nargs="+", help="the calculation, for example '+ 3 4'"
+    )
+    evaluate_command.add_argument("--socket", help="daemon Unix socket path")
+    evaluate_command.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="evaluate in-process without contacting the daemon",
+    )
+
+    daemon = commands.add_parser(
+        "daemon", help="run the resident daemon used by 'calculator eval'"
+    )
+    daemon.add_argument("--socket", help="Unix socket path to listen on")
+    daemon.add_argument(
+        "--idle-timeout",
+        metavar="SECONDS",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="exit after SECONDS without connections",
+    )
+
+    reduce_command = commands.add_parser(
+        "reduce", help="sum, multiply or find the min or max of a stream of numbers"
+    )
+    reduce_command.add_argument("reduction", choices=REDUCTIONS)
+    reduce_command.add_argument(
+        "input", help="file with one number per line ('-' for standard input)"
+    )
+    reduce_command.add_argument(
+        "--scan",
+        action="store_true",
+        help="print the running value after every number instead of the total",
+    )
+
+    csv_command = commands.add_parser(
+        "csv", help="append a formula column to every row of a CSV file"
+    )
+    csv_command.add_argument(
+        "--expr",
+        required=True,
+        help="formula over header names or col1, col2, ... such as "
+        "'price * qty' or 'col3 * col5'",
+    )
+    csv_command.add_argument("input", help="CSV file ('-' for standard input)")
+    csv_command.add_argument(
+        "output",
+        nargs="?",
+        default="-",
+        help="CSV file to write (default: standard output)",
+    )
+    csv_command.add_argument(
+        "--no-header",
+        action="store_true",
+        help="the first row is data, not column titles",
+    )
+    csv_command.add_argument(
+        "--name", default="result", help="title of the result column"
+    )
+    csv_command.add_argument("--delimiter", default=",", help="field delimiter")
+
+    divide = commands.add_parser(
+        "divide", help="print the exact decimal expansion of a quotient"
+    )
+    divide.add_argument("dividend", help="integer or decimal, such as 22 or 0.125")
+    divide.add_argument("divisor", help="integer or decimal, such as 7 or 1.5")
+    divide.add_argument(
+        "--digits",
+        metavar="N",
+        type=int,
+        default=DEFAULT_DIVIDE_DIGITS,
+        help=f"digits after the point, truncated (default: {DEFAULT_DIVIDE_DIGITS})",
+    )
+    divide.add_argument(
+        "--repeating",
+        action="store_true",
+        help="print every digit, the repeating part in parentheses",
+    )
+    divide.add_argument(
+        "--max-period",
+        metavar="N",
+        type=int,
+        default=DEFAULT_MAX_PERIOD,
+        help=f"longest repeating part to look for (default: {DEFAULT_MAX_PERIOD})",
+    )
+    divide.add_argument(
+        "--output", metavar="FILE", help="file to write (default: standard output)"
+    )
+
+    binary = commands.add_parser(
+        "binary", help="convert and evaluate fixed-width binary operand files"
+    )
+    binary_commands = binary.add_subparsers(
+        dest="binary_command", metavar="ACTION", required=True
+    )
+    encode = binary_commands.add_parser(
+        "encode", help="convert a text batch file to a binary operand file"
+    )
+    encode.add_argument("input", help="text batch file ('-' for standard input)")
+    encode.add_argument("output", help="binary operand file to write")
+    decode = binary_commands.add_parser(
+        "decode", help="print a binary operand file as text batch lines"
+    )
+    decode.add_argument("input", help="binary operand file")
+    run = binary_commands.add_parser(
+        "run", help="evaluate a binary operand file into a float64 result file"
+    )
+    run.add_argument("input", help="binary operand file")
+    run.add_argument("results", help="float64 result file to write")
+    run.add_argument("--status", metavar="FILE", help="also write status bytes")
+    run.add_argument(
+        "--backend",
+        choices=("auto", "python", "numpy"),
+        default="auto",
+        help="evaluation backend (default: numpy when installed)",
+    )
+    return parser
+
+
+def run_eval(request: str, path: Optional[str], use_daemon: bool) -> None:
+    """
+    Evaluate one calculation and print its result.
+
+    Args:
+        request: The calculation, such as ``+ 3 4``.
+        path: The daemon socket path, or None for the default.
+        use_daemon: False to evaluate in-process.
+
+    Raises:
+        SystemExit: With status 1 if the calculation fails.
+    """
+    from .client import evaluate
+    from .protocol import parse_response
+
+    success, payload = parse_response(evaluate(request, path, use_daemon))
+    if not success:
+        print(f"Error: {payload}", file=sys.stderr)
+        sys.exit(1)
+    print(payload)
+
+
+def run_binary_command(args: argparse.Namespace) -> None:
+    """
+    Run a ``calculator binary`` action.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        InvalidBinaryFileError: If an operand file is malformed.
+        ValueError: If the requested backend is unavailable.
+    """
+    from .batch import format_error
+    from .binary import decode_to_text, encode_text, run_binary
+
+    if args.binary_command == "encode":
+        with open(args.output, "wb") as destination:
+            if args.input == "-":
+                errors = encode_text(sys.stdin, destination)
+            else:
+                with open(args.input, encoding="utf-8") as source:
+                    errors = encode_text(source, destination)
+        for line_number, message in errors:
+            print(format_error(line_number, message), end="", file=sys.stderr)
+    elif args.binary_command == "decode":
+        decode_to_text(args.input, sys.stdout)
+    else:
+        with open(args.results, "wb") as results:
+            if args.status is None:
+                failed = run_binary(args.input, results, backend=args.backend)
+            else:
+                with open(args.status, "wb") as status:
+                    failed = run_binary(args.input, results, status, args.backend)
+        if failed:
+            print(f"{failed} records failed.", file=sys.stderr)
+
+
+def run_csv_command(args: argparse.Namespace) -> None:
+    """
+    Run ``calculator csv``, reporting failed rows on standard error.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        InvalidExpressionError: If the formula is not valid.
+        InvalidColumnError: If the formula reads a column that does not exist.
+    """
+    from .csvfile import run_csv
+
+    if args.input == "-":
+        source: IO[str] = sys.stdin
+    else:
+        source = open(args.input, encoding="utf-8", newline="")
+    try:
+        if args.output == "-":
+            output: IO[str] = sys.stdout
+        else:
+            output = open(args.output, "w", encoding="utf-8", newline="")
+        try:
+            failed = run_csv(
+                source,
+                output,
+                args.expr,
+                sys.stderr,
+                on_zero=args.on_zero,
+                header=not args.no_header,
+                name=args.name,
+                delimiter=args.delimiter,
+            )
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    if failed:
+        print(f"{failed} rows failed.", file=sys.stderr)
+
+
+def run_divide_command(args: argparse.Namespace) -> None:
+    """
+    Run ``calculator divide``, streaming the digits as they are computed.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Raises:
+        OSError: If the output file cannot be written.
+        SystemExit: With status 1 if an operand is not a number, the
+            divisor is zero, or the repeating part is longer than
+            --max-period.
+    """
+    from .digits import ExactQuotient
+
+    try:
+        quotient = ExactQuotient.parse(args.dividend, args.divisor)
+    except CalculatorError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    output = (
+        sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    )
+    try:
+        if args.repeating:
+            if not quotient.write_repeating(output, args.max_period):
+                print(
+                    f"Error: the repeating part is longer than {args.max_period} "
+                    "digits.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+        else:
+            quotient.write(output, args.digits)
+        output.write("\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def run_reduce_command(args: argparse.Namespace) -> None:
+    """
+    Run ``calculator reduce`` and print its result.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Raises:
+        OSError: If the input file cannot be read.
+        SystemExit: With status 1 if a line is not a number, or min or max
+            is taken of an empty input.
+    """
+    from .batch import format_error
+    from .reductions import NumberReader, run_reduction
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    numbers = NumberReader(source)
+    try:
+        run_reduction(args.reduction, numbers, sys.stdout, args.scan)
+    except InvalidNumberError as e:
+        sys.stdout.flush()
+        print(format_error(numbers.line_number, str(e)), end="", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the calculator application.
+
+    Args:
+        argv: Command-line arguments, defaulting to sys.argv[1:].
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    if args.workers > 1 and args.batch in (None, "-"):
+        parser.error("--workers requires --batch with a file path")
+
+    addresses: List[Tuple[str, int]] = []
+    if args.cluster is not None:
+        if args.batch in (None, "-"):
+            parser.error("--cluster requires --batch with a file path")
+        if args.workers > 1:
+            parser.error("--cluster and --workers cannot be combined")
+        from .cluster import parse_address
+
+        try:
+            addresses = [parse_address(address) for address in args.cluster.split(",")]
+        except ValueError as e:
+            parser.error(str(e))
+
+    # The cache and metrics options wrap the Operations of the REPL, --batch,
+    # daemon, serve and worker; the other modes never calculate through it.
+    if args.workers > 1 or addresses:
+        elsewhere: Optional[str] = "--workers or --cluster"
+    elif args.command not in (None, "daemon", "serve", "worker"):
+        elsewhere = f"the {args.command} command"
+    else:
+        elsewhere = None
+    if elsewhere is not None:
+        for option, used in (
+            ("--cache", args.cache or args.cache_bytes is not None),
+            ("--persistent-cache", args.persistent_cache is not None),
+            ("--metrics", args.metrics or args.metrics_file is not None),
+        ):
+            if used:
+                parser.error(f"{option} does not apply to {elsewhere}")
+
+    if args.history_size < 1:
+        parser.error("--history-size must be a positive integer")
+
+    numeric: Optional[Operations] = None
+    if args.numeric != "float" or args.precision is not None:
+        if args.command is not None or args.workers > 1 or addresses:
+            parser.error("--numeric and --precision apply to the REPL and --batch")
+        from .numeric import NumericOperations, make_backend
+
+        try:
+            numeric = NumericOperations(make_backend(args.numeric, args.precision))
+        except ValueError as e:
+            parser.error(f"invalid --precision: {e}")
+
+    operations = numeric
+    store: Optional["PersistentCache"] = None
+    if args.persistent_cache is not None:
+        import sqlite3
+
+        from .cache import CachedOperations
+        from .persistent_cache import PersistentCache
+
+        backend = numeric.backend if numeric is not None else None
+        try:
+            store = PersistentCache(
+                args.persistent_cache, args.persistent_cache_size, backend
+            )
+        except ValueError as e:
+            parser.error(f"invalid persistent cache size: {e}")
+        except sqlite3.Error as e:
+            parser.error(f"cannot open {args.persistent_cache}: {e}")
+        operations = CachedOperations(store, numeric)
+
+    cached: Optional["CachedOperations"] = None
+    if args.cache or args.cache_bytes is not None:
+        from .cache import CachedOperations, ResultCache
+
+        try:
+            cached = CachedOperations(
+                ResultCache(args.cache, args.cache_bytes), operations
+            )
+        except ValueError as e:
+            parser.error(f"invalid cache size: {e}")
+    if cached is not None:
+        operations = cached
+
+    exporter: Optional["PrometheusFileExporter"] = None
+    if args.metrics or args.metrics_file:
+        from .metrics import InstrumentedOperations, Metrics, PrometheusFileExporter
+
+        metrics = Metrics()
+        operations = InstrumentedOperations(metrics, operations)
+        if args.metrics_file:
+            try:
+                exporter = PrometheusFileExporter(
+                    metrics, args.metrics_file, args.metrics_interval
+                )
+            except ValueError as e:
+                parser.error(f"invalid --metrics-interval: {e}")
+            exporter.start()
+
+    try:
+        if args.command == "eval":
+            run_eval(" ".join(args.request), args.socket, not args.no_daemon)
+        elif args.command == "daemon":
+            from .client import default_socket_path
+            from .daemon import run_daemon
+
+            path = args.socket or default_socket_path()
+            try:
+                run_daemon(path, args.idle_timeout, operations)
+            except OSError as e:
+                parser.error(f"cannot listen on {path}: {e}")
+        elif args.command == "serve":
+            from .server import run_server
+
+            try:
+                run_server(args.host, args.port, operations)
+            except OSError as e:
+                parser.error(f"cannot listen on {args.host}:{args.port}: {e.strerror}")
+        elif args.command == "worker":
+            from .cluster import run_worker
+
+            try:
+                run_worker(args.host, args.port, operations)
+            except OSError as e:
+                parser.error(f"cannot listen on {args.host}:{args.port}: {e.strerror}")
+        elif args.command == "reduce":
+            try:
+                run_reduce_command(args)
+            except OSError as e:
+                parser.error(f"cannot read {args.input}: {e.strerror}")
+        elif args.command == "csv":
+            if len(args.delimiter) != 1:
+                parser.error("--delimiter must be a single character")
+            try:
+                run_csv_command(args)
+            except OSError as e:
+                parser.error(f"cannot access {e.filename}: {e.strerror}")
+            except (InvalidExpressionError, InvalidColumnError) as e:
+                parser.error(str(e))
+        elif args.command == "divide":
+            if args.digits < 0:
+                parser.error("--digits must not be negative")
+            if args.max_period < 1:
+                parser.error("--max-period must be a positive integer")
+            try:
+                run_divide_command(args)
+            except OSError as e:
+                parser.error(f"cannot write {args.output}: {e.strerror}")
+        elif args.command == "binary":
+            try:
+                run_binary_command(args)
+            except OSError as e:
+                parser.error(f"cannot access {e.filename}: {e.strerror}")
+            except (InvalidBinaryFileError, ValueError) as e:
+                parser.error(str(e))
+        elif args.batch is not None:
+            try:
+                if addresses:
+                    from .cluster import run_cluster
+
+                    run_cluster(args.batch, sys.stdout, addresses, on_zero=args.on_zero)
+                elif args.workers > 1:
+                    from .parallel import run_parallel
 
+                    run_parallel(
+                        args.batch, sys.stdout, args.workers, on_zero=args.on_zero
+                    )
+                else:
+                    from .batch import run_batch_path
 
-def main() -> None:
-    """Main entry point for the calculator application."""
-    calculator = CalculatorCLI()
-    calculator.run()
+                    run_batch_path(
+                        args.batch, operations=operations, on_zero=args.on_zero
+                    )
+            except OSError as e:
+                parser.error(f"cannot read {args.batch}: {e.strerror}")
+            except ClusterError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            calculator = CalculatorCLI(
+                operations,
+                history_size=args.history_size,
+                history_file=args.history_file,
+            )
+            if sys.stdin.isatty():
+                calculator.run()
+            else:
+                calculator.run_stream(sys.stdin, sys.stdout)
+    finally:
+        if exporter is not None:
+            exporter.stop()
+            for error in exporter.errors[-1:]:
+                print(
+                    f"Cannot write {args.metrics_file}: {error.strerror}",
+                    file=sys.stderr,
+                )
+        if cached is not None:
+            print(cached.cache.format_stats(), file=sys.stderr)
+        if store is not None:
+            print(store.format_stats(), file=sys.stderr)
+            store.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,344 @@
+"""Per-operation call, error and latency metrics for the calculator.
+
+Instrumentation is opt-in: InstrumentedOperations wraps another operations
+implementation, so the plain Operations path carries no timing code at
+all when metrics are disabled.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .defaults import DEFAULT_EXPORT_INTERVAL
+from .operations import Operations
+
+# Histogram bucket upper bounds are powers of two nanoseconds, from 64 ns
+# to about 1.07 s; slower calls fall into the final +Inf bucket.
+MIN_BUCKET_EXPONENT = 6
+MAX_BUCKET_EXPONENT = 30
+BUCKET_BOUNDS_NS = tuple(
+    2**exponent for exponent in range(MIN_BUCKET_EXPONENT, MAX_BUCKET_EXPONENT + 1)
+)
+
+# Metrics are labelled with the layer that recorded them.
+OPERATIONS_SCOPE = "operations"
+REPL_SCOPE = "repl"
+
+_Key = Tuple[str, str]
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic (power-of-two) buckets."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+
+    def observe(self, elapsed_ns: int) -> None:
+        """
+        Record one latency.
+
+        Args:
+            elapsed_ns: The latency in nanoseconds.
+        """
+        # The bucket with bound 2**e holds latencies in (2**(e-1), 2**e].
+        index = (elapsed_ns - 1).bit_length() - MIN_BUCKET_EXPONENT
+        if index < 0:
+            index = 0
+        elif index > len(BUCKET_BOUNDS_NS):
+            index = len(BUCKET_BOUNDS_NS)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile from the bucket counts.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The upper bound in nanoseconds of the bucket holding the
+            quantile (infinity for the overflow bucket, 0 when empty).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_NS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return float("inf")
+
+
+class Metrics:
+    """Thread-safe call counters, error counters and latency histograms."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self.calls: Dict[_Key, int] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+        self.latency: Dict[_Key, LatencyHistogram] = {}
+
+    def record(
+        self,
+        scope: str,
+        operation: str,
+        elapsed_ns: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            scope: The layer that made the call, such as OPERATIONS_SCOPE.
+            operation: The operation symbol.
+            elapsed_ns: The call latency in nanoseconds.
+            error: The exception the call raised, if any.
+        """
+        key = (scope, operation)
+        with self._lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+            if error is not None:
+                error_key = (scope, operation, type(error).__name__)
+                self.errors[error_key] = self.errors.get(error_key, 0) + 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = LatencyHistogram()
+            histogram.observe(elapsed_ns)
+
+    def clear(self) -> None:
+        """Reset every metric."""
+        with self._lock:
+            self.calls.clear()
+            self.errors.clear()
+            self.latency.clear()
+
+    def format_stats(self) -> str:
+        """
+        Format the metrics for display.
+
+        Returns:
+            One line per scope and operation with its call and error
+            counts and latency estimates, or a note that nothing was
+            recorded yet.
+        """
+        with self._lock:
+            if not self.calls:
+                return "No calculations recorded yet."
+            lines = []
+            for key in sorted(self.calls):
+                scope, operation = key
+                histogram = self.latency[key]
+                errors = sum(
+                    count
+                    for (error_scope, error_operation, _), count in self.errors.items()
+                    if (error_scope, error_operation) == key
+                )
+                mean_us = histogram.total_ns / histogram.count / 1000
+                lines.append(
+                    f"{scope} {operation}: {self.calls[key]} calls, {errors} errors, "
+                    f"mean {mean_us:.1f} us, "
+                    f"p50 <= {_format_ns(histogram.quantile(0.5))}, "
+                    f"p99 <= {_format_ns(histogram.quantile(0.99))}"
+                )
+            for (scope, operation, name), count in sorted(self.errors.items()):
+                lines.append(f"{scope} {operation}: {name} x{count}")
+        return "\n".join(lines)
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        lines = [
+            "# HELP calculator_calls_total Calculations performed.",
+            "# TYPE calculator_calls_total counter",
+        ]
+        with self._lock:
+            for (scope, operation), count in sorted(self.calls.items()):
+                lines.append(
+                    f"calculator_calls_total{_labels(scope, operation)} {count}"
+                )
+
+            lines.append("# HELP calculator_errors_total Calculations that failed.")
+            lines.append("# TYPE calculator_errors_total counter")
+            for (scope, operation, name), count in sorted(self.errors.items()):
+                labels = _labels(scope, operation, error=name)
+                lines.append(f"calculator_errors_total{labels} {count}")
+
+            lines.append(
+                "# HELP calculator_latency_seconds Calculation latency in seconds."
+            )
+            lines.append("# TYPE calculator_latency_seconds histogram")
+            for (scope, operation), histogram in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKET_BOUNDS_NS, histogram.buckets):
+                    cumulative += count
+                    labels = _labels(scope, operation, le=repr(bound / 1e9))
+                    lines.append(
+                        f"calculator_latency_seconds_bucket{labels} {cumulative}"
+                    )
+                labels = _labels(scope, operation, le="+Inf")
+                lines.append(
+                    f"calculator_latency_seconds_bucket{labels} {histogram.count}"
+                )
+                labels = _labels(scope, operation)
+                lines.append(
+                    f"calculator_latency_seconds_sum{labels} "
+                    f"{histogram.total_ns / 1e9!r}"
+                )
+                lines.append(
+                    f"calculator_latency_seconds_count{labels} {histogram.count}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Atomically replace path with the Prometheus exposition text.
+
+        Args:
+            path: The output file path.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+
+def _format_ns(value: float) -> str:
+    """Format a latency bound in nanoseconds with a readable unit."""
+    if value == float("inf"):
+        return "inf"
+    if value < 1000:
+        return f"{value:.0f} ns"
+    if value < 1_000_000:
+        return f"{value / 1000:.1f} us"
+    return f"{value / 1_000_000:.1f} ms"
+
+
+def _labels(scope: str, operation: str, **extra: str) -> str:
+    """Format a Prometheus label set, escaping the label values."""
+    labels = {"scope": scope, "operation": operation, **extra}
+    body = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + body + "}"
+
+
+class InstrumentedOperations(Operations):
+    """Operations that record call counts, errors and latency per operator."""
+
+    def __init__(
+        self, metrics: Optional[Metrics] = None, inner: Optional[Operations] = None
+    ) -> None:
+        """
+        Initialize the instrumented operations.
+
+        Args:
+            metrics: The metrics to record into, new Metrics if omitted.
+            inner: The operations implementation to time, plain Operations
+                by default (a CachedOperations is timed including the cache).
+        """
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.inner = inner if inner is not None else Operations()
+        self.backend = self.inner.backend
+
+    def calculate(self, operation: str, a: float, b: float) -> float:  # type: ignore[override]
+        """
+        Perform the operation through the inner implementation and record it.
+
+        Args:
+            operation: The operation to perform (+, -, *, /).
+            a: First number.
+            b: Second number.
+
+        Returns:
+            The result of the calculation.
+
+        Raises:
+            DivisionByZeroError: If dividing by zero.
+            ValueError: If operation is not supported.
+        """
+        start = time.perf_counter_ns()
+        try:
+            result = self.inner.calculate(operation, a, b)
+        except Exception as e:
+            self.metrics.record(
+                OPERATIONS_SCOPE, operation, time.perf_counter_ns() - start, e
+            )
+            raise
+        self.metrics.record(OPERATIONS_SCOPE, operation, time.perf_counter_ns() - start)
+        return result
+
+
+class PrometheusFileExporter:
+    """Background thread that dumps metrics to a file at an interval."""
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        path: str,
+        interval: float = DEFAULT_EXPORT_INTERVAL,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            metrics: The metrics to export.
+            path: The output file path, replaced atomically on each dump.
+            interval: Seconds between dumps.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be a positive number of seconds.")
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.errors: List[OSError] = []
+
+    def start(self) -> None:
+        """Start dumping in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Dump the metrics every interval until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.dump()
+
+    def dump(self) -> None:
+        """Write the metrics file once, remembering any write error."""
+        try:
+            self.metrics.write_prometheus(self.path)
+        except OSError as e:
+            self.errors.append(e)
+
+    def stop(self) -> None:
+        """Stop the thread and write a final dump."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.dump()
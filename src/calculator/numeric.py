@@ -0,0 +1,336 @@
+"""Numeric backends: the number type operands are parsed into and computed in.
+
+The calculator computes in float by default. A backend swaps in native
+int, Decimal or Fraction arithmetic: Validator.validate_number parses
+operands with it and NumericOperations calculates with it. Values keep the
+calculator's ``float`` annotations; with a backend they hold its numbers.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from decimal import Context, Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Any, Callable, Dict, Optional
+
+from .defaults import DEFAULT_PRECISION
+from .exceptions import DivisionByZeroError
+from .operations import Operations
+from .registry import BUILTIN_OPERATIONS, REGISTRY
+
+
+class NumericBackend(ABC):
+    """Base class of the numeric backends, using the Python operators."""
+
+    name = ""
+
+    # Whether one instance may compute in several threads at once; an
+    # Engine gives each thread its own copy of a backend that may not.
+    thread_safe = True
+
+    @abstractmethod
+    def parse(self, text: str) -> Any:
+        """
+        Convert an operand to the backend's number type.
+
+        Args:
+            text: The operand text.
+
+        Returns:
+            The number.
+
+        Raises:
+            ValueError: If text is not a valid number for the backend.
+        """
+
+    def add(self, a: Any, b: Any) -> Any:
+        """Return a + b."""
+        return a + b
+
+    def subtract(self, a: Any, b: Any) -> Any:
+        """Return a - b."""
+        return a - b
+
+    def multiply(self, a: Any, b: Any) -> Any:
+        """Return a * b."""
+        return a * b
+
+    def divide(self, a: Any, b: Any) -> Any:
+        """Return a / b; b is never zero."""
+        return a / b
+
+    def negate(self, a: Any) -> Any:
+        """Return -a."""
+        return -a
+
+    def methods(self) -> Dict[str, Callable[[Any, Any], Any]]:
+        """
+        Map the symbols of the built-in operations to the backend's methods.
+
+        Returns:
+            The bound methods named like the registry's built-in functions.
+        """
+        return {
+            symbol: getattr(self, function.__name__)
+            for symbol, function in BUILTIN_OPERATIONS.items()
+        }
+
+
+class FloatBackend(NumericBackend):
+    """IEEE 754 double precision, the calculator's default arithmetic."""
+
+    name = "float"
+
+    def parse(self, text: str) -> float:
+        """
+        Convert an operand to a float.
+
+        Args:
+            text: The operand text.
+
+        Returns:
+            The number.
+
+        Raises:
+            ValueError: If text is not a valid float.
+        """
+        return float(text)
+
+
+def _as_float(value: Any) -> float:
+    """Convert a number to float, saturating huge integers to infinity."""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+class IntegerBackend(NumericBackend):
+    """Exact native integers, falling back to float where they cannot go.
+
+    Integer operands stay Python ints through addition, subtraction,
+    multiplication and exact division; an inexact quotient or an operand
+    that is not an integer literal (``1.5``, ``1e3``, ``inf``) is float.
+    """
+
+    name = "int"
+
+    def parse(self, text: str) -> Any:
+        """
+        Convert an operand to an int, or a float if it is not an integer.
+
+        Args:
+            text: The operand text.
+
+        Returns:
+            The number.
+
+        Raises:
+            ValueError: If text is not a valid number.
+        """
+        # Skip the failing int() call for the common non-integer spellings.
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+
+    def add(self, a: Any, b: Any) -> Any:
+        """Return a + b, exactly when both are ints."""
+        if type(a) is int and type(b) is int:
+            return a + b
+        return _as_float(a) + _as_float(b)
+
+    def subtract(self, a: Any, b: Any) -> Any:
+        """Return a - b, exactly when both are ints."""
+        if type(a) is int and type(b) is int:
+            return a - b
+        return _as_float(a) - _as_float(b)
+
+    def multiply(self, a: Any, b: Any) -> Any:
+        """Return a * b, exactly when both are ints."""
+        if type(a) is int and type(b) is int:
+            return a * b
+        return _as_float(a) * _as_float(b)
+
+    def divide(self, a: Any, b: Any) -> Any:
+        """Return a / b, as an int when both are ints and b divides a."""
+        if type(a) is int and type(b) is int:
+            quotient, remainder = divmod(a, b)
+            if not remainder:
+                return quotient
+            try:
+                return a / b
+            except OverflowError:
+                return -math.inf if (a < 0) != (b < 0) else math.inf
+        return _as_float(a) / _as_float(b)
+
+
+class DecimalBackend(NumericBackend):
+    """Decimal arithmetic with a fixed number of significant digits.
+
+    The backend creates its decimal contexts once and calls their methods,
+    so it neither reads nor changes the thread's current decimal context.
+    Like float, overflow gives an infinity and invalid operations give NaN.
+    Every operation records its signals in those contexts' flags, so an
+    instance is not shared between threads.
+    """
+
+    name = "decimal"
+    thread_safe = False
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            precision: Significant digits of every result.
+
+        Raises:
+            ValueError: If precision is not positive.
+        """
+        if precision <= 0:
+            raise ValueError("precision must be a positive integer.")
+        self.precision = precision
+        self.context = Context(prec=precision, traps=[])
+        self._parser = Context(prec=precision, traps=[InvalidOperation])
+
+    def parse(self, text: str) -> Decimal:
+        """
+        Convert an operand to a Decimal rounded to the precision.
+
+        Args:
+            text: The operand text.
+
+        Returns:
+            The number.
+
+        Raises:
+            ValueError: If text is not a valid decimal number.
+        """
+        try:
+            number = self._parser.create_decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Invalid decimal number: {text!r}") from None
+        if number.is_snan():
+            raise ValueError(f"Signaling NaN is not supported: {text!r}")
+        return number
+
+    def add(self, a: Any, b: Any) -> Decimal:
+        """Return a + b rounded to the precision."""
+        return self.context.add(a, b)
+
+    def subtract(self, a: Any, b: Any) -> Decimal:
+        """Return a - b rounded to the precision."""
+        return self.context.subtract(a, b)
+
+    def multiply(self, a: Any, b: Any) -> Decimal:
+        """Return a * b rounded to the precision."""
+        return self.context.multiply(a, b)
+
+    def divide(self, a: Any, b: Any) -> Decimal:
+        """Return a / b rounded to the precision."""
+        return self.context.divide(a, b)
+
+    def negate(self, a: Any) -> Decimal:
+        """Return -a rounded to the precision."""
+        return self.context.minus(a)
+
+
+class FractionBackend(NumericBackend):
+    """Exact rational arithmetic; operands may also be written ``1/3``."""
+
+    name = "fraction"
+
+    def parse(self, text: str) -> Fraction:
+        """
+        Convert an operand to a Fraction.
+
+        Args:
+            text: The operand text, such as ``3``, ``0.25`` or ``1/3``.
+
+        Returns:
+            The number.
+
+        Raises:
+            ValueError: If text is not a finite rational number.
+        """
+        try:
+            return Fraction(text)
+        except ZeroDivisionError:
+            raise ValueError(f"Zero denominator: {text!r}") from None
+
+
+BACKENDS: Dict[str, Callable[[], NumericBackend]] = {
+    "float": FloatBackend,
+    "int": IntegerBackend,
+    "decimal": DecimalBackend,
+    "fraction": FractionBackend,
+}
+
+
+def make_backend(name: str, precision: Optional[int] = None) -> NumericBackend:
+    """
+    Create a numeric backend by name.
+
+    Args:
+        name: One of defaults.NUMERIC_BACKENDS.
+        precision: Significant digits for the decimal backend,
+            DEFAULT_PRECISION if omitted.
+
+    Returns:
+        The backend.
+
+    Raises:
+        ValueError: If the name is unknown, or precision is given for a
+            backend other than decimal or is not positive.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unsupported numeric backend: {name}")
+    if name == "decimal":
+        return DecimalBackend(DEFAULT_PRECISION if precision is None else precision)
+    if precision is not None:
+        raise ValueError("precision only applies to the decimal backend.")
+    return BACKENDS[name]()
+
+
+class NumericOperations(Operations):
+    """Operations that calculate with a numeric backend."""
+
+    def __init__(self, backend: Optional[NumericBackend] = None) -> None:
+        """
+        Initialize the operations.
+
+        Args:
+            backend: The numeric backend, FloatBackend if omitted.
+        """
+        self.backend = backend if backend is not None else FloatBackend()
+        self._methods = self.backend.methods()
+
+    def calculate(self, operation: str, a: float, b: float) -> float:  # type: ignore[override]
+        """
+        Perform the specified operation with the backend's arithmetic.
+
+        Args:
+            operation: The operation to perform (+, -, *, / or a plugin's,
+                which is passed the backend's numbers as they are).
+            a: First number, of the backend's number type.
+            b: Second number, of the backend's number type.
+
+        Returns:
+            The result, of the backend's number type.
+
+        Raises:
+            DivisionByZeroError: If dividing by zero.
+            OperationPluginError: If the operation's plugin cannot be loaded.
+            ValueError: If operation is not supported.
+        """
+        method = self._methods.get(operation)
+        if method is None:
+            method = REGISTRY.get(operation)
+            if method is None:
+                raise ValueError(f"Unsupported operation: {operation}")
+        if operation == "/" and b == 0:
+            raise DivisionByZeroError()
+        result: float = method(a, b)
+        return result
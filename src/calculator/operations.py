@@ -1,11 +1,35 @@
 """Mathematical operations module for the calculator application."""
 
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
 from .exceptions import DivisionByZeroError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+    from .vectorized import BatchResult
+
+# The registry's dispatch table, bound on first use: the registry is built
+# from the Operations methods, so it cannot be imported here. Plugins are
+# added to the table in place.
+_DISPATCH: Optional[Dict[str, Callable[[Any, Any], Any]]] = None
+
+
+def _dispatch_table() -> Dict[str, Callable[[Any, Any], Any]]:
+    """Bind and return the registry's dispatch table."""
+    global _DISPATCH
+    from .registry import REGISTRY
+
+    _DISPATCH = REGISTRY.table
+    return _DISPATCH
+
 
 class Operations:
     """Handles arithmetic operations for the calculator."""
 
+    # The numeric backend operands are parsed with for calculate; None
+    # means plain float. Set by NumericOperations and its wrappers.
+    backend: Optional["NumericBackend"] = None
+
     @staticmethod
     def add(a: float, b: float) -> float:
         """
@@ -72,8 +96,11 @@ class Operations:
         """
         Perform the specified operation on two numbers.
 
+        Operations are looked up in the registry, so plugin operations are
+        supported too.
+
         Args:
-            operation: The operation to perform (+, -, *, /).
+            operation: The operation to perform (+, -, *, / or a plugin's).
             a: First number.
             b: Second number.
 
@@ -82,16 +109,49 @@ class Operations:
 
         Raises:
             DivisionByZeroError: If dividing by zero.
+            OperationPluginError: If the operation's plugin cannot be loaded.
             ValueError: If operation is not supported.
         """
-        operations_map = {
-            "+": Operations.add,
-            "-": Operations.subtract,
-            "*": Operations.multiply,
-            "/": Operations.divide,
-        }
+        function = (_DISPATCH or _dispatch_table()).get(operation)
+        if function is None:
+            from .registry import REGISTRY
 
-        if operation not in operations_map:
-            raise ValueError(f"Unsupported operation: {operation}")
+            function = REGISTRY.get(operation)
+            if function is None:
+                raise ValueError(f"Unsupported operation: {operation}")
+        result: float = function(a, b)
+        return result
+
+    @staticmethod
+    def calculate_many(
+        operation: str,
+        a: Any,
+        b: Any,
+        on_zero: str = "nan",
+        backend: str = "auto",
+    ) -> "BatchResult":
+        """
+        Perform the specified operation element-wise over operand arrays.
+
+        Either operand may be a scalar, which is broadcast against the other.
+        Divisions by zero do not abort the batch; they are flagged in the
+        result's ``zero_division`` mask and filled according to on_zero.
+
+        Args:
+            operation: The operation to perform (+, -, *, /).
+            a: First operands (sequence, ``array('d')``, NumPy array or scalar).
+            b: Second operands (sequence, ``array('d')``, NumPy array or scalar).
+            on_zero: Division-by-zero policy: ``nan``, ``inf`` or ``raise``.
+            backend: ``python``, ``numpy`` or ``auto`` (NumPy when installed).
+
+        Returns:
+            The batch result holding the values and the zero-division mask.
+
+        Raises:
+            DivisionByZeroError: If a divisor is zero and on_zero is ``raise``.
+            ValueError: If operation, on_zero, backend or operand lengths are
+                not supported.
+        """
+        from .vectorized import calculate_many
 
-        return operations_map[operation](a, b)
+        return calculate_many(operation, a, b, on_zero=on_zero, backend=backend)
@@ -0,0 +1,141 @@
+"""Multi-core batch evaluation using a process pool with ordered output."""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Deque, List, Tuple, Union
+
+from .batch import format_error
+from .evaluation import ZERO_POLICIES, evaluate_lines
+
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# A chunk output is either a formatted result line or a
+# (chunk-relative line number, error message) pair.
+ChunkOutput = Union[str, Tuple[int, str]]
+
+
+def split_ranges(
+    path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: The input file path.
+        chunk_bytes: Target size of each range in bytes.
+
+    Returns:
+        Contiguous (start, end) byte offsets covering the whole file.
+
+    Raises:
+        ValueError: If chunk_bytes is not positive.
+        OSError: If the file cannot be read.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be a positive integer.")
+
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as handle:
+        start = 0
+        while start < size:
+            end = start + chunk_bytes
+            if end < size:
+                handle.seek(end - 1)
+                handle.readline()
+                end = handle.tell()
+            end = min(end, size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def evaluate_chunk(
+    path: str, start: int, end: int, on_zero: str = "error"
+) -> Tuple[int, List[ChunkOutput]]:
+    """
+    Validate and compute every line of one byte range.
+
+    Runs inside a worker process, so errors carry line numbers relative to
+    the chunk; the parent adds the chunk's line offset.
+
+    Args:
+        path: The input file path.
+        start: Byte offset of the first line of the chunk.
+        end: Byte offset just past the last line of the chunk.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Returns:
+        The number of lines in the chunk and its outputs in input order.
+    """
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+
+    lines = [raw.decode("utf-8", "replace") for raw in data.splitlines()]
+    result = evaluate_lines(lines, on_zero)
+    errors = iter(result.errors())
+    outputs: List[ChunkOutput] = [
+        next(errors) if status else f"{value}\n"
+        for status, value in zip(result.statuses, result.values)
+    ]
+    return len(lines), outputs
+
+
+def run_parallel(
+    path: str,
+    output: IO[str],
+    workers: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    on_zero: str = "error",
+) -> None:
+    """
+    Evaluate a batch file across a process pool, writing results in order.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    by the chunk size rather than the file size.
+
+    Args:
+        path: The input file path.
+        output: The stream results are written to.
+        workers: Number of worker processes.
+        chunk_bytes: Target size of each chunk in bytes.
+        on_zero: Division-by-zero policy: ``error``, ``nan`` or ``inf``.
+
+    Raises:
+        ValueError: If workers or chunk_bytes is not positive, or on_zero
+            is not supported.
+        OSError: If the file cannot be read.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+
+    ranges = iter(split_ranges(path, chunk_bytes))
+    line_offset = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: "Deque[Future[Tuple[int, List[ChunkOutput]]]]" = deque()
+
+        def submit_next() -> None:
+            chunk = next(ranges, None)
+            if chunk is not None:
+                pending.append(executor.submit(evaluate_chunk, path, *chunk, on_zero))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            line_count, outputs = pending.popleft().result()
+            submit_next()
+            output.writelines(
+                (
+                    item
+                    if isinstance(item, str)
+                    else format_error(line_offset + item[0], item[1])
+                )
+                for item in outputs
+            )
+            line_offset += line_count
+    output.flush()
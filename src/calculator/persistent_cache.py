@@ -0,0 +1,295 @@
+"""Persistent cross-session result cache stored in a SQLite file.
+
+A PersistentCache stands in for a ResultCache in CachedOperations, so
+results computed in one run are reused by the next. Lookups are single
+indexed reads; new results and the recency updates of hits are queued and
+written together in one transaction per batch. Rows record the numeric
+backend (and the decimal precision) that computed them, so backends never
+share results.
+
+Several processes may use one file at once: the database runs in WAL mode
+so readers do not block the writer, and writers wait for each other's
+transactions. Results are deterministic, so concurrent writes of the same
+calculation store the same row.
+"""
+
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import CacheKey, CacheValue
+from .defaults import DEFAULT_PERSISTENT_CACHE_SIZE
+from .exceptions import DivisionByZeroError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+
+# Queued writes and hit timestamps that trigger a flush.
+DEFAULT_BATCH_SIZE = 512
+
+# Seconds a process waits for another process's write transaction.
+LOCK_TIMEOUT = 30.0
+
+# Seconds within which a hit does not refresh a row's last use again;
+# recency is tracked to this resolution to spare writes on hot rows.
+TOUCH_INTERVAL = 60.0
+
+# Created in one immediate transaction, so processes opening a new file
+# at the same time do not race. Triggers keep the row count in a one-row
+# table, which makes checking the size cap O(1).
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS results (
+    backend TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    a TEXT NOT NULL,
+    b TEXT NOT NULL,
+    result TEXT,
+    used REAL NOT NULL,
+    UNIQUE (backend, operation, a, b)
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+CREATE TABLE IF NOT EXISTS counts (entries INTEGER NOT NULL);
+INSERT INTO counts SELECT 0 WHERE NOT EXISTS (SELECT * FROM counts);
+CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results
+BEGIN
+    UPDATE counts SET entries = entries + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results
+BEGIN
+    UPDATE counts SET entries = entries - 1;
+END;
+COMMIT;
+"""
+
+# Row key: backend identity, operation and the operands' text.
+RowKey = Tuple[str, str, str, str]
+
+
+def backend_identity(backend: Optional["NumericBackend"]) -> str:
+    """
+    Name the arithmetic that computed a result.
+
+    Args:
+        backend: The numeric backend, or None for the default float path.
+
+    Returns:
+        The backend name, with the precision for the decimal backend.
+    """
+    if backend is None:
+        return "float"
+    precision = getattr(backend, "precision", None)
+    return backend.name if precision is None else f"{backend.name}:{precision}"
+
+
+class PersistentCache:
+    """Result cache in a SQLite file, bounded by entries with LRU eviction.
+
+    Recency is kept to TOUCH_INTERVAL: a hit on a row used more recently
+    than that is not written back, so repeated hits cost one read each.
+
+    Values are stored as text: operands and results round-trip through
+    ``str()`` and the backend's parser, and a NULL result records a
+    division by zero. Results whose text is too long for ``str()``, such
+    as integers of more than 4300 digits, are not cached.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_PERSISTENT_CACHE_SIZE,
+        backend: Optional["NumericBackend"] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: The SQLite database file.
+            max_entries: Maximum number of stored results; the least
+                recently used are evicted beyond it.
+            backend: The numeric backend results are computed with, None
+                for the default float arithmetic.
+            batch_size: Queued writes that trigger a flush.
+
+        Raises:
+            ValueError: If max_entries or batch_size is not positive.
+            sqlite3.Error: If the file cannot be opened as a database.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        self.path = path
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.backend = backend_identity(backend)
+        self.parse: Callable[[str], Any] = float if backend is None else backend.parse
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Results waiting to be written, and hits waiting to be touched.
+        self._pending: Dict[RowKey, Tuple[Optional[str], float]] = {}
+        self._touched: Dict[RowKey, float] = {}
+        self._connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+
+    def __len__(self) -> int:
+        """Return the number of stored results, including queued ones."""
+        self.flush()
+        return self._count(self._connection)
+
+    @staticmethod
+    def _count(connection: sqlite3.Connection) -> int:
+        """Return the number of stored results."""
+        count: int = connection.execute("SELECT entries FROM counts").fetchone()[0]
+        return count
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _row_key(self, key: CacheKey) -> Optional[RowKey]:
+        """Convert a ResultCache key to a row key, None if not storable."""
+        try:
+            return (self.backend, key[0], str(key[2]), str(key[4]))
+        except ValueError:
+            return None
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        """
+        Look up a result and mark it as recently used.
+
+        Args:
+            key: The cache key built by ResultCache.make_key.
+
+        Returns:
+            The stored result or DivisionByZeroError, or None on a miss.
+        """
+        row_key = self._row_key(key)
+        if row_key is None:
+            self.misses += 1
+            return None
+        queued = self._pending.get(row_key)
+        if queued is not None:
+            text: Optional[str] = queued[0]
+        else:
+            row = self._connection.execute(
+                "SELECT result, used FROM results "
+                "WHERE backend = ? AND operation = ? AND a = ? AND b = ?",
+                row_key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            text, used = row
+            now = time.time()
+            if now - used >= TOUCH_INTERVAL:
+                self._touched[row_key] = now
+                if len(self._touched) >= self.batch_size:
+                    self.flush()
+        self.hits += 1
+        if text is None:
+            return DivisionByZeroError()
+        value: float = self.parse(text)
+        return value
+
+    def put(self, key: CacheKey, value: CacheValue) -> None:
+        """
+        Queue a result for storage, flushing a full batch.
+
+        Args:
+            key: The cache key built by ResultCache.make_key.
+            value: The result, or the DivisionByZeroError that was raised.
+        """
+        row_key = self._row_key(key)
+        if row_key is None:
+            return
+        try:
+            text = None if isinstance(value, DivisionByZeroError) else str(value)
+        except ValueError:
+            return
+        self._pending[row_key] = (text, time.time())
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the queued results and hits, then evict beyond the cap."""
+        if not self._pending and not self._touched:
+            return
+        rows: List[Tuple[Any, ...]] = [
+            (*row_key, text, used) for row_key, (text, used) in self._pending.items()
+        ]
+        touches = [(used, *row_key) for row_key, used in self._touched.items()]
+        self._pending.clear()
+        self._touched.clear()
+        # One transaction per batch; another process's transaction is
+        # waited for up to LOCK_TIMEOUT. Results are deterministic, so a row
+        # another process stored meanwhile is kept as it is.
+        with self._connection as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            connection.executemany(
+                "UPDATE results SET used = ? "
+                "WHERE backend = ? AND operation = ? AND a = ? AND b = ?",
+                touches,
+            )
+            excess = self._count(connection) - self.max_entries
+            if excess > 0:
+                connection.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY used LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def clear(self) -> None:
+        """Remove every stored result, of every backend, and reset the stats."""
+        self._pending.clear()
+        self._touched.clear()
+        with self._connection as connection:
+            connection.execute("DELETE FROM results")
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        """Flush the queued writes and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Summarize cache effectiveness.
+
+        Returns:
+            Entries, hits, misses, hit rate and evictions.
+        """
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+        }
+
+    def format_stats(self) -> str:
+        """
+        Format the cache statistics for display.
+
+        Returns:
+            A one-line human-readable summary.
+        """
+        return (
+            f"Persistent cache: {len(self)} entries, {self.hits} hits, "
+            f"{self.misses} misses, hit rate {self.hit_rate:.1%}, "
+            f"{self.evictions} evictions"
+        )
@@ -0,0 +1,47 @@
+"""Line-based request/response protocol shared by the network front ends."""
+
+from typing import Callable, Tuple
+
+from .batch import parse_line
+from .exceptions import CalculatorError
+
+OK = "OK"
+ERROR = "ERR"
+
+
+def handle_request(line: str, calculate: Callable[[str, float, float], float]) -> str:
+    """
+    Answer one request line such as ``+ 3 4``.
+
+    Args:
+        line: The request line.
+        calculate: The calculate function to evaluate with.
+
+    Returns:
+        ``OK <result>`` or ``ERR <message>``, including the trailing newline.
+    """
+    try:
+        operation, first_num, second_num = parse_line(line)
+        return f"{OK} {calculate(operation, first_num, second_num)}\n"
+    except CalculatorError as e:
+        return f"{ERROR} {e}\n"
+
+
+def parse_response(line: str) -> Tuple[bool, str]:
+    """
+    Split a response line into its status and payload.
+
+    Args:
+        line: The response line.
+
+    Returns:
+        A (success, payload) tuple, where payload is the result text or
+        the error message.
+
+    Raises:
+        ValueError: If the line is not a protocol response.
+    """
+    status, _, payload = line.rstrip("\n").partition(" ")
+    if status not in (OK, ERROR):
+        raise ValueError(f"Malformed response: {line!r}")
+    return status == OK, payload
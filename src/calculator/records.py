@@ -0,0 +1,288 @@
+"""Compact in-memory calculation records.
+
+A result kept as a tuple or dict of Python floats costs well over 100 bytes
+per row. CalculationRecord is a ``__slots__`` object for holding a few
+records. RecordBatch stores many of them as a struct of arrays: one
+opcode byte (an index into OPERATION_SYMBOLS) and three doubles per record,
+25 bytes in all. Records are only materialized as objects when iterated
+or indexed.
+"""
+
+from array import array
+from itertools import compress, repeat
+from typing import Any, Callable, Iterable, Iterator, Union, overload
+
+from .operations import Operations
+from .registry import OPERATION_SYMBOLS, builtin_opcode
+
+
+def _extend(column: "array[float]", values: Any, size: int) -> None:
+    """Append a scalar size times, or a sequence or float64 buffer, to column."""
+    if isinstance(values, (int, float)):
+        column.extend(repeat(float(values), size))
+        return
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format == "d" and view.c_contiguous:
+        # array('d') and float64 NumPy arrays: one copy of the raw doubles.
+        column.frombytes(view.cast("B"))
+    else:
+        column.extend(map(float, values))
+
+
+class CalculationRecord:
+    """One calculation: its operation symbol, operands and result."""
+
+    __slots__ = ("operation", "a", "b", "result")
+
+    def __init__(self, operation: str, a: float, b: float, result: float) -> None:
+        """
+        Initialize the record.
+
+        Args:
+            operation: The operation symbol (+, -, *, /).
+            a: First operand.
+            b: Second operand.
+            result: The result.
+        """
+        self.operation = operation
+        self.a = a
+        self.b = b
+        self.result = result
+
+    @classmethod
+    def calculate(cls, operation: str, a: float, b: float) -> "CalculationRecord":
+        """
+        Perform an operation with Operations.calculate and record it.
+
+        Args:
+            operation: The operation to perform (+, -, *, /).
+            a: First number.
+            b: Second number.
+
+        Returns:
+            The record.
+
+        Raises:
+            DivisionByZeroError: If dividing by zero.
+            ValueError: If operation is not supported.
+        """
+        return cls(operation, a, b, Operations.calculate(operation, a, b))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare records field by field."""
+        if not isinstance(other, CalculationRecord):
+            return NotImplemented
+        return (self.operation, self.a, self.b, self.result) == (
+            other.operation,
+            other.a,
+            other.b,
+            other.result,
+        )
+
+    def __repr__(self) -> str:
+        """Return a debugging representation."""
+        return (
+            f"CalculationRecord({self.operation!r}, {self.a!r}, {self.b!r}, "
+            f"{self.result!r})"
+        )
+
+
+class RecordBatch:
+    """Calculation records stored column-wise in compact buffers.
+
+    ``opcodes`` is a bytearray of indexes into OPERATION_SYMBOLS; ``a``,
+    ``b`` and ``results`` are ``array('d')`` columns of the same length.
+    Slicing and filtering return new batches with copied columns.
+    """
+
+    __slots__ = ("opcodes", "a", "b", "results")
+
+    def __init__(self, records: Iterable[CalculationRecord] = ()) -> None:
+        """
+        Initialize the batch.
+
+        Args:
+            records: Records to store.
+
+        Raises:
+            ValueError: If a record's operation is not supported.
+        """
+        self.opcodes = bytearray()
+        self.a: "array[float]" = array("d")
+        self.b: "array[float]" = array("d")
+        self.results: "array[float]" = array("d")
+        self.extend(records)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        opcodes: bytearray,
+        a: "array[float]",
+        b: "array[float]",
+        results: "array[float]",
+    ) -> "RecordBatch":
+        """Build a batch that takes ownership of existing columns."""
+        batch = cls()
+        batch.opcodes, batch.a, batch.b, batch.results = opcodes, a, b, results
+        return batch
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.opcodes)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the record data in the four columns."""
+        return len(self.opcodes) * (1 + 3 * self.a.itemsize)
+
+    def add(self, operation: str, a: float, b: float, result: float) -> None:
+        """
+        Append one calculation.
+
+        Args:
+            operation: The operation symbol (+, -, *, /).
+            a: First operand.
+            b: Second operand.
+            result: The result.
+
+        Raises:
+            ValueError: If operation is not supported.
+        """
+        self.opcodes.append(builtin_opcode(operation))
+        self.a.append(a)
+        self.b.append(b)
+        self.results.append(result)
+
+    def append(self, record: CalculationRecord) -> None:
+        """
+        Append a record.
+
+        Args:
+            record: The record.
+
+        Raises:
+            ValueError: If the record's operation is not supported.
+        """
+        self.add(record.operation, record.a, record.b, record.result)
+
+    def extend(self, records: Iterable[CalculationRecord]) -> None:
+        """
+        Append records.
+
+        Args:
+            records: The records.
+
+        Raises:
+            ValueError: If a record's operation is not supported.
+        """
+        add = self.add
+        for record in records:
+            add(record.operation, record.a, record.b, record.result)
+
+    def calculate(self, operation: str, a: Any, b: Any, on_zero: str = "nan") -> None:
+        """
+        Apply one operation over operand arrays and append every record.
+
+        Results come from Operations.calculate_many, so divisions by zero
+        store the value its on_zero policy gives.
+
+        Args:
+            operation: The operation to perform (+, -, *, /).
+            a: First operands (sequence, ``array('d')``, NumPy array or scalar).
+            b: Second operands (sequence, ``array('d')``, NumPy array or scalar).
+            on_zero: Division-by-zero policy: ``nan``, ``inf`` or ``raise``.
+
+        Raises:
+            DivisionByZeroError: If a divisor is zero and on_zero is ``raise``.
+            ValueError: If operation, on_zero or the operand lengths are
+                not supported.
+        """
+        values = Operations.calculate_many(operation, a, b, on_zero=on_zero).values
+        size = len(values)
+        self.opcodes.extend(repeat(builtin_opcode(operation), size))
+        _extend(self.a, a, size)
+        _extend(self.b, b, size)
+        _extend(self.results, values, size)
+
+    def _record(self, index: int) -> CalculationRecord:
+        """Materialize the record at index."""
+        return CalculationRecord(
+            OPERATION_SYMBOLS[self.opcodes[index]],
+            self.a[index],
+            self.b[index],
+            self.results[index],
+        )
+
+    def __iter__(self) -> Iterator[CalculationRecord]:
+        """Iterate over the records, materializing one at a time."""
+        symbols = OPERATION_SYMBOLS
+        for code, a, b, result in zip(self.opcodes, self.a, self.b, self.results):
+            yield CalculationRecord(symbols[code], a, b, result)
+
+    @overload
+    def __getitem__(self, index: int) -> CalculationRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordBatch": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[CalculationRecord, "RecordBatch"]:
+        """
+        Return the record at an index, or a batch of a slice.
+
+        Args:
+            index: A record index (negative counts from the end) or a slice.
+
+        Returns:
+            The record, or a new batch holding copies of the sliced columns.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return RecordBatch._from_columns(
+                self.opcodes[index], self.a[index], self.b[index], self.results[index]
+            )
+        return self._record(index)
+
+    def filter(self, predicate: Callable[[CalculationRecord], bool]) -> "RecordBatch":
+        """
+        Select the records a predicate accepts.
+
+        Args:
+            predicate: Called with each record.
+
+        Returns:
+            A new batch of the accepted records, in order.
+        """
+        return self._compress([predicate(record) for record in self])
+
+    def select(self, operation: str) -> "RecordBatch":
+        """
+        Select the records of one operation without materializing any.
+
+        Args:
+            operation: The operation symbol.
+
+        Returns:
+            A new batch of that operation's records, in order.
+
+        Raises:
+            ValueError: If operation is not supported.
+        """
+        code = builtin_opcode(operation)
+        return self._compress([opcode == code for opcode in self.opcodes])
+
+    def _compress(self, mask: Iterable[bool]) -> "RecordBatch":
+        """Build a batch of the records where mask is true."""
+        mask = list(mask)
+        return RecordBatch._from_columns(
+            bytearray(compress(self.opcodes, mask)),
+            array("d", compress(self.a, mask)),
+            array("d", compress(self.b, mask)),
+            array("d", compress(self.results, mask)),
+        )
@@ -0,0 +1,253 @@
+"""Streaming reductions (sum, prod, min, max) and prefix scans over numbers.
+
+Reductions consume their input a block at a time, so memory use does not
+depend on its length. Sums stay within about one rounding of the exact
+result however many values are added: reductions sum each block exactly
+with math.fsum, carrying the running total and its rounding error into the
+next block, and scans use Neumaier's variant of Kahan summation.
+"""
+
+import math
+from itertools import chain, islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List
+
+from .exceptions import InvalidNumberError
+
+# Values gathered into one block by reduce_values.
+BLOCK_SIZE = 4096
+
+
+class CompensatedSum:
+    """Running float sum with Neumaier compensation.
+
+    Adds with a rounding error independent of the number of terms, where
+    plain repeated addition accumulates one rounding per term. Infinities
+    and NaNs propagate as in plain float addition.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a zero sum."""
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: The value to add.
+        """
+        total = self.total
+        result = total + value
+        # Recover the low-order bits lost by the addition.
+        if abs(total) >= abs(value):
+            self.compensation += (total - result) + value
+        else:
+            self.compensation += (value - result) + total
+        self.total = result
+
+    @property
+    def value(self) -> float:
+        """The compensated sum."""
+        total = self.total
+        if not math.isfinite(total):
+            return total
+        return total + self.compensation
+
+
+def _sum_blocks(blocks: Iterator[List[float]]) -> float:
+    """Sum blocks with fsum, carrying the total as a high and low part."""
+    high = low = 0.0
+    for block in blocks:
+        try:
+            total = math.fsum(chain((high, low), block))
+            # The rounding error of total, so the next block starts exact.
+            if math.isfinite(total):
+                low = math.fsum(chain((high, low, -total), block))
+        except (OverflowError, ValueError):
+            # fsum rejects inf - inf and intermediate overflow; plain
+            # addition gives the NaN or infinity float arithmetic would.
+            total = high + low + sum(block)
+        high = total
+    return high
+
+
+def _prod_blocks(blocks: Iterator[List[float]]) -> float:
+    """Multiply the blocks together."""
+    product = 1.0
+    for block in blocks:
+        product *= math.prod(block)
+    return product
+
+
+def _extreme_blocks(
+    blocks: Iterator[List[float]], choose: Callable[..., float], name: str
+) -> float:
+    """Find the min or max of the blocks; NaN if any value is NaN."""
+    result = None
+    has_nan = False
+    for block in blocks:
+        has_nan = has_nan or any(map(math.isnan, block))
+        extreme = choose(block)
+        result = extreme if result is None else choose(result, extreme)
+    if result is None:
+        raise ValueError(f"{name} of an empty input.")
+    return math.nan if has_nan else result
+
+
+_REDUCERS: Dict[str, Callable[[Iterator[List[float]]], float]] = {
+    "sum": _sum_blocks,
+    "prod": _prod_blocks,
+    "min": lambda blocks: _extreme_blocks(blocks, min, "min"),
+    "max": lambda blocks: _extreme_blocks(blocks, max, "max"),
+}
+
+
+def _blocks(values: Iterable[float], block_size: int) -> Iterator[List[float]]:
+    """Yield the values in lists of block_size."""
+    iterator = iter(values)
+    while True:
+        block = list(islice(iterator, block_size))
+        if not block:
+            return
+        yield block
+
+
+def reduce_values(
+    reduction: str, values: Iterable[float], block_size: int = BLOCK_SIZE
+) -> float:
+    """
+    Reduce a stream of numbers to one value.
+
+    Args:
+        reduction: One of defaults.REDUCTIONS: ``sum``, ``prod``, ``min`` or ``max``.
+        values: The numbers, consumed once in blocks.
+        block_size: Values held in memory at a time.
+
+    Returns:
+        The compensated sum (0.0 when empty), the product (1.0 when empty),
+        or the minimum or maximum (NaN if any value is NaN).
+
+    Raises:
+        ValueError: If reduction or block_size is not supported, or min or
+            max is taken of an empty input.
+    """
+    reducer = _REDUCERS.get(reduction)
+    if reducer is None:
+        raise ValueError(f"Unsupported reduction: {reduction}")
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer.")
+    return reducer(_blocks(values, block_size))
+
+
+def scan_values(reduction: str, values: Iterable[float]) -> Iterator[float]:
+    """
+    Compute the running (prefix) reduction of a stream of numbers.
+
+    Args:
+        reduction: One of defaults.REDUCTIONS.
+        values: The numbers, consumed lazily.
+
+    Yields:
+        The reduction of the first 1, 2, ... values; running sums are
+        compensated like reduce_values.
+
+    Raises:
+        ValueError: If reduction is not supported.
+    """
+    if reduction not in _REDUCERS:
+        raise ValueError(f"Unsupported reduction: {reduction}")
+    return _scan(reduction, values)
+
+
+def _scan(reduction: str, values: Iterable[float]) -> Iterator[float]:
+    """Generate the running reduction once the reduction is validated."""
+    if reduction == "sum":
+        # CompensatedSum inlined: a method call per value halves throughput.
+        total = compensation = 0.0
+        for value in values:
+            result = total + value
+            if abs(total) >= abs(value):
+                compensation += (total - result) + value
+            else:
+                compensation += (value - result) + total
+            total = result
+            yield total + compensation if math.isfinite(total) else total
+    elif reduction == "prod":
+        product = 1.0
+        for value in values:
+            product *= value
+            yield product
+    else:
+        choose = min if reduction == "min" else max
+        current = None
+        for value in values:
+            if current is None:
+                current = value
+            elif current == current:
+                # Once a NaN is seen the running value stays NaN.
+                current = value if value != value else choose(current, value)
+            yield current
+
+
+class NumberReader:
+    """Iterate over the numbers of a text stream, one number per line.
+
+    Blank lines are skipped. line_number tracks the line last read, so a
+    caller can report where an InvalidNumberError occurred.
+    """
+
+    def __init__(self, stream: Iterable[str]) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            stream: A text stream or any iterable of lines.
+        """
+        self.stream = stream
+        self.line_number = 0
+
+    def __iter__(self) -> Iterator[float]:
+        """
+        Yield the numbers of the stream.
+
+        Yields:
+            Each number as a float.
+
+        Raises:
+            InvalidNumberError: If a non-blank line is not a number.
+        """
+        for self.line_number, line in enumerate(self.stream, 1):
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                number = float(text)
+            except ValueError:
+                raise InvalidNumberError(text)
+            yield number
+
+
+def run_reduction(
+    reduction: str, numbers: Iterable[float], output: IO[str], scan: bool = False
+) -> None:
+    """
+    Reduce or scan a stream of numbers, writing the results.
+
+    Args:
+        reduction: One of defaults.REDUCTIONS.
+        numbers: The numbers, such as a NumberReader over a file.
+        output: The stream results are written to.
+        scan: Write every running value instead of only the final one.
+
+    Raises:
+        InvalidNumberError: If a NumberReader meets a line that is not a
+            number.
+        ValueError: If reduction is not supported, or min or max is taken
+            of an empty input.
+    """
+    if scan:
+        output.writelines(f"{value}\n" for value in scan_values(reduction, numbers))
+    else:
+        output.write(f"{reduce_values(reduction, numbers)}\n")
+    output.flush()
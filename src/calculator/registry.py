@@ -0,0 +1,241 @@
+"""Registry of the operations the calculator supports.
+
+The registry maps operation symbols to two-argument functions. Validator,
+Operations and the error messages all read from the same registry, so an
+operation added here is accepted everywhere a symbol is.
+
+Third-party packages add operations through the ``calculator.operations``
+entry point group; the entry point name is the symbol::
+
+    [project.entry-points."calculator.operations"]
+    "%" = "my_package.operations:modulo"
+
+Plugins cost nothing until they are needed. The built-ins are in
+``table`` from import; entry point names are only read (which imports
+importlib.metadata) the first time a symbol is not in the table or the
+full list of operations is asked for, and a plugin's module is only
+imported the first time its symbol is used. ``table`` is the precomputed
+dispatch table: it is filled in place as plugins load and never rebuilt.
+"""
+
+import functools
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import (
+    CalculatorError,
+    DivisionByZeroError,
+    OperationPluginCallError,
+    OperationPluginError,
+)
+from .operations import Operations
+
+Operator = Callable[[Any, Any], Any]
+
+ENTRY_POINT_GROUP = "calculator.operations"
+
+
+# The built-in operations, in the order of their opcodes.
+BUILTIN_OPERATIONS: Dict[str, Operator] = {
+    "+": Operations.add,
+    "-": Operations.subtract,
+    "*": Operations.multiply,
+    "/": Operations.divide,
+}
+
+# Compact numeric codes of the built-in operations, used by the binary and
+# bulk formats: OPERATION_SYMBOLS[OPCODES[symbol]] == symbol. Plugin
+# operations have no opcode.
+OPERATION_SYMBOLS: Tuple[str, ...] = tuple(BUILTIN_OPERATIONS)
+OPCODES: Dict[str, int] = {
+    symbol: code for code, symbol in enumerate(OPERATION_SYMBOLS)
+}
+
+
+def builtin_opcode(symbol: str) -> int:
+    """
+    Return the opcode of a built-in operation.
+
+    The bulk and binary formats store operations as opcodes, so they only
+    support the built-ins.
+
+    Args:
+        symbol: The operation symbol.
+
+    Returns:
+        The opcode.
+
+    Raises:
+        ValueError: If symbol is not a built-in operation.
+    """
+    try:
+        return OPCODES[symbol]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported operation: {symbol}. Bulk evaluation only supports "
+            f"the built-in operations: {', '.join(OPERATION_SYMBOLS)}"
+        ) from None
+
+
+def valid_symbol(symbol: str) -> bool:
+    """
+    Check whether a string can name an operation.
+
+    A symbol is the first field of an input line, so it must be a single
+    token without whitespace; ``=`` is reserved for variable assignments.
+
+    Args:
+        symbol: The candidate symbol.
+
+    Returns:
+        True if the symbol can be registered.
+    """
+    return bool(symbol) and "=" not in symbol and symbol.split() == [symbol]
+
+
+def plugin_target(function: Operator, symbol: str) -> str:
+    """Describe where a plugin function is defined, as ``module:name``."""
+    return f"{function.__module__}:{getattr(function, '__qualname__', symbol)}"
+
+
+def _checked(function: Operator, symbol: str, target: str) -> Operator:
+    """
+    Wrap a plugin so its failures are reported as calculator errors.
+
+    ZeroDivisionError becomes DivisionByZeroError, and any other exception
+    that is not a CalculatorError becomes OperationPluginCallError.
+    """
+
+    @functools.wraps(function)
+    def call(a: Any, b: Any) -> Any:
+        try:
+            return function(a, b)
+        except ZeroDivisionError:
+            raise DivisionByZeroError() from None
+        except CalculatorError:
+            raise
+        except Exception as e:
+            raise OperationPluginCallError(symbol, target, e) from e
+
+    return call
+
+
+class OperationRegistry:
+    """Operation symbols and the functions that compute them."""
+
+    def __init__(self, group: Optional[str] = ENTRY_POINT_GROUP) -> None:
+        """
+        Initialize the registry with the built-in operations.
+
+        Args:
+            group: The entry point group plugins are discovered in, or None
+                to discover none.
+        """
+        self.group = group
+        self.table: Dict[str, Operator] = dict(BUILTIN_OPERATIONS)
+        self._entry_points: Optional[Dict[str, Any]] = None
+
+    def register(self, symbol: str, function: Operator) -> None:
+        """
+        Add or replace an operation.
+
+        Args:
+            symbol: The operation symbol.
+            function: Called with the two operands; returns the result.
+
+        Raises:
+            ValueError: If the symbol is not a single token, contains ``=``
+                or names a built-in operation.
+        """
+        if not valid_symbol(symbol):
+            raise ValueError(f"Invalid operation symbol: {symbol!r}")
+        if symbol in BUILTIN_OPERATIONS:
+            raise ValueError(f"Cannot replace built-in operation: {symbol}")
+        self.table[symbol] = _checked(function, symbol, plugin_target(function, symbol))
+
+    def get(self, symbol: str) -> Optional[Operator]:
+        """
+        Return the function of an operation, loading its plugin if needed.
+
+        Args:
+            symbol: The operation symbol.
+
+        Returns:
+            The function, or None if no operation has the symbol.
+
+        Raises:
+            OperationPluginError: If the symbol's plugin cannot be loaded.
+        """
+        function = self.table.get(symbol)
+        if function is None and symbol in self._discover():
+            function = self._load(symbol)
+        return function
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check for an operation without loading its plugin."""
+        return symbol in self.table or symbol in self._discover()
+
+    def symbols(self, discover: bool = True) -> List[str]:
+        """
+        List the operation symbols: the built-ins first, then the rest sorted.
+
+        Args:
+            discover: Include plugins that have not been loaded yet.
+
+        Returns:
+            The symbols.
+        """
+        names = set(self.table)
+        if discover:
+            names.update(self._discover())
+        extra = sorted(names.difference(BUILTIN_OPERATIONS))
+        return list(BUILTIN_OPERATIONS) + extra
+
+    def describe(self, discover: bool = True) -> str:
+        """
+        Format the operation symbols for messages, e.g. ``+, -, *, /``.
+
+        Args:
+            discover: Include plugins that have not been loaded yet.
+
+        Returns:
+            The comma-separated symbols.
+        """
+        return ", ".join(self.symbols(discover))
+
+    def _discover(self) -> Dict[str, Any]:
+        """Read (once) the entry points of the group, by symbol."""
+        if self._entry_points is None:
+            found: Dict[str, Any] = {}
+            if self.group is not None:
+                from importlib.metadata import entry_points
+
+                if sys.version_info >= (3, 10):
+                    candidates = entry_points(group=self.group)
+                else:  # pragma: no cover - Python < 3.10
+                    candidates = entry_points().get(self.group, ())
+                for entry_point in candidates:
+                    name = entry_point.name
+                    if valid_symbol(name) and name not in BUILTIN_OPERATIONS:
+                        found.setdefault(name, entry_point)
+            self._entry_points = found
+        return self._entry_points
+
+    def _load(self, symbol: str) -> Operator:
+        """Import a discovered plugin and add it to the table."""
+        entry_point = self._entry_points[symbol]  # type: ignore[index]
+        try:
+            function = entry_point.load()
+        except Exception as e:
+            raise OperationPluginError(symbol, entry_point.value, e) from e
+        if not callable(function):
+            raise OperationPluginError(
+                symbol, entry_point.value, TypeError("not callable")
+            )
+        checked = _checked(function, symbol, entry_point.value)
+        self.table[symbol] = checked
+        return checked
+
+
+# The registry the calculator uses.
+REGISTRY = OperationRegistry()
@@ -0,0 +1,153 @@
+"""asyncio TCP server exposing the calculator to many concurrent clients."""
+
+import asyncio
+import signal
+import sys
+from typing import Optional, Set
+
+from .defaults import DEFAULT_HOST, DEFAULT_PORT
+from .operations import Operations
+from .protocol import ERROR, handle_request
+
+# Longest accepted request line; longer lines close the connection.
+MAX_LINE_BYTES = 64 * 1024
+
+
+class CalculatorServer:
+    """Line-based calculator server; one ``OK``/``ERR`` response per request."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        operations: Optional[Operations] = None,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            host: The interface to listen on.
+            port: The TCP port, or 0 to pick a free one.
+            operations: The operations implementation to calculate with.
+            shutdown_timeout: Seconds to wait for connections to flush on
+                shutdown.
+        """
+        self.host = host
+        self.requested_port = port
+        self.operations = operations if operations is not None else Operations()
+        self.shutdown_timeout = shutdown_timeout
+        self._server: Optional[asyncio.Server] = None
+        self._handlers: Set["asyncio.Task[None]"] = set()
+        self._shutdown: Optional[asyncio.Event] = None
+
+    @property
+    def port(self) -> int:
+        """The TCP port the server is bound to."""
+        if self._server is None:
+            return self.requested_port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        """Bind the listening socket and start accepting connections."""
+        self._shutdown = asyncio.Event()
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.host,
+            self.requested_port,
+            limit=MAX_LINE_BYTES,
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve one connection until the client disconnects.
+
+        Requests may be pipelined: responses are written in request order.
+        Awaiting drain after each response pauses reading while the client
+        is not consuming its responses, which bounds per-connection memory.
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        calculate = self.operations.calculate
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(f"{ERROR} Request line too long.\n".encode())
+                    break
+                if not line:
+                    break
+                response = handle_request(line.decode("utf-8", "replace"), calculate)
+                writer.write(response.encode())
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    def request_shutdown(self) -> None:
+        """Ask serve_until_shutdown to stop the server (signal-safe)."""
+        if self._shutdown is not None:
+            self._shutdown.set()
+
+    async def serve_until_shutdown(self) -> None:
+        """Serve until request_shutdown is called, then close gracefully."""
+        assert self._shutdown is not None
+        await self._shutdown.wait()
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections and close the open ones.
+
+        Responses to requests that were already read are flushed before
+        each connection closes.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        handlers = list(self._handlers)
+        for handler in handlers:
+            handler.cancel()
+        if handlers:
+            await asyncio.wait(handlers, timeout=self.shutdown_timeout)
+        await self._server.wait_closed()
+        self._server = None
+
+
+async def serve(host: str, port: int, operations: Optional[Operations] = None) -> None:
+    """
+    Run a server until SIGINT or SIGTERM.
+
+    Args:
+        host: The interface to listen on.
+        port: The TCP port.
+        operations: The operations implementation to calculate with.
+    """
+    server = CalculatorServer(host, port, operations)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, server.request_shutdown)
+        except NotImplementedError:  # pragma: no cover - Windows event loops
+            pass
+    print(f"Serving on {host}:{server.port}", file=sys.stderr, flush=True)
+    await server.serve_until_shutdown()
+
+
+def run_server(host: str, port: int, operations: Optional[Operations] = None) -> None:
+    """
+    Run the calculator server in a new event loop.
+
+    Args:
+        host: The interface to listen on.
+        port: The TCP port.
+        operations: The operations implementation to calculate with.
+    """
+    asyncio.run(serve(host, port, operations))
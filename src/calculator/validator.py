@@ -1,12 +1,85 @@
 """Input validation module for the calculator application."""
 
-from .exceptions import InvalidNumberError, InvalidOperationError
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .exceptions import (
+    CalculatorError,
+    InvalidLineError,
+    InvalidNumberError,
+    InvalidOperationError,
+)
+from .registry import OPCODES, OPERATION_SYMBOLS, REGISTRY, builtin_opcode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+
+
+class ScanResult:
+    """Parallel arrays of the valid records and failed lines of a scan."""
+
+    def __init__(self) -> None:
+        """Initialize an empty scan result."""
+        self.opcodes = bytearray()
+        self.first: "array[float]" = array("d")
+        self.second: "array[float]" = array("d")
+        self.line_numbers: "array[int]" = array("L")
+        self.error_lines: "array[int]" = array("L")
+        self._error_sources: List[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of valid records."""
+        return len(self.opcodes)
+
+    def records(self) -> Iterator[Tuple[int, str, float, float]]:
+        """
+        Iterate over the valid records.
+
+        Returns:
+            An iterator of (line number, operation, first number, second
+            number) tuples.
+        """
+        symbols = [OPERATION_SYMBOLS[code] for code in self.opcodes]
+        return zip(self.line_numbers, symbols, self.first, self.second)
+
+    def errors(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over the failed lines.
+
+        Error messages are only formatted here, so scanning a buffer never
+        pays for messages nobody reads. A valid line that uses a plugin
+        operation is reported as unsupported in bulk.
+
+        Yields:
+            Tuples of (line number, error message).
+        """
+        for line_number, line in zip(self.error_lines, self._error_sources):
+            try:
+                operation = Validator.validate_line(line)[0]
+            except CalculatorError as e:
+                yield line_number, str(e)
+                continue
+            try:
+                builtin_opcode(operation)
+            except ValueError as e:
+                yield line_number, str(e)
 
 
 class Validator:
     """Handles input validation for the calculator."""
 
-    VALID_OPERATIONS = {"+", "-", "*", "/"}
+    # A live view of the loaded operations; plugins that have not been
+    # used yet are checked through the registry.
+    VALID_OPERATIONS = REGISTRY.table.keys()
 
     @staticmethod
     def validate_operation(operation: str) -> str:
@@ -23,20 +96,23 @@ class Validator:
             InvalidOperationError: If the operation is not supported.
         """
         operation = operation.strip()
-        if operation not in Validator.VALID_OPERATIONS:
+        if operation not in REGISTRY:
             raise InvalidOperationError(operation)
         return operation
 
     @staticmethod
-    def validate_number(value: str) -> float:
+    def validate_number(
+        value: str, backend: Optional["NumericBackend"] = None
+    ) -> float:
         """
         Validate and convert a string to a number.
 
         Args:
             value: The string value to validate and convert.
+            backend: The numeric backend to parse with, float if omitted.
 
         Returns:
-            The validated number as a float.
+            The validated number as a float, or the backend's number type.
 
         Raises:
             InvalidNumberError: If the value cannot be converted to a number.
@@ -45,11 +121,93 @@ class Validator:
         if not value:
             raise InvalidNumberError(value)
 
+        parse: Callable[[str], float] = float if backend is None else backend.parse
         try:
-            return float(value)
+            return parse(value)
         except ValueError:
             raise InvalidNumberError(value)
 
+    @staticmethod
+    def validate_line(
+        line: str, backend: Optional["NumericBackend"] = None
+    ) -> Tuple[str, float, float]:
+        """
+        Validate a ``<operation> <number> <number>`` line such as ``+ 3 4``.
+
+        Args:
+            line: The raw input line.
+            backend: The numeric backend to parse with, float if omitted.
+
+        Returns:
+            The validated (operation, first number, second number) triple.
+
+        Raises:
+            InvalidLineError: If the line does not have exactly three fields.
+            InvalidOperationError: If the operation is not supported.
+            InvalidNumberError: If an operand is not a valid number.
+        """
+        fields = line.split()
+        if len(fields) != 3:
+            raise InvalidLineError(line.strip())
+        return (
+            Validator.validate_operation(fields[0]),
+            Validator.validate_number(fields[1], backend),
+            Validator.validate_number(fields[2], backend),
+        )
+
+    @staticmethod
+    def scan_lines(lines: Union[str, Iterable[str]], first_line: int = 1) -> ScanResult:
+        """
+        Validate a whole block of lines in one pass.
+
+        Accepts exactly the lines validate_line accepts, except those using
+        a plugin operation, which fail because the arrays only hold the
+        built-in opcodes. Appends the results to flat arrays instead of
+        returning a tuple per line, and defers formatting error messages
+        until ScanResult.errors is read.
+        Blank lines are skipped.
+
+        Args:
+            lines: A text buffer, or an iterable of lines.
+            first_line: The line number of the first line.
+
+        Returns:
+            The valid records and the line numbers of the failed lines.
+        """
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+
+        result = ScanResult()
+        add_opcode = result.opcodes.append
+        add_first = result.first.append
+        add_second = result.second.append
+        add_line = result.line_numbers.append
+        add_error = result.error_lines.append
+        add_source = result._error_sources.append
+        opcodes = OPCODES
+
+        for line_number, line in enumerate(lines, first_line):
+            fields = line.split()
+            if len(fields) == 3:
+                opcode = opcodes.get(fields[0])
+                if opcode is not None:
+                    try:
+                        first_num = float(fields[1])
+                        second_num = float(fields[2])
+                    except ValueError:
+                        pass
+                    else:
+                        add_opcode(opcode)
+                        add_first(first_num)
+                        add_second(second_num)
+                        add_line(line_number)
+                        continue
+            elif not fields:
+                continue
+            add_error(line_number)
+            add_source(line)
+        return result
+
     @staticmethod
     def is_quit_command(command: str) -> bool:
         """
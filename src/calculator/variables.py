@@ -0,0 +1,289 @@
+"""Named variables and formulas kept in a dependency graph.
+
+A variable holds either a number or a formula over other variables, such
+as ``x = a * b``. The graph records which variables each formula reads,
+so changing a variable recomputes only the variables downstream of it,
+each once and after everything it reads. Formulas that would make a
+variable depend on itself are rejected when they are defined.
+"""
+
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import (
+    CalculatorError,
+    CircularReferenceError,
+    InvalidExpressionError,
+    UndefinedVariableError,
+)
+from .expression import CONSTANT_NAMES, CompiledExpression, compile_expression
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .numeric import NumericBackend
+
+_NAME_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+
+def parse_assignment(statement: str) -> Tuple[str, str]:
+    """
+    Split an assignment such as ``x = a * b`` into its name and formula.
+
+    Args:
+        statement: The assignment text.
+
+    Returns:
+        The variable name and the formula text.
+
+    Raises:
+        InvalidExpressionError: If the statement is not ``<name> = <formula>``.
+    """
+    name, equals, formula = statement.partition("=")
+    name = name.strip()
+    if not equals or not _NAME_PATTERN.fullmatch(name):
+        raise InvalidExpressionError(
+            statement.strip(), "Expected: <name> = <expression>"
+        )
+    return name, formula
+
+
+class VariableGraph:
+    """Variables and formulas with incremental recomputation.
+
+    Every variable is a node; a formula adds an edge from each variable it
+    reads. Values are recomputed eagerly on each change, but only for the
+    changed variable and its downstream variables, in topological order,
+    so the cost of an update is proportional to the affected subgraph.
+
+    A formula that fails, for example by dividing by zero, stores its
+    error instead of a value; the variables that read it fail with the
+    same error until it is fixed.
+    """
+
+    def __init__(self, backend: Optional["NumericBackend"] = None) -> None:
+        """
+        Initialize an empty graph.
+
+        Args:
+            backend: The numeric backend formulas parse their numbers with
+                and compute in, float if omitted.
+        """
+        self._parse = None if backend is None else backend.parse
+        self._negate = None if backend is None else backend.negate
+        self._calculate = None
+        if backend is not None:
+            from .numeric import NumericOperations
+
+            self._calculate = NumericOperations(backend).calculate
+        self._formulas: Dict[str, CompiledExpression] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._values: Dict[str, float] = {}
+        self._errors: Dict[str, CalculatorError] = {}
+
+    def __len__(self) -> int:
+        """Return the number of variables."""
+        return len(self._dependents)
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether a variable is defined."""
+        return name in self._dependents
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the variable names in order of definition."""
+        return iter(self._dependents)
+
+    def get(self, name: str) -> float:
+        """
+        Return the current value of a variable.
+
+        Args:
+            name: The variable name.
+
+        Returns:
+            The value.
+
+        Raises:
+            UndefinedVariableError: If the variable is not defined.
+            CalculatorError: The error of a formula that failed.
+        """
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        if name in self._errors:
+            raise self._errors[name]
+        raise UndefinedVariableError(name)
+
+    def formula(self, name: str) -> Optional[str]:
+        """
+        Return the formula of a variable.
+
+        Args:
+            name: The variable name.
+
+        Returns:
+            The formula text, or None if the variable holds a number.
+
+        Raises:
+            UndefinedVariableError: If the variable is not defined.
+        """
+        if name not in self._dependents:
+            raise UndefinedVariableError(name)
+        compiled = self._formulas.get(name)
+        return compiled.source if compiled is not None else None
+
+    def set_value(self, name: str, value: float) -> List[str]:
+        """
+        Set a variable to a number, replacing any formula it had.
+
+        Args:
+            name: The variable name.
+            value: The new value.
+
+        Returns:
+            The variables that were recomputed, in order, starting with name.
+
+        Raises:
+            InvalidExpressionError: If name is not a valid variable name.
+        """
+        self._check_name(name)
+        self._unlink(name)
+        self._dependents.setdefault(name, set())
+        self._values[name] = value
+        self._errors.pop(name, None)
+        order = self._downstream(name)
+        self._recompute(order[1:])
+        return order
+
+    def set_formula(self, name: str, formula: str) -> List[str]:
+        """
+        Set a variable to a formula over other variables.
+
+        Args:
+            name: The variable name.
+            formula: An infix expression, such as ``a * b + 1``.
+
+        Returns:
+            The variables that were recomputed, in order, starting with name.
+
+        Raises:
+            InvalidExpressionError: If name or formula is not valid.
+            UndefinedVariableError: If the formula reads an undefined
+                variable.
+            CircularReferenceError: If the formula would make name depend
+                on itself; the graph is left unchanged.
+        """
+        self._check_name(name)
+        compiled = compile_expression(formula, allow_names=True, parse=self._parse)
+        self._check_cycle(name, compiled.names)
+        for source in compiled.names:
+            if source not in self._dependents:
+                raise UndefinedVariableError(source)
+
+        self._unlink(name)
+        self._formulas[name] = compiled
+        for source in compiled.names:
+            self._dependents[source].add(name)
+        self._dependents.setdefault(name, set())
+        order = self._downstream(name)
+        self._recompute(order)
+        return order
+
+    def assign(self, statement: str) -> List[str]:
+        """
+        Apply an assignment such as ``x = a * b`` or ``a = 3``.
+
+        Args:
+            statement: The assignment text.
+
+        Returns:
+            The variables that were recomputed, in order, starting with the
+            assigned one.
+
+        Raises:
+            InvalidExpressionError: If the statement is not valid.
+            UndefinedVariableError: If the formula reads an undefined
+                variable.
+            CircularReferenceError: If the formula would create a cycle.
+        """
+        name, formula = parse_assignment(statement)
+        return self.set_formula(name, formula)
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        """Reject names that are not identifiers or that denote constants."""
+        if not _NAME_PATTERN.fullmatch(name) or name.lower() in CONSTANT_NAMES:
+            raise InvalidExpressionError(name, "Not a valid variable name.")
+
+    def _unlink(self, name: str) -> None:
+        """Remove the edges from the variables name's formula reads."""
+        compiled = self._formulas.pop(name, None)
+        if compiled is not None:
+            for source in compiled.names:
+                self._dependents[source].discard(name)
+
+    def _check_cycle(self, name: str, sources: Tuple[str, ...]) -> None:
+        """Raise CircularReferenceError if name reaches any of sources."""
+        if name in sources:
+            raise CircularReferenceError([name, name])
+        if name not in self._dependents:
+            return
+        targets = set(sources)
+        parents: Dict[str, str] = {}
+        queue = deque([name])
+        while queue:
+            current = queue.popleft()
+            for dependent in self._dependents[current]:
+                if dependent in parents:
+                    continue
+                parents[dependent] = current
+                if dependent in targets:
+                    # name -> dependent -> ... -> current -> name, read as
+                    # "depends on".
+                    cycle = [name, dependent]
+                    while cycle[-1] != name:
+                        cycle.append(parents[cycle[-1]])
+                    raise CircularReferenceError(cycle)
+                queue.append(dependent)
+
+    def _downstream(self, name: str) -> List[str]:
+        """Return name and every variable that reads it, topologically."""
+        dependents = self._dependents
+        order: List[str] = []
+        seen = {name}
+        # Iterative depth-first search; reversed postorder of a DAG is a
+        # topological order. Recursion would overflow on long chains.
+        stack = [(name, iter(dependents[name]))]
+        while stack:
+            current, children = stack[-1]
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append((child, iter(dependents[child])))
+                    break
+            else:
+                stack.pop()
+                order.append(current)
+        order.reverse()
+        return order
+
+    def _recompute(self, order: List[str]) -> None:
+        """Evaluate the formulas of order, which is topologically sorted."""
+        formulas, values, errors = self._formulas, self._values, self._errors
+        calculate, negate = self._calculate, self._negate
+        for name in order:
+            compiled = formulas[name]
+            error = next(
+                (errors[source] for source in compiled.names if source in errors),
+                None,
+            )
+            if error is None:
+                try:
+                    values[name] = compiled.evaluate(values, calculate, negate)
+                except CalculatorError as e:
+                    error = e
+                else:
+                    errors.pop(name, None)
+                    continue
+            values.pop(name, None)
+            errors[name] = error
@@ -0,0 +1,198 @@
+"""Vectorized batch operations for the calculator application."""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import Any, Callable, Optional, Tuple
+
+from .exceptions import DivisionByZeroError
+from .registry import builtin_opcode
+
+# A scalar, a sequence, an ``array('d')`` buffer or a NumPy array.
+Operand = Any
+
+BACKENDS = ("auto", "python", "numpy")
+ZERO_POLICIES = ("nan", "inf", "raise")
+
+# Element-wise kernels of the built-in operations, by registry opcode. They
+# are the C operators, which also apply to NumPy arrays; division by zero
+# is handled before the kernel is applied.
+KERNELS: Tuple[Callable[[Any, Any], Any], ...] = (
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.truediv,
+)
+
+_numpy_module: Optional[Any] = None
+
+
+def load_numpy() -> Optional[Any]:
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None if NumPy is not installed.
+    """
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+class BatchResult:
+    """Result buffer and per-element division-by-zero mask of a batch."""
+
+    def __init__(self, values: Any, zero_division: Any, backend: str) -> None:
+        """
+        Initialize the batch result.
+
+        Args:
+            values: The result buffer (``array('d')`` or a NumPy array).
+            zero_division: Per-element mask, true where the divisor was zero.
+            backend: Name of the backend that produced the result.
+        """
+        self.values = values
+        self.zero_division = zero_division
+        self.backend = backend
+
+    def __len__(self) -> int:
+        """Return the number of results in the batch."""
+        return len(self.values)
+
+    @property
+    def error_count(self) -> int:
+        """Number of elements that hit a division by zero."""
+        return int(sum(self.zero_division))
+
+
+def _is_scalar(value: Any) -> bool:
+    """Check whether an operand should be broadcast as a scalar."""
+    return isinstance(value, (int, float))
+
+
+def zero_fill(dividend: float, divisor: float, on_zero: str) -> float:
+    """
+    Compute the value stored for an element whose divisor is zero.
+
+    Args:
+        dividend: The dividend of the element.
+        divisor: The (signed) zero divisor of the element.
+        on_zero: The division-by-zero policy.
+
+    Returns:
+        NaN for the ``nan`` policy, otherwise the IEEE 754 quotient.
+    """
+    if on_zero == "nan" or dividend == 0 or dividend != dividend:
+        return math.nan
+    sign = math.copysign(1.0, dividend) * math.copysign(1.0, divisor)
+    return math.copysign(math.inf, sign)
+
+
+def _python_backend(
+    kernel: Callable[[Any, Any], Any], a: Operand, b: Operand, on_zero: str
+) -> BatchResult:
+    """Evaluate a batch with the pure-Python ``array('d')`` backend."""
+    a_scalar, b_scalar = _is_scalar(a), _is_scalar(b)
+    if a_scalar and b_scalar:
+        raise ValueError("At least one operand must be a sequence.")
+    if not a_scalar and not b_scalar and len(a) != len(b):
+        raise ValueError(f"Operand lengths differ: {len(a)} and {len(b)}.")
+
+    size = len(b) if a_scalar else len(a)
+    xs = repeat(float(a), size) if a_scalar else a
+    ys = repeat(float(b), size) if b_scalar else b
+    mask = bytearray(size)
+
+    if kernel is operator.truediv:
+        has_zero = (b == 0) if b_scalar else (0 in b)
+        if has_zero:
+            if on_zero == "raise":
+                raise DivisionByZeroError()
+            if b_scalar:
+                mask = bytearray(b"\x01" * size)
+            else:
+                mask = bytearray([y == 0 for y in b])
+            values = array(
+                "d",
+                [x / y if y else zero_fill(x, y, on_zero) for x, y in zip(xs, ys)],
+            )
+            return BatchResult(values, mask, "python")
+
+    values = array("d", map(kernel, xs, ys))
+    return BatchResult(values, mask, "python")
+
+
+def _numpy_backend(
+    np: Any, kernel: Callable[[Any, Any], Any], a: Operand, b: Operand, on_zero: str
+) -> BatchResult:
+    """Evaluate a batch with the NumPy backend."""
+    x = np.asarray(a, dtype=np.float64)
+    y = np.asarray(b, dtype=np.float64)
+    if x.ndim > 1 or y.ndim > 1:
+        raise ValueError("Operands must be one-dimensional.")
+    if x.ndim == 0 and y.ndim == 0:
+        raise ValueError("At least one operand must be a sequence.")
+    if x.ndim == 1 and y.ndim == 1 and x.shape != y.shape:
+        raise ValueError(f"Operand lengths differ: {x.size} and {y.size}.")
+
+    shape = x.shape if x.ndim else y.shape
+    if kernel is not operator.truediv:
+        values = kernel(x, y)
+        return BatchResult(values, np.zeros(shape, dtype=bool), "numpy")
+
+    mask = np.broadcast_to(y == 0, shape)
+    if on_zero == "raise" and mask.any():
+        raise DivisionByZeroError()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.divide(x, y)
+    if on_zero == "nan":
+        values[mask] = np.nan
+    return BatchResult(values, mask.copy(), "numpy")
+
+
+def calculate_many(
+    operation: str,
+    a: Operand,
+    b: Operand,
+    on_zero: str = "nan",
+    backend: str = "auto",
+) -> BatchResult:
+    """
+    Apply one operation element-wise over whole operand arrays.
+
+    Args:
+        operation: The operation to perform (+, -, *, /).
+        a: First operands, as a sequence, ``array('d')``, NumPy array or scalar.
+        b: Second operands, as a sequence, ``array('d')``, NumPy array or scalar.
+        on_zero: Value stored where the divisor is zero: ``nan``, ``inf``
+            (the IEEE 754 signed infinity) or ``raise``.
+        backend: ``python``, ``numpy`` or ``auto`` (NumPy when installed).
+
+    Returns:
+        The batch result with its division-by-zero mask.
+
+    Raises:
+        DivisionByZeroError: If a divisor is zero and on_zero is ``raise``.
+        ValueError: If the operation, policy, backend or operand shapes
+            are not supported.
+    """
+    kernel = KERNELS[builtin_opcode(operation)]
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unsupported division-by-zero policy: {on_zero}")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend}")
+
+    if backend != "python":
+        np = load_numpy()
+        if np is not None:
+            return _numpy_backend(np, kernel, a, b, on_zero)
+        if backend == "numpy":
+            raise ValueError("The numpy backend requires NumPy to be installed.")
+
+    return _python_backend(kernel, a, b, on_zero)
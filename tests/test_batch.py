@@ -0,0 +1,173 @@
+"""Test module for the streaming batch mode."""
+
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.calculator.batch import (
+    evaluate_lines,
+    parse_line,
+    read_lines,
+    run_batch,
+    run_batch_path,
+)
+from src.calculator.exceptions import (
+    InvalidLineError,
+    InvalidNumberError,
+    InvalidOperationError,
+)
+from src.calculator.numeric import DecimalBackend, IntegerBackend, NumericOperations
+from src.calculator.operations import Operations
+
+MIXED_LINES = [
+    "+ 3 4",
+    "/ 1 0",
+    "/ -2 0",
+    "^ 1 2",
+    "^ 1 x",
+    "x 1",
+    "- 1 a",
+    "* 2 -inf",
+    "/ 1e308 1e-308",
+]
+
+
+class TestReadLines:
+    """Test cases for read_lines."""
+
+    def test_numbers_lines_and_skips_blanks(self) -> None:
+        """Test blank lines are skipped but keep their line numbers."""
+        lines = list(read_lines(["+ 1 2\n", "\n", "   \n", "* 3 4\n"]))
+        assert lines == [(1, "+ 1 2\n"), (4, "* 3 4\n")]
+
+    def test_is_lazy(self) -> None:
+        """Test lines are pulled from the stream one at a time."""
+
+        def endless() -> object:
+            while True:
+                yield "+ 1 1\n"
+
+        assert next(read_lines(endless())) == (1, "+ 1 1\n")  # type: ignore
+
+
+class TestParseLine:
+    """Test cases for parse_line."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("+ 3 4", ("+", 3.0, 4.0)),
+            ("  /\t1e3   -2.5 \n", ("/", 1000.0, -2.5)),
+            ("* inf 2", ("*", float("inf"), 2.0)),
+        ],
+    )
+    def test_valid_lines(self, line: str, expected: object) -> None:
+        """Test valid lines are parsed through the validator."""
+        assert parse_line(line) == expected
+
+    @pytest.mark.parametrize("line", ["+ 3", "+ 3 4 5", "+"])
+    def test_wrong_field_count(self, line: str) -> None:
+        """Test lines without exactly three fields are rejected."""
+        with pytest.raises(InvalidLineError) as exc_info:
+            parse_line(line + "\n")
+        assert exc_info.value.line == line
+
+    def test_invalid_operation(self) -> None:
+        """Test an unsupported operation is rejected."""
+        with pytest.raises(InvalidOperationError):
+            parse_line("^ 3 4")
+
+    def test_invalid_number(self) -> None:
+        """Test an invalid operand is rejected."""
+        with pytest.raises(InvalidNumberError):
+            parse_line("+ 3 abc")
+
+
+class TestEvaluateLines:
+    """Test cases for evaluate_lines and run_batch."""
+
+    def test_results_and_errors(self) -> None:
+        """Test results and numbered errors are produced in input order."""
+        output = list(
+            evaluate_lines(
+                [(1, "+ 3 4"), (2, "/ 1 0"), (3, "^ 1 2"), (5, "x 1"), (6, "- 1 a")]
+            )
+        )
+        assert output == [
+            "7.0\n",
+            "Error: line 2: Division by zero is not allowed.\n",
+            "Error: line 3: Invalid operation: '^'. Supported operations: +, -, *, /\n",
+            "Error: line 5: Invalid line: 'x 1'. "
+            "Expected: <operation> <first number> <second number>\n",
+            "Error: line 6: Invalid number: 'a'. Please enter a valid number.\n",
+        ]
+
+    @pytest.mark.parametrize("on_zero", ["error", "nan", "inf"])
+    def test_custom_operations_match_fast_path(self, on_zero: str) -> None:
+        """Test the raising and non-raising paths produce the same output."""
+        lines = list(enumerate(MIXED_LINES, 1))
+        fast = list(evaluate_lines(lines, on_zero=on_zero))
+        raising = list(evaluate_lines(lines, Operations(), on_zero))
+        assert fast == raising
+
+    def test_zero_policies(self) -> None:
+        """Test nan and inf policies turn divisions by zero into values."""
+        lines = [(1, "/ 1 0"), (2, "/ -1 0"), (3, "/ 0 0")]
+        assert list(evaluate_lines(lines, on_zero="nan")) == ["nan\n"] * 3
+        assert list(evaluate_lines(lines, on_zero="inf")) == [
+            "inf\n",
+            "-inf\n",
+            "nan\n",
+        ]
+
+    def test_numeric_backend(self) -> None:
+        """Test operands are parsed and computed with the operations' backend."""
+        lines = [(1, "* 123456789123456789 1000000007"), (2, "/ 7 2"), (3, "+ a 1")]
+        assert list(evaluate_lines(lines, NumericOperations(IntegerBackend()))) == [
+            "123456789987654312864197523\n",
+            "3.5\n",
+            "Error: line 3: Invalid number: 'a'. Please enter a valid number.\n",
+        ]
+
+    def test_numeric_backend_zero_policy(self) -> None:
+        """Test division-by-zero policies apply to backend numbers."""
+        operations = NumericOperations(DecimalBackend())
+        lines = [(1, "/ -1 0"), (2, "+ 0.1 0.2")]
+        assert list(evaluate_lines(lines, operations, "inf")) == ["-inf\n", "0.3\n"]
+
+    def test_invalid_zero_policy(self) -> None:
+        """Test unknown division-by-zero policies are rejected."""
+        with pytest.raises(ValueError, match="policy"):
+            list(evaluate_lines([(1, "+ 1 2")], on_zero="raise"))
+
+    def test_run_batch(self) -> None:
+        """Test run_batch streams a whole input into the output."""
+        source = StringIO("+ 1 2\n\n* 2 3\n/ 9 3\n")
+        output = StringIO()
+        run_batch(source, output)
+        assert output.getvalue() == "3.0\n6.0\n3.0\n"
+
+
+class TestRunBatchPath:
+    """Test cases for run_batch_path."""
+
+    def test_file(self, tmp_path: Path) -> None:
+        """Test reading batch input from a file."""
+        path = tmp_path / "input.txt"
+        path.write_text("- 10 4\n", encoding="utf-8")
+        output = StringIO()
+        run_batch_path(str(path), output)
+        assert output.getvalue() == "6.0\n"
+
+    @patch("sys.stdout", new_callable=StringIO)
+    @patch("sys.stdin", new=StringIO("* 6 7\n"))
+    def test_stdin(self, mock_stdout: StringIO) -> None:
+        """Test '-' reads from standard input and writes to standard output."""
+        run_batch_path("-")
+        assert mock_stdout.getvalue() == "42.0\n"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file raises OSError."""
+        with pytest.raises(OSError):
+            run_batch_path(str(tmp_path / "missing.txt"), StringIO())
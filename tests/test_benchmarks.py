@@ -0,0 +1,139 @@
+"""Test module for the benchmark suite's workloads and regression gate."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from benchmarks import suite
+from benchmarks.workloads import (
+    WORKLOADS,
+    generate_answers,
+    generate_lines,
+    generate_numbers,
+    generate_triples,
+)
+from src.calculator.evaluation import STATUS_DIVISION_BY_ZERO, evaluate_lines
+
+
+def document(**ops_per_sec: float) -> Dict[str, Any]:
+    """Build a minimal results document."""
+    return {
+        "format": suite.FORMAT_VERSION,
+        "results": {
+            name: {"ops": 1, "seconds": 1 / value, "ops_per_sec": value}
+            for name, value in ops_per_sec.items()
+        },
+    }
+
+
+class TestWorkloads:
+    """Test cases for the synthetic workload generators."""
+
+    @pytest.mark.parametrize("workload", WORKLOADS)
+    def test_reproducible(self, workload: str) -> None:
+        """Test the same seed produces the same data and another seed does not."""
+        assert generate_lines(100, workload) == generate_lines(100, workload)
+        assert generate_lines(100, workload) != generate_lines(100, workload, seed=1)
+        assert generate_numbers(50, workload) == generate_numbers(50, workload)
+        assert generate_answers(50, workload) == generate_answers(50, workload)
+
+    def test_workload_mix(self) -> None:
+        """Test each workload has the failures it is named for."""
+        clean = evaluate_lines(generate_lines(1000, "clean"))
+        dirty = evaluate_lines(generate_lines(1000, "dirty"))
+        zero = evaluate_lines(generate_lines(1000, "zero"))
+
+        assert clean.error_count == 0
+        assert 200 < dirty.error_count < 400
+        assert 400 < zero.statuses.count(STATUS_DIVISION_BY_ZERO) < 600
+        assert all(b != 0 for _, _, b in generate_triples(1000, "clean"))
+
+    def test_unknown_workload(self) -> None:
+        """Test unknown workload names are rejected."""
+        with pytest.raises(ValueError, match="Unknown workload"):
+            generate_lines(10, "messy")
+
+
+class TestCompare:
+    """Test cases for the regression comparison."""
+
+    def test_threshold(self) -> None:
+        """Test only drops larger than the threshold are regressions."""
+        baseline = document(a=1000.0, b=1000.0, c=1000.0)
+        current = document(a=950.0, b=850.0, c=2000.0)
+
+        rows, regressions = suite.compare(baseline, current, threshold=10)
+
+        assert regressions == ["b"]
+        assert [row[-1] for row in rows] == ["ok", "REGRESSION", "ok"]
+        assert rows[1][3] == "-15.0%"
+
+    def test_missing_and_new(self) -> None:
+        """Test added and removed benchmarks are reported but never fail."""
+        rows, regressions = suite.compare(document(old=1.0), document(new=1.0))
+        assert regressions == []
+        assert [(row[0], row[-1]) for row in rows] == [
+            ("new", "new"),
+            ("old", "missing"),
+        ]
+
+    def test_compare_command_exit_status(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test the compare command exits with 1 on a regression."""
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        baseline.write_text(json.dumps(document(a=100.0)))
+        current.write_text(json.dumps(document(a=80.0)))
+
+        assert suite.main(["compare", str(baseline), str(current)]) == 1
+        assert "regressed by more than 10%" in capsys.readouterr().err
+        assert (
+            suite.main(["compare", str(baseline), str(current), "--threshold", "25"])
+            == 0
+        )
+
+    def test_load_rejects_other_files(self, tmp_path: Path) -> None:
+        """Test files that are not results documents are rejected."""
+        path = tmp_path / "other.json"
+        path.write_text("{}")
+        with pytest.raises(ValueError, match="results file"):
+            suite.load_results(str(path))
+
+
+class TestRunSuite:
+    """Test cases for running the suite."""
+
+    def test_every_benchmark_runs(self, tmp_path: Path) -> None:
+        """Test a tiny run covers every benchmark and writes valid JSON."""
+        output = tmp_path / "results.json"
+        assert (
+            suite.main(["run", "--size", "20", "--repeat", "1", "-o", str(output)]) == 0
+        )
+
+        results = suite.load_results(str(output))["results"]
+        assert sorted(results) == sorted(suite.benchmark_names())
+        assert all(result["ops_per_sec"] > 0 for result in results.values())
+
+    def test_filter_and_baseline(self, tmp_path: Path) -> None:
+        """Test --filter limits the run and --baseline applies the gate."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps(document(**{"operations.calculate[clean]": 1e12}))
+        )
+
+        status = suite.main(
+            [
+                "run",
+                "--size",
+                "20",
+                "--repeat",
+                "1",
+                "--filter",
+                "operations.calculate[clean]",
+                "--baseline",
+                str(baseline),
+            ]
+        )
+        assert status == 1
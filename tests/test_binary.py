@@ -0,0 +1,193 @@
+"""Test module for the binary operand/result file format."""
+
+import math
+import struct
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.calculator import binary
+from src.calculator.binary import (
+    HEADER,
+    HEADER_SIZE,
+    MAGIC,
+    RECORD,
+    RECORD_SIZE,
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_INVALID_OPCODE,
+    STATUS_OK,
+    decode_to_text,
+    encode_text,
+    read_results,
+    run_binary,
+)
+from src.calculator.exceptions import InvalidBinaryFileError
+
+SAMPLE = "+ 3 4\n/ 1 0\n\n* 2 abc\n- 10 2.5\n/ 9 3\n* 1e3 -2\n"
+
+BACKENDS = ["python", "numpy"]
+
+
+@pytest.fixture
+def operand_file(tmp_path: Path) -> str:
+    """Encode the sample batch input and return the operand file path."""
+    path = tmp_path / "input.bin"
+    with open(path, "wb") as destination:
+        encode_text(StringIO(SAMPLE), destination)
+    return str(path)
+
+
+def write_records(path: Path, records: list) -> str:
+    """Write raw (opcode, a, b) records with a matching header."""
+    data = HEADER.pack(MAGIC, len(records))
+    data += b"".join(RECORD.pack(*record) for record in records)
+    path.write_bytes(data)
+    return str(path)
+
+
+class TestEncodeText:
+    """Test cases for encode_text."""
+
+    def test_layout(self, operand_file: str) -> None:
+        """Test the header count and fixed-width record layout."""
+        data = Path(operand_file).read_bytes()
+        assert HEADER_SIZE == 16 and RECORD_SIZE == 24
+        assert HEADER.unpack_from(data) == (MAGIC, 5)
+        assert len(data) == HEADER_SIZE + 5 * RECORD_SIZE
+        assert RECORD.unpack_from(data, HEADER_SIZE) == (0, 3.0, 4.0)
+        assert data[HEADER_SIZE + 1 : HEADER_SIZE + 8] == bytes(7)
+
+    def test_invalid_lines_are_reported(self) -> None:
+        """Test invalid lines are skipped and returned with line numbers."""
+        errors = encode_text(StringIO(SAMPLE), BytesIO())
+        assert [line for line, _ in errors] == [4]
+        assert "abc" in errors[0][1]
+
+    def test_empty_input(self) -> None:
+        """Test an empty input produces a header-only file."""
+        destination = BytesIO()
+        assert encode_text(StringIO(""), destination) == []
+        assert destination.getvalue() == HEADER.pack(MAGIC, 0)
+
+
+class TestDecodeToText:
+    """Test cases for decode_to_text."""
+
+    def test_round_trip(self, operand_file: str) -> None:
+        """Test decoding reproduces the valid input lines."""
+        output = StringIO()
+        assert decode_to_text(operand_file, output) == 5
+        assert output.getvalue() == (
+            "+ 3.0 4.0\n/ 1.0 0.0\n- 10.0 2.5\n/ 9.0 3.0\n* 1000.0 -2.0\n"
+        )
+
+    def test_unknown_opcode(self, tmp_path: Path) -> None:
+        """Test unknown opcodes are decoded as a numbered placeholder."""
+        path = write_records(tmp_path / "bad.bin", [(9, 1.0, 2.0)])
+        output = StringIO()
+        decode_to_text(path, output)
+        assert output.getvalue() == "#9 1.0 2.0\n"
+
+
+class TestRunBinary:
+    """Test cases for run_binary."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_results_and_status(
+        self, operand_file: str, tmp_path: Path, backend: str
+    ) -> None:
+        """Test results are written in record order with status bytes."""
+        results_path = tmp_path / "results.bin"
+        status = BytesIO()
+        with open(results_path, "wb") as results:
+            failed = run_binary(operand_file, results, status, backend)
+
+        values = read_results(str(results_path))
+        assert failed == 1
+        assert list(values[:1]) + list(values[2:]) == [7.0, 7.5, 3.0, -2000.0]
+        assert math.isnan(values[1])
+        assert list(status.getvalue()) == [
+            STATUS_OK,
+            STATUS_DIVISION_BY_ZERO,
+            STATUS_OK,
+            STATUS_OK,
+            STATUS_OK,
+        ]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_invalid_opcode(self, tmp_path: Path, backend: str) -> None:
+        """Test unknown opcodes produce NaN and an invalid-opcode status."""
+        path = write_records(tmp_path / "in.bin", [(7, 1.0, 2.0), (2, 3.0, 4.0)])
+        results = BytesIO()
+        status = BytesIO()
+        assert run_binary(path, results, status, backend) == 1
+
+        values = struct.unpack("<2d", results.getvalue())
+        assert math.isnan(values[0]) and values[1] == 12.0
+        assert list(status.getvalue()) == [STATUS_INVALID_OPCODE, STATUS_OK]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_backends_agree_across_blocks(self, tmp_path: Path, backend: str) -> None:
+        """Test block-wise evaluation matches the per-record reference."""
+        records = [(i % 4, float(i), float(i % 5)) for i in range(50)]
+        path = write_records(tmp_path / "in.bin", records)
+        results = BytesIO()
+        with patch.object(binary, "BLOCK_RECORDS", 7):
+            run_binary(path, results, backend=backend)
+
+        values = struct.unpack(f"<{len(records)}d", results.getvalue())
+        for (opcode, a, b), value in zip(records, values):
+            if opcode == 3 and b == 0:
+                assert math.isnan(value)
+            else:
+                expected = [a + b, a - b, a * b, a / b if b else 0][opcode]
+                assert value == expected
+
+    def test_python_backend_on_big_endian_host(self, tmp_path: Path) -> None:
+        """Test native doubles are byte-swapped when the host is not little-endian."""
+        # Operands stored big-endian read on this host just as the
+        # little-endian file format reads on a big-endian one.
+        records = [(0, 1.5, 2.0), (3, 1.0, 0.0), (2, -3.0, 4.0)]
+        data = HEADER.pack(MAGIC, len(records))
+        data += b"".join(struct.pack(">B7xdd", *record) for record in records)
+        path = tmp_path / "in.bin"
+        path.write_bytes(data)
+        results = BytesIO()
+        with patch.object(binary.sys, "byteorder", "big"):
+            assert run_binary(str(path), results, backend="python") == 1
+
+        values = struct.unpack(">3d", results.getvalue())
+        assert values[0] == 3.5 and math.isnan(values[1]) and values[2] == -12.0
+
+    def test_auto_without_numpy(self, operand_file: str) -> None:
+        """Test the auto backend falls back to pure Python."""
+        with patch.object(binary, "load_numpy", return_value=None):
+            assert run_binary(operand_file, BytesIO()) == 1
+
+    def test_numpy_backend_unavailable(self, operand_file: str) -> None:
+        """Test requesting numpy without NumPy installed fails."""
+        with patch.object(binary, "load_numpy", return_value=None):
+            with pytest.raises(ValueError, match="NumPy"):
+                run_binary(operand_file, BytesIO(), backend="numpy")
+
+    def test_unsupported_backend(self, operand_file: str) -> None:
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            run_binary(operand_file, BytesIO(), backend="gpu")
+
+    @pytest.mark.parametrize(
+        "data, reason",
+        [
+            (b"", "empty"),
+            (b"CALC", "shorter than the header"),
+            (b"NOTCALC!" + bytes(8), "Bad magic"),
+            (HEADER.pack(MAGIC, 2) + bytes(RECORD_SIZE), "Expected 2 records"),
+        ],
+    )
+    def test_malformed_files(self, tmp_path: Path, data: bytes, reason: str) -> None:
+        """Test malformed operand files raise InvalidBinaryFileError."""
+        path = tmp_path / "bad.bin"
+        path.write_bytes(data)
+        with pytest.raises(InvalidBinaryFileError, match=reason):
+            run_binary(str(path), BytesIO(), backend="python")
@@ -0,0 +1,252 @@
+"""Test module for the memoizing result cache."""
+
+import math
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from src.calculator.cache import CachedOperations, ResultCache
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.numeric import DecimalBackend, IntegerBackend, NumericOperations
+from src.calculator.operations import Operations
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_commutative_keys_are_canonical(self) -> None:
+        """Test + and * share entries regardless of operand order."""
+        assert ResultCache.make_key("+", 3.0, 4.0) == ResultCache.make_key(
+            "+", 4.0, 3.0
+        )
+        assert ResultCache.make_key("*", 3.0, 4.0) == ResultCache.make_key(
+            "*", 4.0, 3.0
+        )
+
+    def test_non_commutative_keys_keep_order(self) -> None:
+        """Test - and / keep their operand order."""
+        assert ResultCache.make_key("-", 3.0, 4.0) != ResultCache.make_key(
+            "-", 4.0, 3.0
+        )
+        assert ResultCache.make_key("/", 3.0, 4.0) != ResultCache.make_key(
+            "/", 4.0, 3.0
+        )
+
+    def test_operand_types_are_part_of_the_key(self) -> None:
+        """Test int and float operands never share an entry."""
+        assert ResultCache.make_key("+", 3, 4) != ResultCache.make_key("+", 3.0, 4.0)
+
+    def test_decimal_operands_are_keyed_by_text(self) -> None:
+        """Test equal Decimals written differently never share a result."""
+        assert ResultCache.make_key("*", Decimal("2"), Decimal(3)) != (
+            ResultCache.make_key("*", Decimal("2.0"), Decimal(3))
+        )
+
+    def test_get_and_put(self) -> None:
+        """Test lookups count hits and misses."""
+        cache = ResultCache()
+        key = cache.make_key("+", 1.0, 2.0)
+
+        assert cache.get(key) is None
+        cache.put(key, 3.0)
+        assert cache.get(key) == 3.0
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+        assert len(cache) == 1
+
+    def test_put_replaces_existing_entry(self) -> None:
+        """Test re-storing a key does not double count its memory."""
+        cache = ResultCache()
+        key = cache.make_key("+", 1.0, 2.0)
+        cache.put(key, 3.0)
+        footprint = cache.memory_bytes
+        cache.put(key, 3.0)
+        assert cache.memory_bytes == footprint
+        assert len(cache) == 1
+
+    def test_lru_eviction_by_entries(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache = ResultCache(maxsize=2)
+        first, second, third = (cache.make_key("+", float(n), 1.0) for n in (1, 2, 3))
+        cache.put(first, 2.0)
+        cache.put(second, 3.0)
+        cache.get(first)
+        cache.put(third, 4.0)
+
+        assert cache.evictions == 1
+        assert cache.get(second) is None
+        assert cache.get(first) == 2.0
+
+    def test_eviction_by_memory_footprint(self) -> None:
+        """Test entries are evicted to stay under max_bytes."""
+        probe = ResultCache()
+        probe.put(probe.make_key("+", 1.0, 1.0), 2.0)
+        entry_bytes = probe.memory_bytes
+
+        cache = ResultCache(maxsize=100, max_bytes=entry_bytes * 3)
+        for n in range(10):
+            cache.put(cache.make_key("+", float(n + 1), 1.0), float(n + 2))
+
+        assert len(cache) == 3
+        assert cache.evictions == 7
+        assert cache.memory_bytes <= entry_bytes * 3
+
+    def test_memory_bound_keeps_newest_entry(self) -> None:
+        """Test a tiny byte budget still keeps the latest entry."""
+        cache = ResultCache(max_bytes=1)
+        cache.put(cache.make_key("+", 1.0, 1.0), 2.0)
+        assert len(cache) == 1
+
+    def test_stats_and_clear(self) -> None:
+        """Test stats report the footprint and clear resets everything."""
+        cache = ResultCache()
+        cache.put(cache.make_key("+", 1.0, 1.0), 2.0)
+        cache.get(cache.make_key("+", 1.0, 1.0))
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["memory_bytes"] > 0
+        assert cache.format_stats().startswith("Cache: 1 entries, 1 hits, 0 misses")
+
+        cache.clear()
+        assert cache.stats() == {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "evictions": 0,
+            "memory_bytes": 0,
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"maxsize": 0}, "maxsize must be a positive integer."),
+            ({"max_bytes": 0}, "max_bytes must be a positive integer."),
+        ],
+    )
+    def test_invalid_bounds(self, kwargs: dict, message: str) -> None:
+        """Test non-positive bounds are rejected."""
+        with pytest.raises(ValueError, match=message):
+            ResultCache(**kwargs)
+
+
+class TestCachedOperations:
+    """Test cases for CachedOperations."""
+
+    def test_is_operations(self) -> None:
+        """Test CachedOperations can replace Operations."""
+        operations = CachedOperations()
+        assert isinstance(operations, Operations)
+        assert operations.add(1, 2) == 3
+
+    @pytest.mark.parametrize(
+        "operation, a, b", [("+", 3.0, 4.0), ("-", 3.0, 4.0), ("*", 2.5, -4.0)]
+    )
+    def test_results_match_operations(self, operation: str, a: float, b: float) -> None:
+        """Test cached results equal uncached results."""
+        operations = CachedOperations()
+        expected = Operations.calculate(operation, a, b)
+        assert operations.calculate(operation, a, b) == expected
+        assert operations.calculate(operation, a, b) == expected
+        assert operations.cache.hits == 1
+
+    def test_commutative_calls_share_an_entry(self) -> None:
+        """Test + 3 4 and + 4 3 are served by one entry."""
+        operations = CachedOperations()
+        operations.calculate("+", 3.0, 4.0)
+        assert operations.calculate("+", 4.0, 3.0) == 7.0
+        assert len(operations.cache) == 1
+        assert operations.cache.hits == 1
+
+    def test_division_by_zero_is_cached(self) -> None:
+        """Test a repeated bad division raises again without dividing."""
+        operations = CachedOperations()
+        with pytest.raises(DivisionByZeroError) as first:
+            operations.calculate("/", 5.0, 0.0)
+
+        with patch.object(Operations, "divide") as mock_divide:
+            with pytest.raises(DivisionByZeroError) as second:
+                operations.calculate("/", 5.0, 0.0)
+            mock_divide.assert_not_called()
+
+        assert second.value is not first.value
+        assert second.value.message == "Division by zero is not allowed."
+        assert operations.cache.hits == 1
+
+    def test_cached_division_by_zero_keeps_no_traceback(self) -> None:
+        """Test the stored error is never raised and each hit raises a new one."""
+        operations = CachedOperations()
+        for _ in range(2):
+            with pytest.raises(DivisionByZeroError) as info:
+                operations.calculate("/", 5.0, 0.0)
+            assert info.value.__traceback__ is not None
+        stored = operations.cache.get(ResultCache.make_key("/", 5.0, 0.0))
+        assert isinstance(stored, DivisionByZeroError)
+        assert stored.__traceback__ is None and stored is not info.value
+
+    @pytest.mark.parametrize(
+        "operation, a, b",
+        [("*", -0.0, 5.0), ("*", 5.0, -0.0), ("-", 0.0, 0.0), ("/", -0.0, 2.0)],
+    )
+    def test_zero_operands_bypass_cache(
+        self, operation: str, a: float, b: float
+    ) -> None:
+        """Test zero operands are computed directly to keep the sign of zero."""
+        operations = CachedOperations()
+        result = operations.calculate(operation, a, b)
+        expected = Operations.calculate(operation, a, b)
+        assert math.copysign(1.0, result) == math.copysign(1.0, expected)
+        assert len(operations.cache) == 0
+
+    def test_nan_operands_bypass_cache(self) -> None:
+        """Test NaN operands are never cached."""
+        operations = CachedOperations()
+        assert math.isnan(operations.calculate("+", math.nan, 1.0))
+        assert len(operations.cache) == 0
+
+    def test_shared_cache(self) -> None:
+        """Test an explicit cache instance is used."""
+        cache = ResultCache(maxsize=8)
+        assert CachedOperations(cache).cache is cache
+
+    def test_invalid_operation_is_not_cached(self) -> None:
+        """Test unsupported operations still raise ValueError."""
+        operations = CachedOperations()
+        with pytest.raises(ValueError, match="Unsupported operation"):
+            operations.calculate("^", 1.0, 2.0)
+        assert len(operations.cache) == 0
+
+    def test_inner_operations(self) -> None:
+        """Test misses are computed by the inner operations and its backend."""
+        inner = NumericOperations(IntegerBackend())
+        operations = CachedOperations(inner=inner)
+        assert operations.backend is inner.backend
+        big = 2**70
+        assert operations.calculate("*", big, big) == big * big
+        assert operations.calculate("*", big, big) == big * big
+        assert operations.cache.hits == 1
+        with pytest.raises(DivisionByZeroError):
+            operations.calculate("/", 1, 0)
+
+    def test_decimal_results_keep_their_exponent(self) -> None:
+        """Test cached Decimal results print as they do without the cache."""
+        operations = CachedOperations(inner=NumericOperations(DecimalBackend()))
+        calculations = [
+            ("+", "1.0", "1"),
+            ("+", "1.00", "1"),
+            ("*", "2", "3"),
+            ("*", "2.0", "3"),
+            ("*", "2.0", "3"),
+        ]
+        results = [
+            str(operations.calculate(operation, Decimal(a), Decimal(b)))
+            for operation, a, b in calculations
+        ]
+        assert results == ["2.0", "2.00", "6", "6.0", "6.0"]
+        assert operations.cache.hits == 1
+
+    def test_plain_operations_have_no_backend(self) -> None:
+        """Test the default float path reports no numeric backend."""
+        assert CachedOperations().backend is None
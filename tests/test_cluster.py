@@ -0,0 +1,343 @@
+"""Test module for batch evaluation distributed over TCP workers."""
+
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+from io import StringIO
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.calculator.batch import run_batch
+from src.calculator.cluster import (
+    FRAME,
+    MAX_FRAME_BYTES,
+    RESULT,
+    TASK,
+    Address,
+    Coordinator,
+    WorkerServer,
+    count_lines,
+    evaluate_task,
+    parse_address,
+    read_frame,
+    run_cluster,
+    run_worker,
+    serve_worker,
+    write_frame,
+)
+from src.calculator.exceptions import ClusterError
+from src.calculator.operations import Operations
+
+SAMPLE = (
+    "+ 3 4\n"
+    "/ 1 0\n"
+    "\n"
+    "* 2 abc\n"
+    "- 10 2.5\r\n"
+    "^ 1 2\n"
+    "/ 9 3\n"
+    "+ 1\n"
+    "* 1e3 -2"
+)
+
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> str:
+    """Write the sample batch input and return its path."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(SAMPLE.encode("utf-8"))
+    return str(path)
+
+
+def serial_output(path: str) -> str:
+    """Evaluate a batch file in-process."""
+    output = StringIO()
+    with open(path, encoding="utf-8") as source:
+        run_batch(source, output)
+    return output.getvalue()
+
+
+def closed_port() -> int:
+    """Return a local TCP port nothing listens on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return int(probe.getsockname()[1])
+
+
+async def dies(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """A worker that crashes after receiving its first chunk."""
+    await read_frame(reader)
+    writer.close()
+
+
+async def misnumbers(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """A worker that answers with the wrong line number."""
+    _, policy, number, _ = await read_frame(reader)
+    write_frame(writer, RESULT, policy, number + 1, b"")
+    await writer.drain()
+
+
+async def hangs(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """A worker that never answers."""
+    await read_frame(reader)
+    await asyncio.sleep(60)
+
+
+async def coordinate(
+    path: str,
+    workers: int = 0,
+    handlers: Tuple[Handler, ...] = (),
+    chunk_bytes: int = 8,
+    **options: object,
+) -> str:
+    """Run a coordinator on fake workers followed by real in-process ones."""
+    servers = [
+        await asyncio.start_server(handler, "127.0.0.1", 0) for handler in handlers
+    ]
+    addresses: List[Address] = [
+        ("127.0.0.1", server.sockets[0].getsockname()[1]) for server in servers
+    ]
+    real = [WorkerServer(port=0) for _ in range(workers)]
+    for worker in real:
+        await worker.start()
+        addresses.append(("127.0.0.1", worker.port))
+    output = StringIO()
+    try:
+        coordinator = Coordinator(addresses, **options)  # type: ignore[arg-type]
+        await coordinator.run(path, output, chunk_bytes)
+    finally:
+        for server in servers:
+            server.close()
+        for worker in real:
+            await worker.close()
+    return output.getvalue()
+
+
+class TestFraming:
+    """Test cases for addresses, line counting and frames."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("127.0.0.1:7879", ("127.0.0.1", 7879)),
+            (" worker-2:1 ", ("worker-2", 1)),
+            ("[::1]:65535", ("::1", 65535)),
+        ],
+    )
+    def test_parse_address(self, text: str, expected: Address) -> None:
+        """Test HOST:PORT addresses are parsed."""
+        assert parse_address(text) == expected
+
+    @pytest.mark.parametrize("text", ["host", ":7879", "host:0", "host:65536", "h:x"])
+    def test_invalid_address(self, text: str) -> None:
+        """Test addresses without a host or a valid port are rejected."""
+        with pytest.raises(ValueError, match="Invalid worker address"):
+            parse_address(text)
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"a", b"a\n", b"a\r\nb\rc\n\nd", b"\r\n\r", b"\n\r\n"]
+    )
+    def test_count_lines(self, data: bytes) -> None:
+        """Test lines are counted as bytes.splitlines splits them."""
+        assert count_lines(data) == len(data.splitlines())
+
+    def test_evaluate_task(self) -> None:
+        """Test chunk lines are numbered from the first line, skipping blanks."""
+        payload = b"+ 1 2\n\n/ 1 0\r\n* 2 \xff\n"
+        expected = (
+            "3.0\n"
+            "Error: line 12: Division by zero is not allowed.\n"
+            "Error: line 13: Invalid number: '�'. Please enter a valid number.\n"
+        )
+        assert evaluate_task(payload, 10, None, "error") == expected.encode()
+        assert evaluate_task(payload, 10, Operations(), "error") == expected.encode()
+        assert evaluate_task(b"/ -1 0", 1, None, "inf") == b"-inf\n"
+
+
+class TestWorkerServer:
+    """Test cases for WorkerServer."""
+
+    def test_answers_tasks(self) -> None:
+        """Test tasks on one connection are answered in order."""
+
+        async def scenario() -> List[Tuple[int, int, int, bytes]]:
+            worker = WorkerServer(port=0)
+            await worker.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", worker.port)
+                write_frame(writer, TASK, 0, 5, b"+ 1 2\n")
+                write_frame(writer, TASK, 2, 9, b"/ 1 0\n")
+                frames = [await read_frame(reader), await read_frame(reader)]
+                writer.close()
+                return frames
+            finally:
+                await worker.close()
+
+        assert asyncio.run(scenario()) == [
+            (RESULT, 0, 5, b"3.0\n"),
+            (RESULT, 2, 9, b"inf\n"),
+        ]
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            FRAME.pack(RESULT, 0, 1, 0),
+            FRAME.pack(TASK, 3, 1, 0),
+            FRAME.pack(TASK, 0, 1, MAX_FRAME_BYTES + 1),
+            b"\x01",
+        ],
+    )
+    def test_closes_on_bad_frames(self, header: bytes) -> None:
+        """Test unexpected, invalid, over-long and cut-off frames close the link."""
+
+        async def scenario() -> bytes:
+            worker = WorkerServer(port=0)
+            await worker.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", worker.port)
+                writer.write(header)
+                writer.write_eof()
+                answer = await asyncio.wait_for(reader.read(), timeout=5)
+                writer.close()
+                return answer
+            finally:
+                await worker.close()
+
+        assert asyncio.run(scenario()) == b""
+
+    def test_serve_worker_stops_on_sigterm(self, capsys: pytest.CaptureFixture) -> None:
+        """Test serve_worker announces its address and stops on SIGTERM."""
+
+        async def scenario() -> None:
+            task = asyncio.ensure_future(serve_worker("127.0.0.1", 0))
+            await asyncio.sleep(0.2)
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(task, timeout=5)
+
+        asyncio.run(scenario())
+        assert "Worker listening on 127.0.0.1:" in capsys.readouterr().err
+
+    def test_run_worker(self) -> None:
+        """Test run_worker runs serve_worker in a fresh event loop."""
+        with patch(
+            "src.calculator.cluster.serve_worker", new_callable=AsyncMock
+        ) as mock:
+            run_worker("127.0.0.1", 9999)
+        mock.assert_awaited_once_with("127.0.0.1", 9999, None)
+
+
+class TestCoordinator:
+    """Test cases for Coordinator."""
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 8, 1000])
+    def test_matches_serial_output(self, sample_file: str, chunk_bytes: int) -> None:
+        """Test distributed output equals serial output, including line numbers."""
+        output = asyncio.run(coordinate(sample_file, 3, chunk_bytes=chunk_bytes))
+        assert output == serial_output(sample_file)
+        assert "Error: line 8: Invalid line: '+ 1'." in output
+
+    def test_zero_policy(self, sample_file: str) -> None:
+        """Test the division-by-zero policy reaches the workers."""
+        output = asyncio.run(coordinate(sample_file, 2, on_zero="nan"))
+        assert output.splitlines()[1] == "nan"
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test an empty file produces no output."""
+        path = tmp_path / "empty.txt"
+        path.write_text("")
+        assert asyncio.run(coordinate(str(path), 1)) == ""
+
+    @pytest.mark.parametrize(
+        "handler, options",
+        [(dies, {}), (misnumbers, {}), (hangs, {"timeout": 0.5})],
+    )
+    def test_failed_worker_chunks_are_retried(
+        self, sample_file: str, handler: Handler, options: dict
+    ) -> None:
+        """Test chunks of a dead, misbehaving or stuck worker go to another."""
+        output = asyncio.run(coordinate(sample_file, 1, (handler,), **options))
+        assert output == serial_output(sample_file)
+
+    def test_no_worker_left(self, sample_file: str) -> None:
+        """Test the run fails once every worker has failed."""
+        with pytest.raises(ClusterError, match="No worker is left; last worker"):
+            asyncio.run(coordinate(sample_file, 0, (dies, dies)))
+
+    def test_attempts(self, sample_file: str) -> None:
+        """Test the run fails when a chunk has failed on attempts workers."""
+        with pytest.raises(ClusterError, match="failed on 1 workers"):
+            asyncio.run(coordinate(sample_file, 1, (dies,) * 3, attempts=1))
+
+    @pytest.mark.parametrize(
+        "addresses, options, message",
+        [
+            ([], {}, "address"),
+            ([("127.0.0.1", 1)], {"attempts": 0}, "attempts"),
+            ([("127.0.0.1", 1)], {"timeout": 0}, "timeout"),
+            ([("127.0.0.1", 1)], {"on_zero": "skip"}, "policy"),
+        ],
+    )
+    def test_invalid_arguments(
+        self, addresses: List[Address], options: dict, message: str
+    ) -> None:
+        """Test invalid coordinator arguments are rejected."""
+        with pytest.raises(ValueError, match=message):
+            Coordinator(addresses, **options)
+
+
+class TestRunCluster:
+    """Test cases for run_cluster with worker processes."""
+
+    @pytest.fixture
+    def workers(self) -> Iterator[List["subprocess.Popen[str]"]]:
+        """Start three worker processes on free localhost ports."""
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-m", "src.calculator.main", "worker", "--port", "0"],
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(3)
+        ]
+        yield processes
+        for process in processes:
+            process.kill()
+            process.wait(timeout=10)
+            process.stderr.close()  # type: ignore[union-attr]
+
+    def test_worker_processes(
+        self, sample_file: str, workers: List["subprocess.Popen[str]"]
+    ) -> None:
+        """Test worker processes evaluate a file, and one dying is survived."""
+        addresses = [
+            parse_address(process.stderr.readline().rsplit(" ", 1)[1])  # type: ignore
+            for process in workers
+        ]
+        output = StringIO()
+        run_cluster(sample_file, output, addresses, chunk_bytes=8)
+        assert output.getvalue() == serial_output(sample_file)
+
+        workers[0].kill()
+        workers[0].wait(timeout=10)
+        output = StringIO()
+        run_cluster(sample_file, output, addresses, chunk_bytes=8)
+        assert output.getvalue() == serial_output(sample_file)
+
+    def test_unreachable_workers(self, sample_file: str) -> None:
+        """Test the run fails when no worker can be reached."""
+        with pytest.raises(ClusterError, match="No worker is left"):
+            run_cluster(sample_file, StringIO(), [("127.0.0.1", closed_port())])
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file raises OSError."""
+        with pytest.raises(OSError):
+            run_cluster(str(tmp_path / "missing.txt"), StringIO(), [("localhost", 1)])
@@ -0,0 +1,175 @@
+"""Test module for formula columns over CSV files."""
+
+import math
+import sys
+from io import StringIO
+from typing import List
+
+import pytest
+from src.calculator import vectorized
+from src.calculator.csvfile import ColumnFormula, resolve_column, run_csv
+from src.calculator.exceptions import InvalidColumnError, InvalidExpressionError
+
+PRICES = """\
+item,price,qty
+apple,2.5,4
+pear, x ,3
+
+plum,1,0
+fig,3
+"kiwi, gold",1e3,2
+"""
+
+
+def run(text: str, expression: str, **options: object) -> List[str]:
+    """Run a formula over CSV text; return the output and error lines."""
+    output, errors = StringIO(), StringIO()
+    failed = run_csv(
+        StringIO(text), output, expression, errors, **options  # type: ignore[arg-type]
+    )
+    error_lines = errors.getvalue().splitlines()
+    assert failed == len(error_lines)
+    return output.getvalue().splitlines() + error_lines
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Evaluate blocks with NumPy, or with the pure-Python backend."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vectorized, "_numpy_module", None)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    return str(request.param)
+
+
+class TestResolveColumn:
+    """Test cases for resolve_column."""
+
+    def test_header_names_and_positions(self) -> None:
+        """Test header titles take precedence over colN names."""
+        header = [" col2 ", "price", "qty"]
+        assert resolve_column("price", header) == 1
+        assert resolve_column("col2", header) == 0
+        assert resolve_column("col3", header) == 2
+        assert resolve_column("col40") == 39
+
+    @pytest.mark.parametrize("name", ["cost", "col0", "col4", "col01"])
+    def test_unknown_columns(self, name: str) -> None:
+        """Test names that match no column are rejected."""
+        with pytest.raises(InvalidColumnError) as info:
+            resolve_column(name, ["price", "qty", "total"])
+        assert info.value.message.startswith(f"Invalid column: '{name}'.")
+
+
+@pytest.mark.usefixtures("backend")
+class TestColumnFormula:
+    """Test cases for ColumnFormula."""
+
+    def test_evaluate_block(self) -> None:
+        """Test every row of a block is computed in one pass."""
+        formula = ColumnFormula("-(col1 + col2) * 2 / -col2 - 1", None)
+        values, errors = formula.evaluate([["1", "1"], ["3", " 1 "], ["-1", "4"]])
+        assert list(values) == [3.0, 7.0, 0.5]
+        assert errors == {}
+
+    def test_constant_formulas(self) -> None:
+        """Test formulas that read no column give one value per row."""
+        values, errors = ColumnFormula("-(2 * 3)").evaluate([["a"], ["b"]])
+        assert list(values) == [-6.0, -6.0]
+        values, errors = ColumnFormula("-2").evaluate([["a"], ["b"]])
+        assert list(values) == [-2.0, -2.0]
+        values, errors = ColumnFormula("1 / 0").evaluate([["a"], ["b"]])
+        assert sorted(errors) == [0, 1]
+
+    def test_failed_rows(self) -> None:
+        """Test bad cells and divisions by zero fail only their own rows."""
+        formula = ColumnFormula("a / b", ["a", "b"])
+        rows = [["1", "2"], ["1", ""], ["1", "0"], ["1"], ["nan", "inf"]]
+        values, errors = formula.evaluate(rows)
+        assert values[0] == 0.5 and math.isnan(values[4])
+        assert errors == {
+            1: "Invalid number: ''. Please enter a valid number.",
+            2: "Division by zero is not allowed.",
+            3: "Invalid column: 'b'. The row has 1 columns.",
+        }
+
+    @pytest.mark.parametrize(
+        "on_zero, expected", [("nan", math.nan), ("inf", -math.inf)]
+    )
+    def test_zero_policies(self, on_zero: str, expected: float) -> None:
+        """Test the nan and inf policies store a value instead of failing."""
+        values, errors = ColumnFormula("col1 / col2").evaluate([["-1", "0"]], on_zero)
+        assert errors == {}
+        assert values[0] == expected or math.isnan(expected) and math.isnan(values[0])
+
+
+@pytest.mark.usefixtures("backend")
+class TestRunCsv:
+    """Test cases for run_csv."""
+
+    def test_appends_result_column(self) -> None:
+        """Test results are appended and failed rows reported by row number."""
+        assert run(PRICES, "price * qty", block_rows=2) == [
+            "item,price,qty,result",
+            "apple,2.5,4,10.0",
+            "pear, x ,3,",
+            "",
+            "plum,1,0,0.0",
+            "fig,3,",
+            '"kiwi, gold",1e3,2,2000.0',
+            "Error: row 3: Invalid number: 'x'. Please enter a valid number.",
+            "Error: row 6: Invalid column: 'qty'. The row has 2 columns.",
+        ]
+
+    def test_options(self) -> None:
+        """Test headerless input, the delimiter, name and on_zero options."""
+        text = "6;3\n1;0\n"
+        assert run(text, "col1 / col2", header=False, delimiter=";") == [
+            "6;3;2.0",
+            "1;0;",
+            "Error: row 2: Division by zero is not allowed.",
+        ]
+        assert run(
+            text.replace(";", ","), "col1 / col2", header=False, on_zero="inf"
+        ) == [
+            "6,3,2.0",
+            "1,0,inf",
+        ]
+        assert run("a\n4\n", "a * a", name="square") == ["a,square", "4,16.0"]
+
+    def test_lines_are_copied(self) -> None:
+        """Test rows keep their text and line endings; quoted breaks still work."""
+        output = StringIO()
+        text = 'a,"b"\r\n1, 2\r\n\r\n3,"4"'
+        run_csv(StringIO(text), output, "a * b", StringIO(), name='x,"y"')
+        assert output.getvalue() == (
+            'a,"b","x,""y"""\r\n1, 2,2.0\r\n\r\n3,"4",12.0\r\n'
+        )
+        output = StringIO()
+        text = 'note,x\n"two\nlines",3\n\nshort\n'
+        failed = run_csv(StringIO(text), output, "x", StringIO())
+        assert failed == 1
+        assert output.getvalue() == 'note,x,result\n"two\nlines",3,3.0\n\nshort,\n'
+
+    def test_float_delimiter(self) -> None:
+        """Test cells are quoted when the delimiter can appear in a float."""
+        assert run("a.b\n1.4\n", "a / b", delimiter=".") == [
+            "a.b.result",
+            '1.4."0.25"',
+        ]
+
+    def test_empty_input(self) -> None:
+        """Test an empty file writes nothing but the formula is still checked."""
+        assert run("", "a * b") == []
+        with pytest.raises(InvalidExpressionError):
+            run("", "a *")
+
+    def test_invalid_arguments(self) -> None:
+        """Test bad formulas, columns and options raise before any output."""
+        with pytest.raises(InvalidColumnError):
+            run(PRICES, "price * total")
+        with pytest.raises(ValueError, match="policy"):
+            run(PRICES, "price", on_zero="skip")
+        with pytest.raises(ValueError, match="block_rows"):
+            run(PRICES, "price", block_rows=0)
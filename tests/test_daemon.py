@@ -0,0 +1,279 @@
+"""Test module for the resident daemon and its one-shot client."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from src.calculator import client
+from src.calculator.client import (
+    check_socket_path,
+    default_socket_path,
+    evaluate,
+    request_daemon,
+    start_daemon,
+)
+from src.calculator.daemon import (
+    DaemonServer,
+    is_daemon_running,
+    run_daemon,
+    serve_daemon,
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    """Return a short socket path inside the test directory."""
+    return str(tmp_path / "calc.sock")
+
+
+def wait_for_daemon(path: str) -> None:
+    """Wait until a daemon accepts connections on path."""
+    deadline = time.monotonic() + 10
+    while not is_daemon_running(path):
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+
+
+class TestDefaultSocketPath:
+    """Test cases for default_socket_path."""
+
+    def test_environment_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test CALCULATOR_SOCKET overrides the default path."""
+        monkeypatch.setenv("CALCULATOR_SOCKET", "/run/calc.sock")
+        assert default_socket_path() == "/run/calc.sock"
+
+    def test_runtime_directory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the socket goes in XDG_RUNTIME_DIR when it is set."""
+        monkeypatch.delenv("CALCULATOR_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert default_socket_path() == "/run/user/1000/calculator.sock"
+
+    def test_per_user_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default path is in a per-user temporary directory."""
+        monkeypatch.delenv("CALCULATOR_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert default_socket_path().endswith(
+            os.path.join(f"calculator-{os.getuid()}", "daemon.sock")
+        )
+
+
+class TestCheckSocketPath:
+    """Test cases for check_socket_path."""
+
+    @pytest.mark.parametrize("mode", [0o700, 0o1777])
+    def test_safe_paths(self, tmp_path: Path, mode: int) -> None:
+        """Test private and sticky directories and own sockets pass."""
+        tmp_path.chmod(mode)
+        check_socket_path(str(tmp_path / "calc.sock"))
+        (tmp_path / "calc.sock").write_text("")
+        check_socket_path(str(tmp_path / "calc.sock"))
+        check_socket_path(str(tmp_path / "missing" / "calc.sock"))
+
+    def test_shared_directory(self, tmp_path: Path) -> None:
+        """Test a directory others may write to without the sticky bit fails."""
+        tmp_path.chmod(0o777)
+        with pytest.raises(PermissionError, match="Unsafe daemon socket directory"):
+            check_socket_path(str(tmp_path / "calc.sock"))
+
+    @pytest.mark.parametrize(
+        "function, message", [("stat", "directory"), ("lstat", "another user")]
+    )
+    def test_other_users_paths(
+        self, tmp_path: Path, function: str, message: str
+    ) -> None:
+        """Test a directory or socket another user created fails."""
+        (tmp_path / "calc.sock").write_text("")
+        real = getattr(os, function)
+
+        def owned_by_other(path: str) -> os.stat_result:
+            info = list(real(path))
+            info[4] = os.getuid() + 1
+            return os.stat_result(info)
+
+        with patch.object(os, function, side_effect=owned_by_other):
+            with pytest.raises(PermissionError, match=message):
+                check_socket_path(str(tmp_path / "calc.sock"))
+
+
+class TestDaemonServer:
+    """Test cases for the daemon server and client."""
+
+    def test_request_round_trip(self, socket_path: str) -> None:
+        """Test requests are answered over the Unix socket."""
+
+        async def scenario() -> List[str]:
+            server = DaemonServer(socket_path)
+            await server.start()
+            try:
+                assert oct(os.stat(socket_path).st_mode & 0o777) == "0o600"
+                loop = asyncio.get_running_loop()
+                return [
+                    await loop.run_in_executor(None, request_daemon, line, socket_path)
+                    for line in ("+ 3 4", "/ 1 0")
+                ]
+            finally:
+                await server.close()
+
+        assert asyncio.run(scenario()) == [
+            "OK 7.0\n",
+            "ERR Division by zero is not allowed.\n",
+        ]
+        assert not os.path.exists(socket_path)
+
+    def test_exits_when_idle(self, socket_path: str) -> None:
+        """Test the daemon shuts down after idle_timeout without clients."""
+        started = time.monotonic()
+        run_daemon(socket_path, idle_timeout=0.1)
+        assert time.monotonic() - started < 5
+        assert not os.path.exists(socket_path)
+
+    def test_replaces_stale_socket(self, socket_path: str) -> None:
+        """Test a socket file left by a crashed daemon is replaced."""
+        Path(socket_path).write_text("stale")
+        run_daemon(socket_path, idle_timeout=0.05)
+        assert not os.path.exists(socket_path)
+
+    def test_creates_private_directory(self, tmp_path: Path) -> None:
+        """Test a missing socket directory is created for the user only."""
+        directory = tmp_path / "calculator"
+        run_daemon(str(directory / "calc.sock"), idle_timeout=0.05)
+        assert oct(directory.stat().st_mode & 0o777) == "0o700"
+
+    def test_refuses_unsafe_path(self, tmp_path: Path) -> None:
+        """Test the daemon neither removes nor binds a path others control."""
+        tmp_path.chmod(0o777)
+        path = tmp_path / "calc.sock"
+        path.write_text("someone else's")
+        with pytest.raises(PermissionError):
+            run_daemon(str(path), idle_timeout=0.05)
+        assert path.read_text() == "someone else's"
+
+    def test_does_not_replace_live_daemon(self, socket_path: str) -> None:
+        """Test a second daemon leaves a running one alone."""
+
+        async def scenario() -> bool:
+            server = DaemonServer(socket_path)
+            await server.start()
+            try:
+                await serve_daemon(socket_path, idle_timeout=0.05)
+                return os.path.exists(socket_path)
+            finally:
+                await server.close()
+
+        assert asyncio.run(scenario()) is True
+
+    def test_stops_on_sigterm(self, socket_path: str) -> None:
+        """Test the daemon shuts down gracefully on SIGTERM."""
+
+        async def scenario() -> None:
+            task = asyncio.ensure_future(serve_daemon(socket_path))
+            while not os.path.exists(socket_path):
+                await asyncio.sleep(0.01)
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(task, timeout=5)
+
+        asyncio.run(scenario())
+        assert not os.path.exists(socket_path)
+
+    def test_daemon_closing_without_answer(self, socket_path: str) -> None:
+        """Test an empty response raises ConnectionError."""
+
+        async def hang_up(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await reader.readline()
+            writer.close()
+
+        async def scenario() -> None:
+            server = await asyncio.start_unix_server(hang_up, socket_path)
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, request_daemon, "+ 1 1", socket_path)
+            finally:
+                server.close()
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(scenario())
+
+
+class TestEvaluate:
+    """Test cases for the one-shot client."""
+
+    def test_in_process(self) -> None:
+        """Test use_daemon=False evaluates without any socket."""
+        with patch.object(client, "request_daemon") as mock_request:
+            assert evaluate("* 6 7", use_daemon=False) == "OK 42.0\n"
+        mock_request.assert_not_called()
+
+    def test_uses_running_daemon(self) -> None:
+        """Test a running daemon answers the request."""
+        with patch.object(client, "request_daemon", return_value="OK 1.0\n"):
+            with patch.object(client, "start_daemon") as mock_start:
+                assert evaluate("+ 0.5 0.5", "/tmp/x.sock") == "OK 1.0\n"
+        mock_start.assert_not_called()
+
+    def test_starts_daemon_automatically(self, socket_path: str) -> None:
+        """Test the daemon is started on first use and then reused."""
+        processes: List["subprocess.Popen[bytes]"] = []
+
+        def start(path: str) -> "subprocess.Popen[bytes]":
+            processes.append(start_daemon(path))
+            return processes[-1]
+
+        with patch.object(client, "STARTUP_TIMEOUT", 30.0):
+            with patch.object(client, "start_daemon", side_effect=start):
+                try:
+                    assert evaluate("+ 3 4", socket_path) == "OK 7.0\n"
+                    wait_for_daemon(socket_path)
+                    assert evaluate("- 3 4", socket_path) == "OK -1.0\n"
+                finally:
+                    for process in processes:
+                        process.terminate()
+                        process.wait(timeout=10)
+
+        assert len(processes) == 1
+
+    def test_falls_back_when_daemon_does_not_start(self) -> None:
+        """Test in-process fallback when the daemon never comes up."""
+        with patch.object(client, "request_daemon", side_effect=OSError):
+            with patch.object(client, "start_daemon"):
+                with patch.object(client, "STARTUP_TIMEOUT", 0.05):
+                    assert evaluate("/ 1 0", "/tmp/x.sock") == (
+                        "ERR Division by zero is not allowed.\n"
+                    )
+
+    def test_stops_waiting_when_daemon_exits(self, tmp_path: Path) -> None:
+        """Test a daemon that dies while starting is not waited for."""
+        path = str(tmp_path / "not-a-directory" / "calc.sock")
+        Path(path).parent.write_text("")
+        with patch.object(client, "STARTUP_TIMEOUT", 30.0):
+            started = time.monotonic()
+            assert evaluate("+ 1 2", path) == "OK 3.0\n"
+        assert time.monotonic() - started < 10
+
+    def test_falls_back_on_unsafe_socket(self, tmp_path: Path) -> None:
+        """Test a socket path others control is never connected to."""
+        tmp_path.chmod(0o777)
+        with patch.object(client, "request_daemon") as mock_request:
+            with patch.object(client, "start_daemon") as mock_start:
+                assert evaluate("+ 1 2", str(tmp_path / "calc.sock")) == "OK 3.0\n"
+        mock_request.assert_not_called()
+        mock_start.assert_not_called()
+
+    def test_falls_back_when_daemon_cannot_launch(self) -> None:
+        """Test in-process fallback when spawning the daemon fails."""
+        with patch.object(client, "request_daemon", side_effect=OSError):
+            with patch.object(client, "start_daemon", side_effect=OSError):
+                assert evaluate("+ 1 2", "/tmp/x.sock") == "OK 3.0\n"
+
+    def test_falls_back_without_unix_sockets(self) -> None:
+        """Test platforms without AF_UNIX evaluate in-process."""
+        with patch.object(client.socket, "AF_UNIX", create=True):
+            del client.socket.AF_UNIX
+            assert evaluate("+ 1 2") == "OK 3.0\n"
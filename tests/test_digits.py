@@ -0,0 +1,159 @@
+"""Test module for exact decimal expansions of quotients."""
+
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from io import StringIO
+from itertools import islice
+from typing import Optional, Tuple
+
+import pytest
+from src.calculator.digits import ExactQuotient
+from src.calculator.exceptions import DivisionByZeroError, InvalidNumberError
+
+
+def reference(dividend: int, divisor: int, count: int) -> str:
+    """Compute the first count digits after the point with Decimal."""
+    with localcontext() as context:
+        context.prec = count + 50
+        quotient = abs(Decimal(dividend) / Decimal(divisor))
+    return f"{quotient:.{count + 20}f}".split(".")[1][:count]
+
+
+class TestExactQuotient:
+    """Test cases for ExactQuotient."""
+
+    @pytest.mark.parametrize(
+        "dividend, divisor", [(1, 7), (-22, 7), (1, 999983), (355, 113), (2**89, 3**41)]
+    )
+    def test_digits_match_decimal(self, dividend: int, divisor: int) -> None:
+        """Test chunked and single digits agree with high-precision Decimal."""
+        quotient = ExactQuotient(dividend, divisor)
+        expected = reference(dividend, divisor, 3000)
+        assert "".join(quotient.chunks(0, 3000)) == expected
+        assert "".join(quotient.chunks(0, 3000, size=7)) == expected
+        assert "".join(islice(quotient.digits(), 3000)) == expected
+        assert "".join(quotient.chunks(1234, 2345, size=100)) == expected[1234:2345]
+        assert next(quotient.digits(2999)) == expected[2999]
+
+    def test_inputs(self) -> None:
+        """Test integers, decimals and fractions are divided exactly."""
+        quotient = ExactQuotient(Decimal("0.1"), 3)
+        assert (quotient.numerator, quotient.denominator) == (1, 30)
+        assert ExactQuotient(Fraction(3, 4), Decimal("-1.5")).numerator == -1
+        quotient = ExactQuotient.parse(" 1.25e1 ", "-1/3")
+        assert (quotient.numerator, quotient.denominator) == (-75, 2)
+        assert quotient.integer_part == "-37"
+        assert ExactQuotient(-1, 8).integer_part == "-0"
+        assert ExactQuotient(6, 3).integer_part == "2"
+
+    def test_large_integer_part(self) -> None:
+        """Test integer parts beyond the str() digit limit are converted."""
+        assert ExactQuotient.parse("1e5000", "3").integer_part == "3" * 5000
+        assert ExactQuotient(-(10**9000), 1).integer_part == "-1" + "0" * 9000
+
+    @pytest.mark.parametrize("divisor", [0, Decimal("0.0"), Fraction(0)])
+    def test_division_by_zero(self, divisor: object) -> None:
+        """Test a zero divisor raises DivisionByZeroError."""
+        with pytest.raises(DivisionByZeroError):
+            ExactQuotient(1, divisor)  # type: ignore[arg-type]
+        with pytest.raises(DivisionByZeroError):
+            ExactQuotient.parse("1", str(divisor))
+
+    @pytest.mark.parametrize("text", ["x", "nan", "inf", "1/0", ""])
+    def test_invalid_numbers(self, text: str) -> None:
+        """Test operands that are not finite rationals are rejected."""
+        with pytest.raises(InvalidNumberError):
+            ExactQuotient.parse(text, "1")
+        with pytest.raises(InvalidNumberError):
+            ExactQuotient.parse("1", text)
+
+    def test_terminating(self) -> None:
+        """Test a terminating expansion ends without trailing zeros."""
+        quotient = ExactQuotient(1, 2**12)
+        assert "".join(quotient.chunks(size=5)) == "000244140625"
+        assert "".join(quotient.digits()) == "000244140625"
+        assert list(quotient.chunks(12)) == []
+        assert "".join(quotient.chunks(4, 8)) == "4414"
+        assert list(ExactQuotient(6, 3).digits()) == []
+
+    @pytest.mark.parametrize("size", [0, 4301])
+    def test_chunk_size(self, size: int) -> None:
+        """Test chunk sizes Python cannot convert to text are rejected."""
+        with pytest.raises(ValueError, match="size"):
+            next(ExactQuotient(1, 7).chunks(size=size))
+
+    @pytest.mark.parametrize(
+        "dividend, divisor, expected",
+        [
+            (1, 4, (2, 0)),
+            (5, 1, (0, 0)),
+            (1, 7, (0, 6)),
+            (1, 6, (1, 1)),
+            (7, 12, (2, 1)),
+            (1, 3 * 2**5 * 5**7, (7, 1)),
+            (1, 999983, (0, 999982)),
+            (-1, 81, (0, 9)),
+        ],
+    )
+    def test_cycle(
+        self, dividend: int, divisor: int, expected: Tuple[int, int]
+    ) -> None:
+        """Test the non-repeating prefix and the period are found."""
+        quotient = ExactQuotient(dividend, divisor)
+        assert quotient.cycle() == expected
+        start, period = expected
+        if period:
+            digits = "".join(quotient.chunks(0, start + 3 * period))
+            assert digits[start : start + period] == digits[start + period :][:period]
+
+    @pytest.mark.parametrize("limit, expected", [(5, None), (6, (0, 6))])
+    def test_cycle_limit(self, limit: int, expected: Optional[Tuple[int, int]]) -> None:
+        """Test periods longer than the limit are not searched for."""
+        assert ExactQuotient(1, 7).cycle(limit) == expected
+
+
+class TestWrite:
+    """Test cases for writing quotients to a stream."""
+
+    @pytest.mark.parametrize(
+        "dividend, divisor, count, expected",
+        [
+            (1, 7, 10, "0.1428571428"),
+            (-1, 3, 5, "-0.33333"),
+            (1, 8, 10, "0.125"),
+            (22, 7, 0, "3"),
+            (6, 3, 10, "2"),
+        ],
+    )
+    def test_write(
+        self, dividend: int, divisor: int, count: int, expected: str
+    ) -> None:
+        """Test quotients are truncated to count digits after the point."""
+        output = StringIO()
+        written = ExactQuotient(dividend, divisor).write(output, count)
+        assert output.getvalue() == expected
+        assert written == len(expected.partition(".")[2])
+
+    @pytest.mark.parametrize(
+        "dividend, divisor, expected",
+        [
+            (1, 7, "0.(142857)"),
+            (1, 6, "0.1(6)"),
+            (-7, 12, "-0.58(3)"),
+            (1, 4, "0.25"),
+            (4, 2, "2"),
+        ],
+    )
+    def test_write_repeating(self, dividend: int, divisor: int, expected: str) -> None:
+        """Test the repeating part is written in parentheses."""
+        output = StringIO()
+        assert ExactQuotient(dividend, divisor).write_repeating(output)
+        assert output.getvalue() == expected
+
+    def test_write_repeating_limit(self) -> None:
+        """Test nothing is written when the period is longer than the limit."""
+        output = StringIO()
+        assert not ExactQuotient(1, 17).write_repeating(output, 15)
+        assert output.getvalue() == ""
+        assert ExactQuotient(1, 17).write_repeating(output, 16)
+        assert output.getvalue() == "0.(0588235294117647)"
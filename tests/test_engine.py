@@ -0,0 +1,222 @@
+"""Test module for the thread-safe calculation engine."""
+
+import random
+import sys
+import threading
+from decimal import Decimal
+from typing import Any, Callable, Iterator, List
+
+import pytest
+from src.calculator.engine import Engine
+from src.calculator.exceptions import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidExpressionError,
+    InvalidLineError,
+    InvalidNumberError,
+    InvalidOperationError,
+)
+from src.calculator.metrics import OPERATIONS_SCOPE, InstrumentedOperations, Metrics
+from src.calculator.numeric import DecimalBackend, IntegerBackend, NumericOperations
+from src.calculator.operations import Operations
+from src.calculator.validator import Validator
+
+THREADS = 8
+
+
+def make_lines(count: int, seed: int) -> List[str]:
+    """Build lines of every operation, including divisions by zero."""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice('+-*/')} {rng.randint(-50, 50)} {rng.randint(-5, 5)}"
+        for _ in range(count)
+    ]
+
+
+def outcome(evaluate: Callable[[str], Any], line: str) -> Any:
+    """Return the result of a line, or the type of the error it raised."""
+    try:
+        return evaluate(line)
+    except CalculatorError as e:
+        return type(e)
+
+
+def run_threads(target: Callable[[int], None], count: int = THREADS) -> None:
+    """Run target(index) in count threads started together; re-raise failures."""
+    barrier = threading.Barrier(count)
+    failures: List[BaseException] = []
+
+    def run(index: int) -> None:
+        try:
+            barrier.wait()
+            target(index)
+        except BaseException as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if failures:
+        raise failures[0]
+
+
+@pytest.fixture
+def frequent_switches() -> Iterator[None]:
+    """Make the interpreter switch threads as often as it can."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestEngine:
+    """Test cases for Engine."""
+
+    @pytest.mark.parametrize(
+        "operation, a, b", [("+", 3.0, 4.0), ("-", 3.0, 4.5), ("*", -2.0, 4.0)]
+    )
+    def test_calculate_matches_operations(
+        self, operation: str, a: float, b: float
+    ) -> None:
+        """Test results are those of Operations.calculate."""
+        assert Engine().calculate(operation, a, b) == Operations.calculate(
+            operation, a, b
+        )
+
+    def test_calculate_errors(self) -> None:
+        """Test division by zero and unknown operations raise as Operations does."""
+        engine = Engine()
+        assert engine.calculate("/", 1.0, 4.0) == 0.25
+        with pytest.raises(DivisionByZeroError):
+            engine.calculate("/", 1.0, 0.0)
+        with pytest.raises(ValueError, match="Unsupported operation: %"):
+            engine.calculate("%", 1.0, 2.0)
+
+    @pytest.mark.parametrize(
+        "line, error",
+        [
+            ("+ 1", InvalidLineError),
+            ("% 1 2", InvalidOperationError),
+            ("+ 1 x", InvalidNumberError),
+            ("/ 1 0", DivisionByZeroError),
+        ],
+    )
+    def test_evaluate_errors(self, line: str, error: type) -> None:
+        """Test invalid lines raise the validator's errors."""
+        with pytest.raises(error):
+            Engine().evaluate(line)
+
+    def test_evaluate_and_parse(self) -> None:
+        """Test lines and operands are validated and computed."""
+        engine = Engine()
+        assert engine.evaluate(" * 2.5 4 ") == 10.0
+        assert engine.parse(" 1e3") == 1000.0
+        with pytest.raises(InvalidNumberError):
+            engine.parse("abc")
+
+    def test_backends_match_numeric_operations(self) -> None:
+        """Test an engine computes as NumericOperations with the same backend."""
+        for backend in (IntegerBackend(), DecimalBackend(5)):
+            engine = Engine(backend)
+            operations = NumericOperations(backend)
+            for line in make_lines(200, seed=1):
+                assert outcome(engine.evaluate, line) == outcome(
+                    lambda text: operations.calculate(
+                        *Validator.validate_line(text, backend)
+                    ),
+                    line,
+                )
+        assert Engine(IntegerBackend()).evaluate("* 99999999999 99999999999") == (
+            99999999999**2
+        )
+
+    def test_decimal_backend_is_copied(self) -> None:
+        """Test the shared decimal backend is never computed with."""
+        backend = DecimalBackend(5)
+        engine = Engine(backend)
+        assert engine.evaluate("/ 1 3") == Decimal("0.33333")
+        assert engine.parse("1.234567") == Decimal("1.2346")
+        assert not any(backend.context.flags.values())
+        assert not any(backend._parser.flags.values())
+
+    def test_evaluate_expression(self) -> None:
+        """Test infix expressions are evaluated in float."""
+        engine = Engine()
+        assert engine.evaluate_expression("(1 + 2) * -3") == -9.0
+        with pytest.raises(InvalidExpressionError):
+            engine.evaluate_expression("1 +")
+
+
+@pytest.mark.usefixtures("frequent_switches")
+class TestConcurrentUse:
+    """Stress tests sharing one engine, or the static API, between threads."""
+
+    def test_shared_float_engine(self) -> None:
+        """Test threads sharing an engine get the single-threaded results."""
+        engine = Engine()
+        lines = [make_lines(2000, seed=i) for i in range(THREADS)]
+        expected = [[outcome(engine.evaluate, line) for line in part] for part in lines]
+        results: List[List[Any]] = [[] for _ in range(THREADS)]
+
+        def work(index: int) -> None:
+            for _ in range(3):
+                results[index] = [
+                    outcome(engine.evaluate, line) for line in lines[index]
+                ]
+
+        run_threads(work)
+        assert results == expected
+
+    def test_shared_decimal_engine(self) -> None:
+        """Test each thread computes with a private copy of the decimal backend."""
+        backend = DecimalBackend(7)
+        engine = Engine(backend)
+        lines = make_lines(500, seed=7)
+        expected = [outcome(engine.evaluate, line) for line in lines]
+        results: List[List[Any]] = [[] for _ in range(THREADS)]
+        backends: List[Any] = [None] * THREADS
+
+        def work(index: int) -> None:
+            results[index] = [outcome(engine.evaluate, line) for line in lines]
+            backends[index] = engine._state()[0]
+
+        run_threads(work)
+        assert results == [expected] * THREADS
+        assert len({id(copy) for copy in backends} | {id(backend)}) == THREADS + 1
+        assert all(copy.precision == 7 for copy in backends)
+        assert not any(backend.context.flags.values())
+
+    def test_static_api_is_reentrant(self) -> None:
+        """Test Validator and Operations may be called from many threads."""
+        lines = make_lines(2000, seed=3)
+
+        def evaluate(line: str) -> Any:
+            return Operations.calculate(*Validator.validate_line(line))
+
+        expected = [outcome(evaluate, line) for line in lines]
+        results: List[List[Any]] = [[] for _ in range(THREADS)]
+
+        def work(index: int) -> None:
+            results[index] = [outcome(evaluate, line) for line in lines]
+
+        run_threads(work)
+        assert results == [expected] * THREADS
+
+    def test_shared_metrics_count_every_call(self) -> None:
+        """Test instrumented calls from many threads are all counted."""
+        operations = InstrumentedOperations(Metrics())
+
+        def work(index: int) -> None:
+            for n in range(1000):
+                try:
+                    operations.calculate("/", float(n), float(index))
+                except DivisionByZeroError:
+                    pass
+
+        run_threads(work)
+        metrics = operations.metrics
+        assert metrics.calls[(OPERATIONS_SCOPE, "/")] == THREADS * 1000
+        assert metrics.errors[(OPERATIONS_SCOPE, "/", "DivisionByZeroError")] == 1000
+        assert metrics.latency[(OPERATIONS_SCOPE, "/")].count == THREADS * 1000
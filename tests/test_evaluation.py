@@ -0,0 +1,123 @@
+"""Test module for the non-raising status-code evaluation API."""
+
+import math
+
+import pytest
+from src.calculator.batch import evaluate_lines as evaluate_batch
+from src.calculator.evaluation import (
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_INVALID_LINE,
+    STATUS_INVALID_NUMBER,
+    STATUS_INVALID_OPERATION,
+    STATUS_OK,
+    evaluate_line,
+    evaluate_lines,
+    status_message,
+)
+from src.calculator.operations import Operations
+
+
+class TestEvaluateLine:
+    """Test cases for evaluate_line."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("+ 3 4", 7.0),
+            (" - 10 2.5 ", 7.5),
+            ("* 1e3 -2", -2000.0),
+            ("/ 9 3", 3.0),
+        ],
+    )
+    def test_ok(self, line: str, expected: float) -> None:
+        """Test valid lines return STATUS_OK and their result."""
+        assert evaluate_line(line) == (STATUS_OK, expected)
+
+    @pytest.mark.parametrize(
+        "line, status",
+        [
+            ("/ 1 0", STATUS_DIVISION_BY_ZERO),
+            ("^ 1 2", STATUS_INVALID_OPERATION),
+            ("^ 1 x", STATUS_INVALID_OPERATION),
+            ("+ 1 x", STATUS_INVALID_NUMBER),
+            ("+ 1", STATUS_INVALID_LINE),
+            ("+ 1 2 3", STATUS_INVALID_LINE),
+        ],
+    )
+    def test_failures(self, line: str, status: int) -> None:
+        """Test failures return their status code and NaN."""
+        code, value = evaluate_line(line)
+        assert code == status
+        assert math.isnan(value)
+
+    @pytest.mark.parametrize(
+        "line, on_zero, expected",
+        [
+            ("/ 1 0", "inf", math.inf),
+            ("/ -1 0", "inf", -math.inf),
+            ("/ 1 -0.0", "inf", -math.inf),
+        ],
+    )
+    def test_zero_policy_inf(self, line: str, on_zero: str, expected: float) -> None:
+        """Test the inf policy yields IEEE 754 signed infinities."""
+        assert evaluate_line(line, on_zero) == (STATUS_OK, expected)
+
+    def test_zero_policy_nan(self) -> None:
+        """Test the nan policy yields NaN with an OK status."""
+        status, value = evaluate_line("/ 1 0", "nan")
+        assert status == STATUS_OK and math.isnan(value)
+
+
+class TestStatusMessage:
+    """Test cases for status_message."""
+
+    @pytest.mark.parametrize(
+        "line", ["/ 1 0", "^ 1 2", "^ 1 x", "+ 1 x", "+ 1", " x  "]
+    )
+    def test_matches_raising_api(self, line: str) -> None:
+        """Test messages match the errors the raising batch path reports."""
+        status, _ = evaluate_line(line)
+        expected = next(evaluate_batch([(1, line)], Operations()))
+        assert f"Error: line 1: {status_message(status, line)}\n" == expected
+
+    def test_ok(self) -> None:
+        """Test STATUS_OK has no message."""
+        assert status_message(STATUS_OK, "+ 1 2") == ""
+
+    def test_inconsistent_status(self) -> None:
+        """Test a failure status for a valid line is rejected."""
+        with pytest.raises(ValueError):
+            status_message(STATUS_INVALID_NUMBER, "+ 1 2")
+
+
+class TestEvaluateLines:
+    """Test cases for evaluate_lines."""
+
+    def test_parallel_arrays(self) -> None:
+        """Test values, statuses and line numbers stay parallel."""
+        result = evaluate_lines(["+ 1 2", "", "/ 1 0", "  ", "* 2 x"], first_line=5)
+
+        assert len(result) == 3
+        assert result.error_count == 2
+        assert list(result.statuses) == [
+            STATUS_OK,
+            STATUS_DIVISION_BY_ZERO,
+            STATUS_INVALID_NUMBER,
+        ]
+        assert result.values[0] == 3.0
+        assert result.line_numbers.tolist() == [5, 7, 9]
+        assert list(result.errors()) == [
+            (7, "Division by zero is not allowed."),
+            (9, "Invalid number: 'x'. Please enter a valid number."),
+        ]
+
+    def test_zero_policy(self) -> None:
+        """Test the division-by-zero policy applies to every line."""
+        result = evaluate_lines(["/ 1 0", "/ -1 0"], on_zero="inf")
+        assert result.values.tolist() == [math.inf, -math.inf]
+        assert result.error_count == 0
+
+    def test_invalid_zero_policy(self) -> None:
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError, match="policy"):
+            evaluate_lines([], on_zero="raise")
@@ -1,11 +1,19 @@
 """Test module for calculator exceptions."""
 
+import pickle
+
 import pytest
 from src.calculator.exceptions import (
     CalculatorError,
     DivisionByZeroError,
     InvalidOperationError,
     InvalidNumberError,
+    InvalidLineError,
+    InvalidExpressionError,
+    InvalidBinaryFileError,
+    ClusterError,
+    OperationPluginCallError,
+    OperationPluginError,
 )
 
 
@@ -95,3 +103,98 @@ class TestInvalidNumberError:
         assert error.value == value
         assert error.message == expected_message
         assert str(error) == expected_message
+
+
+class TestInvalidLineError:
+    """Test cases for InvalidLineError."""
+
+    def test_invalid_line_error(self) -> None:
+        """Test InvalidLineError with a malformed line."""
+        error = InvalidLineError("+ 1")
+        expected_message = (
+            "Invalid line: '+ 1'. Expected: <operation> <first number> <second number>"
+        )
+
+        assert error.line == "+ 1"
+        assert error.message == expected_message
+        assert str(error) == expected_message
+        assert isinstance(error, CalculatorError)
+
+
+class TestInvalidExpressionError:
+    """Test cases for InvalidExpressionError."""
+
+    def test_invalid_expression_error(self) -> None:
+        """Test InvalidExpressionError with an expression and reason."""
+        error = InvalidExpressionError("1 +", "Unexpected end of expression.")
+        expected_message = "Invalid expression: '1 +'. Unexpected end of expression."
+
+        assert error.expression == "1 +"
+        assert error.reason == "Unexpected end of expression."
+        assert error.message == expected_message
+        assert str(error) == expected_message
+        assert isinstance(error, CalculatorError)
+
+
+class TestInvalidBinaryFileError:
+    """Test cases for InvalidBinaryFileError."""
+
+    def test_invalid_binary_file_error(self) -> None:
+        """Test InvalidBinaryFileError with a path and reason."""
+        error = InvalidBinaryFileError("in.bin", "Bad magic number.")
+        expected_message = "Invalid binary file: 'in.bin'. Bad magic number."
+
+        assert error.path == "in.bin"
+        assert error.reason == "Bad magic number."
+        assert error.message == expected_message
+        assert str(error) == expected_message
+        assert isinstance(error, CalculatorError)
+
+
+class TestClusterError:
+    """Test cases for ClusterError."""
+
+    def test_cluster_error(self) -> None:
+        """Test ClusterError with a reason."""
+        error = ClusterError("No worker could be reached.")
+        expected_message = "Distributed evaluation failed: No worker could be reached."
+
+        assert error.reason == "No worker could be reached."
+        assert error.message == expected_message
+        assert str(error) == expected_message
+        assert isinstance(error, CalculatorError)
+
+
+class TestLazyMessages:
+    """Test cases for lazily formatted error messages."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            DivisionByZeroError(),
+            InvalidOperationError("^"),
+            InvalidNumberError("abc"),
+            InvalidLineError("+ 1"),
+            InvalidExpressionError("1 +", "Unexpected end of expression."),
+            InvalidBinaryFileError("in.bin", "Bad magic number."),
+            OperationPluginError("%", "plugins:modulo", ImportError("plugins")),
+            OperationPluginCallError("%", "plugins:modulo", TypeError("bad")),
+        ],
+    )
+    def test_pickle_round_trip(self, error: CalculatorError) -> None:
+        """Test errors survive pickling with their fields and message."""
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert restored.message == error.message
+        # Wrapped exceptions compare by identity, so compare their reprs.
+        assert repr(vars(restored)) == repr(vars(error))
+
+    def test_message_reflects_fields(self) -> None:
+        """Test the message is formatted from the current fields."""
+        error = InvalidNumberError("abc")
+        error.value = "xyz"
+        assert str(error) == "Invalid number: 'xyz'. Please enter a valid number."
+
+    def test_base_error_without_arguments(self) -> None:
+        """Test a bare CalculatorError has an empty message."""
+        assert CalculatorError().message == ""
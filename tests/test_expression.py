@@ -0,0 +1,202 @@
+"""Test module for the infix expression engine."""
+
+import math
+from decimal import Decimal
+from typing import Dict, Optional
+
+import pytest
+from src.calculator import expression
+from src.calculator.exceptions import (
+    DivisionByZeroError,
+    InvalidExpressionError,
+    UndefinedVariableError,
+)
+from src.calculator.expression import (
+    NEGATE,
+    CompiledExpression,
+    ExpressionCache,
+    compile_expression,
+    evaluate,
+    tokenize,
+)
+from src.calculator.numeric import DecimalBackend, FractionBackend, NumericOperations
+
+
+class TestTokenize:
+    """Test cases for the tokenizer."""
+
+    def test_tokens_and_positions(self) -> None:
+        """Test tokens carry their kind, text and position."""
+        assert tokenize(" (1.5e3 + inf)") == [
+            ("symbol", "(", 1),
+            ("number", "1.5e3", 2),
+            ("symbol", "+", 8),
+            ("name", "inf", 10),
+            ("symbol", ")", 13),
+        ]
+
+    def test_unexpected_character(self) -> None:
+        """Test unknown characters are reported with their position."""
+        with pytest.raises(InvalidExpressionError) as exc_info:
+            tokenize("1 +  $ 2")
+        assert exc_info.value.reason == "Unexpected character '$' at position 5."
+
+
+class TestCompileExpression:
+    """Test cases for compiling and evaluating expressions."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("(3 + 4) * 2 / 7", 2.0),
+            ("1 + 2 * 3", 7.0),
+            ("(1 + 2) * 3", 9.0),
+            ("10 - 4 - 3", 3.0),
+            ("64 / 4 / 2", 8.0),
+            ("-2 * -3", 6.0),
+            ("--4", 4.0),
+            ("+5 - -5", 10.0),
+            ("-(2 + 3) * 2", -10.0),
+            (".5 + 1.", 1.5),
+            ("1e3 / 1E-1", 10000.0),
+            ("2 - -INF", math.inf),
+            ("42", 42.0),
+        ],
+    )
+    def test_evaluate(self, text: str, expected: float) -> None:
+        """Test precedence, associativity, unary signs and constants."""
+        assert compile_expression(text).evaluate() == expected
+
+    def test_nan_constant(self) -> None:
+        """Test the nan constant evaluates to NaN."""
+        assert math.isnan(compile_expression("nan + 1").evaluate())
+
+    def test_compiled_form_is_postfix(self) -> None:
+        """Test the compiled form is a compact postfix tuple."""
+        compiled = compile_expression("-(3 + 4) * 2")
+        assert compiled.code == (3.0, 4.0, "+", NEGATE, 2.0, "*")
+        assert compiled.source == "-(3 + 4) * 2"
+        assert repr(compiled) == "CompiledExpression('-(3 + 4) * 2')"
+
+    def test_negative_zero(self) -> None:
+        """Test unary minus preserves the sign of zero."""
+        assert math.copysign(1.0, compile_expression("-0").evaluate()) == -1.0
+
+    def test_division_by_zero(self) -> None:
+        """Test division by zero raises DivisionByZeroError at evaluation."""
+        compiled = compile_expression("1 / (2 - 2)")
+        with pytest.raises(DivisionByZeroError):
+            compiled.evaluate()
+
+    @pytest.mark.parametrize(
+        "text, reason",
+        [
+            ("", "Expression is empty."),
+            ("   ", "Expression is empty."),
+            ("1 +", "Unexpected end of expression."),
+            ("(1 + 2", "Missing ')' for '(' at position 0."),
+            ("1 2", "Unexpected '2' at position 2."),
+            (")", "Unexpected ')' at position 0."),
+            ("* 2", "Unexpected '*' at position 0."),
+            ("x + 1", "Unknown name 'x' at position 0."),
+        ],
+    )
+    def test_invalid_expressions(self, text: str, reason: str) -> None:
+        """Test syntax errors raise InvalidExpressionError with a reason."""
+        with pytest.raises(InvalidExpressionError) as exc_info:
+            compile_expression(text)
+
+        assert exc_info.value.expression == text
+        assert exc_info.value.reason == reason
+        assert exc_info.value.message == f"Invalid expression: '{text}'. {reason}"
+
+    def test_variables(self) -> None:
+        """Test names compile to loads when allowed and read their values."""
+        compiled = compile_expression("rate * (x + x) - inf", allow_names=True)
+        assert compiled.names == ("rate", "x")
+        assert compiled.evaluate({"rate": 2.0, "x": 1.5}) == -math.inf
+        assert compile_expression("1 + 2").names == ()
+
+    @pytest.mark.parametrize("variables", [None, {"rate": 2.0}])
+    def test_undefined_variable(self, variables: Optional[Dict[str, float]]) -> None:
+        """Test evaluating without a variable's value raises an error."""
+        compiled = compile_expression("rate * x", allow_names=True)
+        with pytest.raises(UndefinedVariableError, match="'x'|'rate'"):
+            compiled.evaluate(variables)
+
+    def test_numeric_backend(self) -> None:
+        """Test a backend's parse and calculate replace float arithmetic."""
+        operations = NumericOperations(DecimalBackend(5))
+        compiled = compile_expression(
+            "-(0.1 + 0.2) / x", allow_names=True, parse=operations.backend.parse
+        )
+        assert compiled.code[0] == Decimal("0.1")
+        assert compiled.evaluate({"x": Decimal(3)}, operations.calculate) == Decimal(
+            "-0.1"
+        )
+        with pytest.raises(DivisionByZeroError):
+            compiled.evaluate({"x": Decimal(0)}, operations.calculate)
+
+    def test_number_the_backend_rejects(self) -> None:
+        """Test numbers the backend cannot parse are invalid expressions."""
+        with pytest.raises(InvalidExpressionError, match="Unsupported number 'nan'"):
+            compile_expression("1 + nan", parse=FractionBackend().parse)
+
+    def test_compiled_expression_uses_slots(self) -> None:
+        """Test compiled expressions carry no per-instance dict."""
+        assert not hasattr(CompiledExpression("1", (1.0,)), "__dict__")
+
+
+class TestExpressionCache:
+    """Test cases for the compiled-expression LRU cache."""
+
+    def test_hits_and_misses(self) -> None:
+        """Test repeated expressions skip parsing."""
+        cache = ExpressionCache(maxsize=4)
+
+        assert cache.evaluate("1 + 1") == 2.0
+        first = cache.compile("1 + 1")
+        assert cache.compile("1 + 1") is first
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert len(cache) == 1
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Test the least recently used expression is evicted when full."""
+        cache = ExpressionCache(maxsize=2)
+        cache.compile("1")
+        cache.compile("2")
+        cache.compile("1")
+        cache.compile("3")
+
+        assert len(cache) == 2
+        cache.compile("1")
+        assert cache.hits == 2
+        cache.compile("2")
+        assert cache.misses == 4
+
+    def test_invalid_expressions_are_not_cached(self) -> None:
+        """Test parse errors propagate and leave the cache unchanged."""
+        cache = ExpressionCache()
+        with pytest.raises(InvalidExpressionError):
+            cache.compile("1 +")
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        """Test clear drops entries and counters."""
+        cache = ExpressionCache()
+        cache.compile("1")
+        cache.compile("1")
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_invalid_maxsize(self) -> None:
+        """Test a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="maxsize must be a positive integer."):
+            ExpressionCache(maxsize=0)
+
+    def test_module_level_evaluate(self) -> None:
+        """Test evaluate uses the module-level default cache."""
+        expression.default_cache.clear()
+        assert evaluate("2 * (3 + 4)") == 14.0
+        assert evaluate("2 * (3 + 4)") == 14.0
+        assert expression.default_cache.hits == 1
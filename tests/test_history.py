@@ -0,0 +1,111 @@
+"""Test module for the bounded calculation history."""
+
+import math
+from array import array
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from src.calculator import history as history_module
+from src.calculator.exceptions import HistoryError
+from src.calculator.history import History, HistoryEntry
+from src.calculator.numeric import DecimalBackend
+
+
+def fill(history: History, count: int) -> None:
+    """Record count calculations; calculation n is ``n + 0.5 = n + 0.5``."""
+    for n in range(1, count + 1):
+        history.append("+", float(n), 0.5, n + 0.5)
+
+
+class TestHistory:
+    """Test cases for History."""
+
+    def test_recall_in_memory(self) -> None:
+        """Test recent calculations are recalled from the ring."""
+        history = History(capacity=4)
+        fill(history, 3)
+        assert len(history) == 3
+        assert history.result(2) == 2.5
+        assert history.last() == 3.5
+        assert history.entry(1) == HistoryEntry("+", 1.0, 0.5, 1.5)
+        history.close()
+
+    def test_recall_spilled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test evicted calculations are recalled from the log, flushed or not."""
+        monkeypatch.setattr(history_module, "SPILL_BATCH", 3)
+        history = History(capacity=2)
+        fill(history, 10)
+        # 8 spilled: 6 written in two batches, 2 still queued.
+        assert history.result(7) == 7.5
+        assert history.result(1) == 1.5
+        assert history.entry(8) == HistoryEntry("+", 8.0, 0.5, 8.5)
+        assert [entry.result for entry in history.tail(4)] == [7.5, 8.5, 9.5, 10.5]
+        history.close()
+
+    def test_memory_is_bounded(self) -> None:
+        """Test the in-memory columns never grow past the capacity."""
+        history = History(capacity=8)
+        fill(history, 1000)
+        assert len(history._results) == 8
+        assert len(history._operations) == 8 and history._symbols == ["+"]
+        assert len(history._pending) < history_module.SPILL_BATCH
+        history.close()
+
+    @pytest.mark.parametrize("capacity", [2, 8])
+    @pytest.mark.parametrize("number", [0, -1, 4])
+    def test_missing_results(self, capacity: int, number: int) -> None:
+        """Test recalling a calculation not recorded raises HistoryError."""
+        history = History(capacity)
+        fill(history, 3)
+        with pytest.raises(HistoryError, match=r"numbered 1 to 3"):
+            history.result(number)
+
+    def test_empty(self) -> None:
+        """Test an empty history has no latest result."""
+        history = History()
+        with pytest.raises(HistoryError, match="No results yet"):
+            history.last()
+        assert list(history.tail(5)) == []
+        history.close()
+
+    def test_special_values_round_trip(self) -> None:
+        """Test infinities and NaN survive the log."""
+        history = History(capacity=1)
+        history.append("/", -math.inf, 2.0, -math.inf)
+        history.append("*", math.nan, 1.0, math.nan)
+        history.append("+", 1.0, 1.0, 2.0)
+        assert history.result(1) == -math.inf
+        assert math.isnan(history.result(2))
+
+    def test_backend_values_stay_exact(self) -> None:
+        """Test a backend's numbers are kept and parsed back exactly."""
+        backend = DecimalBackend(40)
+        history = History(capacity=1, parse=backend.parse)
+        third = backend.divide(Decimal(1), Decimal(3))
+        history.append("/", Decimal(1), Decimal(3), third)
+        history.append("+", third, third, backend.add(third, third))
+        assert history.result(1) == third
+        assert history.result(2) == backend.add(third, third)
+
+    def test_file_holds_whole_session(self, tmp_path: Path) -> None:
+        """Test close writes every calculation to a named log and index."""
+        path = tmp_path / "history.log"
+        history = History(capacity=2, path=str(path))
+        fill(history, 3)
+        history.close()
+        assert path.read_text() == "+ 1.0 0.5 1.5\n+ 2.0 0.5 2.5\n+ 3.0 0.5 3.5\n"
+        offsets = array("Q", (tmp_path / "history.log.idx").read_bytes())
+        assert offsets.tolist() == [0, 14, 28]
+
+    def test_short_session_creates_no_files(self) -> None:
+        """Test nothing is written until a calculation is evicted."""
+        history = History(capacity=4)
+        fill(history, 4)
+        history.close()
+        assert history._log is None
+
+    def test_invalid_capacity(self) -> None:
+        """Test a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            History(capacity=0)
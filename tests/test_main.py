@@ -1,9 +1,28 @@
 """Test module for the main calculator CLI application."""
 
+import os
+import select
+import socket
+import sys
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, call
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
+from pathlib import Path
+from typing import List
+from src.calculator.binary import read_results
+from src.calculator.cache import CachedOperations
+from src.calculator.metrics import (
+    OPERATIONS_SCOPE,
+    REPL_SCOPE,
+    InstrumentedOperations,
+    Metrics,
+)
+from src.calculator.defaults import DEFAULT_HISTORY_SIZE
 from src.calculator.main import CalculatorCLI, main
+from src.calculator.numeric import NumericOperations, make_backend
+from src.calculator.registry import REGISTRY
 from src.calculator.exceptions import (
     DivisionByZeroError,
     InvalidOperationError,
@@ -241,9 +260,10 @@ class TestCalculatorCLI:
         assert "Exiting..." in output
 
     @patch.object(CalculatorCLI, "run")
-    def test_main_function(self, mock_run: Mock) -> None:
+    @patch("sys.stdin.isatty", return_value=True)
+    def test_main_function(self, mock_isatty: Mock, mock_run: Mock) -> None:
         """Test main function creates calculator and runs it."""
-        main()
+        main([])
         mock_run.assert_called_once()
 
 
@@ -307,14 +327,15 @@ class TestMainFunction:
     """Test cases for the main function."""
 
     @patch("src.calculator.main.CalculatorCLI")
+    @patch("sys.stdin.isatty", return_value=True)
     def test_main_creates_and_runs_calculator(
-        self, mock_calculator_class: Mock
+        self, mock_isatty: Mock, mock_calculator_class: Mock
     ) -> None:
         """Test that main function creates calculator instance and runs it."""
         mock_calculator_instance = Mock()
         mock_calculator_class.return_value = mock_calculator_instance
 
-        main()
+        main([])
 
         mock_calculator_class.assert_called_once()
         mock_calculator_instance.run.assert_called_once()
@@ -327,3 +348,973 @@ class TestMainFunction:
         assert hasattr(calculator, "validator")
         assert calculator.operations is not None
         assert calculator.validator is not None
+
+
+class TestVariables:
+    """Test cases for variables in the REPL."""
+
+    def run_session(self, answers: str, backend: str = "float") -> str:
+        """Run a piped session with a numeric backend and return its output."""
+        output = StringIO()
+        operations = NumericOperations(make_backend(backend))
+        CalculatorCLI(operations).run_stream(StringIO(answers), output)
+        return output.getvalue()
+
+    def test_assign_and_use_as_operand(self) -> None:
+        """Test assignments print recomputed values and names are operands."""
+        output = self.run_session("a = 2\nb = a * 3\na = 5\n+\nb\n 1 \nq\n")
+        assert "a = 2.0\nb = 6.0\na = 5.0\nb = 15.0\nResult: 16.0\n" in output
+
+    def test_errors(self) -> None:
+        """Test invalid assignments and failed formulas are reported."""
+        output = self.run_session("a = b\nz = 1 / 0\n*\nz\n2\n3\nq\n")
+        assert "Error: Undefined variable: 'b'.\n" in output
+        assert "z = Error: Division by zero is not allowed.\n" in output
+        assert "Error: Division by zero is not allowed.\nResult: 6.0\n" in output
+
+    @pytest.mark.parametrize(
+        "backend, answers, expected",
+        [
+            ("decimal", "x = 0.1 + 0.2\n+\nx\n0\n", "x = 0.3\nResult: 0.3\n"),
+            (
+                "int",
+                "x = 12345678901234567891\ny = -x * 2\n+\ny\n1\n",
+                "x = 12345678901234567891\ny = -24691357802469135782\n"
+                "Result: -24691357802469135781\n",
+            ),
+            ("fraction", "x = 1 / 3\n*\nx\n3\n", "x = 1/3\nResult: 1\n"),
+        ],
+    )
+    def test_numeric_backend(self, backend: str, answers: str, expected: str) -> None:
+        """Test formulas parse and compute with the operations' backend."""
+        assert expected in self.run_session(answers + "q\n", backend)
+
+    def test_number_the_backend_rejects(self) -> None:
+        """Test a constant the backend cannot represent is reported."""
+        output = self.run_session("x = inf\nq\n", "fraction")
+        assert "Unsupported number 'inf' at position 1." in output
+
+    def test_graph_is_created_lazily(self) -> None:
+        """Test the variable graph exists only after an assignment."""
+        calculator = CalculatorCLI()
+        assert calculator.variables is None
+        with patch("sys.stdout", new_callable=StringIO):
+            calculator.assign_variable("x = 1")
+        assert calculator.variables is not None and calculator.variables.get("x") == 1
+
+
+class TestHistory:
+    """Test cases for the REPL history."""
+
+    def run_session(self, answers: str, calculator: CalculatorCLI) -> str:
+        """Run a piped session and return its output."""
+        output = StringIO()
+        calculator.run_stream(StringIO(answers), output)
+        return output.getvalue()
+
+    def test_recall_results(self) -> None:
+        """Test ans and $N recall results, including spilled ones."""
+        calculator = CalculatorCLI(history_size=1)
+        output = self.run_session("+\n1\n2\n*\nANS\n10\n-\n$1\n $2 \nq\n", calculator)
+        assert "Result: 3.0\n\nResult: 30.0\n\nResult: -27.0\n" in output
+        assert calculator.history is not None and len(calculator.history) == 3
+
+    def test_recall_errors(self) -> None:
+        """Test missing results and malformed references are re-prompted."""
+        output = self.run_session("+\nans\n$x\n1\n$1\n$5\n2\nq\n", CalculatorCLI())
+        assert "Error: No results yet.\n" in output
+        assert "Error: Invalid number: '$x'. Please enter a valid number.\n" in output
+        assert output.count("Error: ") == 4
+        assert "Result: 3.0\n" in output
+
+    def test_history_command(self) -> None:
+        """Test history lists the latest calculations with their numbers."""
+        output = self.run_session("history\n/\n1\n4\nhistory\nq\n", CalculatorCLI())
+        assert "No calculations yet.\n" in output
+        assert "$1: 1.0 / 4.0 = 0.25\n" in output
+
+    def test_multi_character_plugin_operation(self) -> None:
+        """Test plugin symbols longer than one character are recorded whole."""
+        REGISTRY.register("**", lambda a, b: a**b)
+        try:
+            calculator = CalculatorCLI(history_size=1)
+            output = self.run_session("**\n2\n10\n+\n$1\n1\nhistory\nq\n", calculator)
+        finally:
+            del REGISTRY.table["**"]
+        assert "Result: 1024.0\n" in output
+        assert "$1: 2.0 ** 10.0 = 1024.0\n$2: 1024.0 + 1.0 = 1025.0\n" in output
+
+    def test_history_file(self, tmp_path: Path) -> None:
+        """Test --history-file keeps the whole session and size is checked."""
+        path = tmp_path / "session.log"
+        with patch("sys.stdin", StringIO("+\n1\n2\n-\nans\n1\nq\n")), patch(
+            "sys.stdout", new_callable=StringIO
+        ):
+            main(["--history-size", "1", "--history-file", str(path)])
+        assert path.read_text() == "+ 1.0 2.0 3.0\n- 3.0 1.0 2.0\n"
+
+    def test_invalid_history_size(self, capsys: pytest.CaptureFixture) -> None:
+        """Test a non-positive --history-size is a usage error."""
+        with pytest.raises(SystemExit):
+            main(["--history-size", "0"])
+        assert "--history-size must be a positive integer" in capsys.readouterr().err
+
+
+class TestStreamMode:
+    """Test cases for the non-interactive REPL fast path."""
+
+    PROMPTS = (
+        "Enter operation (+, -, *, /): ",
+        "Enter first number: ",
+        "Enter second number: ",
+    )
+
+    def prompted_output(self, answers: List[str]) -> str:
+        """Run the interactive REPL over answers and drop its prompts."""
+        with patch("builtins.input", side_effect=answers + [EOFError()]):
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                CalculatorCLI().run()
+        output = mock_stdout.getvalue()
+        for prompt in self.PROMPTS:
+            output = output.replace(prompt, "")
+        return output
+
+    @pytest.mark.parametrize(
+        "answers",
+        [
+            ["+", "3", "4", "/", "1", "0", "quit"],
+            ["^", "stats", "*", "x", "2", "", "5"],
+            ["-", "1", "exit"],
+            ["/", "q"],
+            [],
+        ],
+    )
+    @pytest.mark.parametrize("block_chars", [1, 4096])
+    def test_matches_interactive_output(
+        self, answers: List[str], block_chars: int
+    ) -> None:
+        """Test the output equals the prompted REPL's minus its prompts."""
+        output = StringIO()
+        source = StringIO("".join(f"{answer}\n" for answer in answers))
+        CalculatorCLI().run_stream(source, output, block_chars)
+        assert output.getvalue() == self.prompted_output(answers)
+
+    def test_flushes_once_per_block(self) -> None:
+        """Test output is written before each block is read, not per line."""
+        source = StringIO("+\n1\n2\n" * 100)
+        output = Mock()
+        CalculatorCLI().run_stream(source, output, block_chars=1 << 20)
+        # Welcome before the block, the block's results, the final goodbye.
+        assert output.flush.call_count == 3
+
+    @pytest.mark.parametrize("block_chars", [1, 4096])
+    def test_binary_backed_stream(self, block_chars: int) -> None:
+        """Test a file-backed source decodes split characters and newlines."""
+        answers = ["+", "3", "4", "ü", "quit"]
+        data = "\r\n".join(answers).encode("utf-8")
+        output = StringIO()
+        source = TextIOWrapper(BytesIO(data), encoding="utf-8")
+        CalculatorCLI().run_stream(source, output, block_chars)
+        assert output.getvalue() == self.prompted_output(answers)
+
+    def test_pipe_is_answered_line_by_line(self) -> None:
+        """Test each piped line is answered before the next one is written."""
+        read_in, write_in = os.pipe()
+        read_out, write_out = os.pipe()
+        source = open(read_in, encoding="utf-8")
+        output = open(write_out, "w", encoding="utf-8")
+        thread = threading.Thread(
+            target=CalculatorCLI().run_stream, args=(source, output)
+        )
+        thread.start()
+        received = b""
+        try:
+            for line in (b"+\n", b"1\n", b"2\n"):
+                os.write(write_in, line)
+            while b"Result: 3.0" not in received:
+                ready, _, _ = select.select([read_out], [], [], 10)
+                assert ready, "no answer before the next line was written"
+                received += os.read(read_out, 4096)
+        finally:
+            os.close(write_in)
+            thread.join()
+            source.close()
+            output.close()
+            os.close(read_out)
+
+    def test_keyboard_interrupt(self) -> None:
+        """Test an interrupt still writes the buffered output."""
+        source = Mock()
+        source.readlines.side_effect = [["+\n", "1\n", "2\n"], KeyboardInterrupt]
+        output = StringIO()
+        CalculatorCLI().run_stream(source, output)
+        assert output.getvalue().endswith(
+            "Result: 3.0\n\n\nExiting...\nThank you for using Calculator CLI!\n"
+        )
+
+    @patch("sys.stdin.isatty", return_value=False)
+    def test_main_uses_stream_when_not_a_tty(self, mock_isatty: Mock) -> None:
+        """Test main() picks the fast path for piped standard input."""
+        with patch("src.calculator.main.CalculatorCLI") as mock_class:
+            main([])
+        instance = mock_class.return_value
+        instance.run_stream.assert_called_once()
+        instance.run.assert_not_called()
+
+
+class TestBatchMode:
+    """Test cases for the --batch command-line option."""
+
+    def test_batch_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test --batch evaluates a file and prints one result per line."""
+        path = tmp_path / "input.txt"
+        path.write_text("+ 3 4\n/ 1 0\n", encoding="utf-8")
+
+        main(["--batch", str(path)])
+
+        assert capsys.readouterr().out == (
+            "7.0\nError: line 2: Division by zero is not allowed.\n"
+        )
+
+    @patch.object(CalculatorCLI, "run")
+    def test_batch_does_not_start_repl(
+        self, mock_run: Mock, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test batch mode does not start the REPL."""
+        path = tmp_path / "input.txt"
+        path.write_text("", encoding="utf-8")
+        main(["--batch", str(path)])
+        mock_run.assert_not_called()
+
+    def test_batch_missing_file(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a missing batch file is reported as a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--batch", str(tmp_path / "missing.txt")])
+
+        assert exc_info.value.code == 2
+        assert "cannot read" in capsys.readouterr().err
+
+    def test_batch_file_invalid_utf8(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test bytes that are not UTF-8 are reported on their line, as --workers."""
+        path = tmp_path / "input.txt"
+        path.write_bytes(b"+ 3 4\n* 2 \xff\n\xfe 1 2\n")
+
+        main(["--batch", str(path)])
+
+        assert capsys.readouterr().out.splitlines() == [
+            "7.0",
+            "Error: line 2: Invalid number: '�'. Please enter a valid number.",
+            "Error: line 3: Invalid operation: '�'. "
+            "Supported operations: +, -, *, /",
+        ]
+
+    def test_batch_stdin_invalid_utf8(self, capsys: pytest.CaptureFixture) -> None:
+        """Test standard input that is not UTF-8 is reported as a file is."""
+        buffer = BytesIO(b"+ 3 4\n* 2 \xff\n+ 1 2\n")
+        stdin = TextIOWrapper(buffer, encoding="utf-8")
+        with patch("sys.stdin", stdin):
+            main(["--batch", "-"])
+
+        assert capsys.readouterr().out.splitlines() == [
+            "7.0",
+            "Error: line 2: Invalid number: '\ufffd'. Please enter a valid number.",
+            "3.0",
+        ]
+        assert not buffer.closed
+
+
+class TestCacheOption:
+    """Test cases for the --cache command-line options."""
+
+    def test_batch_with_cache(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --cache memoizes batch results and reports statistics."""
+        path = tmp_path / "input.txt"
+        path.write_text("+ 3 4\n+ 4 3\n/ 1 0\n/ 1 0\n", encoding="utf-8")
+
+        main(["--batch", str(path), "--cache", "16"])
+
+        captured = capsys.readouterr()
+        assert captured.out.splitlines()[:2] == ["7.0", "7.0"]
+        assert "Cache: 2 entries, 2 hits, 2 misses, hit rate 50.0%" in captured.err
+
+    @patch.object(CalculatorCLI, "run")
+    def test_repl_with_cache(
+        self, mock_run: Mock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --cache gives the REPL cached operations."""
+        with patch("src.calculator.main.CalculatorCLI") as mock_class:
+            main(["--cache", "8", "--cache-bytes", "4096"])
+
+        operations = mock_class.call_args[0][0]
+        assert operations.cache.maxsize == 8
+        assert operations.cache.max_bytes == 4096
+        assert "Cache: 0 entries" in capsys.readouterr().err
+
+    def test_repl_without_cache(self) -> None:
+        """Test the REPL uses plain operations by default."""
+        with patch("src.calculator.main.CalculatorCLI") as mock_class:
+            main([])
+        mock_class.assert_called_once_with(
+            None, history_size=DEFAULT_HISTORY_SIZE, history_file=None
+        )
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--cache", "-1"],
+            ["--cache-bytes", "100"],
+            ["--cache", "4", "--cache-bytes", "0"],
+        ],
+    )
+    def test_invalid_cache_sizes(
+        self, argv: List[str], capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test invalid cache bounds are reported as usage errors."""
+        with pytest.raises(SystemExit):
+            main(argv)
+        assert "invalid cache size" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (
+                ["--cache", "8", "--workers", "2", "--batch", "f"],
+                "--cache does not apply to --workers or --cluster",
+            ),
+            (
+                ["--cache-bytes", "4096", "--batch", "f", "--cluster", "h:1"],
+                "--cache does not apply to --workers or --cluster",
+            ),
+            (
+                ["--metrics", "--workers", "2", "--batch", "f"],
+                "--metrics does not apply to --workers or --cluster",
+            ),
+            (
+                ["--metrics-file", "m.prom", "--batch", "f", "--cluster", "h:1"],
+                "--metrics does not apply to --workers or --cluster",
+            ),
+            (["--cache", "8", "eval", "+ 1 2"], "--cache does not apply to the eval"),
+            (
+                ["--metrics", "reduce", "sum", "-"],
+                "--metrics does not apply to the reduce",
+            ),
+            (["--metrics-file", "m.prom", "divide", "1", "3"], "the divide command"),
+            (
+                ["--persistent-cache", "c.db", "csv", "a", "--expr", "a"],
+                "the csv command",
+            ),
+            (["--cache", "8", "binary", "run", "f", "r"], "the binary command"),
+        ],
+    )
+    def test_options_of_other_modes(
+        self, argv: List[str], message: str, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test cache and metrics options are rejected where nothing uses them."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
+
+    def test_batch_with_persistent_cache(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --persistent-cache reuses results from an earlier run."""
+        path = tmp_path / "input.txt"
+        path.write_text("+ 3 4\n/ 1 3\n", encoding="utf-8")
+        argv = ["--batch", str(path), "--persistent-cache", str(tmp_path / "c.db")]
+
+        main(argv + ["--cache", "16"])
+        assert "Persistent cache: 2 entries, 0 hits" in capsys.readouterr().err
+        main(argv + ["--numeric", "decimal", "--precision", "5"])
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["7", "0.33333"]
+        assert "Persistent cache: 4 entries, 0 hits, 2 misses" in captured.err
+        main(argv)
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["7.0", "0.3333333333333333"]
+        assert "Persistent cache: 4 entries, 2 hits, 0 misses" in captured.err
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--persistent-cache-size", "0"], "invalid persistent cache size"),
+            (["--workers", "2", "--batch", "in.txt"], "does not apply to --workers"),
+        ],
+    )
+    def test_invalid_persistent_cache(
+        self,
+        tmp_path: Path,
+        argv: List[str],
+        message: str,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test unusable --persistent-cache options are usage errors."""
+        with pytest.raises(SystemExit):
+            main(argv + ["--persistent-cache", str(tmp_path / "c.db")])
+        assert message in capsys.readouterr().err
+
+    def test_persistent_cache_not_a_database(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a --persistent-cache file that is not a database is reported."""
+        path = tmp_path / "c.db"
+        path.write_text("not a database\n" * 100)
+        with pytest.raises(SystemExit):
+            main(["--persistent-cache", str(path)])
+        assert f"cannot open {path}" in capsys.readouterr().err
+
+    def test_cli_accepts_custom_operations(self) -> None:
+        """Test CalculatorCLI uses injected operations."""
+        operations = CachedOperations()
+        assert CalculatorCLI(operations).operations is operations
+
+
+class TestWorkersOption:
+    """Test cases for the --workers command-line option."""
+
+    def test_batch_with_workers(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --workers evaluates the batch file in a process pool."""
+        path = tmp_path / "input.txt"
+        path.write_text("+ 3 4\n/ 1 0\n* 2 3\n", encoding="utf-8")
+
+        main(["--batch", str(path), "--workers", "2"])
+
+        assert capsys.readouterr().out == (
+            "7.0\nError: line 2: Division by zero is not allowed.\n6.0\n"
+        )
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_batch_on_zero(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture, workers: str
+    ) -> None:
+        """Test --on-zero applies to serial and parallel batch mode."""
+        path = tmp_path / "input.txt"
+        path.write_text("/ -1 0\n/ 0 0\n", encoding="utf-8")
+
+        main(["--batch", str(path), "--workers", workers, "--on-zero", "inf"])
+
+        assert capsys.readouterr().out == "-inf\nnan\n"
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--workers", "0"], "--workers must be a positive integer"),
+            (["--workers", "2"], "--workers requires --batch with a file path"),
+            (["--batch", "-", "--workers", "2"], "--workers requires --batch"),
+        ],
+    )
+    def test_invalid_workers(
+        self, argv: List[str], message: str, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test invalid --workers usage is reported as a usage error."""
+        with pytest.raises(SystemExit):
+            main(argv)
+        assert message in capsys.readouterr().err
+
+
+class TestClusterOption:
+    """Test cases for the --cluster option and the worker subcommand."""
+
+    @patch("src.calculator.cluster.run_cluster")
+    def test_batch_on_cluster(self, mock_run_cluster: Mock, tmp_path: Path) -> None:
+        """Test --cluster sends the batch file to the listed workers."""
+        path = str(tmp_path / "input.txt")
+        main(
+            ["--batch", path, "--cluster", "10.0.0.2:7879,[::1]:80", "--on-zero", "nan"]
+        )
+        mock_run_cluster.assert_called_once_with(
+            path, sys.stdout, [("10.0.0.2", 7879), ("::1", 80)], on_zero="nan"
+        )
+
+    def test_unreachable_workers(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a run that fails on its workers exits with status 1."""
+        path = tmp_path / "input.txt"
+        path.write_text("+ 3 4\n", encoding="utf-8")
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--batch", str(path), "--cluster", f"127.0.0.1:{port}"])
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err.startswith(
+            "Error: Distributed evaluation failed: No worker is left"
+        )
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--cluster", "h:1"], "--cluster requires --batch with a file path"),
+            (["--batch", "-", "--cluster", "h:1"], "--cluster requires --batch"),
+            (["--batch", "f", "--cluster", "h:1", "--workers", "2"], "combined"),
+            (["--batch", "f", "--cluster", "h:1,h"], "Invalid worker address: 'h'"),
+            (["--batch", "f", "--cluster", "h:1", "--numeric", "int"], "--numeric"),
+            (
+                ["--batch", "f", "--cluster", "h:1", "--persistent-cache", "c.db"],
+                "does not apply to --workers or --cluster",
+            ),
+        ],
+    )
+    def test_invalid_cluster(
+        self, argv: List[str], message: str, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test invalid --cluster usage is reported as a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
+
+    @patch("src.calculator.cluster.run_worker")
+    def test_worker(self, mock_run_worker: Mock) -> None:
+        """Test worker starts a worker server with the given address."""
+        main(["worker", "--host", "0.0.0.0", "--port", "9000"])
+        mock_run_worker.assert_called_once_with("0.0.0.0", 9000, None)
+
+    @patch("src.calculator.cluster.run_worker", side_effect=OSError(98, "in use"))
+    def test_worker_port_in_use(
+        self, mock_run_worker: Mock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a bind failure is reported as a usage error."""
+        with pytest.raises(SystemExit):
+            main(["worker"])
+        assert "cannot listen on 127.0.0.1:7879: in use" in capsys.readouterr().err
+
+
+class TestServeCommand:
+    """Test cases for the serve subcommand."""
+
+    @patch("src.calculator.server.run_server")
+    def test_serve(self, mock_run_server: Mock) -> None:
+        """Test serve starts the TCP server with the given address."""
+        main(["serve", "--host", "0.0.0.0", "--port", "9000"])
+        mock_run_server.assert_called_once_with("0.0.0.0", 9000, None)
+
+    @patch("src.calculator.server.run_server", side_effect=OSError(98, "in use"))
+    def test_serve_port_in_use(
+        self, mock_run_server: Mock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a bind failure is reported as a usage error."""
+        with pytest.raises(SystemExit):
+            main(["serve"])
+        assert "cannot listen on 127.0.0.1:7878: in use" in capsys.readouterr().err
+
+
+class TestEvalAndDaemonCommands:
+    """Test cases for the eval and daemon subcommands."""
+
+    @patch("src.calculator.client.evaluate", return_value="OK 7.0\n")
+    def test_eval_prints_result(
+        self, mock_evaluate: Mock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test eval joins its arguments and prints the result."""
+        main(["eval", "+", "3", "4", "--socket", "/tmp/c.sock"])
+
+        mock_evaluate.assert_called_once_with("+ 3 4", "/tmp/c.sock", True)
+        assert capsys.readouterr().out == "7.0\n"
+
+    def test_eval_in_process_error(self, capsys: pytest.CaptureFixture) -> None:
+        """Test eval reports errors on stderr with exit status 1."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["eval", "/ 1 0", "--no-daemon"])
+
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err == "Error: Division by zero is not allowed.\n"
+
+    @patch("src.calculator.daemon.run_daemon")
+    def test_daemon(self, mock_run_daemon: Mock) -> None:
+        """Test daemon runs the resident server on the given socket."""
+        main(["daemon", "--socket", "/tmp/c.sock", "--idle-timeout", "30"])
+        mock_run_daemon.assert_called_once_with("/tmp/c.sock", 30.0, None)
+
+    @patch("src.calculator.daemon.run_daemon")
+    @patch("src.calculator.client.default_socket_path", return_value="/tmp/d.sock")
+    def test_daemon_default_socket(
+        self, mock_path: Mock, mock_run_daemon: Mock
+    ) -> None:
+        """Test daemon falls back to the default socket path."""
+        main(["daemon"])
+        assert mock_run_daemon.call_args[0][0] == "/tmp/d.sock"
+
+    @patch("src.calculator.daemon.run_daemon", side_effect=PermissionError("unsafe"))
+    def test_daemon_unsafe_socket(
+        self, mock_run_daemon: Mock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a socket path the daemon refuses is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["daemon", "--socket", "/tmp/c.sock"])
+        assert exc_info.value.code == 2
+        assert "cannot listen on /tmp/c.sock: unsafe" in capsys.readouterr().err
+
+
+class TestReduceCommand:
+    """Test cases for the reduce subcommand."""
+
+    def test_sum_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test a file is summed with compensation."""
+        numbers = tmp_path / "numbers.txt"
+        numbers.write_text("1e16\n1\n-1e16\n\n0.1\n")
+        main(["reduce", "sum", str(numbers)])
+        assert capsys.readouterr().out == "1.1\n"
+
+    def test_scan_stdin(self, capsys: pytest.CaptureFixture) -> None:
+        """Test --scan prints the running values of stdin."""
+        with patch("sys.stdin", StringIO("3\n1\n2\n")):
+            main(["reduce", "max", "-", "--scan"])
+        assert capsys.readouterr().out == "3.0\n3.0\n3.0\n"
+
+    def test_invalid_line(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test a bad line is reported with its line number and status 1."""
+        numbers = tmp_path / "numbers.txt"
+        numbers.write_text("1\nabc\n")
+        with pytest.raises(SystemExit) as exc_info:
+            main(["reduce", "prod", str(numbers)])
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err.startswith(
+            "Error: line 2: Invalid number: 'abc'"
+        )
+
+    def test_empty_min(self, capsys: pytest.CaptureFixture) -> None:
+        """Test min of an empty input is an error with status 1."""
+        with patch("sys.stdin", StringIO("")), pytest.raises(SystemExit) as exc_info:
+            main(["reduce", "min", "-"])
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().err == "Error: min of an empty input.\n"
+
+    def test_missing_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test an unreadable input is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["reduce", "sum", str(tmp_path / "missing.txt")])
+        assert exc_info.value.code == 2
+        assert "cannot read" in capsys.readouterr().err
+
+
+class TestBinaryCommand:
+    """Test cases for the binary subcommand."""
+
+    def test_encode_run_decode(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test encoding, evaluating and decoding through the CLI."""
+        text = tmp_path / "input.txt"
+        text.write_text("+ 3 4\nbad line\n/ 1 0\n")
+        operands = str(tmp_path / "input.bin")
+        results = str(tmp_path / "results.bin")
+        status = tmp_path / "status.bin"
+
+        main(["binary", "encode", str(text), operands])
+        assert "line 2" in capsys.readouterr().err
+
+        main(["binary", "run", operands, results, "--status", str(status)])
+        assert capsys.readouterr().err == "1 records failed.\n"
+        assert status.read_bytes() == b"\x00\x01"
+
+        main(["binary", "run", operands, results, "--backend", "python"])
+        assert read_results(results)[0] == 7.0
+
+        main(["binary", "decode", operands])
+        assert capsys.readouterr().out == "+ 3.0 4.0\n/ 1.0 0.0\n"
+
+    def test_encode_from_stdin(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test encode reads standard input for '-'."""
+        operands = str(tmp_path / "input.bin")
+        with patch("sys.stdin", StringIO("* 2 5\n")):
+            main(["binary", "encode", "-", operands])
+        main(["binary", "run", operands, str(tmp_path / "out.bin")])
+        assert read_results(str(tmp_path / "out.bin")).tolist() == [10.0]
+        assert capsys.readouterr().err == ""
+
+    def test_missing_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test a missing input file is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["binary", "decode", str(tmp_path / "missing.bin")])
+        assert exc_info.value.code == 2
+        assert "cannot access" in capsys.readouterr().err
+
+    def test_malformed_file(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a malformed operand file is a usage error."""
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"garbage")
+        with pytest.raises(SystemExit):
+            main(["binary", "decode", str(path)])
+        assert "Invalid binary file" in capsys.readouterr().err
+
+
+class TestCsvCommand:
+    """Test cases for the csv subcommand."""
+
+    def test_file_to_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test a result column is appended and bad rows reported."""
+        source = tmp_path / "in.csv"
+        source.write_text("price,qty\n2.5,4\n1,x\n")
+        output = tmp_path / "out.csv"
+        main(["csv", "--expr", "price * col2", str(source), str(output)])
+        assert output.read_text() == "price,qty,result\n2.5,4,10.0\n1,x,\n"
+        assert capsys.readouterr().err == (
+            "Error: row 3: Invalid number: 'x'. Please enter a valid number.\n"
+            "1 rows failed.\n"
+        )
+
+    def test_stdin_options(self, capsys: pytest.CaptureFixture) -> None:
+        """Test standard input, --no-header, --delimiter and --on-zero."""
+        with patch("sys.stdin", StringIO("1;0\n6;3\n")):
+            main(
+                [
+                    "--on-zero",
+                    "inf",
+                    "csv",
+                    "--expr",
+                    "col1 / col2",
+                    "--no-header",
+                    "--delimiter",
+                    ";",
+                    "-",
+                ]
+            )
+        assert capsys.readouterr() == ("1;0;inf\n6;3;2.0\n", "")
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--expr", "price *"], "Invalid expression"),
+            (["--expr", "total"], "Invalid column: 'total'"),
+            (["--expr", "price", "--delimiter", ";;"], "single character"),
+            (["--expr", "price", "missing.csv"], "cannot access"),
+        ],
+    )
+    def test_usage_errors(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture,
+        argv: List[str],
+        message: str,
+    ) -> None:
+        """Test bad formulas, options and files are usage errors."""
+        source = tmp_path / "in.csv"
+        source.write_text("price\n1\n")
+        if not argv[-1].endswith(".csv"):
+            argv = argv + [str(source)]
+        with pytest.raises(SystemExit) as exc_info:
+            main(["csv"] + argv)
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
+
+
+class TestDivideCommand:
+    """Test cases for the divide subcommand."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["1", "7", "--digits", "12"], "0.142857142857\n"),
+            (["-1", "0.75"], "-1.3333333333333333333333333333333333333333333333333"),
+            (["1", "4"], "0.25\n"),
+            (["-22", "7", "--repeating"], "-3.(142857)\n"),
+            (["1/3", "2", "--repeating"], "0.1(6)\n"),
+        ],
+    )
+    def test_prints_digits(
+        self, capsys: pytest.CaptureFixture, argv: List[str], expected: str
+    ) -> None:
+        """Test truncated and repeating expansions are printed."""
+        main(["divide"] + argv)
+        assert capsys.readouterr().out.startswith(expected)
+
+    def test_output_file(self, tmp_path: Path) -> None:
+        """Test --output streams the digits to a file."""
+        output = tmp_path / "digits.txt"
+        main(["divide", "1", "3", "--digits", "100000", "--output", str(output)])
+        assert output.read_text() == "0." + "3" * 100000 + "\n"
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["1", "0"], "Error: Division by zero is not allowed.\n"),
+            (["x", "1"], "Error: Invalid number: 'x'. Please enter a valid number.\n"),
+            (
+                ["1", "17", "--repeating", "--max-period", "10"],
+                "Error: the repeating part is longer than 10 digits.\n",
+            ),
+        ],
+    )
+    def test_errors(
+        self, capsys: pytest.CaptureFixture, argv: List[str], message: str
+    ) -> None:
+        """Test bad operands and long periods exit with status 1."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["divide"] + argv)
+        assert exc_info.value.code == 1
+        assert capsys.readouterr() == ("", message)
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--digits", "-1"], "--digits must not be negative"),
+            (["--max-period", "0"], "--max-period must be a positive integer"),
+            (["--output", "/nonexistent/digits.txt"], "cannot write"),
+        ],
+    )
+    def test_usage_errors(
+        self, capsys: pytest.CaptureFixture, argv: List[str], message: str
+    ) -> None:
+        """Test bad options and output files are usage errors."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["divide", "1", "7"] + argv)
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
+
+
+class TestMetricsOption:
+    """Test cases for metrics in the REPL and the --metrics options."""
+
+    @patch("builtins.input", side_effect=["stats", "+"])
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_stats_command_disabled(
+        self, mock_stdout: StringIO, mock_input: Mock
+    ) -> None:
+        """Test 'stats' explains how to enable metrics and re-prompts."""
+        assert CalculatorCLI().get_operation() == "+"
+        assert "Metrics are disabled" in mock_stdout.getvalue()
+
+    @patch("builtins.input", side_effect=[" STATS ", "q"])
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_stats_command_enabled(
+        self, mock_stdout: StringIO, mock_input: Mock
+    ) -> None:
+        """Test 'stats' prints the recorded metrics."""
+        calculator = CalculatorCLI(InstrumentedOperations())
+        calculator.perform_calculation("+", 1, 2)
+        assert calculator.get_operation() is None
+        output = mock_stdout.getvalue()
+        assert "operations +: 1 calls, 0 errors" in output
+        assert "repl +: 1 calls, 0 errors" in output
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_welcome_mentions_stats(self, mock_stdout: StringIO) -> None:
+        """Test the welcome message mentions 'stats' when metrics are on."""
+        CalculatorCLI(metrics=Metrics()).display_welcome()
+        assert "Type 'stats'" in mock_stdout.getvalue()
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_perform_calculation_records_errors(self, mock_stdout: StringIO) -> None:
+        """Test REPL calculations record errors by exception class."""
+        metrics = Metrics()
+        calculator = CalculatorCLI(metrics=metrics)
+        calculator.perform_calculation("/", 1, 0)
+        calculator.perform_calculation("^", 1, 2)
+
+        assert metrics.errors == {
+            (REPL_SCOPE, "/", "DivisionByZeroError"): 1,
+            (REPL_SCOPE, "^", "ValueError"): 1,
+        }
+        assert (OPERATIONS_SCOPE, "/") not in metrics.calls
+
+    def test_repl_with_metrics(self) -> None:
+        """Test --metrics instruments the operations given to the REPL."""
+        with patch("src.calculator.main.CalculatorCLI") as mock_class:
+            main(["--metrics", "--cache", "4"])
+        operations = mock_class.call_args[0][0]
+        assert isinstance(operations, InstrumentedOperations)
+        assert isinstance(operations.inner, CachedOperations)
+
+    def test_metrics_file(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test --metrics-file dumps batch metrics in Prometheus format."""
+        batch = tmp_path / "input.txt"
+        batch.write_text("+ 1 2\n/ 1 0\n", encoding="utf-8")
+        path = tmp_path / "metrics.prom"
+
+        main(["--batch", str(batch), "--metrics-file", str(path)])
+
+        text = path.read_text()
+        assert 'calculator_calls_total{scope="operations",operation="+"} 1' in text
+        assert 'error="DivisionByZeroError"} 1' in text
+        assert capsys.readouterr().out.startswith("3.0\n")
+
+    def test_metrics_file_write_error(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test an unwritable metrics file is reported on exit."""
+        path = tmp_path / "missing" / "metrics.prom"
+        with patch("src.calculator.main.CalculatorCLI"):
+            main(["--metrics-file", str(path)])
+        assert f"Cannot write {path}" in capsys.readouterr().err
+
+    def test_invalid_metrics_interval(self, capsys: pytest.CaptureFixture) -> None:
+        """Test a non-positive interval is a usage error."""
+        with pytest.raises(SystemExit):
+            main(["--metrics-file", "m.prom", "--metrics-interval", "0"])
+        assert "invalid --metrics-interval" in capsys.readouterr().err
+
+
+class TestNumericOption:
+    """Test cases for the --numeric and --precision options."""
+
+    def test_batch_int(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test --numeric int keeps integer results exact."""
+        path = tmp_path / "input.txt"
+        path.write_text("* 99999999999999999 99999999999999999\n/ 9 3\n")
+        main(["--batch", str(path), "--numeric", "int"])
+        assert capsys.readouterr().out == "9999999999999999800000000000000001\n3\n"
+
+    def test_batch_decimal_precision(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test --precision sets the significant digits of decimal results."""
+        path = tmp_path / "input.txt"
+        path.write_text("/ 2 3\n")
+        main(["--batch", str(path), "--numeric", "decimal", "--precision", "6"])
+        assert capsys.readouterr().out == "0.666667\n"
+
+    def test_batch_with_cache_and_metrics(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test the backend is kept under the cache and metrics wrappers."""
+        path = tmp_path / "input.txt"
+        path.write_text("/ 1 3\n/ 1 3\n")
+        main(
+            ["--batch", str(path), "--numeric", "fraction", "--cache", "8", "--metrics"]
+        )
+        captured = capsys.readouterr()
+        assert captured.out == "1/3\n1/3\n"
+        assert "1 hits" in captured.err
+
+    @patch("builtins.input", side_effect=["+", "1/3", "1/6", "quit"])
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_repl_parses_with_backend(
+        self, mock_stdout: StringIO, mock_input: Mock
+    ) -> None:
+        """Test the REPL parses operands with the operations' backend."""
+        with patch("sys.stdin.isatty", return_value=True):
+            main(["--numeric", "fraction"])
+        assert "Result: 1/2" in mock_stdout.getvalue()
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--numeric", "int", "serve"],
+            ["--numeric", "decimal", "eval", "+ 1 2"],
+            ["--precision", "5", "--batch", "in.txt", "--workers", "2"],
+            ["--numeric", "int", "--precision", "5"],
+            ["--numeric", "decimal", "--precision", "0"],
+        ],
+    )
+    def test_invalid_combinations(
+        self, argv: List[str], capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test unsupported modes and precisions are usage errors."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert "--precision" in capsys.readouterr().err
@@ -0,0 +1,211 @@
+"""Test module for calculation metrics and the Prometheus exporter."""
+
+import math
+from pathlib import Path
+
+import pytest
+from src.calculator.cache import CachedOperations
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.numeric import FractionBackend, NumericOperations
+from src.calculator.metrics import (
+    BUCKET_BOUNDS_NS,
+    OPERATIONS_SCOPE,
+    REPL_SCOPE,
+    InstrumentedOperations,
+    LatencyHistogram,
+    Metrics,
+    PrometheusFileExporter,
+)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    @pytest.mark.parametrize(
+        "elapsed_ns, index",
+        [
+            (0, 0),
+            (64, 0),
+            (65, 1),
+            (128, 1),
+            (129, 2),
+            (2**30, len(BUCKET_BOUNDS_NS) - 1),
+            (2**30 + 1, len(BUCKET_BOUNDS_NS)),
+            (10**12, len(BUCKET_BOUNDS_NS)),
+        ],
+    )
+    def test_bucket_boundaries(self, elapsed_ns: int, index: int) -> None:
+        """Test latencies land in power-of-two buckets with an overflow bucket."""
+        histogram = LatencyHistogram()
+        histogram.observe(elapsed_ns)
+        assert histogram.buckets[index] == 1
+        assert histogram.count == 1
+        assert histogram.total_ns == elapsed_ns
+
+    def test_quantiles(self) -> None:
+        """Test quantiles return the upper bound of the holding bucket."""
+        histogram = LatencyHistogram()
+        assert histogram.quantile(0.5) == 0.0
+        for _ in range(99):
+            histogram.observe(100)
+        histogram.observe(10**12)
+        assert histogram.quantile(0.5) == 128.0
+        assert histogram.quantile(0.99) == 128.0
+        assert math.isinf(histogram.quantile(1.0))
+
+
+class TestMetrics:
+    """Test cases for Metrics."""
+
+    def test_record_and_clear(self) -> None:
+        """Test calls, errors by class and latency are recorded per key."""
+        metrics = Metrics()
+        metrics.record(OPERATIONS_SCOPE, "/", 100)
+        metrics.record(OPERATIONS_SCOPE, "/", 200, DivisionByZeroError())
+
+        key = (OPERATIONS_SCOPE, "/")
+        assert metrics.calls == {key: 2}
+        assert metrics.errors == {(OPERATIONS_SCOPE, "/", "DivisionByZeroError"): 1}
+        assert metrics.latency[key].count == 2
+
+        metrics.clear()
+        assert not metrics.calls and not metrics.errors and not metrics.latency
+
+    def test_format_stats(self) -> None:
+        """Test the stats summary lists every key and error class."""
+        metrics = Metrics()
+        assert metrics.format_stats() == "No calculations recorded yet."
+
+        metrics.record(OPERATIONS_SCOPE, "+", 500)
+        metrics.record(REPL_SCOPE, "/", 2_000_000, DivisionByZeroError())
+        metrics.record(REPL_SCOPE, "*", 5_000)
+        assert metrics.format_stats().splitlines() == [
+            "operations +: 1 calls, 0 errors, mean 0.5 us, p50 <= 512 ns, "
+            "p99 <= 512 ns",
+            "repl *: 1 calls, 0 errors, mean 5.0 us, p50 <= 8.2 us, p99 <= 8.2 us",
+            "repl /: 1 calls, 1 errors, mean 2000.0 us, p50 <= 2.1 ms, "
+            "p99 <= 2.1 ms",
+            "repl /: DivisionByZeroError x1",
+        ]
+
+    def test_format_stats_overflow(self) -> None:
+        """Test latencies past the last bucket are shown as unbounded."""
+        metrics = Metrics()
+        metrics.record(OPERATIONS_SCOPE, "+", 10**12)
+        assert "p99 <= inf" in metrics.format_stats()
+
+    def test_prometheus_format(self) -> None:
+        """Test the Prometheus exposition text."""
+        metrics = Metrics()
+        metrics.record(OPERATIONS_SCOPE, "/", 100, DivisionByZeroError())
+        metrics.record(OPERATIONS_SCOPE, "/", 3000)
+        text = metrics.to_prometheus()
+        lines = text.splitlines()
+
+        labels = 'scope="operations",operation="/"'
+        assert "# TYPE calculator_calls_total counter" in lines
+        assert f"calculator_calls_total{{{labels}}} 2" in lines
+        assert (
+            f'calculator_errors_total{{{labels},error="DivisionByZeroError"}} 1'
+            in lines
+        )
+        assert "# TYPE calculator_latency_seconds histogram" in lines
+        assert f'calculator_latency_seconds_bucket{{{labels},le="6.4e-08"}} 0' in lines
+        assert f'calculator_latency_seconds_bucket{{{labels},le="1.28e-07"}} 1' in lines
+        assert f'calculator_latency_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f"calculator_latency_seconds_sum{{{labels}}} 3.1e-06" in lines
+        assert f"calculator_latency_seconds_count{{{labels}}} 2" in lines
+        assert text.endswith("\n")
+
+    def test_label_escaping(self) -> None:
+        """Test label values are escaped."""
+        metrics = Metrics()
+        metrics.record('a"b\\c\nd', "+", 1)
+        assert 'scope="a\\"b\\\\c\\nd"' in metrics.to_prometheus()
+
+    def test_write_prometheus(self, tmp_path: Path) -> None:
+        """Test the exposition text is written to a file atomically."""
+        metrics = Metrics()
+        metrics.record(OPERATIONS_SCOPE, "+", 1)
+        path = tmp_path / "metrics.prom"
+        metrics.write_prometheus(str(path))
+        assert path.read_text() == metrics.to_prometheus()
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestInstrumentedOperations:
+    """Test cases for InstrumentedOperations."""
+
+    def test_records_results_and_errors(self) -> None:
+        """Test calls are delegated, timed and errors re-raised."""
+        operations = InstrumentedOperations()
+        assert operations.calculate("+", 1, 2) == 3
+        with pytest.raises(DivisionByZeroError):
+            operations.calculate("/", 1, 0)
+        with pytest.raises(ValueError):
+            operations.calculate("^", 1, 2)
+
+        metrics = operations.metrics
+        assert metrics.calls[(OPERATIONS_SCOPE, "+")] == 1
+        assert metrics.errors == {
+            (OPERATIONS_SCOPE, "/", "DivisionByZeroError"): 1,
+            (OPERATIONS_SCOPE, "^", "ValueError"): 1,
+        }
+
+    def test_wraps_cached_operations(self) -> None:
+        """Test a wrapped CachedOperations is timed including its cache."""
+        cached = CachedOperations()
+        operations = InstrumentedOperations(Metrics(), cached)
+        operations.calculate("*", 2, 3)
+        operations.calculate("*", 2, 3)
+        assert cached.cache.hits == 1
+        assert operations.metrics.calls[(OPERATIONS_SCOPE, "*")] == 2
+
+    def test_exposes_inner_backend(self) -> None:
+        """Test the inner operations' numeric backend is passed through."""
+        inner = NumericOperations(FractionBackend())
+        assert InstrumentedOperations(Metrics(), inner).backend is inner.backend
+        assert InstrumentedOperations().backend is None
+
+
+class TestPrometheusFileExporter:
+    """Test cases for PrometheusFileExporter."""
+
+    def test_periodic_and_final_dumps(self, tmp_path: Path) -> None:
+        """Test the exporter dumps while running and once more on stop."""
+        metrics = Metrics()
+        path = tmp_path / "metrics.prom"
+        exporter = PrometheusFileExporter(metrics, str(path), interval=0.01)
+        exporter.start()
+        metrics.record(OPERATIONS_SCOPE, "+", 1)
+        exporter.stop()
+
+        assert 'calculator_calls_total{scope="operations",operation="+"} 1' in (
+            path.read_text()
+        )
+        assert exporter.errors == []
+
+    def test_periodic_dump(self, tmp_path: Path) -> None:
+        """Test the background thread dumps before stop is called."""
+        path = tmp_path / "metrics.prom"
+        exporter = PrometheusFileExporter(Metrics(), str(path), interval=0.01)
+        exporter.start()
+        try:
+            for _ in range(500):
+                if path.exists():
+                    break
+                exporter._stopped.wait(0.01)
+            assert path.exists()
+        finally:
+            exporter.stop()
+
+    def test_write_errors_are_kept(self, tmp_path: Path) -> None:
+        """Test write failures are remembered instead of raised."""
+        exporter = PrometheusFileExporter(Metrics(), str(tmp_path / "no" / "file"))
+        exporter.stop()
+        assert len(exporter.errors) == 1
+
+    def test_invalid_interval(self, tmp_path: Path) -> None:
+        """Test a non-positive interval is rejected."""
+        with pytest.raises(ValueError, match="interval"):
+            PrometheusFileExporter(Metrics(), str(tmp_path / "m"), interval=0)
@@ -0,0 +1,248 @@
+"""Test module for the numeric backends."""
+
+import decimal
+import math
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+import pytest
+from src.calculator.defaults import NUMERIC_BACKENDS
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.numeric import (
+    BACKENDS,
+    DecimalBackend,
+    FloatBackend,
+    FractionBackend,
+    IntegerBackend,
+    NumericBackend,
+    NumericOperations,
+    make_backend,
+)
+
+
+class TestMakeBackend:
+    """Test cases for make_backend."""
+
+    def test_every_choice_is_registered(self) -> None:
+        """Test the CLI choices and the registry list the same backends."""
+        assert tuple(BACKENDS) == NUMERIC_BACKENDS
+
+    @pytest.mark.parametrize("name", NUMERIC_BACKENDS)
+    def test_by_name(self, name: str) -> None:
+        """Test each backend is created by its name."""
+        assert make_backend(name).name == name
+
+    def test_decimal_precision(self) -> None:
+        """Test the decimal backend takes a precision, 28 by default."""
+        assert make_backend("decimal").precision == 28  # type: ignore[attr-defined]
+        assert make_backend("decimal", 5).precision == 5  # type: ignore[attr-defined]
+
+    def test_unknown_name(self) -> None:
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unsupported numeric backend"):
+            make_backend("complex")
+
+    def test_precision_for_other_backend(self) -> None:
+        """Test a precision is rejected for backends without one."""
+        with pytest.raises(ValueError, match="decimal backend"):
+            make_backend("int", 10)
+
+    @pytest.mark.parametrize("precision", [0, -3])
+    def test_invalid_precision(self, precision: int) -> None:
+        """Test non-positive precisions are rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            DecimalBackend(precision)
+
+    def test_methods(self) -> None:
+        """Test the built-in symbols map to the backend's bound methods."""
+        backend = DecimalBackend()
+        assert backend.methods() == {
+            "+": backend.add,
+            "-": backend.subtract,
+            "*": backend.multiply,
+            "/": backend.divide,
+        }
+
+    def test_negate(self) -> None:
+        """Test negation uses the operator, or the decimal context's precision."""
+        assert IntegerBackend().negate(-5) == 5
+        assert str(DecimalBackend(3).negate(Decimal("1.2345"))) == "-1.23"
+
+    def test_base_class_parse_is_abstract(self) -> None:
+        """Test the base class leaves parsing to the backends."""
+        with pytest.raises(TypeError, match="abstract"):
+            NumericBackend()  # type: ignore[abstract]
+
+
+class TestFloatBackend:
+    """Test cases for FloatBackend."""
+
+    def test_matches_float(self) -> None:
+        """Test parsing and arithmetic are plain float arithmetic."""
+        backend = FloatBackend()
+        a, b = backend.parse("0.1"), backend.parse("0.2")
+        assert backend.add(a, b) == 0.1 + 0.2
+        assert backend.subtract(a, b) == 0.1 - 0.2
+        assert backend.multiply(a, b) == 0.1 * 0.2
+        assert backend.divide(a, b) == 0.1 / 0.2
+
+
+class TestIntegerBackend:
+    """Test cases for IntegerBackend."""
+
+    backend = IntegerBackend()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [("42", 42), ("-7", -7), ("1_000", 1000), ("1.5", 1.5), ("inf", math.inf)],
+    )
+    def test_parse(self, text: str, expected: Any) -> None:
+        """Test integer literals parse to int and others fall back to float."""
+        value = self.backend.parse(text)
+        assert value == expected
+        assert type(value) is type(expected)
+
+    def test_parse_invalid(self) -> None:
+        """Test invalid numbers are rejected."""
+        with pytest.raises(ValueError):
+            self.backend.parse("abc")
+
+    def test_stays_exact(self) -> None:
+        """Test int arithmetic keeps every digit."""
+        big = 123456789123456789
+        assert self.backend.multiply(big, big) == big * big
+        assert self.backend.add(2**64, 1) == 2**64 + 1
+        assert self.backend.subtract(2**64, 1) == 2**64 - 1
+        assert type(self.backend.add(1, 2)) is int
+
+    def test_exact_division_stays_int(self) -> None:
+        """Test a quotient without remainder stays an int."""
+        quotient = self.backend.divide(10**30, 10**10)
+        assert quotient == 10**20
+        assert type(quotient) is int
+        assert self.backend.divide(-9, 3) == -3
+
+    def test_inexact_division_is_float(self) -> None:
+        """Test an inexact quotient becomes a correctly rounded float."""
+        assert self.backend.divide(10, 4) == 2.5
+        assert self.backend.divide(1, 3) == 1 / 3
+
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (10**400 + 1, 3, math.inf),
+            (-(10**400) - 1, 3, -math.inf),
+            (10**400 + 1, -3, -math.inf),
+        ],
+    )
+    def test_division_overflow(self, a: int, b: int, expected: float) -> None:
+        """Test a quotient too large for a float saturates to infinity."""
+        assert self.backend.divide(a, b) == expected
+
+    def test_mixed_operands_use_float(self) -> None:
+        """Test a float operand makes the result float, even for huge ints."""
+        assert self.backend.add(1, 0.5) == 1.5
+        assert self.backend.subtract(1, 0.5) == 0.5
+        assert self.backend.multiply(10**400, 1.5) == math.inf
+        assert self.backend.multiply(-(10**400), 1.5) == -math.inf
+        assert self.backend.divide(3, 0.5) == 6.0
+
+
+class TestDecimalBackend:
+    """Test cases for DecimalBackend."""
+
+    def test_exact_decimal_fractions(self) -> None:
+        """Test decimal fractions add without binary rounding error."""
+        backend = DecimalBackend()
+        assert backend.add(backend.parse("0.1"), backend.parse("0.2")) == Decimal("0.3")
+
+    def test_precision(self) -> None:
+        """Test results are rounded to the configured precision."""
+        backend = DecimalBackend(5)
+        assert backend.divide(Decimal(1), Decimal(3)) == Decimal("0.33333")
+        assert backend.multiply(Decimal(12345), Decimal(10)) == Decimal("1.2345E+5")
+        assert backend.subtract(Decimal(1), Decimal("0.00001")) == Decimal("0.99999")
+        assert backend.parse("3.141592653") == Decimal("3.1416")
+
+    def test_ignores_thread_context(self) -> None:
+        """Test the backend's context is used, not the thread's."""
+        backend = DecimalBackend(10)
+        with decimal.localcontext() as context:
+            context.prec = 2
+            context.traps[decimal.Inexact] = True
+            assert backend.divide(Decimal(2), Decimal(3)) == Decimal("0.6666666667")
+        assert decimal.getcontext().prec == 28
+
+    def test_float_like_specials(self) -> None:
+        """Test overflow gives infinity and invalid operations give NaN."""
+        backend = DecimalBackend()
+        huge = backend.parse("9e999999")
+        assert backend.multiply(huge, huge) == Decimal("Infinity")
+        inf = backend.parse("inf")
+        assert backend.subtract(inf, inf).is_nan()
+
+    @pytest.mark.parametrize("text", ["abc", "1/3", "sNaN", ""])
+    def test_parse_invalid(self, text: str) -> None:
+        """Test invalid numbers and signaling NaNs are rejected."""
+        with pytest.raises(ValueError):
+            DecimalBackend().parse(text)
+
+
+class TestFractionBackend:
+    """Test cases for FractionBackend."""
+
+    backend = FractionBackend()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [("3", Fraction(3)), ("0.25", Fraction(1, 4)), ("1/3", Fraction(1, 3))],
+    )
+    def test_parse(self, text: str, expected: Fraction) -> None:
+        """Test integers, decimals and ratios parse exactly."""
+        assert self.backend.parse(text) == expected
+
+    @pytest.mark.parametrize("text", ["abc", "inf", "nan", "1/0"])
+    def test_parse_invalid(self, text: str) -> None:
+        """Test non-finite and malformed numbers are rejected."""
+        with pytest.raises(ValueError):
+            self.backend.parse(text)
+
+    def test_exact_division(self) -> None:
+        """Test division never rounds."""
+        third = self.backend.divide(Fraction(1), Fraction(3))
+        assert self.backend.multiply(third, Fraction(3)) == 1
+
+
+class TestNumericOperations:
+    """Test cases for NumericOperations."""
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [("+", 13), ("-", 7), ("*", 30), ("/", Fraction(10, 3))],
+    )
+    def test_calculate(self, operation: str, expected: Fraction) -> None:
+        """Test every operation goes through the backend."""
+        operations = NumericOperations(FractionBackend())
+        result = operations.calculate(operation, Fraction(10), Fraction(3))
+        assert result == expected
+        assert isinstance(result, Fraction)
+
+    def test_float_by_default(self) -> None:
+        """Test the float backend is used when none is given."""
+        operations = NumericOperations()
+        assert isinstance(operations.backend, FloatBackend)
+        assert operations.calculate("/", 1.0, 4.0) == 0.25
+
+    @pytest.mark.parametrize(
+        "backend, zero", [(IntegerBackend(), 0), (DecimalBackend(), Decimal("-0"))]
+    )
+    def test_division_by_zero(self, backend: NumericBackend, zero: Any) -> None:
+        """Test a zero divisor raises DivisionByZeroError for every backend."""
+        with pytest.raises(DivisionByZeroError):
+            NumericOperations(backend).calculate("/", 1, zero)
+
+    def test_unsupported_operation(self) -> None:
+        """Test unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unsupported operation"):
+            NumericOperations().calculate("^", 1.0, 2.0)
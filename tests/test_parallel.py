@@ -0,0 +1,113 @@
+"""Test module for multi-core batch evaluation."""
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from src.calculator.batch import run_batch
+from src.calculator.parallel import evaluate_chunk, run_parallel, split_ranges
+
+SAMPLE = (
+    "+ 3 4\n"
+    "/ 1 0\n"
+    "\n"
+    "* 2 abc\n"
+    "- 10 2.5\r\n"
+    "^ 1 2\n"
+    "/ 9 3\n"
+    "+ 1\n"
+    "* 1e3 -2"
+)
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> str:
+    """Write the sample batch input and return its path."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(SAMPLE.encode("utf-8"))
+    return str(path)
+
+
+class TestSplitRanges:
+    """Test cases for split_ranges."""
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 5, 7, 16, 1000])
+    def test_ranges_cover_file_on_line_boundaries(
+        self, sample_file: str, chunk_bytes: int
+    ) -> None:
+        """Test ranges are contiguous and every range ends after a newline."""
+        data = Path(sample_file).read_bytes()
+        ranges = split_ranges(sample_file, chunk_bytes)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test an empty file has no ranges."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert split_ranges(str(path)) == []
+
+    def test_invalid_chunk_size(self, sample_file: str) -> None:
+        """Test a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError, match="chunk_bytes must be a positive integer."):
+            split_ranges(sample_file, 0)
+
+
+class TestEvaluateChunk:
+    """Test cases for evaluate_chunk."""
+
+    def test_relative_line_numbers(self, sample_file: str) -> None:
+        """Test errors carry line numbers relative to the chunk."""
+        start = SAMPLE.index("/ 1 0")
+        end = SAMPLE.index("/ 9 3")
+        line_count, outputs = evaluate_chunk(sample_file, start, end)
+
+        assert line_count == 5
+        assert outputs == [
+            (1, "Division by zero is not allowed."),
+            (3, "Invalid number: 'abc'. Please enter a valid number."),
+            "7.5\n",
+            (5, "Invalid operation: '^'. Supported operations: +, -, *, /"),
+        ]
+
+
+class TestRunParallel:
+    """Test cases for run_parallel."""
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 8, 1000])
+    def test_matches_serial_output(self, sample_file: str, chunk_bytes: int) -> None:
+        """Test parallel output equals serial output, including line numbers."""
+        serial = StringIO()
+        with open(sample_file, encoding="utf-8") as source:
+            run_batch(source, serial)
+
+        parallel = StringIO()
+        run_parallel(sample_file, parallel, workers=2, chunk_bytes=chunk_bytes)
+
+        assert parallel.getvalue() == serial.getvalue()
+        assert "Error: line 8: Invalid line: '+ 1'." in parallel.getvalue()
+
+    def test_invalid_workers(self, sample_file: str) -> None:
+        """Test a non-positive worker count is rejected."""
+        with pytest.raises(ValueError, match="workers must be a positive integer."):
+            run_parallel(sample_file, StringIO(), workers=0)
+
+    def test_invalid_zero_policy(self, sample_file: str) -> None:
+        """Test unknown division-by-zero policies are rejected."""
+        with pytest.raises(ValueError, match="policy"):
+            run_parallel(sample_file, StringIO(), workers=1, on_zero="raise")
+
+    def test_zero_policy(self, sample_file: str) -> None:
+        """Test the division-by-zero policy reaches the worker processes."""
+        output = StringIO()
+        run_parallel(sample_file, output, workers=2, chunk_bytes=8, on_zero="inf")
+        assert output.getvalue().splitlines()[1] == "inf"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file raises OSError."""
+        with pytest.raises(OSError):
+            run_parallel(str(tmp_path / "missing.txt"), StringIO(), workers=2)
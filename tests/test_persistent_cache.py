@@ -0,0 +1,213 @@
+"""Test module for the SQLite-backed persistent result cache."""
+
+import itertools
+import multiprocessing
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from src.calculator import persistent_cache as persistent_cache_module
+from src.calculator.cache import CachedOperations, ResultCache
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.numeric import (
+    DecimalBackend,
+    FractionBackend,
+    IntegerBackend,
+    NumericOperations,
+)
+from src.calculator.operations import Operations
+from src.calculator.persistent_cache import PersistentCache, backend_identity
+
+
+def stored_rows(path: Path) -> int:
+    """Count the rows another connection sees in a cache file."""
+    with sqlite3.connect(str(path)) as connection:
+        count: int = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    return count
+
+
+def calculate_range(path: str, start: int, stop: int, max_entries: int) -> None:
+    """Calculate ``* n 3`` for n in [start, stop) through a shared cache file."""
+    cache = PersistentCache(path, max_entries, batch_size=7)
+    operations = CachedOperations(cache)
+    for n in range(start, stop):
+        operations.calculate("*", float(n), 3.0)
+    cache.close()
+
+
+class TestPersistentCache:
+    """Test cases for PersistentCache."""
+
+    def test_results_survive_reopening(self, tmp_path: Path) -> None:
+        """Test results stored by one instance are found by the next."""
+        path = str(tmp_path / "cache.db")
+        cache = PersistentCache(path)
+        cache.put(ResultCache.make_key("+", 3.0, 4.0), 7.0)
+        cache.put(ResultCache.make_key("/", 1.0, 0.0), DivisionByZeroError())
+        cache.close()
+
+        cache = PersistentCache(path)
+        assert cache.get(ResultCache.make_key("+", 4.0, 3.0)) == 7.0
+        assert isinstance(
+            cache.get(ResultCache.make_key("/", 1.0, 0.0)), DivisionByZeroError
+        )
+        assert cache.get(ResultCache.make_key("-", 3.0, 4.0)) is None
+        assert (cache.hits, cache.misses) == (2, 1)
+        cache.close()
+
+    def test_backend_identity(self) -> None:
+        """Test backends, and decimal precisions, are told apart."""
+        assert backend_identity(None) == "float"
+        assert backend_identity(IntegerBackend()) == "int"
+        assert backend_identity(FractionBackend()) == "fraction"
+        assert backend_identity(DecimalBackend(5)) == "decimal:5"
+
+    def test_backends_never_share_results(self, tmp_path: Path) -> None:
+        """Test a result is only found by the backend that computed it."""
+        path = str(tmp_path / "cache.db")
+        key = ResultCache.make_key("/", 1, 3)
+        backends = [None, IntegerBackend(), DecimalBackend(5), DecimalBackend(28)]
+        for backend in backends:
+            cache = PersistentCache(path, backend=backend)
+            assert cache.get(key) is None
+            operations = NumericOperations(backend) if backend else Operations()
+            cache.put(key, operations.calculate("/", 1, 3))
+            cache.close()
+
+        cache = PersistentCache(path, backend=DecimalBackend(5))
+        assert cache.get(key) == Decimal("0.33333")
+        assert len(cache) == 4
+        cache.close()
+
+    def test_writes_are_batched(self, tmp_path: Path) -> None:
+        """Test results are written in one transaction per full batch."""
+        path = tmp_path / "cache.db"
+        cache = PersistentCache(str(path), batch_size=3)
+        for n in range(2):
+            cache.put(ResultCache.make_key("+", float(n), 1.0), n + 1.0)
+        assert stored_rows(path) == 0
+        assert cache.get(ResultCache.make_key("+", 1.0, 1.0)) == 2.0
+        cache.put(ResultCache.make_key("+", 2.0, 1.0), 3.0)
+        assert stored_rows(path) == 3
+        cache.close()
+
+    def test_least_recently_used_are_evicted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the file is capped and a looked-up result outlives older ones."""
+        clock = itertools.count()
+        monkeypatch.setattr(
+            persistent_cache_module,
+            "time",
+            SimpleNamespace(time=lambda: float(next(clock))),
+        )
+        monkeypatch.setattr(persistent_cache_module, "TOUCH_INTERVAL", 1.0)
+        path = tmp_path / "cache.db"
+        cache = PersistentCache(str(path), max_entries=3, batch_size=1)
+        keys = [ResultCache.make_key("+", float(n), 1.0) for n in range(5)]
+        for n, key in enumerate(keys[:3]):
+            cache.put(key, n + 1.0)
+        assert cache.get(keys[0]) == 1.0
+        cache.put(keys[3], 4.0)
+        cache.put(keys[4], 5.0)
+        assert [cache.get(key) for key in keys] == [1.0, None, None, 4.0, 5.0]
+        assert cache.evictions == 2
+        assert len(cache) == stored_rows(path) == 3
+        cache.close()
+
+    def test_recent_hits_are_not_written(self, tmp_path: Path) -> None:
+        """Test a hit on a row used within TOUCH_INTERVAL queues no update."""
+        cache = PersistentCache(str(tmp_path / "cache.db"), batch_size=1)
+        cache.put(ResultCache.make_key("+", 1.0, 2.0), 3.0)
+        assert cache.get(ResultCache.make_key("+", 1.0, 2.0)) == 3.0
+        assert not cache._touched
+        cache.close()
+
+    def test_unprintable_numbers_are_not_cached(self, tmp_path: Path) -> None:
+        """Test integers too long for str() are computed but not stored."""
+        cache = PersistentCache(str(tmp_path / "cache.db"), backend=IntegerBackend())
+        huge = 10**5000
+        cache.put(ResultCache.make_key("+", huge, 1), huge + 1)
+        cache.put(ResultCache.make_key("*", 10**2500, 10**2500), huge)
+        assert cache.get(ResultCache.make_key("+", huge, 1)) is None
+        assert cache.get(ResultCache.make_key("*", 10**2500, 10**2500)) is None
+        assert len(cache) == 0
+        cache.close()
+
+    @pytest.mark.parametrize("size", [{"max_entries": 0}, {"batch_size": -1}])
+    def test_invalid_sizes(self, tmp_path: Path, size: dict) -> None:
+        """Test non-positive bounds are rejected."""
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            PersistentCache(str(tmp_path / "cache.db"), **size)
+
+    def test_not_a_database(self, tmp_path: Path) -> None:
+        """Test a file that is not a SQLite database is reported."""
+        path = tmp_path / "cache.db"
+        path.write_text("not a database\n" * 100)
+        with pytest.raises(sqlite3.DatabaseError):
+            PersistentCache(str(path))
+
+    def test_clear_and_stats(self, tmp_path: Path) -> None:
+        """Test clear empties the file and statistics are reported."""
+        cache = PersistentCache(str(tmp_path / "cache.db"))
+        cache.put(ResultCache.make_key("+", 1.0, 2.0), 3.0)
+        cache.get(ResultCache.make_key("+", 1.0, 2.0))
+        cache.get(ResultCache.make_key("+", 1.0, 3.0))
+        assert cache.stats() == {
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "evictions": 0,
+        }
+        assert cache.format_stats() == (
+            "Persistent cache: 1 entries, 1 hits, 1 misses, hit rate 50.0%, "
+            "0 evictions"
+        )
+        cache.clear()
+        assert len(cache) == 0 and cache.hit_rate == 0.0
+        cache.close()
+
+    def test_warm_cache_skips_computation(self, tmp_path: Path) -> None:
+        """Test CachedOperations reuses results from an earlier session."""
+        path = str(tmp_path / "cache.db")
+        backend = FractionBackend()
+        one, three = backend.parse("1"), backend.parse("3")
+        calls = []
+        for _ in range(2):
+            cache = PersistentCache(path, backend=backend)
+            inner = NumericOperations(backend)
+            with patch.object(inner, "calculate", wraps=inner.calculate) as mock:
+                operations = CachedOperations(cache, inner)
+                assert operations.calculate("/", one, three) == backend.parse("1/3")
+                with pytest.raises(DivisionByZeroError):
+                    operations.calculate("/", one, backend.parse("0"))
+            calls.append(mock.call_count)
+            cache.close()
+        assert calls == [2, 0]
+
+    def test_processes_share_a_file(self, tmp_path: Path) -> None:
+        """Test concurrent processes store consistent results within the cap."""
+        path = str(tmp_path / "cache.db")
+        max_entries = 150
+        processes = [
+            multiprocessing.Process(
+                target=calculate_range, args=(path, 50 * i, 50 * i + 100, max_entries)
+            )
+            for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT a, b, result FROM results").fetchall()
+            entries = connection.execute("SELECT entries FROM counts").fetchone()[0]
+        assert len(rows) == entries == max_entries
+        for a, b, result in rows:
+            assert float(result) == float(a) * float(b)
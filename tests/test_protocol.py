@@ -0,0 +1,45 @@
+"""Test module for the line-based request/response protocol."""
+
+import pytest
+from src.calculator.operations import Operations
+from src.calculator.protocol import handle_request, parse_response
+
+
+class TestHandleRequest:
+    """Test cases for handle_request."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("+ 3 4\n", "OK 7.0\n"),
+            ("/ 1 0", "ERR Division by zero is not allowed.\n"),
+            ("^ 1 2", "ERR Invalid operation: '^'. Supported operations: +, -, *, /\n"),
+            (
+                "",
+                "ERR Invalid line: ''. Expected: <operation> <first number> <second number>\n",
+            ),
+        ],
+    )
+    def test_responses(self, line: str, expected: str) -> None:
+        """Test every request gets exactly one OK or ERR response."""
+        assert handle_request(line, Operations.calculate) == expected
+
+
+class TestParseResponse:
+    """Test cases for parse_response."""
+
+    def test_ok(self) -> None:
+        """Test an OK response carries the result."""
+        assert parse_response("OK 7.0\n") == (True, "7.0")
+
+    def test_error(self) -> None:
+        """Test an ERR response carries the message."""
+        assert parse_response("ERR Division by zero is not allowed.\n") == (
+            False,
+            "Division by zero is not allowed.",
+        )
+
+    def test_malformed(self) -> None:
+        """Test anything else is rejected."""
+        with pytest.raises(ValueError, match="Malformed response"):
+            parse_response("HELLO\n")
@@ -0,0 +1,135 @@
+"""Test module for compact calculation records."""
+
+import math
+from array import array
+
+import pytest
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.records import CalculationRecord, RecordBatch
+
+
+def make_batch() -> RecordBatch:
+    """Build a batch of one record per operation: 6 + 2, 6 - 2, 6 * 2, 6 / 2."""
+    return RecordBatch(CalculationRecord.calculate(op, 6.0, 2.0) for op in "+-*/")
+
+
+class TestCalculationRecord:
+    """Test cases for CalculationRecord."""
+
+    def test_calculate(self) -> None:
+        """Test records hold the Operations result."""
+        record = CalculationRecord.calculate("/", 1.0, 4.0)
+        assert (record.operation, record.a, record.b, record.result) == (
+            "/",
+            1.0,
+            4.0,
+            0.25,
+        )
+        with pytest.raises(DivisionByZeroError):
+            CalculationRecord.calculate("/", 1.0, 0.0)
+
+    def test_slots(self) -> None:
+        """Test records have no per-instance dict."""
+        record = CalculationRecord("+", 1.0, 2.0, 3.0)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.note = "x"  # type: ignore[attr-defined]
+
+    def test_equality(self) -> None:
+        """Test records compare by their fields."""
+        record = CalculationRecord("+", 1.0, 2.0, 3.0)
+        assert record == CalculationRecord("+", 1.0, 2.0, 3.0)
+        assert record != CalculationRecord("+", 1.0, 2.0, 4.0)
+        assert record != ("+", 1.0, 2.0, 3.0)
+        assert repr(record) == "CalculationRecord('+', 1.0, 2.0, 3.0)"
+
+
+class TestRecordBatch:
+    """Test cases for RecordBatch."""
+
+    def test_columns(self) -> None:
+        """Test records are stored as opcodes and double columns."""
+        batch = make_batch()
+        assert len(batch) == 4
+        assert batch.opcodes == bytearray([0, 1, 2, 3])
+        assert batch.results == array("d", [8.0, 4.0, 12.0, 3.0])
+        assert batch.nbytes == 4 * 25
+
+    def test_iteration_and_indexing(self) -> None:
+        """Test records are materialized on iteration and indexing."""
+        batch = make_batch()
+        assert [record.result for record in batch] == [8.0, 4.0, 12.0, 3.0]
+        assert batch[1] == CalculationRecord("-", 6.0, 2.0, 4.0)
+        assert batch[-1] == CalculationRecord("/", 6.0, 2.0, 3.0)
+        with pytest.raises(IndexError):
+            batch[4]
+
+    def test_slicing(self) -> None:
+        """Test slices are new batches with copied columns."""
+        batch = make_batch()
+        part = batch[1:4:2]
+        assert isinstance(part, RecordBatch)
+        assert [record.operation for record in part] == ["-", "/"]
+        part.results[0] = 0.0
+        assert batch.results[1] == 4.0
+
+    def test_filter_and_select(self) -> None:
+        """Test records are selected by predicate or by operation."""
+        batch = make_batch()
+        batch.add("*", 1.0, 1.0, 1.0)
+        large = batch.filter(lambda record: record.result > 3.0)
+        assert [record.operation for record in large] == ["+", "-", "*"]
+        products = batch.select("*")
+        assert list(products) == [
+            CalculationRecord("*", 6.0, 2.0, 12.0),
+            CalculationRecord("*", 1.0, 1.0, 1.0),
+        ]
+        assert len(batch.select("/")) == 1
+        with pytest.raises(ValueError, match="Unsupported operation: %"):
+            batch.select("%")
+
+    def test_add_validates_operation(self) -> None:
+        """Test only the calculator's operations can be stored."""
+        batch = RecordBatch()
+        with pytest.raises(ValueError, match="Unsupported operation: %"):
+            batch.add("%", 1.0, 2.0, 3.0)
+        batch.append(CalculationRecord("+", 1.0, 2.0, 3.0))
+        assert len(batch) == 1
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ([1, 2, 3], [2.0, 0.0, 4.0]),
+            (array("d", [1.0, 2.0, 3.0]), [2, 0, 4]),
+            (array("d", [1.0, 2.0, 3.0])[::1], array("d", [2.0, 0.0, 4.0])),
+        ],
+    )
+    def test_calculate_many(self, a: object, b: object) -> None:
+        """Test bulk calculation appends a record per element."""
+        batch = RecordBatch()
+        batch.calculate("/", a, b)
+        assert batch.opcodes == bytearray([3, 3, 3])
+        assert batch.a == array("d", [1.0, 2.0, 3.0])
+        assert batch.b == array("d", [2.0, 0.0, 4.0])
+        assert batch.results[0] == 0.5 and batch.results[2] == 0.75
+        assert math.isnan(batch.results[1])
+
+    def test_calculate_many_broadcasts_and_numpy(self) -> None:
+        """Test scalar operands repeat and NumPy operands are copied."""
+        np = pytest.importorskip("numpy")
+        batch = RecordBatch()
+        batch.calculate("+", np.arange(3.0), 1)
+        batch.calculate("*", 2.0, np.arange(3))
+        batch.calculate("-", np.arange(6.0)[::2], 1.0)
+        assert batch.a.tolist() == [0.0, 1.0, 2.0, 2.0, 2.0, 2.0, 0.0, 2.0, 4.0]
+        assert batch.b.tolist() == [1.0, 1.0, 1.0, 0.0, 1.0, 2.0, 1.0, 1.0, 1.0]
+        assert batch.results.tolist() == [1.0, 2.0, 3.0, 0.0, 2.0, 4.0, -1.0, 1.0, 3.0]
+
+    def test_calculate_many_errors(self) -> None:
+        """Test a failing bulk calculation appends nothing."""
+        batch = RecordBatch()
+        with pytest.raises(DivisionByZeroError):
+            batch.calculate("/", [1.0], [0.0], on_zero="raise")
+        with pytest.raises(ValueError, match="Unsupported operation"):
+            batch.calculate("%", [1.0], [2.0])
+        assert len(batch) == 0
@@ -0,0 +1,178 @@
+"""Test module for the streaming reductions and scans."""
+
+import math
+import random
+from io import StringIO
+from typing import Iterator, List
+
+import pytest
+from src.calculator.defaults import REDUCTIONS
+from src.calculator.exceptions import InvalidNumberError
+from src.calculator.reductions import (
+    CompensatedSum,
+    NumberReader,
+    reduce_values,
+    run_reduction,
+    scan_values,
+)
+
+# Naive left-to-right float addition gets 0.0 for this sum; the exact
+# answer is 2.0.
+CANCELLING = [1.0, 1e100, 1.0, -1e100]
+
+
+class TestCompensatedSum:
+    """Test cases for CompensatedSum."""
+
+    def test_recovers_lost_bits(self) -> None:
+        """Test small terms absorbed by a large one are not lost."""
+        accumulator = CompensatedSum()
+        for value in CANCELLING:
+            accumulator.add(value)
+        assert accumulator.value == 2.0
+
+    def test_many_small_terms(self) -> None:
+        """Test the error does not grow with the number of terms."""
+        accumulator = CompensatedSum()
+        for _ in range(100_000):
+            accumulator.add(0.1)
+        assert accumulator.value == math.fsum([0.1] * 100_000)
+
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            ([1.0, math.inf, 2.0], math.inf),
+            ([math.inf, -math.inf], math.nan),
+            ([1e308, 1e308, -1e308], math.inf),
+            ([1.0, math.nan], math.nan),
+        ],
+    )
+    def test_special_values(self, values: List[float], expected: float) -> None:
+        """Test infinities, NaN and overflow behave like float addition."""
+        accumulator = CompensatedSum()
+        for value in values:
+            accumulator.add(value)
+        assert accumulator.value == expected or (
+            math.isnan(expected) and math.isnan(accumulator.value)
+        )
+
+
+class TestReduceValues:
+    """Test cases for reduce_values."""
+
+    @pytest.mark.parametrize("block_size", [1, 3, 4096])
+    def test_sum_is_compensated(self, block_size: int) -> None:
+        """Test sums match math.fsum whatever the block size."""
+        rng = random.Random(7)
+        values = [rng.uniform(-1, 1) * 10 ** rng.randint(-10, 10) for _ in range(5000)]
+        assert reduce_values("sum", values, block_size) == math.fsum(values)
+        assert reduce_values("sum", CANCELLING, block_size) == 2.0
+
+    @pytest.mark.parametrize(
+        "reduction, expected",
+        [("sum", 10.0), ("prod", 24.0), ("min", 1.0), ("max", 4.0)],
+    )
+    def test_reductions(self, reduction: str, expected: float) -> None:
+        """Test every reduction over a small input and across blocks."""
+        assert reduce_values(reduction, [3.0, 1.0, 4.0, 2.0]) == expected
+        assert reduce_values(reduction, [3.0, 1.0, 4.0, 2.0], block_size=3) == expected
+
+    def test_empty_inputs(self) -> None:
+        """Test empty sums and products are the identities."""
+        assert reduce_values("sum", []) == 0.0
+        assert reduce_values("prod", []) == 1.0
+        for reduction in ("min", "max"):
+            with pytest.raises(ValueError, match="empty"):
+                reduce_values(reduction, [])
+
+    def test_nan_propagates(self) -> None:
+        """Test min and max are NaN when any value is NaN."""
+        assert math.isnan(reduce_values("min", [1.0, math.nan, -1.0]))
+        assert math.isnan(reduce_values("max", [1.0, 2.0, math.nan], block_size=2))
+
+    def test_sum_special_values(self) -> None:
+        """Test blocks that fsum rejects still follow float semantics."""
+        assert math.isnan(reduce_values("sum", [math.inf, 1.0, -math.inf]))
+        assert reduce_values("sum", [1e308, 1e308, 1.0]) == math.inf
+
+    def test_consumes_lazily(self) -> None:
+        """Test the input is consumed as a stream, not materialized."""
+
+        def numbers() -> Iterator[float]:
+            for value in range(1, 100_001):
+                yield float(value)
+
+        assert reduce_values("sum", numbers()) == 5000050000.0
+
+    def test_invalid_arguments(self) -> None:
+        """Test unknown reductions and block sizes are rejected."""
+        with pytest.raises(ValueError, match="Unsupported reduction"):
+            reduce_values("mean", [1.0])
+        with pytest.raises(ValueError, match="block_size"):
+            reduce_values("sum", [1.0], block_size=0)
+
+
+class TestScanValues:
+    """Test cases for scan_values."""
+
+    @pytest.mark.parametrize(
+        "reduction, expected",
+        [
+            ("sum", [3.0, 4.0, 8.0, 10.0]),
+            ("prod", [3.0, 3.0, 12.0, 24.0]),
+            ("min", [3.0, 1.0, 1.0, 1.0]),
+            ("max", [3.0, 3.0, 4.0, 4.0]),
+        ],
+    )
+    def test_running_values(self, reduction: str, expected: List[float]) -> None:
+        """Test every prefix reduction."""
+        assert list(scan_values(reduction, [3.0, 1.0, 4.0, 2.0])) == expected
+
+    def test_sum_scan_is_compensated(self) -> None:
+        """Test running sums recover the bits naive addition loses."""
+        assert list(scan_values("sum", CANCELLING))[-1] == 2.0
+
+    def test_nan_sticks(self) -> None:
+        """Test a running min stays NaN after a NaN."""
+        result = list(scan_values("min", [2.0, math.nan, 1.0]))
+        assert result[0] == 2.0
+        assert all(math.isnan(value) for value in result[1:])
+
+    def test_matches_reduce(self) -> None:
+        """Test the last running value equals the reduction."""
+        values = [0.5, -2.0, 7.25, 3.0]
+        for reduction in REDUCTIONS:
+            assert list(scan_values(reduction, values))[-1] == reduce_values(
+                reduction, values
+            )
+
+    def test_invalid_reduction(self) -> None:
+        """Test unknown reductions are rejected before iterating."""
+        with pytest.raises(ValueError, match="Unsupported reduction"):
+            scan_values("mean", [1.0])
+
+
+class TestNumberReader:
+    """Test cases for NumberReader and run_reduction."""
+
+    def test_reads_numbers_and_skips_blanks(self) -> None:
+        """Test one number per line is read and blank lines are skipped."""
+        reader = NumberReader(StringIO("1\n\n  2.5 \n-inf\n"))
+        assert list(reader) == [1.0, 2.5, -math.inf]
+        assert reader.line_number == 4
+
+    def test_invalid_line(self) -> None:
+        """Test a bad line raises InvalidNumberError at its line number."""
+        reader = NumberReader(StringIO("1\n2\nabc\n4\n"))
+        with pytest.raises(InvalidNumberError):
+            list(reader)
+        assert reader.line_number == 3
+
+    @pytest.mark.parametrize(
+        "scan, expected", [(False, "6.0\n"), (True, "1.0\n3.0\n6.0\n")]
+    )
+    def test_run_reduction(self, scan: bool, expected: str) -> None:
+        """Test the total or the running values are written."""
+        output = StringIO()
+        run_reduction("sum", NumberReader(StringIO("1\n2\n3\n")), output, scan)
+        assert output.getvalue() == expected
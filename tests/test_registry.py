@@ -0,0 +1,283 @@
+"""Test module for the operation registry and its plugins."""
+
+import math
+import sys
+from fractions import Fraction
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from src.calculator.batch import evaluate_lines as evaluate_batch
+from src.calculator.binary import HEADER, MAGIC, encode_text
+from src.calculator.engine import Engine
+from src.calculator.evaluation import (
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_INVALID_NUMBER,
+    STATUS_INVALID_OPERATION,
+    STATUS_OK,
+    evaluate_line,
+    evaluate_line_with_error,
+    evaluate_lines,
+    status_message,
+)
+from src.calculator.exceptions import (
+    DivisionByZeroError,
+    InvalidOperationError,
+    OperationPluginCallError,
+    OperationPluginError,
+)
+from src.calculator.numeric import FractionBackend, NumericOperations
+from src.calculator.operations import Operations
+from src.calculator.registry import (
+    BUILTIN_OPERATIONS,
+    OPERATION_SYMBOLS,
+    REGISTRY,
+    OperationRegistry,
+    builtin_opcode,
+)
+from src.calculator.validator import Validator
+
+PLUGIN_MODULE = "calc_test_plugins"
+
+ENTRY_POINTS = f"""\
+[calculator.operations]
+% = {PLUGIN_MODULE}:modulo
+^ = {PLUGIN_MODULE}:power
++ = {PLUGIN_MODULE}:power
+x y = {PLUGIN_MODULE}:power
+broken = calc_test_missing:modulo
+value = {PLUGIN_MODULE}:VALUE
+"""
+
+PLUGIN_SOURCE = """\
+VALUE = 3
+
+
+def modulo(a, b):
+    return a % b
+
+
+def power(a, b):
+    return a**b
+"""
+
+
+@pytest.fixture
+def plugins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Install a distribution with operation entry points on sys.path."""
+    dist_info = tmp_path / "calc_test_plugins-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Name: calc-test-plugins\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS)
+    (tmp_path / f"{PLUGIN_MODULE}.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    table = dict(REGISTRY.table)
+    REGISTRY._entry_points = None
+    yield
+    REGISTRY.table.clear()
+    REGISTRY.table.update(table)
+    REGISTRY._entry_points = None
+    sys.modules.pop(PLUGIN_MODULE, None)
+
+
+class TestOperationRegistry:
+    """Test cases for OperationRegistry without plugins."""
+
+    def test_builtins(self) -> None:
+        """Test the four built-in operations are registered in order."""
+        registry = OperationRegistry(None)
+        assert registry.symbols() == ["+", "-", "*", "/"]
+        assert registry.describe() == "+, -, *, /"
+        assert registry.get("-")(5, 3) == 2  # type: ignore[misc]
+        assert registry.get("/")(1, 4) == 0.25  # type: ignore[misc]
+        with pytest.raises(DivisionByZeroError):
+            registry.get("/")(1, 0)  # type: ignore[misc]
+        assert registry.get("%") is None
+        assert "*" in registry and "%" not in registry
+
+    def test_builtins_are_the_operations_methods(self) -> None:
+        """Test the registry and the opcodes are built from Operations."""
+        assert BUILTIN_OPERATIONS == {
+            "+": Operations.add,
+            "-": Operations.subtract,
+            "*": Operations.multiply,
+            "/": Operations.divide,
+        }
+        assert [builtin_opcode(symbol) for symbol in OPERATION_SYMBOLS] == [0, 1, 2, 3]
+        with pytest.raises(ValueError) as info:
+            builtin_opcode("%")
+        assert str(info.value) == (
+            "Unsupported operation: %. Bulk evaluation only supports the "
+            "built-in operations: +, -, *, /"
+        )
+
+    def test_register(self) -> None:
+        """Test registered operations are dispatched and listed after built-ins."""
+        registry = OperationRegistry(None)
+        registry.register("max", max)
+        registry.register("//", lambda a, b: a // b)
+        assert registry.describe() == "+, -, *, /, //, max"
+        assert registry.table["max"](2, 5) == 5
+        with pytest.raises(DivisionByZeroError):
+            registry.table["//"](1, 0)
+
+    def test_plugin_failures_are_wrapped(self) -> None:
+        """Test unexpected exceptions of a plugin become OperationPluginCallError."""
+        registry = OperationRegistry(None)
+        registry.register("max", max)
+        with pytest.raises(OperationPluginCallError) as info:
+            registry.table["max"](1, "a")
+        assert isinstance(info.value.error, TypeError)
+        assert info.value.message.startswith(
+            "Operation 'max' from builtins:max failed: "
+        )
+        registry.register("div", lambda a, b: Operations.calculate("/", a, b))
+        with pytest.raises(DivisionByZeroError):
+            registry.table["div"](1.0, 0.0)
+
+    @pytest.mark.parametrize("symbol", ["", "a b", "x=y", "+"])
+    def test_register_rejects_symbols(self, symbol: str) -> None:
+        """Test symbols must be single tokens and built-ins cannot be replaced."""
+        with pytest.raises(ValueError):
+            OperationRegistry(None).register(symbol, max)
+
+
+@pytest.mark.usefixtures("plugins")
+class TestPlugins:
+    """Test cases for operations discovered through entry points."""
+
+    def test_discovery_does_not_import(self) -> None:
+        """Test plugins are listed without importing their modules."""
+        registry = OperationRegistry()
+        assert registry.describe() == "+, -, *, /, %, ^, broken, value"
+        assert "%" in registry and "x y" not in registry
+        assert PLUGIN_MODULE not in sys.modules
+        assert "%" not in registry.table
+
+    def test_loaded_on_first_use(self) -> None:
+        """Test a plugin is imported once, on first lookup, into the table."""
+        registry = OperationRegistry()
+        modulo = registry.get("%")
+        assert PLUGIN_MODULE in sys.modules
+        assert registry.table["%"] is modulo
+        assert registry.get("%") is modulo
+        assert modulo(7, 3) == 1  # type: ignore[misc]
+        with pytest.raises(DivisionByZeroError):
+            modulo(7, 0)  # type: ignore[misc]
+        assert registry.get("+")(2, 3) == 5  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "symbol, reason", [("broken", "calc_test_missing"), ("value", "not callable")]
+    )
+    def test_load_errors(self, symbol: str, reason: str) -> None:
+        """Test a plugin that cannot be loaded raises OperationPluginError."""
+        with pytest.raises(OperationPluginError) as info:
+            OperationRegistry().get(symbol)
+        assert info.value.message.startswith(f"Cannot load operation '{symbol}'")
+        assert reason in info.value.message
+
+    def test_validator_and_operations(self) -> None:
+        """Test plugin operations are validated and calculated like built-ins."""
+        assert Validator.validate_line("% 7 3") == ("%", 7.0, 3.0)
+        assert Operations.calculate("%", 7.0, 3.0) == 1.0
+        assert "%" in Validator.VALID_OPERATIONS
+        with pytest.raises(ValueError, match="Unsupported operation: ?"):
+            Operations.calculate("?", 1.0, 2.0)
+        assert InvalidOperationError("?").message == (
+            "Invalid operation: '?'. Supported operations: +, -, *, /, %, ^, "
+            "broken, value"
+        )
+
+    def test_backends(self) -> None:
+        """Test plugins receive the backend's numbers."""
+        assert NumericOperations(FractionBackend()).calculate(
+            "^", Fraction(1, 2), Fraction(2)
+        ) == Fraction(1, 4)
+        assert Engine().calculate("^", 2.0, 10.0) == 1024.0
+        with pytest.raises(ValueError, match="Unsupported operation: ?"):
+            NumericOperations().calculate("?", 1.0, 2.0)
+
+    def test_evaluate_line(self) -> None:
+        """Test the non-raising path computes plugins and classifies failures."""
+        assert evaluate_line("% 7 3") == (STATUS_OK, 1.0)
+        status, value = evaluate_line("% 7 0")
+        assert status == STATUS_DIVISION_BY_ZERO and math.isnan(value)
+        assert evaluate_line("% 7 0", "inf") == (STATUS_OK, math.inf)
+        assert evaluate_line("% x 1")[0] == STATUS_INVALID_NUMBER
+        assert evaluate_line("? x 1")[0] == STATUS_INVALID_OPERATION
+        assert evaluate_line("? 1 1")[0] == STATUS_INVALID_OPERATION
+        assert evaluate_line("broken 1 2")[0] == STATUS_INVALID_OPERATION
+        assert status_message(STATUS_INVALID_OPERATION, "broken 1 2").startswith(
+            "Cannot load operation 'broken'"
+        )
+        assert status_message(STATUS_INVALID_OPERATION, "? 1 2").startswith(
+            "Invalid operation: '?'"
+        )
+
+    def test_evaluate_line_plugin_failure(self) -> None:
+        """Test a plugin that raises while computing reports its error."""
+        status, value, error = evaluate_line_with_error("^ 10 1000")
+        assert status == STATUS_INVALID_OPERATION and math.isnan(value)
+        assert isinstance(error, OperationPluginCallError)
+        assert status_message(status, "^ 10 1000", error).startswith(
+            f"Operation '^' from {PLUGIN_MODULE}:power failed: "
+        )
+        with pytest.raises(ValueError, match="does not fail"):
+            status_message(status, "^ 10 1000")
+        with pytest.raises(OperationPluginCallError):
+            Operations.calculate("^", 10.0, 1000.0)
+
+    def test_failed_plugin_is_not_called_again(self) -> None:
+        """Test failed lines report the plugin's own error without a retry."""
+        calls = []
+
+        def counting(a: float, b: float) -> float:
+            calls.append((a, b))
+            raise RuntimeError(f"call {len(calls)}")
+
+        REGISTRY.register("count", counting)
+        [(line_number, message)] = evaluate_lines(["count 1 2"]).errors()
+        assert line_number == 1 and message.endswith("counting failed: call 1")
+        [output] = evaluate_batch([(1, "count 1 2")])
+        assert output.endswith("counting failed: call 2\n")
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("result", [None, "abc", 10**400])
+    def test_plugin_result_that_is_not_a_number(self, result: object) -> None:
+        """Test a plugin result float() rejects is a line error, not a crash."""
+
+        def bad(a: float, b: float) -> object:
+            return result
+
+        REGISTRY.register("bad", bad)
+        status, value, error = evaluate_line_with_error("bad 1 2")
+        assert status == STATUS_INVALID_OPERATION and math.isnan(value)
+        assert isinstance(error, OperationPluginCallError)
+        outputs = list(evaluate_batch([(1, "bad 1 2"), (2, "+ 1 2")]))
+        assert outputs[0].startswith("Error: line 1: Operation 'bad' from ")
+        assert outputs[1] == "3.0\n"
+
+    def test_binary_encoding_reports_plugin_lines(self) -> None:
+        """Test plugin lines are reported, not encoded, in binary operand files."""
+        destination = BytesIO()
+        assert encode_text(StringIO("% 7 3\n+ 1 2\n"), destination) == [
+            (
+                1,
+                "Unsupported operation: %. Bulk evaluation only supports the "
+                "built-in operations: +, -, *, /",
+            )
+        ]
+        assert HEADER.unpack_from(destination.getvalue()) == (MAGIC, 1)
+
+    def test_scan_lines_reports_plugin_lines(self) -> None:
+        """Test the bulk scanner reports the plugin lines it counts as failed."""
+        scan = Validator.scan_lines("% 7 3\n+ 1 2\n")
+        assert scan.line_numbers.tolist() == [2]
+        assert list(scan.errors()) == [
+            (
+                1,
+                "Unsupported operation: %. Bulk evaluation only supports the "
+                "built-in operations: +, -, *, /",
+            )
+        ]
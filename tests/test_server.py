@@ -0,0 +1,135 @@
+"""Test module for the asyncio calculator server."""
+
+import asyncio
+import os
+import signal
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+from src.calculator.cache import CachedOperations
+from src.calculator.server import (
+    MAX_LINE_BYTES,
+    CalculatorServer,
+    run_server,
+    serve,
+)
+
+
+async def exchange(port: int, requests: List[str]) -> List[str]:
+    """Pipeline requests on one connection and collect the responses."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(requests).encode())
+    await writer.drain()
+    responses = [(await reader.readline()).decode() for _ in requests]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+class TestCalculatorServer:
+    """Test cases for CalculatorServer."""
+
+    def test_pipelined_requests(self) -> None:
+        """Test pipelined requests are answered in order."""
+
+        async def scenario() -> List[str]:
+            server = CalculatorServer(port=0)
+            await server.start()
+            try:
+                return await exchange(
+                    server.port, ["+ 3 4\n", "/ 1 0\n", "* 2 2.5\n", "x\n"]
+                )
+            finally:
+                await server.close()
+
+        assert asyncio.run(scenario()) == [
+            "OK 7.0\n",
+            "ERR Division by zero is not allowed.\n",
+            "OK 5.0\n",
+            "ERR Invalid line: 'x'. Expected: <operation> <first number> "
+            "<second number>\n",
+        ]
+
+    def test_many_concurrent_connections(self) -> None:
+        """Test concurrent clients are served independently."""
+
+        async def scenario() -> List[List[str]]:
+            server = CalculatorServer(port=0, operations=CachedOperations())
+            await server.start()
+            try:
+                return await asyncio.gather(
+                    *(exchange(server.port, [f"+ {n} 1\n"] * 3) for n in range(50))
+                )
+            finally:
+                await server.close()
+
+        results = asyncio.run(scenario())
+        assert results == [[f"OK {n + 1.0}\n"] * 3 for n in range(50)]
+
+    def test_line_too_long(self) -> None:
+        """Test an over-long request is rejected and the connection closed."""
+
+        async def scenario() -> List[bytes]:
+            server = CalculatorServer(port=0)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(b"1" * (MAX_LINE_BYTES + 10) + b"\n")
+                await writer.drain()
+                response = await reader.readline()
+                remainder = await reader.read()
+                writer.close()
+                return [response, remainder]
+            finally:
+                await server.close()
+
+        assert asyncio.run(scenario()) == [b"ERR Request line too long.\n", b""]
+
+    def test_graceful_shutdown_closes_idle_connections(self) -> None:
+        """Test shutdown flushes responses and closes open connections."""
+
+        async def scenario() -> List[bytes]:
+            server = CalculatorServer(port=0)
+            await server.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"- 5 2\n")
+            await writer.drain()
+            first = await reader.readline()
+
+            waiter = asyncio.ensure_future(server.serve_until_shutdown())
+            server.request_shutdown()
+            await asyncio.wait_for(waiter, timeout=5)
+            rest = await reader.read()
+            writer.close()
+            return [first, rest]
+
+        assert asyncio.run(scenario()) == [b"OK 3.0\n", b""]
+
+    def test_lifecycle_before_start(self) -> None:
+        """Test port, request_shutdown and close before start are harmless."""
+        server = CalculatorServer(port=1234)
+        assert server.port == 1234
+        server.request_shutdown()
+        asyncio.run(server.close())
+
+
+class TestServe:
+    """Test cases for serve and run_server."""
+
+    def test_serve_stops_on_sigterm(self, capsys: object) -> None:
+        """Test serve shuts down gracefully on SIGTERM."""
+
+        async def scenario() -> None:
+            task = asyncio.ensure_future(serve("127.0.0.1", 0))
+            await asyncio.sleep(0.2)
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(task, timeout=5)
+
+        asyncio.run(scenario())
+        assert "Serving on 127.0.0.1:" in capsys.readouterr().err  # type: ignore
+
+    def test_run_server(self) -> None:
+        """Test run_server runs serve in a fresh event loop."""
+        with patch("src.calculator.server.serve", new_callable=AsyncMock) as mock:
+            run_server("127.0.0.1", 9999)
+        mock.assert_awaited_once_with("127.0.0.1", 9999, None)
@@ -0,0 +1,87 @@
+"""Test module for the startup-time budget."""
+
+import subprocess
+import sys
+from typing import Set
+
+from benchmarks.bench_startup import ROOT, import_time_us, time_to_prompt
+
+# Best-of-three cumulative ``-X importtime`` figure for src.calculator.main.
+# It is about 20 ms on a development machine; the budget leaves headroom for
+# slow CI runners while still catching an eagerly imported mode.
+IMPORT_BUDGET_MS = 100
+
+# Wall-clock budget from process start to the first REPL prompt.
+PROMPT_BUDGET_MS = 1000
+
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "importlib.metadata",
+    "mmap",
+    "numpy",
+    "sqlite3",
+    "subprocess",
+    "threading",
+)
+
+
+def loaded_modules(module: str) -> Set[str]:
+    """Import a module in a fresh interpreter and list sys.modules."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print('\\n'.join(sys.modules))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(completed.stdout.split())
+
+
+class TestLazyImports:
+    """Test each mode only imports what it needs."""
+
+    def test_repl_skips_other_modes(self) -> None:
+        """Test importing the CLI loads no mode-specific dependencies."""
+        modules = loaded_modules("src.calculator.main")
+        assert not modules.intersection(HEAVY_MODULES)
+        for mode in (
+            "batch",
+            "binary",
+            "cache",
+            "cluster",
+            "csvfile",
+            "daemon",
+            "digits",
+            "history",
+            "metrics",
+            "numeric",
+            "persistent_cache",
+            "reductions",
+            "variables",
+            "server",
+        ):
+            assert f"src.calculator.{mode}" not in modules
+
+    def test_client_skips_daemon_server(self) -> None:
+        """Test the eval client does not import asyncio or the server."""
+        modules = loaded_modules("src.calculator.client")
+        assert "asyncio" not in modules
+        assert "src.calculator.server" not in modules
+        assert "subprocess" not in modules
+
+
+class TestStartupBudget:
+    """Test startup stays within its time budget."""
+
+    def test_import_time(self) -> None:
+        """Test importing the CLI stays under IMPORT_BUDGET_MS."""
+        assert import_time_us(repeat=3) < IMPORT_BUDGET_MS * 1000
+
+    def test_time_to_first_prompt(self) -> None:
+        """Test the REPL prompts within PROMPT_BUDGET_MS."""
+        assert time_to_prompt(repeat=3) < PROMPT_BUDGET_MS / 1000
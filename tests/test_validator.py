@@ -1,8 +1,20 @@
 """Test module for input validator."""
 
+import math
+from decimal import Decimal
+from fractions import Fraction
+from typing import List, Tuple
+
 import pytest
+from src.calculator.numeric import DecimalBackend, FractionBackend, IntegerBackend
+from src.calculator.registry import OPCODES
 from src.calculator.validator import Validator
-from src.calculator.exceptions import InvalidOperationError, InvalidNumberError
+from src.calculator.exceptions import (
+    CalculatorError,
+    InvalidLineError,
+    InvalidOperationError,
+    InvalidNumberError,
+)
 
 
 class TestValidator:
@@ -195,3 +207,162 @@ class TestValidator:
         assert Validator.validate_number("5") == 5.0
         assert Validator.is_quit_command("quit") is True
         assert Validator.sanitize_input("  TEST  ") == "test"
+
+
+# Operand forms shared by the per-token and bulk parity tests.
+NUMBER_FORMS = [
+    "5",
+    "-3.14",
+    "+2",
+    "5e2",
+    "1.23E-4",
+    ".5",
+    "5.",
+    "1_000",
+    "inf",
+    "-Infinity",
+    "nan",
+    "abc",
+    "5abc",
+    "--5",
+    "5.5.5",
+    "1,000",
+    "0x10",
+    "$5",
+]
+OPERATION_FORMS = ["+", "-", "*", "/", "^", "//", "add"]
+
+
+def per_token(lines: List[str]) -> Tuple[list, list]:
+    """Validate lines one at a time, as the per-token path does."""
+    records = []
+    errors = []
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            records.append((line_number, *Validator.validate_line(line)))
+        except CalculatorError as e:
+            errors.append((line_number, str(e)))
+    return records, errors
+
+
+def same_records(left: list, right: list) -> bool:
+    """Compare record lists, treating NaN operands as equal."""
+    return len(left) == len(right) and all(
+        a[:2] == b[:2]
+        and all(
+            x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(a[2:], b[2:])
+        )
+        for a, b in zip(left, right)
+    )
+
+
+class TestValidateLine:
+    """Test cases for validate_line."""
+
+    def test_valid_line(self) -> None:
+        """Test a valid line is split into its validated fields."""
+        assert Validator.validate_line("  *  2  -1.5e1 \n") == ("*", 2.0, -15.0)
+
+    @pytest.mark.parametrize(
+        "line, error",
+        [
+            ("+ 1", InvalidLineError),
+            ("+ 1 2 3", InvalidLineError),
+            ("^ 1 2", InvalidOperationError),
+            ("+ 1 x", InvalidNumberError),
+        ],
+    )
+    def test_invalid_line(self, line: str, error: type) -> None:
+        """Test each invalid line raises the matching error."""
+        with pytest.raises(error):
+            Validator.validate_line(line)
+
+    def test_numeric_backend(self) -> None:
+        """Test operands are parsed with the given numeric backend."""
+        assert Validator.validate_line("/ 1/3 0.5", FractionBackend()) == (
+            "/",
+            Fraction(1, 3),
+            Fraction(1, 2),
+        )
+
+
+class TestValidateNumberBackends:
+    """Test cases for validate_number with a numeric backend."""
+
+    def test_integer_backend(self) -> None:
+        """Test the int backend keeps integer literals exact."""
+        value = Validator.validate_number(" 12345678901234567890 ", IntegerBackend())
+        assert value == 12345678901234567890
+        assert type(value) is int
+
+    def test_decimal_backend(self) -> None:
+        """Test the decimal backend parses to Decimal."""
+        assert Validator.validate_number("0.1", DecimalBackend()) == Decimal("0.1")
+
+    @pytest.mark.parametrize("value", ["abc", "", "1/0"])
+    def test_invalid_numbers(self, value: str) -> None:
+        """Test backend parse failures become InvalidNumberError."""
+        with pytest.raises(InvalidNumberError):
+            Validator.validate_number(value, FractionBackend())
+
+
+class TestScanLines:
+    """Test cases for the bulk scan_lines scanner."""
+
+    def test_parallel_arrays(self) -> None:
+        """Test valid records land in parallel arrays by line number."""
+        scan = Validator.scan_lines("+ 3 4\n\nbad\n/ 1 0\n")
+
+        assert len(scan) == 2
+        assert list(scan.opcodes) == [OPCODES["+"], OPCODES["/"]]
+        assert scan.first.tolist() == [3.0, 1.0]
+        assert scan.second.tolist() == [4.0, 0.0]
+        assert scan.line_numbers.tolist() == [1, 4]
+        assert scan.error_lines.tolist() == [3]
+        assert list(scan.records()) == [(1, "+", 3.0, 4.0), (4, "/", 1.0, 0.0)]
+
+    def test_line_iterable_and_first_line(self) -> None:
+        """Test an iterable of lines and a line number offset."""
+        scan = Validator.scan_lines(["* 2 3\n", "+ 1\n"], first_line=10)
+        assert scan.line_numbers.tolist() == [10]
+        assert list(scan.errors()) == [
+            (
+                11,
+                "Invalid line: '+ 1'. Expected: <operation> <first number> "
+                "<second number>",
+            )
+        ]
+
+    def test_number_form_parity(self) -> None:
+        """Test every operation/number combination matches the per-token path."""
+        lines = [
+            f" {operation}\t{first} {second} "
+            for operation in OPERATION_FORMS
+            for first in NUMBER_FORMS
+            for second in NUMBER_FORMS[::3]
+        ]
+        records, errors = per_token(lines)
+        scan = Validator.scan_lines(lines)
+
+        assert same_records(list(scan.records()), records)
+        assert list(scan.errors()) == errors
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "\n\n",
+            "+ 1\n+ 1 2 3\n  \n\t\n",
+            "+ 3 4\r\n- 1e3 -inf\r\n",
+            "/ 1 0\n* nan 2\n+ 1 2 # comment\n",
+        ],
+    )
+    def test_buffer_parity(self, text: str) -> None:
+        """Test whole buffers match the per-token path line for line."""
+        records, errors = per_token(text.splitlines())
+        scan = Validator.scan_lines(text)
+
+        assert same_records(list(scan.records()), records)
+        assert list(scan.errors()) == errors
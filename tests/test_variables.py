@@ -0,0 +1,152 @@
+"""Test module for named variables and the dependency graph."""
+
+from decimal import Decimal
+from typing import List
+
+import pytest
+from src.calculator.exceptions import (
+    CircularReferenceError,
+    DivisionByZeroError,
+    InvalidExpressionError,
+    UndefinedVariableError,
+)
+from src.calculator.numeric import DecimalBackend, IntegerBackend
+from src.calculator.variables import VariableGraph, parse_assignment
+
+
+class TestParseAssignment:
+    """Test cases for parse_assignment."""
+
+    def test_splits_name_and_formula(self) -> None:
+        """Test the name is stripped and the formula kept."""
+        assert parse_assignment(" x = a * b") == ("x", " a * b")
+
+    @pytest.mark.parametrize("statement", ["a * b", "= 1", "2x = 1", "a b = 1"])
+    def test_invalid(self, statement: str) -> None:
+        """Test statements without a single name before '=' are rejected."""
+        with pytest.raises(InvalidExpressionError, match="<name> = <expression>"):
+            parse_assignment(statement)
+
+
+class TestVariableGraph:
+    """Test cases for VariableGraph."""
+
+    def setup_method(self) -> None:
+        """Set up a small graph: x = a * b, y = x + a, z = b - 1."""
+        self.graph = VariableGraph()
+        for statement in ("a = 2", "b = 3", "x = a * b", "y = x + a", "z = b - 1"):
+            self.graph.assign(statement)
+
+    def test_values(self) -> None:
+        """Test formulas are evaluated from the values they read."""
+        assert [self.graph.get(name) for name in "abxyz"] == [2, 3, 6, 8, 2]
+        assert list(self.graph) == ["a", "b", "x", "y", "z"]
+        assert len(self.graph) == 5
+        assert "x" in self.graph and "w" not in self.graph
+
+    def test_formula(self) -> None:
+        """Test a variable's formula text is kept."""
+        assert self.graph.formula("y") == " x + a"
+        self.graph.set_value("y", 1.0)
+        assert self.graph.formula("y") is None
+        with pytest.raises(UndefinedVariableError):
+            self.graph.formula("w")
+
+    def test_update_recomputes_only_downstream(self) -> None:
+        """Test only the variables reading a changed one are recomputed."""
+        assert self.graph.set_value("a", 10.0) == ["a", "x", "y"]
+        assert self.graph.get("y") == 40.0
+        assert self.graph.set_value("b", 5.0)[0] == "b"
+        assert sorted(self.graph.assign("b = 1")) == ["b", "x", "y", "z"]
+        assert self.graph.get("z") == 0.0
+
+    def test_topological_order(self) -> None:
+        """Test a variable is recomputed after everything it reads."""
+        self.graph.assign("w = y + x")
+        order = self.graph.set_value("a", 1.0)
+        assert order.index("x") < order.index("y") < order.index("w")
+        assert self.graph.get("w") == 7.0
+
+    def test_redefinition_moves_edges(self) -> None:
+        """Test a new formula stops depending on what the old one read."""
+        self.graph.assign("x = b + 1")
+        assert self.graph.set_value("a", 0.0) == ["a", "y"]
+        self.graph.set_value("x", 100.0)
+        assert self.graph.set_value("b", 0.0) == ["b", "z"]
+        assert self.graph.get("y") == 100.0
+
+    def test_long_chain(self) -> None:
+        """Test chains deeper than the recursion limit are recomputed."""
+        graph = VariableGraph()
+        graph.set_value("c0", 0.0)
+        for i in range(1, 5000):
+            graph.set_formula(f"c{i}", f"c{i - 1} + 1")
+        assert len(graph.set_value("c0", 1.0)) == 5000
+        assert graph.get("c4999") == 5000.0
+
+    @pytest.mark.parametrize(
+        "statement, cycle",
+        [
+            ("a = a + 1", ["a", "a"]),
+            ("b = y", ["b", "y", "x", "b"]),
+            ("b = z * 2", ["b", "z", "b"]),
+        ],
+    )
+    def test_cycles_are_rejected(self, statement: str, cycle: List[str]) -> None:
+        """Test a formula creating a cycle is rejected and changes nothing."""
+        with pytest.raises(CircularReferenceError) as exc_info:
+            self.graph.assign(statement)
+        assert exc_info.value.cycle == cycle
+        assert exc_info.value.message == f"Circular reference: {' -> '.join(cycle)}."
+        assert self.graph.get("a") == 2.0 and self.graph.get("b") == 3.0
+        assert self.graph.set_value("a", 1.0) == ["a", "x", "y"]
+
+    def test_shared_input_without_cycle(self) -> None:
+        """Test an input read along several paths may become a formula."""
+        assert self.graph.assign("a = b + 1") == ["a", "x", "y"]
+        assert self.graph.get("y") == 16.0
+
+    def test_undefined_reference(self) -> None:
+        """Test a formula may only read defined variables."""
+        with pytest.raises(UndefinedVariableError) as exc_info:
+            self.graph.assign("w = a + v")
+        assert exc_info.value.message == "Undefined variable: 'v'."
+        assert "w" not in self.graph
+        with pytest.raises(UndefinedVariableError):
+            self.graph.get("w")
+
+    @pytest.mark.parametrize("name", ["inf", "NaN", "1x", "a-b"])
+    def test_invalid_names(self, name: str) -> None:
+        """Test names that are constants or not identifiers are rejected."""
+        with pytest.raises(InvalidExpressionError, match="variable name"):
+            self.graph.set_value(name, 1.0)
+
+    def test_errors_propagate_and_clear(self) -> None:
+        """Test a failing formula fails its readers until it is fixed."""
+        self.graph.assign("b = 0")
+        self.graph.assign("q = a / b")
+        self.graph.assign("r = q + 1")
+        for name in ("q", "r"):
+            with pytest.raises(DivisionByZeroError):
+                self.graph.get(name)
+        self.graph.set_value("b", 4.0)
+        assert self.graph.get("r") == 1.5
+
+    def test_numeric_backend(self) -> None:
+        """Test formulas parse and compute with the graph's backend."""
+        graph = VariableGraph(IntegerBackend())
+        graph.assign("a = 12345678901234567891")
+        graph.assign("b = a * 10 / 5")
+        assert graph.get("b") == 24691357802469135782
+        graph.assign("c = b / 0")
+        with pytest.raises(DivisionByZeroError):
+            graph.get("c")
+
+    def test_negation_keeps_the_backend_precision(self) -> None:
+        """Test unary minus rounds in the backend's context, not the thread's."""
+        digits = "1.2345678901234567890123456789012345678901234567"
+        graph = VariableGraph(DecimalBackend(50))
+        graph.assign(f"x = -{digits}")
+        graph.assign("y = -x")
+        assert graph.get("x") == Decimal(f"-{digits}")
+        assert graph.get("y") == Decimal(digits)
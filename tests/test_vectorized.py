@@ -0,0 +1,196 @@
+"""Test module for vectorized batch operations."""
+
+import math
+import sys
+from array import array
+from typing import Any, List
+
+import pytest
+from src.calculator import vectorized
+from src.calculator.exceptions import DivisionByZeroError
+from src.calculator.operations import Operations
+from src.calculator.vectorized import BatchResult, calculate_many
+
+np = pytest.importorskip("numpy")
+
+BACKENDS = ["python", "numpy"]
+
+
+def as_list(result: BatchResult) -> List[float]:
+    """Convert batch values to a plain list for comparisons."""
+    return [float(value) for value in result.values]
+
+
+def as_mask(result: BatchResult) -> List[bool]:
+    """Convert a batch zero-division mask to a plain list of booleans."""
+    return [bool(flag) for flag in result.zero_division]
+
+
+class TestCalculateMany:
+    """Test cases for calculate_many on every backend."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            ("+", [5.0, 1.0, 2.5]),
+            ("-", [-3.0, -5.0, 1.5]),
+            ("*", [4.0, -6.0, 1.0]),
+            ("/", [0.25, -2.0 / 3.0, 4.0]),
+        ],
+    )
+    def test_elementwise(
+        self, backend: str, operation: str, expected: List[float]
+    ) -> None:
+        """Test element-wise evaluation matches Operations.calculate."""
+        a = [1.0, -2.0, 2.0]
+        b = [4.0, 3.0, 0.5]
+        result = calculate_many(operation, a, b, backend=backend)
+
+        assert result.backend == backend
+        assert len(result) == 3
+        assert as_list(result) == pytest.approx(expected)
+        assert as_list(result) == [
+            Operations.calculate(operation, x, y) for x, y in zip(a, b)
+        ]
+        assert result.error_count == 0
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_array_inputs(self, backend: str) -> None:
+        """Test array('d') buffers are accepted as operands."""
+        a = array("d", [1.0, 2.0])
+        b = array("d", [3.0, 4.0])
+        result = calculate_many("*", a, b, backend=backend)
+        assert as_list(result) == [3.0, 8.0]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_numpy_inputs(self, backend: str) -> None:
+        """Test NumPy arrays are accepted as operands."""
+        result = calculate_many(
+            "-", np.array([5.0, 6.0]), np.array([1.0, 2.0]), backend=backend
+        )
+        assert as_list(result) == [4.0, 4.0]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_scalar_broadcasting(self, backend: str) -> None:
+        """Test scalars are broadcast against the other operand."""
+        left = calculate_many("-", 10, [1.0, 2.0, 3.0], backend=backend)
+        right = calculate_many("/", [1.0, 2.0, 3.0], 2.0, backend=backend)
+
+        assert as_list(left) == [9.0, 8.0, 7.0]
+        assert as_list(right) == [0.5, 1.0, 1.5]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_division_by_zero_nan_policy(self, backend: str) -> None:
+        """Test zero divisors are masked and filled with NaN by default."""
+        result = calculate_many("/", [1.0, 2.0, 0.0], [0.0, 4.0, 0.0], backend=backend)
+        values = as_list(result)
+
+        assert math.isnan(values[0])
+        assert values[1] == 0.5
+        assert math.isnan(values[2])
+        assert as_mask(result) == [True, False, True]
+        assert result.error_count == 2
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_division_by_zero_inf_policy(self, backend: str) -> None:
+        """Test the inf policy stores IEEE 754 quotients."""
+        result = calculate_many(
+            "/",
+            [1.0, -1.0, 1.0, 0.0, math.nan],
+            [0.0, 0.0, -0.0, 0.0, 0.0],
+            on_zero="inf",
+            backend=backend,
+        )
+        values = as_list(result)
+
+        assert values[:3] == [math.inf, -math.inf, -math.inf]
+        assert math.isnan(values[3])
+        assert math.isnan(values[4])
+        assert result.error_count == 5
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_division_by_scalar_zero(self, backend: str) -> None:
+        """Test a scalar zero divisor masks the whole batch."""
+        result = calculate_many("/", [1.0, 2.0], 0, backend=backend)
+        assert as_mask(result) == [True, True]
+        assert all(math.isnan(value) for value in as_list(result))
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_division_by_zero_raise_policy(self, backend: str) -> None:
+        """Test the raise policy aborts with DivisionByZeroError."""
+        with pytest.raises(DivisionByZeroError):
+            calculate_many(
+                "/", [1.0, 2.0], [1.0, 0.0], on_zero="raise", backend=backend
+            )
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_raise_policy_without_zero(self, backend: str) -> None:
+        """Test the raise policy is silent when no divisor is zero."""
+        result = calculate_many("/", [1.0], [2.0], on_zero="raise", backend=backend)
+        assert as_list(result) == [0.5]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_length_mismatch(self, backend: str) -> None:
+        """Test operands of different lengths are rejected."""
+        with pytest.raises(ValueError, match="Operand lengths differ: 2 and 3."):
+            calculate_many("+", [1.0, 2.0], [1.0, 2.0, 3.0], backend=backend)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_two_scalars(self, backend: str) -> None:
+        """Test two scalar operands are rejected."""
+        with pytest.raises(ValueError, match="At least one operand"):
+            calculate_many("+", 1.0, 2.0, backend=backend)
+
+    def test_numpy_rejects_two_dimensional(self) -> None:
+        """Test the NumPy backend rejects multi-dimensional operands."""
+        with pytest.raises(ValueError, match="one-dimensional"):
+            calculate_many("+", np.ones((2, 2)), 1.0, backend="numpy")
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"operation": "^"}, r"Unsupported operation: \^"),
+            ({"on_zero": "skip"}, "Unsupported division-by-zero policy: skip"),
+            ({"backend": "gpu"}, "Unsupported backend: gpu"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: Any, message: str) -> None:
+        """Test unsupported operations, policies and backends are rejected."""
+        arguments = {"operation": "+", "a": [1.0], "b": [2.0]}
+        arguments.update(kwargs)
+        with pytest.raises(ValueError, match=message):
+            calculate_many(**arguments)
+
+    def test_auto_backend_prefers_numpy(self) -> None:
+        """Test the auto backend selects NumPy when it is installed."""
+        assert calculate_many("+", [1.0], [2.0]).backend == "numpy"
+
+    def test_operations_calculate_many(self) -> None:
+        """Test Operations.calculate_many delegates to the batch engine."""
+        result = Operations.calculate_many(
+            "/", [1.0, 1.0], [2.0, 0.0], backend="python"
+        )
+        assert isinstance(result.values, array)
+        assert as_list(result)[0] == 0.5
+        assert as_mask(result) == [False, True]
+
+
+class TestNumpyLoading:
+    """Test cases for the optional NumPy dependency."""
+
+    def test_auto_backend_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the auto backend falls back to pure Python without NumPy."""
+        monkeypatch.setattr(vectorized, "_numpy_module", None)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        assert vectorized.load_numpy() is None
+        assert calculate_many("+", [1.0], [2.0]).backend == "python"
+
+    def test_numpy_backend_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test requesting the numpy backend without NumPy fails clearly."""
+        monkeypatch.setattr(vectorized, "_numpy_module", None)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        with pytest.raises(ValueError, match="requires NumPy"):
+            calculate_many("+", [1.0], [2.0], backend="numpy")